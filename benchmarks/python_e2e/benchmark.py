@@ -11,30 +11,240 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
+import os
+import statistics
 import sys
 import time
 from functools import wraps
 
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# The peak RSS of the process before the last reset_peak_rss() call, since
+# resetting the peak also resets ru_maxrss.
+_peak_rss_before_reset = 0
+
+
+def get_rss():
+    """
+    Return the current resident set size of this process in bytes, or None if
+    it is not available on this platform (it is read from /proc).
+    """
+    try:
+        with open("/proc/self/statm") as statm_file:
+            return int(statm_file.read().split()[1]) * \
+                os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _get_rss_high_water_mark():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux, and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def get_peak_rss():
+    """
+    Return the peak resident set size (high-water mark) of this process since
+    it started in bytes, or None if it is not available on this platform.
+    """
+    peak = _get_rss_high_water_mark()
+    if peak is None:
+        return None
+    return max(peak, _peak_rss_before_reset)
+
+
+def reset_peak_rss():
+    """
+    Reset the high-water mark of the RSS to the current RSS, so the peak RSS
+    of a section of code can be measured, and return True, or return False if
+    this is not supported on this platform (it is on Linux).
+    """
+    global _peak_rss_before_reset
+    peak = get_peak_rss()
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs_file:
+            clear_refs_file.write("5")
+    except OSError:
+        return False
+    _peak_rss_before_reset = peak or 0
+    return True
+
+
+def compute_stats(times):
+    """
+    Return a dictionary of summary statistics for the list of times: the
+    median, the interquartile range (IQR), min, max, mean and stdev.
+    """
+    times = sorted(times)
+    if len(times) > 1:
+        (q1, _, q3) = statistics.quantiles(times, n=4, method="inclusive")
+        stdev = statistics.stdev(times)
+    else:
+        (q1, q3) = (times[0], times[0])
+        stdev = 0.0
+    return {"median": statistics.median(times),
+            "iqr": q3 - q1,
+            "min": times[0],
+            "max": times[-1],
+            "mean": statistics.fmean(times),
+            "stdev": stdev,
+            "count": len(times)}
+
+
+class PhaseTimer:
+    """
+    Context manager that accumulates the time spent in the functions of each
+    phase of a benchmarked call (renumbering, symmetrizing, building the CSR,
+    unrenumbering) by wrapping them while it is active.
+
+    hooks is a list of (owner, attr_name, phase) tuples, where owner is a class
+    or module and attr_name the name of the function to time in it. Calls
+    nested in a timed call are attributed to the outermost phase only.
+    """
+    def __init__(self, hooks):
+        self.hooks = hooks
+        self.times = {}
+        self.__originals = []
+        self.__depth = 0
+
+    def reset(self):
+        self.times = {}
+
+    def __wrap(self, func, phase):
+        @wraps(func)
+        def phase_wrapper(*args, **kwargs):
+            if self.__depth > 0:
+                return func(*args, **kwargs)
+            self.__depth += 1
+            t1 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                t2 = time.perf_counter()
+                self.__depth -= 1
+                self.times[phase] = self.times.get(phase, 0.0) + (t2-t1)
+        return phase_wrapper
+
+    def __enter__(self):
+        for (owner, attr_name, phase) in self.hooks:
+            original = inspect.getattr_static(owner, attr_name)
+            if isinstance(original, (staticmethod, classmethod)):
+                wrapper = type(original)(self.__wrap(original.__func__,
+                                                     phase))
+            else:
+                wrapper = self.__wrap(original, phase)
+            self.__originals.append((owner, attr_name, original))
+            setattr(owner, attr_name, wrapper)
+        return self
+
+    def __exit__(self, *exc_info):
+        while self.__originals:
+            (owner, attr_name, original) = self.__originals.pop()
+            setattr(owner, attr_name, original)
+        return False
+
+
+def default_phase_hooks():
+    """
+    Return the PhaseTimer hooks for the cugraph functions that renumber,
+    symmetrize, build the CSR and unrenumber graphs. Functions that are not
+    present in the installed cugraph are skipped.
+    """
+    from cugraph.structure.number_map import NumberMap
+    from cugraph.structure.graph_implementation import (
+        simpleGraph,
+        simpleDistributedGraph,
+    )
+    SG = simpleGraph.simpleGraphImpl
+    candidates = [
+        (NumberMap, "renumber_and_segment", "renumber"),
+        (simpleGraph, "symmetrize", "symmetrize"),
+        (simpleDistributedGraph, "symmetrize", "symmetrize"),
+        (SG, "_get_plc_graph", "csr_build"),
+        (SG, "view_adj_list", "csr_build"),
+        (SG, "view_transposed_adj_list", "csr_build"),
+        (NumberMap, "unrenumber", "unrenumber"),
+        (NumberMap, "from_internal_vertex_id", "unrenumber"),
+    ]
+    return [(owner, attr_name, phase)
+            for (owner, attr_name, phase) in candidates
+            if hasattr(owner, attr_name)]
+
 
 class BenchmarkedResult:
     """
     Class to hold results (the return value of the callable being benchmarked
     and meta-data about the benchmarked function) of a benchmarked function run.
+
+    runtimes holds the time of each timed (non-warmup) call, and runtime their
+    median. phases maps each phase name to the list of the time spent in that
+    phase in each timed call, if the phases were timed. peak_rss_increase is
+    the peak host RSS during the timed calls minus the RSS before them (None
+    if the peak RSS cannot be reset on this platform).
     """
-    def __init__(self, name, retval, runtime, params=None):
+    def __init__(self, name, retval, runtime, params=None, runtimes=None,
+                 phases=None, warmup=0, peak_rss_increase=None):
         self.name = name
         self.retval = retval
         self.runtime = runtime
+        self.runtimes = runtimes or [runtime]
+        self.phases = phases or {}
+        self.warmup = warmup
+        self.peak_rss_increase = peak_rss_increase
         self.params = params or {}
         self.validator_result = True
 
+    @property
+    def stats(self):
+        return compute_stats(self.runtimes)
 
-def benchmark(func):
+    @property
+    def phase_stats(self):
+        return {phase: compute_stats(times)
+                for (phase, times) in self.phases.items()}
+
+    def to_dict(self):
+        """
+        Return the result as a JSON-serializable dictionary, following the
+        "result" definition of reporting.RESULTS_JSON_SCHEMA.
+        """
+        return {"name": self.name,
+                "params": {key: (val if isinstance(val, (int, float, str,
+                                                         bool, type(None)))
+                                 else str(val))
+                           for (key, val) in self.params.items()},
+                "warmup": self.warmup,
+                "runtimes": list(self.runtimes),
+                "stats": self.stats,
+                "phases": self.phase_stats,
+                "phaseRuntimes": {phase: list(times)
+                                  for (phase, times) in self.phases.items()},
+                "peakHostRSSIncrease": self.peak_rss_increase,
+                "validatorResult": bool(self.validator_result)}
+
+
+def benchmark(func, warmup=0, repeat=1, phase_timer=None,
+              residual_phase="algorithm"):
     """
     Returns a callable/closure that wraps func with code to time the func call
     and return a BenchmarkedResult. The resulting callable takes the same
     args/kwargs as func.
 
+    func is called warmup times without being timed, then repeat times, and
+    the BenchmarkedResult has the time of each of the repeat calls, their
+    median as its runtime and the return value of the last call.
+
+    If phase_timer (a PhaseTimer) is given, the time spent in each of its
+    phases is recorded for each timed call, and the time not spent in any of
+    them is recorded as residual_phase.
+
     The BenchmarkedResult will have its params value assigned from the kwargs
     dictionary, but the func positional args are not captured. If a user needs
     the params captured for reporting purposes, they must use kwargs.  This is
@@ -44,17 +254,53 @@ def benchmark(func):
     This can be used as a function decorator or a standalone function to wrap
     functions to benchmark.
     """
+    if warmup < 0 or repeat < 1:
+        raise ValueError("warmup must be >= 0 and repeat must be >= 1")
     benchmark_name = getattr(func, "benchmark_name", func.__name__)
+
     @wraps(func)
     def benchmark_wrapper(*func_args, **func_kwargs):
-        t1 = time.perf_counter()
-        retval = func(*func_args, **func_kwargs)
-        t2 = time.perf_counter()
+        retval = None
+        for _ in range(warmup):
+            # Release the previous return value (eg. a Graph) before the
+            # next call allocates a new one.
+            retval = None
+            retval = func(*func_args, **func_kwargs)
+        retval = None
+        rss = get_rss()
+        peak_rss_reset = (rss is not None) and reset_peak_rss()
+        runtimes = []
+        phases = {}
+        for i in range(repeat):
+            retval = None
+            if phase_timer is not None:
+                phase_timer.reset()
+                with phase_timer:
+                    t1 = time.perf_counter()
+                    retval = func(*func_args, **func_kwargs)
+                    t2 = time.perf_counter()
+                times = dict(phase_timer.times)
+                times[residual_phase] = max(
+                    0.0, (t2-t1) - sum(phase_timer.times.values()))
+                for phase in set(phases) | set(times):
+                    phases.setdefault(phase, [0.0] * i).append(
+                        times.get(phase, 0.0))
+            else:
+                t1 = time.perf_counter()
+                retval = func(*func_args, **func_kwargs)
+                t2 = time.perf_counter()
+            runtimes.append(t2-t1)
+        peak_rss_increase = None
+        if peak_rss_reset:
+            peak_rss_increase = max(0, _get_rss_high_water_mark() - rss)
         return BenchmarkedResult(name=benchmark_name,
                                  retval=retval,
-                                 runtime=(t2-t1),
+                                 runtime=statistics.median(runtimes),
                                  params=func_kwargs,
-                                )
+                                 runtimes=runtimes,
+                                 phases=phases,
+                                 warmup=warmup,
+                                 peak_rss_increase=peak_rss_increase)
 
     # Assign the name to the returned callable as well for use in debug prints,
     # etc.
@@ -67,14 +313,25 @@ class BenchmarkRun:
     Represents a benchmark "run", which can be executed by calling the run()
     method, and results are saved as BenchmarkedResult instances in the results
     list member.
+
+    The graph construction and each algo are run warmup times untimed, then
+    timed repeat times. If time_phases is True, the time spent renumbering,
+    symmetrizing, building the CSR and unrenumbering in each timed call is
+    recorded in the phases of the results.
     """
     def __init__(self,
                  input_dataframe,
                  construct_graph_func,
                  algo_func_param_list,
-                 algo_validator_list=None
-                ):
+                 algo_validator_list=None,
+                 warmup=1,
+                 repeat=1,
+                 time_phases=True):
         self.input_dataframe = input_dataframe
+        self.warmup = warmup
+        self.repeat = repeat
+        self.phase_timer = PhaseTimer(default_phase_hooks()) \
+            if time_phases else None
 
         if type(construct_graph_func) is tuple:
             (construct_graph_func,
@@ -84,7 +341,11 @@ class BenchmarkRun:
 
         # Create benchmark instances for each algo/func to be timed.
         # FIXME: need to accept and save individual algo args
-        self.construct_graph = benchmark(construct_graph_func)
+        self.construct_graph = benchmark(construct_graph_func,
+                                         warmup=warmup,
+                                         repeat=repeat,
+                                         phase_timer=self.phase_timer,
+                                         residual_phase="construct_graph")
 
         # add starting node to algos: BFS and SSSP
         # FIXME: Refactor BenchmarkRun __init__ because all the work
@@ -105,7 +366,11 @@ class BenchmarkRun:
                 (algo, params) = item
             else:
                 (algo, params) = (item, {})
-            self.algos.append((benchmark(algo), params))
+            self.algos.append((benchmark(algo,
+                                         warmup=warmup,
+                                         repeat=repeat,
+                                         phase_timer=self.phase_timer),
+                               params))
 
         self.validators = algo_validator_list or [None] * len(self.algos)
         self.results = []
@@ -123,7 +388,8 @@ class BenchmarkRun:
         """
         self.results = []
 
-        self.__log(f"running {self.construct_graph.name}...", end="")
+        self.__log(f"running {self.construct_graph.name} "
+                   f"(warmup={self.warmup}, repeat={self.repeat})...", end="")
         result = self.construct_graph(self.input_dataframe,
                                       *self.construct_graph_func_args)
         self.__log("done.")
@@ -170,10 +436,9 @@ class BenchmarkRun:
                 self.__log("done.")
         # FIXME: need to handle individual algo args
         for ((algo, params), validator) in zip(self.algos, self.validators):
-            self.__log(f"running {algo.name} (warmup)...", end="")
-            algo(G, **params)
-            self.__log("done.")
-            self.__log(f"running {algo.name}...", end="")
+            self.__log(f"running {algo.name} "
+                       f"(warmup={self.warmup}, repeat={self.repeat})...",
+                       end="")
             result = algo(G, **params)
             self.__log("done.")
 
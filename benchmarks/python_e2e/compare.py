@@ -0,0 +1,409 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the results of a benchmark run to the results of previous runs (the
+baseline), and report the benchmarks (and phases of benchmarks, such as
+renumbering or graph construction) that are significantly slower or faster.
+
+Results are read from the JSON reports written by main.py (--json-results or
+--benchmark-dir), from the per-algo JSON files written to --benchmark-dir, and
+from the CSV files written by reporting.update_csv_report(). The baseline is
+the union of the results of the last --history runs of each benchmark.
+
+A benchmark is a regression if its median time exceeds the baseline median by
+more than the noise threshold (the largest of --threshold times the baseline
+median and --iqr-factor times the baseline IQR) and, when both the baseline and
+the current run have at least --min-samples times, if a one-sided Mann-Whitney
+U test finds the current times greater with a p-value below --alpha.
+"""
+
+import csv
+import json
+import math
+import re
+import shutil
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from benchmark import compute_stats
+
+
+BenchmarkKey = namedtuple("BenchmarkKey",
+                          ["name", "metric", "dataset", "ngpus"])
+
+Comparison = namedtuple("Comparison",
+                        ["key", "status", "baseline", "current", "delta",
+                         "pvalue"])
+Comparison.__doc__ = """
+The comparison of a benchmark metric between the baseline and the current run.
+
+status is one of "regression", "improvement", "unchanged", "new" (no baseline)
+or "missing" (not in the current run). baseline and current are the stats
+(see benchmark.compute_stats) of the times, or None. delta is the relative
+change of the median, and pvalue the p-value of the Mann-Whitney U test (or
+None if there were not enough samples).
+"""
+
+_statuses = ("regression", "improvement", "unchanged", "new", "missing")
+
+
+###############################################################################
+# Loading results
+
+def _dataset_label(context):
+    """
+    Return a label identifying the input graph of a run from its context.
+    """
+    if context.get("csvGraphFile"):
+        label = Path(context["csvGraphFile"]).name
+    elif context.get("scale") is not None:
+        label = f"scale_{context['scale']}"
+    else:
+        return None
+    if context.get("edgefactor") is not None and \
+       context.get("csvGraphFile") is None:
+        label += f"_ef_{context['edgefactor']}"
+    if context.get("symmetric"):
+        label += "_symmetric"
+    if context.get("unweighted"):
+        label += "_unweighted"
+    return label
+
+
+def _load_json(path):
+    """
+    Return the {BenchmarkKey: times} samples of a JSON results file.
+    """
+    with open(path) as json_file:
+        data = json.load(json_file)
+
+    samples = {}
+    if "results" in data:
+        context = data.get("context", {})
+        dataset = _dataset_label(context)
+        ngpus = context.get("ngpus")
+        for result in data["results"]:
+            key = BenchmarkKey(result["name"], "runtime", dataset, ngpus)
+            samples[key] = list(result["runtimes"])
+            for (phase, times) in result.get("phaseRuntimes", {}).items():
+                key = BenchmarkKey(result["name"], f"phase:{phase}", dataset,
+                                   ngpus)
+                samples[key] = list(times)
+
+    elif "funcName" in data:
+        # Per-algo file written by main.store_results_json()
+        args = dict(data.get("argNameValuePairs", []))
+        name = data["funcName"]
+        if name.startswith("benchmarks."):
+            name = name[len("benchmarks."):]
+        key = BenchmarkKey(name, "runtime",
+                           _dataset_label({"scale": args.get("scale")}),
+                           args.get("ngpus"))
+        samples[key] = [data["result"]]
+
+    else:
+        raise ValueError(f"{path} is not a benchmark results file")
+    return samples
+
+
+def _load_csv(path):
+    """
+    Return the {BenchmarkKey: times} samples of a CSV file written by
+    reporting.update_csv_report(). The dataset is taken from the file name if
+    it contains "scale_N", as the files of run_all_nightly_benches.sh do.
+    """
+    match = re.search(r"scale_(\d+)", Path(path).name)
+    dataset = f"scale_{match.group(1)}" if match else None
+
+    samples = {}
+    with open(path) as csv_file:
+        for row in csv.DictReader(csv_file):
+            for (field, value) in row.items():
+                if not field.startswith("ngpus_") or not value:
+                    continue
+                ngpus = field[len("ngpus_"):]
+                ngpus = int(ngpus) if ngpus.isdigit() else None
+                key = BenchmarkKey(row["name"], "runtime", dataset, ngpus)
+                samples[key] = [float(value)]
+    return samples
+
+
+def load_results(path):
+    """
+    Return the {BenchmarkKey: list of times} samples of the results file at
+    path, which can be a JSON or CSV file.
+    """
+    path = Path(path)
+    if path.suffix == ".csv":
+        return _load_csv(path)
+    return _load_json(path)
+
+
+def _is_per_algo_file(path):
+    """
+    Return True if path is a per-algo JSON file written by
+    main.store_results_json().
+    """
+    if path.suffix != ".json":
+        return False
+    with open(path) as json_file:
+        return "funcName" in json.load(json_file)
+
+
+def load_history(paths):
+    """
+    Return the list of samples (see load_results()) of each results file in
+    paths (files, or directories searched for .json and .csv files), ordered
+    from oldest to newest by modification time.
+
+    main.py writes both a JSON report and per-algo JSON files for each run to
+    its benchmark directory, with different dataset labels, so the per-algo
+    files of a directory are skipped if it also contains JSON reports.
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            dir_files = [p for p in path.iterdir()
+                         if p.suffix in (".json", ".csv")]
+            per_algo_files = set(filter(_is_per_algo_file, dir_files))
+            if any(p.suffix == ".json" and p not in per_algo_files
+                   for p in dir_files):
+                dir_files = [p for p in dir_files if p not in per_algo_files]
+            files.extend(dir_files)
+        else:
+            files.append(path)
+    files.sort(key=lambda p: p.stat().st_mtime)
+    return [load_results(p) for p in files]
+
+
+###############################################################################
+# Comparing results
+
+def mann_whitney_pvalue(x, y):
+    """
+    Return the p-value of a one-sided Mann-Whitney U test that the values of
+    x tend to be greater than the values of y.
+
+    scipy is used if available, otherwise the normal approximation (with tie
+    and continuity corrections) is used.
+    """
+    try:
+        from scipy.stats import mannwhitneyu
+    except ImportError:
+        mannwhitneyu = None
+    if mannwhitneyu is not None:
+        return float(mannwhitneyu(x, y, alternative="greater").pvalue)
+
+    (n1, n2) = (len(x), len(y))
+    values = sorted([(v, 0) for v in x] + [(v, 1) for v in y])
+    ranks = [0.0] * len(values)
+    tie_term = 0
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    u = sum(r for (r, (_, group)) in zip(ranks, values) if group == 0) \
+        - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_samples(key, baseline, current, threshold=0.05, alpha=0.05,
+                    min_samples=3, iqr_factor=1.5):
+    """
+    Return the Comparison of the baseline and current lists of times of the
+    benchmark metric key.
+    """
+    if not baseline:
+        return Comparison(key, "new", None, compute_stats(current), None, None)
+    if not current:
+        return Comparison(key, "missing", compute_stats(baseline), None, None,
+                          None)
+
+    base_stats = compute_stats(baseline)
+    curr_stats = compute_stats(current)
+    (base_median, curr_median) = (base_stats["median"], curr_stats["median"])
+    delta = (curr_median - base_median) / base_median if base_median > 0 \
+        else 0.0
+    noise = max(threshold * base_median, iqr_factor * base_stats["iqr"])
+
+    status = "unchanged"
+    pvalue = None
+    if len(baseline) >= min_samples and len(current) >= min_samples:
+        if curr_median - base_median > noise:
+            pvalue = mann_whitney_pvalue(current, baseline)
+            if pvalue < alpha:
+                status = "regression"
+        elif base_median - curr_median > noise:
+            pvalue = mann_whitney_pvalue(baseline, current)
+            if pvalue < alpha:
+                status = "improvement"
+    elif curr_median - base_median > noise:
+        status = "regression"
+    elif base_median - curr_median > noise:
+        status = "improvement"
+    return Comparison(key, status, base_stats, curr_stats, delta, pvalue)
+
+
+def compare(history, current, history_size=5, **kwargs):
+    """
+    Return the list of Comparisons of each benchmark metric of current (the
+    samples of a results file, see load_results()) to the samples of the
+    last history_size runs of history (see load_history()) with the metric.
+    kwargs are passed to compare_samples().
+    """
+    baselines = {}
+    for run in reversed(history):
+        for (key, samples) in run.items():
+            runs = baselines.setdefault(key, [])
+            if len(runs) < history_size:
+                runs.append(samples)
+
+    comparisons = []
+    for key in sorted(set(baselines) | set(current), key=str):
+        baseline = [t for run in baselines.get(key, []) for t in run]
+        comparisons.append(compare_samples(key, baseline,
+                                           current.get(key, []), **kwargs))
+    return comparisons
+
+
+###############################################################################
+# Reporting
+
+def _format_time(stats):
+    return "-" if stats is None else f"{stats['median']:.6}"
+
+
+def _format_comparison(comparison):
+    delta = "-" if comparison.delta is None else f"{comparison.delta:+.1%}"
+    pvalue = "-" if comparison.pvalue is None else f"{comparison.pvalue:.3g}"
+    return (_format_time(comparison.baseline),
+            _format_time(comparison.current), delta, pvalue)
+
+
+def generate_console_report(comparisons):
+    """
+    Return a string suitable for printing to the console with a line for each
+    comparison and the overall PASS/FAIL result.
+    """
+    retstring = ""
+    for c in comparisons:
+        name = f"{c.key.name}[{c.key.metric}]({c.key.dataset}, " \
+               f"ngpus:{c.key.ngpus})"
+        (baseline, current, delta, pvalue) = _format_comparison(c)
+        retstring += f"{name:<60}{baseline:>12}{current:>12}{delta:>9}" \
+                     f"{pvalue:>10}  {c.status}\n"
+    counts = {s: sum(c.status == s for c in comparisons) for s in _statuses}
+    retstring += f"{'-'*80}\n"
+    retstring += ", ".join(f"{count} {status}"
+                           for (status, count) in counts.items()) + "\n"
+    retstring += "FAIL\n" if counts["regression"] else "PASS\n"
+    return retstring
+
+
+def generate_markdown_report(comparisons):
+    """
+    Return a Markdown table of the comparisons, with the regressions first.
+    """
+    lines = ["| Benchmark | Metric | Dataset | GPUs | Baseline (s) | "
+             "Current (s) | Delta | p-value | Status |",
+             "|---|---|---|---|---:|---:|---:|---:|---|"]
+    order = {s: i for (i, s) in enumerate(_statuses)}
+    for c in sorted(comparisons, key=lambda c: order[c.status]):
+        (baseline, current, delta, pvalue) = _format_comparison(c)
+        status = f"**{c.status}**" if c.status == "regression" else c.status
+        lines.append(f"| {c.key.name} | {c.key.metric} | {c.key.dataset} | "
+                     f"{c.key.ngpus} | {baseline} | {current} | {delta} | "
+                     f"{pvalue} | {status} |")
+    return "\n".join(lines) + "\n"
+
+
+###############################################################################
+# Command line
+
+def main(argv=None):
+    """
+    Compare a results file to the baseline, print the report and return 1 if
+    there is a regression, 0 otherwise.
+    """
+    import argparse
+
+    ap = argparse.ArgumentParser(
+        description="Compare benchmark results to a baseline of previous "
+        "results.")
+    ap.add_argument("current", type=str,
+                    help="JSON or CSV results file of the run to compare.")
+    ap.add_argument("--baseline", type=str, action="append", required=True,
+                    help="results file or directory of results files of "
+                    "previous runs. May be specified multiple times.")
+    ap.add_argument("--history", type=int, default=5,
+                    help="number of previous runs of each benchmark in the "
+                    "baseline.")
+    ap.add_argument("--threshold", type=float, default=0.05,
+                    help="minimum relative change of the median time "
+                    "reported as a regression or improvement.")
+    ap.add_argument("--iqr-factor", type=float, default=1.5,
+                    help="minimum change of the median time reported as a "
+                    "regression or improvement, in baseline IQRs.")
+    ap.add_argument("--alpha", type=float, default=0.05,
+                    help="significance level of the Mann-Whitney U test.")
+    ap.add_argument("--min-samples", type=int, default=3,
+                    help="minimum number of times in both the baseline and "
+                    "the current run to use the Mann-Whitney U test.")
+    ap.add_argument("--markdown", type=str, default=None,
+                    help="path of a Markdown file to write the report to.")
+    ap.add_argument("--save", type=str, default=None,
+                    help="directory to copy the current results file to "
+                    "(with a timestamp), to add it to the baseline of later "
+                    "comparisons. Only done if there is no regression.")
+
+    args = ap.parse_args(argv)
+
+    comparisons = compare(load_history(args.baseline),
+                          load_results(args.current),
+                          history_size=args.history,
+                          threshold=args.threshold,
+                          alpha=args.alpha,
+                          min_samples=args.min_samples,
+                          iqr_factor=args.iqr_factor)
+    failed = any(c.status == "regression" for c in comparisons)
+
+    print(generate_console_report(comparisons))
+    if args.markdown:
+        with open(args.markdown, "w") as md_file:
+            md_file.write(generate_markdown_report(comparisons))
+    if args.save and not failed:
+        current = Path(args.current)
+        save_dir = Path(args.save)
+        save_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy(current, save_dir / (f"{current.stem}_"
+                                         f"{time.strftime('%Y%m%d_%H%M%S')}"
+                                         f"{current.suffix}"))
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
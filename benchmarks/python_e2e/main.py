@@ -17,6 +17,7 @@ from cugraph.dask.common.mg_utils import get_visible_devices
 
 from reporting import (generate_console_report,
                        update_csv_report,
+                       write_json_report,
                        )
 
 import cugraph_funcs
@@ -63,10 +64,18 @@ def run(algos,
         edgefactor=None,
         benchmark_dir=None,
         dask_scheduler_file=None,
-        rmm_pool_size=None):
+        rmm_pool_size=None,
+        warmup=1,
+        repeat=1,
+        time_phases=True,
+        json_results_file=None):
     """
     Run the nightly benchmark on cugraph.
     Return True on success, False on failure.
+
+    Each benchmark is run warmup times untimed, then timed repeat times. The
+    results of all the benchmarks are written to json_results_file (and to
+    benchmark_dir) following reporting.RESULTS_JSON_SCHEMA.
     """
     seed = 42
     n_gpus = len(get_visible_devices())
@@ -131,16 +140,33 @@ def run(algos,
         benchmark = BenchmarkRun(df,
                                  (funcs.construct_graph, (symmetric,)),
                                  benchmarks_to_run,
+                                 warmup=warmup,
+                                 repeat=repeat,
+                                 time_phases=time_phases,
                                 )
         success = benchmark.run()
 
-        algo_name = benchmark.results[1].name
-        algo_name = f"benchmarks.{algo_name}"
-        algo_time = benchmark.results[1].runtime
+        context = {"scale": scale,
+                   "csvGraphFile": csv_graph_file,
+                   "edgefactor": edgefactor,
+                   "ngpus": n_gpus,
+                   "symmetric": symmetric,
+                   "unweighted": unweighted,
+                   "warmup": warmup,
+                   "repeat": repeat,
+                  }
         # Generate json files containing the benchmark results
         if benchmark_dir is not None:
-            store_results_json(benchmark_dir, algo_name, algo_time, n_gpus, scale)
-        
+            for result in benchmark.results[1:]:
+                store_results_json(benchmark_dir, f"benchmarks.{result.name}",
+                                   result.runtime, n_gpus, scale)
+            write_json_report(
+                Path(benchmark_dir) /
+                f"benchmark_results_scale_{scale}_ngpus_{n_gpus}.json",
+                benchmark.results, context)
+        if json_results_file:
+            write_json_report(json_results_file, benchmark.results, context)
+
         # Report results
         print(generate_console_report(benchmark.results))
         if csv_results_file:
@@ -186,6 +212,17 @@ if __name__ == "__main__":
                     help="directory to store the results in json files")
     ap.add_argument("--rmm-pool-size", type=str, default=None,
                     help="RMM pool size to initialize each worker with")
+    ap.add_argument("--warmup", type=int, default=1,
+                    help="number of untimed runs of each benchmark before "
+                    "the timed runs.")
+    ap.add_argument("--repeat", type=int, default=1,
+                    help="number of timed runs of each benchmark. The median "
+                    "runtime is reported.")
+    ap.add_argument("--no-phase-timing", default=False, action="store_true",
+                    help="Do not time the renumber, symmetrize, CSR build "
+                    "and unrenumber phases of each benchmark.")
+    ap.add_argument("--json-results", type=str, default=None,
+                    help="path of a JSON file to write all the results to.")
 
 
     args = ap.parse_args()
@@ -199,6 +236,10 @@ if __name__ == "__main__":
                    edgefactor=args.edgefactor,
                    benchmark_dir=args.benchmark_dir,
                    dask_scheduler_file=args.dask_scheduler_file,
-                   rmm_pool_size=args.rmm_pool_size)
+                   rmm_pool_size=args.rmm_pool_size,
+                   warmup=args.warmup,
+                   repeat=args.repeat,
+                   time_phases=not args.no_phase_timing,
+                   json_results_file=args.json_results)
 
     sys.exit(exitcode)
@@ -13,10 +13,72 @@
 
 from os import path
 import csv
+import json
 
 import numpy as np
 
 
+# Version of the JSON results format, to be incremented on incompatible
+# changes to RESULTS_JSON_SCHEMA.
+RESULTS_JSON_VERSION = 1
+
+_stats_schema = {
+    "type": "object",
+    "properties": {
+        "median": {"type": "number"},
+        "iqr": {"type": "number"},
+        "min": {"type": "number"},
+        "max": {"type": "number"},
+        "mean": {"type": "number"},
+        "stdev": {"type": "number"},
+        "count": {"type": "integer", "minimum": 1},
+    },
+    "required": ["median", "iqr", "min", "max", "mean", "stdev", "count"],
+}
+
+# JSON Schema (draft 7) of the report written by write_json_report(). Times
+# are in seconds and memory sizes in bytes.
+RESULTS_JSON_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "cuGraph python_e2e benchmark results",
+    "type": "object",
+    "definitions": {
+        "stats": _stats_schema,
+        "result": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "params": {"type": "object"},
+                "warmup": {"type": "integer", "minimum": 0},
+                "runtimes": {"type": "array",
+                             "items": {"type": "number"},
+                             "minItems": 1},
+                "stats": {"$ref": "#/definitions/stats"},
+                "phases": {"type": "object",
+                           "additionalProperties": {
+                               "$ref": "#/definitions/stats"}},
+                "phaseRuntimes": {"type": "object",
+                                  "additionalProperties": {
+                                      "type": "array",
+                                      "items": {"type": "number"}}},
+                "peakHostRSSIncrease": {"type": ["integer", "null"]},
+                "validatorResult": {"type": "boolean"},
+            },
+            "required": ["name", "params", "warmup", "runtimes", "stats",
+                         "phases", "phaseRuntimes", "peakHostRSSIncrease",
+                         "validatorResult"],
+        },
+    },
+    "properties": {
+        "version": {"const": RESULTS_JSON_VERSION},
+        "context": {"type": "object"},
+        "results": {"type": "array",
+                    "items": {"$ref": "#/definitions/result"}},
+    },
+    "required": ["version", "context", "results"],
+}
+
+
 def __namify_dict(d):
     """
     Return a string repr for a dictionary suitable for using in a benchmark
@@ -32,30 +94,67 @@ def __namify_dict(d):
     return ",".join(strings)
 
 
+def __format_stats(stats):
+    """
+    Return a string repr of the median, IQR and min of stats, the dictionary
+    of statistics of a result.
+    """
+    if stats["count"] == 1:
+        return f"{stats['median']:.6}"
+    return (f"{stats['median']:.6} (iqr:{stats['iqr']:.3}, "
+            f"min:{stats['min']:.6}, n:{stats['count']})")
+
+
 def generate_console_report(benchmark_result_list):
     """
     Return a string suitable for printing to the console containing the
-    benchmark run results.
+    benchmark run results: the median runtime of each result, with its IQR
+    and min if it was timed more than once, followed by the median time of
+    each phase.
     """
     retstring = ""
 
     # Assume results are ordered based on the order they were run, which is
     # the graph_create run, then a run of each algo.
-    r = benchmark_result_list[0]
-    name = f"{r.name}({__namify_dict(r.params)})"
-    space = " " * (70 - len(name))
-    retstring += f"{name}{space}{r.runtime:.6}\n"
-
-    remaining_results = benchmark_result_list[1:]
-
-    for r in remaining_results:
-        retstring += f"{'-'*80}\n"
+    for (i, r) in enumerate(benchmark_result_list):
+        if i > 0:
+            retstring += f"{'-'*80}\n"
         name = f"{r.name}({__namify_dict(r.params)})"
         space = " " * (70 - len(name))
-        retstring += f"{name}{space}{r.runtime:.6}\n"
+        retstring += f"{name}{space}{__format_stats(r.stats)}\n"
+        for (phase, stats) in sorted(r.phase_stats.items()):
+            name = f"    {phase}"
+            space = " " * (70 - len(name))
+            retstring += f"{name}{space}{stats['median']:.6}\n"
+        if r.peak_rss_increase is not None:
+            name = "    peak host RSS increase (MiB)"
+            space = " " * (70 - len(name))
+            retstring += f"{name}{space}{r.peak_rss_increase / 2**20:.1f}\n"
 
     return retstring
 
+
+def generate_json_report(benchmark_result_list, context=None):
+    """
+    Return a JSON-serializable dictionary of the benchmark results, following
+    RESULTS_JSON_SCHEMA. context is a dictionary describing the run (scale,
+    number of GPUs, ...).
+    """
+    return {"version": RESULTS_JSON_VERSION,
+            "context": dict(context or {}),
+            "results": [r.to_dict() for r in benchmark_result_list]}
+
+
+def write_json_report(json_results_file, benchmark_result_list,
+                      context=None):
+    """
+    Write the benchmark results to json_results_file as JSON following
+    RESULTS_JSON_SCHEMA.
+    """
+    with open(json_results_file, "w") as json_file:
+        json.dump(generate_json_report(benchmark_result_list, context),
+                  json_file, indent=4)
+
 def update_csv_report(csv_results_file, benchmark_result_list, ngpus):
     """
     Update (or create if DNE) csv_results_file as a CSV file containing the
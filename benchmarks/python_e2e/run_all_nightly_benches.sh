@@ -20,6 +20,8 @@ UNWEIGHTED_ALGOS="--algo=pagerank --algo=katz"
 GPU_CONFIGS="0 0,1 0,1,2,3 0,1,2,3,4,5,6,7"
 SCALE_VALUES='23 24 25 26 27 28 29 30'
 EDGEFACTOR_VALUES='16'
+# Untimed and timed runs of each benchmark, the median time is reported
+TIMING_OPTIONS="--warmup=1 --repeat=5"
 
 rm -f out.csv
 
@@ -34,7 +36,7 @@ for scale in $SCALE_VALUES; do
             echo ""
             echo ">>>>>>>>>>>>>>>>> EDGEFACTOR: $edgefactor"
             #env CUDA_VISIBLE_DEVICES="$gpus" python "$THIS_SCRIPT_DIR"/main.py $WEIGHTED_ALGOS --scale=$scale --symmetric-graph
-            env CUDA_VISIBLE_DEVICES="$gpus" python "$THIS_SCRIPT_DIR"/main.py $UNWEIGHTED_ALGOS --unweighted --symmetric-graph --scale=$scale --edgefactor=$edgefactor
+            env CUDA_VISIBLE_DEVICES="$gpus" python "$THIS_SCRIPT_DIR"/main.py $UNWEIGHTED_ALGOS $TIMING_OPTIONS --unweighted --symmetric-graph --scale=$scale --edgefactor=$edgefactor
         done
     done
     mv out.csv random_scale_"$scale".csv
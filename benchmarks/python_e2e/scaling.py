@@ -0,0 +1,588 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scaling benchmarks on synthetic graphs.
+
+Sweeps the graph generator, scale, edge factor, directedness, weight dtype and
+renumbering, and for each graph of the sweep times the graph construction and
+each algo (see OPERATIONS) and records their peak device memory. The
+throughput (edges/sec) of each operation is reported as a function of the
+number of edges, and the runtime of each operation is fitted to
+runtime ~ edges**exponent to flag superlinear scaling.
+
+Example:
+    python scaling.py --generator=rmat --scales=10:20:2 --algo=bfs \\
+        --output-dir=scaling_results
+"""
+
+import csv
+import gc
+import itertools
+import json
+import math
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+import cugraph
+
+from benchmark import benchmark, get_peak_rss
+import cugraph_funcs
+import synthetic_graphs
+
+
+SCALING_JSON_VERSION = 1
+
+SweepConfig = namedtuple("SweepConfig", ["generator", "edgefactor", "directed",
+                                         "weight_dtype", "renumber"])
+
+
+def log(s, end="\n"):
+    print(s, end=end)
+    sys.stdout.flush()
+
+
+###############################################################################
+# Operations
+
+def construct_graph(dataframe, directed=True, renumber=True):
+    G = cugraph.Graph(directed=directed)
+    G.from_cudf_edgelist(dataframe, source="src", destination="dst",
+                         edge_attr="weight" if "weight" in dataframe else None,
+                         renumber=renumber)
+    return G
+
+
+construct_graph.benchmark_name = "from_cudf_edgelist"
+
+
+def _start_vertex(G, df):
+    return {"start": df["src"].iloc[0]}
+
+
+def _katz_alpha(G, df):
+    return {"alpha": 1 / G.degree()["degree"].max()}
+
+
+# Maps the name of each algo to (function, function returning its kwargs for
+# a graph and its edgelist, whether it requires an undirected graph).
+OPERATIONS = {"bfs": (cugraph_funcs.bfs, _start_vertex, False),
+              "sssp": (cugraph_funcs.sssp, _start_vertex, False),
+              "pagerank": (cugraph_funcs.pagerank, None, False),
+              "katz": (cugraph_funcs.katz, _katz_alpha, False),
+              "hits": (cugraph_funcs.hits, None, False),
+              "wcc": (cugraph_funcs.wcc, None, False),
+              "louvain": (cugraph_funcs.louvain, None, True),
+              "triangle_count": (cugraph_funcs.triangle_count, None, True)}
+
+
+@contextmanager
+def device_memory_peak():
+    """
+    Context manager yielding a dictionary whose "peak" item is set on exit to
+    the peak bytes of device memory allocated through RMM in the context, or
+    None if RMM does not provide allocation statistics.
+    """
+    peak = {"peak": None}
+    try:
+        import rmm
+        adaptor_type = rmm.mr.StatisticsResourceAdaptor
+    except (ImportError, AttributeError):
+        yield peak
+        return
+    previous = rmm.mr.get_current_device_resource()
+    adaptor = adaptor_type(previous)
+    rmm.mr.set_current_device_resource(adaptor)
+    try:
+        yield peak
+    finally:
+        rmm.mr.set_current_device_resource(previous)
+        peak["peak"] = adaptor.allocation_counts["peak_bytes"]
+
+
+###############################################################################
+# Sweep
+
+def parse_scales(spec):
+    """
+    Return the list of scales of spec, either a comma-separated list
+    ("10,12,16") or an inclusive range "start:stop[:step]" ("10:24:2").
+    """
+    if ":" in spec:
+        bounds = [int(x) for x in spec.split(":")]
+        if len(bounds) not in (2, 3):
+            raise ValueError(f"invalid scale range {spec}")
+        step = bounds[2] if len(bounds) == 3 else 1
+        if step < 1:
+            raise ValueError(f"invalid scale range {spec}")
+        return list(range(bounds[0], bounds[1] + 1, step))
+    return [int(x) for x in spec.split(",")]
+
+
+def sweep_configs(generators, edgefactors, directed, weight_dtypes, renumber):
+    """
+    Return the SweepConfig of each combination of the values of each axis of
+    the sweep.
+    """
+    return [SweepConfig(*values) for values in itertools.product(
+        generators, edgefactors, directed, weight_dtypes, renumber)]
+
+
+def _record(config, scale, num_vertices, num_edges, operation, result=None,
+            peak_device_bytes=None, error=None):
+    record = {"generator": config.generator,
+              "scale": scale,
+              "edgefactor": config.edgefactor,
+              "directed": config.directed,
+              "weightDtype": config.weight_dtype,
+              "renumber": config.renumber,
+              "numVertices": num_vertices,
+              "numEdges": num_edges,
+              "operation": operation,
+              "error": error}
+    if result is not None:
+        stats = result.stats
+        record.update(median=stats["median"],
+                      iqr=stats["iqr"],
+                      min=stats["min"],
+                      runtimes=list(result.runtimes),
+                      edgesPerSec=(num_edges / stats["median"]
+                                   if stats["median"] > 0 else None),
+                      peakDeviceBytes=peak_device_bytes,
+                      peakHostRSSIncrease=result.peak_rss_increase)
+    return record
+
+
+def _run_operation(func, args, kwargs, warmup, repeat):
+    """
+    Benchmark func(*args, **kwargs) and return the BenchmarkedResult and the
+    peak device memory of the runs.
+    """
+    with device_memory_peak() as peak:
+        result = benchmark(func, warmup=warmup, repeat=repeat)(*args,
+                                                               **kwargs)
+    return (result, peak["peak"])
+
+
+def run_sweep(configs, scales, algos=None, warmup=1, repeat=3, seed=42,
+              max_edges=None):
+    """
+    Run the benchmarks of each config at each scale, and return a list of
+    records (dictionaries) with the runtime stats, throughput and peak memory
+    of each operation, or the error it raised.
+
+    The operations of a config that fail at one scale (eg. running out of
+    memory) are skipped at the larger scales, and the scales whose edgelist
+    has more than max_edges edges are skipped.
+    """
+    algos = list(OPERATIONS) if algos is None else list(algos)
+    invalid = set(algos) - set(OPERATIONS)
+    if invalid:
+        raise ValueError(f"Invalid algo(s) specified {invalid}")
+
+    records = []
+    for config in configs:
+        failed = set()
+        for scale in sorted(scales):
+            # Graph construction failed at a smaller scale
+            if construct_graph.benchmark_name in failed:
+                break
+            if (max_edges is not None and
+                    2**scale * config.edgefactor > max_edges):
+                log(f"skipping {config} at scale {scale}: more than "
+                    f"{max_edges} edges")
+                continue
+            log(f"generating {config.generator} graph of scale {scale}...",
+                end="")
+            df = synthetic_graphs.generate_edgelist(
+                config.generator, scale, config.edgefactor, seed=seed,
+                weight_dtype=config.weight_dtype,
+                sparse_ids=config.renumber)
+            (num_vertices, num_edges) = (2**scale, len(df))
+            log("done.")
+
+            def add(operation, *args, **kwargs):
+                records.append(_record(config, scale, num_vertices, num_edges,
+                                       operation, *args, **kwargs))
+
+            G = None
+            name = construct_graph.benchmark_name
+            log(f"running {name}...", end="")
+            try:
+                (result, peak) = _run_operation(
+                    construct_graph, (df,),
+                    {"directed": config.directed,
+                     "renumber": config.renumber}, warmup, repeat)
+                G = result.retval
+                add(name, result, peak)
+                log("done.")
+            except Exception as exc:
+                failed.add(name)
+                add(name, error=repr(exc))
+                log(f"failed: {exc!r}")
+
+            for algo in algos:
+                (func, get_kwargs, undirected_only) = OPERATIONS[algo]
+                if G is None or algo in failed or \
+                   (undirected_only and config.directed):
+                    continue
+                log(f"running {algo}...", end="")
+                try:
+                    kwargs = get_kwargs(G, df) if get_kwargs else {}
+                    (result, peak) = _run_operation(func, (G,), kwargs,
+                                                    warmup, repeat)
+                    result.retval = None
+                    add(algo, result, peak)
+                    log("done.")
+                except Exception as exc:
+                    failed.add(algo)
+                    add(algo, error=repr(exc))
+                    log(f"failed: {exc!r}")
+
+            # Release the graph before generating the next one.
+            del G, df
+            gc.collect()
+
+    return records
+
+
+###############################################################################
+# Analysis
+
+def fit_exponent(num_edges, runtimes):
+    """
+    Return the exponent k of the least-squares fit of
+    runtime = c * num_edges**k (a line in log-log space), or None if there
+    are less than 2 distinct sizes.
+    """
+    points = [(math.log(e), math.log(t)) for (e, t) in zip(num_edges, runtimes)
+              if e > 0 and t > 0]
+    if len(set(x for (x, _) in points)) < 2:
+        return None
+    mean_x = sum(x for (x, _) in points) / len(points)
+    mean_y = sum(y for (_, y) in points) / len(points)
+    return sum((x - mean_x) * (y - mean_y) for (x, y) in points) / \
+        sum((x - mean_x)**2 for (x, _) in points)
+
+
+def _curve_key(record):
+    return (record["operation"], record["generator"], record["edgefactor"],
+            record["directed"], record["weightDtype"], record["renumber"])
+
+
+def analyze_scaling(records, tolerance=0.15):
+    """
+    Group the successful records by operation and config, and return a list
+    of the scaling curve of each group: a dictionary with the config, the
+    list of points (scale, numEdges, median, edgesPerSec, peakDeviceBytes),
+    the fitted exponent of the runtime, the largest exponent between two
+    consecutive points ("worstStepExponent", at "worstStepScale") and whether
+    the curve is superlinear (the fitted exponent is above 1 + tolerance).
+    """
+    curves = {}
+    for record in records:
+        if record.get("error") is None:
+            curves.setdefault(_curve_key(record), []).append(record)
+
+    analysis = []
+    for (key, points) in curves.items():
+        points = sorted(points, key=lambda r: r["numEdges"])
+        exponent = fit_exponent([p["numEdges"] for p in points],
+                                [p["median"] for p in points])
+        (worst_step, worst_scale) = (None, None)
+        for (p1, p2) in zip(points, points[1:]):
+            step = fit_exponent([p1["numEdges"], p2["numEdges"]],
+                                [p1["median"], p2["median"]])
+            if step is not None and (worst_step is None or step > worst_step):
+                (worst_step, worst_scale) = (step, p2["scale"])
+        analysis.append({
+            "operation": key[0],
+            "generator": key[1],
+            "edgefactor": key[2],
+            "directed": key[3],
+            "weightDtype": key[4],
+            "renumber": key[5],
+            "points": [{"scale": p["scale"],
+                        "numEdges": p["numEdges"],
+                        "median": p["median"],
+                        "edgesPerSec": p["edgesPerSec"],
+                        "peakDeviceBytes": p["peakDeviceBytes"]}
+                       for p in points],
+            "exponent": exponent,
+            "worstStepExponent": worst_step,
+            "worstStepScale": worst_scale,
+            "superlinear": (exponent is not None and
+                            exponent > 1 + tolerance),
+        })
+    return sorted(analysis, key=lambda c: (c["operation"], c["generator"],
+                                           c["edgefactor"], c["directed"],
+                                           str(c["weightDtype"]),
+                                           c["renumber"]))
+
+
+###############################################################################
+# Reports
+
+def _config_name(curve):
+    return (f"{curve['generator']}/ef={curve['edgefactor']}/"
+            f"{'directed' if curve['directed'] else 'undirected'}/"
+            f"{curve['weightDtype'] or 'unweighted'}/"
+            f"{'renumber' if curve['renumber'] else 'no-renumber'}")
+
+
+def _format_number(value, fmt="{:.3g}"):
+    return "-" if value is None else fmt.format(value)
+
+
+def _format_bytes(value):
+    if value is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.3g}{unit}"
+        value /= 1024
+    return f"{value:.3g}GiB"
+
+
+def _table_rows(analysis):
+    header = ["operation", "config", "exponent", "worst step", "superlinear",
+              "edges/sec by scale", "peak device memory by scale"]
+    rows = []
+    for curve in analysis:
+        worst = "-" if curve["worstStepExponent"] is None else \
+            (f"{curve['worstStepExponent']:.2f} "
+             f"(scale {curve['worstStepScale']})")
+        rows.append([
+            curve["operation"],
+            _config_name(curve),
+            _format_number(curve["exponent"], "{:.2f}"),
+            worst,
+            "YES" if curve["superlinear"] else "no",
+            " ".join(f"{p['scale']}:{_format_number(p['edgesPerSec'])}"
+                     for p in curve["points"]),
+            " ".join(f"{p['scale']}:{_format_bytes(p['peakDeviceBytes'])}"
+                     for p in curve["points"]),
+        ])
+    return (header, rows)
+
+
+def generate_console_report(analysis):
+    """
+    Return a table of the scaling exponent, throughput and peak device memory
+    of each curve of analysis (see analyze_scaling()).
+    """
+    (header, rows) = _table_rows(analysis)
+    widths = [max(len(row[i]) for row in [header] + rows)
+              for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(width) for (cell, width)
+                       in zip(header, widths)).rstrip(),
+             "-" * (sum(widths) + 2 * (len(widths) - 1))]
+    for row in rows:
+        lines.append("  ".join(cell.ljust(width) for (cell, width)
+                               in zip(row, widths)).rstrip())
+    num_superlinear = sum(c["superlinear"] for c in analysis)
+    lines.append(f"\n{num_superlinear} of {len(analysis)} curves scale "
+                 "superlinearly.")
+    return "\n".join(lines)
+
+
+def generate_markdown_report(analysis):
+    """
+    Return the table of generate_console_report() as Markdown.
+    """
+    (header, rows) = _table_rows(analysis)
+    lines = ["| " + " | ".join(header) + " |",
+             "|" + "---|" * len(header)]
+    for row in rows:
+        lines.append("| " + " | ".join(row) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def write_csv_report(path, records):
+    """
+    Write one row per record (without the individual runtimes) to a CSV file.
+    """
+    fields = ["generator", "scale", "edgefactor", "directed", "weightDtype",
+              "renumber", "numVertices", "numEdges", "operation", "median",
+              "iqr", "min", "edgesPerSec", "peakDeviceBytes",
+              "peakHostRSSIncrease", "error"]
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=fields,
+                                extrasaction="ignore")
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+
+
+def write_json_report(path, records, analysis, context=None):
+    with open(path, "w") as json_file:
+        json.dump({"version": SCALING_JSON_VERSION,
+                   "context": context or {},
+                   "results": records,
+                   "scaling": analysis}, json_file, indent=2, default=str)
+
+
+def write_plots(output_dir, analysis):
+    """
+    Write a PNG per operation with its runtime, throughput and peak device
+    memory as a function of the number of edges (log-log), with a curve per
+    config. Return the list of written files, which is empty if matplotlib is
+    not installed.
+    """
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        log("matplotlib is not installed, not writing plots.")
+        return []
+
+    paths = []
+    operations = sorted(set(c["operation"] for c in analysis))
+    for operation in operations:
+        (fig, axes) = plt.subplots(1, 3, figsize=(18, 5))
+        for curve in analysis:
+            if curve["operation"] != operation:
+                continue
+            edges = [p["numEdges"] for p in curve["points"]]
+            label = _config_name(curve)
+            if curve["exponent"] is not None:
+                label += f" (k={curve['exponent']:.2f})"
+            (line,) = axes[0].plot(edges,
+                                   [p["median"] for p in curve["points"]],
+                                   marker="o", label=label)
+            color = line.get_color()
+            axes[1].plot(edges, [p["edgesPerSec"] for p in curve["points"]],
+                         marker="o", color=color)
+            memory = [p["peakDeviceBytes"] for p in curve["points"]]
+            if None not in memory:
+                axes[2].plot(edges, memory, marker="o", color=color)
+        for (ax, ylabel) in zip(axes, ["runtime (s)", "edges/sec",
+                                       "peak device memory (bytes)"]):
+            ax.set_xscale("log")
+            ax.set_yscale("log")
+            ax.set_xlabel("edges")
+            ax.set_ylabel(ylabel)
+            ax.grid(True, which="both", alpha=0.3)
+        axes[0].legend(fontsize="small")
+        fig.suptitle(f"{operation} scaling")
+        fig.tight_layout()
+        path = Path(output_dir) / f"scaling_{operation}.png"
+        fig.savefig(path)
+        plt.close(fig)
+        paths.append(path)
+    return paths
+
+
+###############################################################################
+# CLI
+
+def _parse_bool_axis(value, true_name, false_name):
+    return {true_name: [True], false_name: [False],
+            "both": [False, True]}[value]
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(
+        description="Run the benchmarks on synthetic graphs of increasing "
+        "sizes and report how their runtime, throughput and memory scale.")
+    ap.add_argument("--generator", action="append",
+                    choices=list(synthetic_graphs.GENERATORS),
+                    help="graph generator. May be specified multiple times. "
+                    "Default is all generators.")
+    ap.add_argument("--scales", type=parse_scales, default="10:24:2",
+                    help="scales (num_verts=2**SCALE) to run, either a "
+                    "comma-separated list or an inclusive range "
+                    "START:STOP[:STEP]. Default is 10:24:2.")
+    ap.add_argument("--edgefactor", type=int, action="append",
+                    help="edge factor (num_edges=num_verts*EDGEFACTOR). May "
+                    "be specified multiple times. Default is 16.")
+    ap.add_argument("--directed", choices=["directed", "undirected", "both"],
+                    default="both",
+                    help="directedness of the graphs. Default is both.")
+    ap.add_argument("--weight-dtype", action="append",
+                    choices=["none", "float32", "float64"],
+                    help="dtype of the edge weights, or none for unweighted "
+                    "graphs. May be specified multiple times. Default is "
+                    "float32.")
+    ap.add_argument("--renumber", choices=["renumber", "no-renumber", "both"],
+                    default="both",
+                    help="renumber graphs with sparse int64 vertex IDs, or "
+                    "use contiguous int32 IDs without renumbering. Default is "
+                    "both.")
+    ap.add_argument("--algo", action="append", choices=list(OPERATIONS),
+                    help="algo to benchmark. May be specified multiple times. "
+                    "Default is all algos. Graph construction is always "
+                    "benchmarked.")
+    ap.add_argument("--warmup", type=int, default=1,
+                    help="number of untimed runs of each benchmark.")
+    ap.add_argument("--repeat", type=int, default=3,
+                    help="number of timed runs of each benchmark.")
+    ap.add_argument("--seed", type=int, default=42,
+                    help="seed of the graph generators.")
+    ap.add_argument("--max-edges", type=int, default=None,
+                    help="skip the graphs with more edges than MAX_EDGES.")
+    ap.add_argument("--tolerance", type=float, default=0.15,
+                    help="scaling curves whose fitted exponent is above "
+                    "1+TOLERANCE are reported as superlinear.")
+    ap.add_argument("--output-dir", type=str, default=None,
+                    help="directory to write the results (JSON and CSV), "
+                    "the Markdown scaling table and the plots to.")
+    args = ap.parse_args(argv)
+
+    weight_dtypes = [None if dtype == "none" else dtype
+                     for dtype in (args.weight_dtype or ["float32"])]
+    configs = sweep_configs(
+        args.generator or list(synthetic_graphs.GENERATORS),
+        args.edgefactor or [16],
+        _parse_bool_axis(args.directed, "directed", "undirected"),
+        weight_dtypes,
+        _parse_bool_axis(args.renumber, "renumber", "no-renumber"))
+
+    records = run_sweep(configs, args.scales, algos=args.algo,
+                        warmup=args.warmup, repeat=args.repeat,
+                        seed=args.seed, max_edges=args.max_edges)
+    analysis = analyze_scaling(records, tolerance=args.tolerance)
+    print(generate_console_report(analysis))
+
+    errors = [r for r in records if r["error"] is not None]
+    for record in errors:
+        log(f"{record['operation']} failed on {record['generator']} graph of "
+            f"scale {record['scale']}: {record['error']}")
+
+    if args.output_dir is not None:
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        context = {"scales": args.scales,
+                   "warmup": args.warmup,
+                   "repeat": args.repeat,
+                   "seed": args.seed,
+                   "tolerance": args.tolerance,
+                   "processPeakHostRSS": get_peak_rss()}
+        write_json_report(output_dir / "scaling_results.json", records,
+                          analysis, context)
+        write_csv_report(output_dir / "scaling_results.csv", records)
+        with open(output_dir / "scaling_report.md", "w") as md_file:
+            md_file.write(generate_markdown_report(analysis))
+        for path in write_plots(output_dir, analysis):
+            log(f"wrote {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
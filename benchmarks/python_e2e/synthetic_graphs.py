@@ -0,0 +1,144 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generators of synthetic edge lists used by the scaling benchmarks, so they can
+run without downloading datasets.
+
+Each generator creates a graph with 2**scale vertices and (about)
+2**scale * edgefactor edges, returned as a cudf DataFrame with "src" and "dst"
+columns of vertex IDs in [0, 2**scale):
+
+* rmat: R-MAT graph with the Graph500 parameters (skewed degrees, small
+  diameter), like the graphs of main.py.
+* erdos_renyi: uniformly random edges (G(n, m) model), with a narrow degree
+  distribution.
+* power_law: Chung-Lu graph whose expected degrees follow a power law.
+* grid: road-like 2D lattice where each vertex is connected to its right and
+  lower neighbors, with a fraction of the edges removed. The degree of a
+  lattice is fixed, so edgefactor is ignored and the graph has about
+  2**scale * 2 edges.
+"""
+
+import cudf
+import cupy
+
+from cugraph.generators import rmat
+
+
+def _rmat_edgelist(scale, edgefactor, random_state):
+    seed = int(random_state.randint(0, 2**31 - 1))
+    df = rmat(
+        scale,
+        (2**scale)*edgefactor,
+        0.57,  # from Graph500
+        0.19,  # from Graph500
+        0.19,  # from Graph500
+        seed,
+        clip_and_flip=False,
+        scramble_vertex_ids=True,
+        create_using=None,  # return edgelist instead of Graph instance
+        mg=False
+    )
+    return df[["src", "dst"]]
+
+
+def _erdos_renyi_edgelist(scale, edgefactor, random_state):
+    num_vertices = 2**scale
+    num_edges = num_vertices * edgefactor
+    return cudf.DataFrame({
+        "src": random_state.randint(0, num_vertices, size=num_edges,
+                                    dtype="int32"),
+        "dst": random_state.randint(0, num_vertices, size=num_edges,
+                                    dtype="int32"),
+    })
+
+
+def _power_law_edgelist(scale, edgefactor, random_state, exponent=2.1):
+    """
+    Chung-Lu graph: both endpoints of each edge are drawn with a probability
+    proportional to the expected degree of the vertices, which decreases as
+    rank**(-1/(exponent-1)) so the degrees follow a power law of the given
+    exponent.
+    """
+    num_vertices = 2**scale
+    num_edges = num_vertices * edgefactor
+    expected_degrees = cupy.arange(1, num_vertices + 1, dtype="float64") ** \
+        (-1.0 / (exponent - 1.0))
+    cdf = cupy.cumsum(expected_degrees)
+    cdf /= cdf[-1]
+    # Shuffle the IDs so the high degree vertices are not the first ones.
+    ids = random_state.permutation(num_vertices).astype("int32")
+
+    def endpoints():
+        ranks = cupy.searchsorted(cdf, random_state.random_sample(num_edges))
+        return ids[cupy.minimum(ranks, num_vertices - 1)]
+
+    return cudf.DataFrame({"src": endpoints(), "dst": endpoints()})
+
+
+def _grid_edgelist(scale, edgefactor, random_state, drop_fraction=0.1):
+    width = 2**(scale // 2)
+    height = 2**(scale - scale // 2)
+    vertices = cupy.arange(width * height, dtype="int32").reshape(height,
+                                                                  width)
+    src = cupy.concatenate([vertices[:, :-1].ravel(),
+                            vertices[:-1, :].ravel()])
+    dst = cupy.concatenate([vertices[:, 1:].ravel(),
+                            vertices[1:, :].ravel()])
+    keep = random_state.random_sample(len(src)) >= drop_fraction
+    return cudf.DataFrame({"src": src[keep], "dst": dst[keep]})
+
+
+GENERATORS = {"rmat": _rmat_edgelist,
+              "erdos_renyi": _erdos_renyi_edgelist,
+              "power_law": _power_law_edgelist,
+              "grid": _grid_edgelist}
+
+
+def _scatter_vertex_ids(series):
+    """
+    Map the vertex IDs to distinct, non-contiguous int64 values (the
+    multiplication by an odd number is a bijection modulo 2**40), so that
+    renumbering them does the same work as renumbering real-world IDs.
+    """
+    return (series.astype("int64") * 2654435761) % 2**40
+
+
+def generate_edgelist(generator, scale, edgefactor=16, seed=42,
+                      weight_dtype=None, sparse_ids=False):
+    """
+    Return a cudf DataFrame with the "src" and "dst" columns of a graph
+    created by the named generator (see GENERATORS) with 2**scale vertices.
+
+    weight_dtype, if not None, is the dtype of a "weight" column of random
+    values in [0, 1). If sparse_ids is True, the vertex IDs are scattered over
+    the int64 range so they must be renumbered, otherwise they are int32
+    values in [0, 2**scale) that can be used without renumbering.
+    """
+    if generator not in GENERATORS:
+        raise ValueError(f"invalid generator {generator}, must be one of "
+                         f"{list(GENERATORS)}")
+    if scale < 1:
+        raise ValueError("scale must be >= 1")
+    random_state = cupy.random.RandomState(seed)
+    df = GENERATORS[generator](scale, edgefactor, random_state)
+    if sparse_ids:
+        df["src"] = _scatter_vertex_ids(df["src"])
+        df["dst"] = _scatter_vertex_ids(df["dst"])
+    else:
+        df["src"] = df["src"].astype("int32")
+        df["dst"] = df["dst"].astype("int32")
+    if weight_dtype is not None:
+        df["weight"] = random_state.random_sample(len(df), dtype=weight_dtype)
+    return df.reset_index(drop=True)
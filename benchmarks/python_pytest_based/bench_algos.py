@@ -29,6 +29,9 @@ except ImportError:
     def setFixtureParamNames(*args, **kwargs):
         pass
 
+import cudf
+import cupy
+
 import cugraph
 from cugraph.structure.number_map import NumberMap
 from cugraph.testing import utils
@@ -191,6 +194,40 @@ def bench_renumber(gpubenchmark, edgelistCreated):
     gpubenchmark(NumberMap.renumber, edgelistCreated, "0", "1")
 
 
+@pytest.mark.ETL
+@pytest.mark.parametrize("use_pandas", [False, True])
+def bench_symmetrize(gpubenchmark, edgelistCreated, use_pandas):
+    edgelist = edgelistCreated.to_pandas() if use_pandas else edgelistCreated
+    gpubenchmark(cugraph.symmetrize_df, edgelist, "0", "1", "2")
+
+
+@pytest.mark.ETL
+def bench_symmetrize_presymmetric(gpubenchmark, edgelistCreated):
+    edgelist = cugraph.symmetrize_df(edgelistCreated, "0", "1", "2")
+    gpubenchmark(cugraph.symmetrize_df, edgelist, "0", "1", "2")
+
+
+@pytest.mark.ETL
+@pytest.mark.parametrize("use_lookup_index", [True, False])
+@pytest.mark.parametrize("num_vertices", [1_000, 1_000_000, 10_000_000])
+def bench_renumber_lookup(gpubenchmark, num_vertices, use_lookup_index):
+    # Vertex ids are offset so the renumber map is not the identity
+    vertices = cudf.Series(cupy.random.permutation(num_vertices) + 100)
+    edgelist = cudf.DataFrame({"src": vertices,
+                               "dst": vertices.shift(1, fill_value=100)})
+    _, number_map = NumberMap.renumber(edgelist, "src", "dst")
+    number_map.implementation.use_lookup_index = use_lookup_index
+
+    queries = vertices.sample(n=min(num_vertices, 1000), random_state=0)
+
+    def lookup():
+        ids = number_map.to_internal_vertex_id(queries)
+        return number_map.unrenumber(cudf.DataFrame({"vertex": ids}),
+                                     "vertex", preserve_order=True)
+
+    gpubenchmark(lookup)
+
+
 def bench_pagerank(gpubenchmark, anyGraphWithTransposedAdjListComputed):
     gpubenchmark(cugraph.pagerank, anyGraphWithTransposedAdjListComputed)
 
@@ -199,6 +236,31 @@ def bench_bfs(gpubenchmark, anyGraphWithAdjListComputed):
     gpubenchmark(cugraph.bfs, anyGraphWithAdjListComputed, 0)
 
 
+def bench_plc_graph_construction(gpubenchmark, anyGraphWithAdjListComputed):
+    # Measures the cost paid on every algorithm call when the pylibcugraph
+    # graph is not cached.
+    G = anyGraphWithAdjListComputed
+
+    def build():
+        G.clear_plc_graph_cache()
+        return G._get_plc_graph()
+
+    gpubenchmark(build)
+
+
+def bench_plc_graph_cached(gpubenchmark, anyGraphWithAdjListComputed):
+    G = anyGraphWithAdjListComputed
+    G._get_plc_graph()
+    gpubenchmark(G._get_plc_graph)
+
+
+def bench_get_traversed_paths(gpubenchmark, anyGraphWithAdjListComputed):
+    bfs_df = cugraph.bfs(anyGraphWithAdjListComputed, 0)
+    targets = bfs_df["vertex"].sample(n=min(len(bfs_df), 5000),
+                                      random_state=0)
+    gpubenchmark(cugraph.utils.get_traversed_paths, bfs_df, targets)
+
+
 def bench_force_atlas2(gpubenchmark, anyGraphWithAdjListComputed):
     gpubenchmark(cugraph.force_atlas2, anyGraphWithAdjListComputed,
                  max_iter=50)
@@ -45,6 +45,7 @@ from cugraph.structure import (
     to_numpy_array,
     from_numpy_matrix,
     to_numpy_matrix,
+    to_scipy_sparse,
     from_adjlist,
     hypergraph,
     symmetrize,
@@ -100,6 +101,12 @@ from cugraph.traversal import (
 from cugraph.tree import minimum_spanning_tree, maximum_spanning_tree
 
 from cugraph.utilities import utils
+from cugraph.utilities import (
+    estimate_memory,
+    set_memory_budget,
+    get_memory_budget,
+)
+from cugraph.utilities import tracing
 
 from cugraph.experimental import strong_connected_component
 from cugraph.experimental import find_bicliques
@@ -16,9 +16,10 @@ import numpy as np
 import cudf
 from cugraph.centrality import betweenness_centrality_wrapper
 from cugraph.centrality import edge_betweenness_centrality_wrapper
-from cugraph.utilities import (df_edge_score_to_dictionary,
-                               df_score_to_dictionary,
+from cugraph.utilities import (df_edge_score_to_mapping,
+                               df_score_to_mapping,
                                ensure_cugraph_obj_for_nx,
+                               memory_planner,
                                )
 
 
@@ -131,6 +132,12 @@ def betweenness_centrality(
     G, isNx = ensure_cugraph_obj_for_nx(G)
 
     vertices = _initialize_vertices(G, k, seed)
+    # The traversals from all the sources reuse the same work buffers, so
+    # the footprint does not depend on the number of sources and the sources
+    # are not split in batches.
+    memory_planner.check_memory(
+        G, "betweenness_centrality", k=len(vertices),
+        result_itemsize=np.dtype(result_dtype).itemsize)
 
     df = betweenness_centrality_wrapper.betweenness_centrality(
         G, normalized, endpoints, weight, vertices, result_dtype
@@ -140,7 +147,7 @@ def betweenness_centrality(
         df = G.unrenumber(df, "vertex")
 
     if isNx is True:
-        dict = df_score_to_dictionary(df, 'betweenness_centrality')
+        dict = df_score_to_mapping(df, 'betweenness_centrality')
         return dict
     else:
         return df
@@ -252,6 +259,9 @@ def edge_betweenness_centrality(
 
     G, isNx = ensure_cugraph_obj_for_nx(G)
     vertices = _initialize_vertices(G, k, seed)
+    memory_planner.check_memory(
+        G, "edge_betweenness_centrality", k=len(vertices),
+        result_itemsize=np.dtype(result_dtype).itemsize)
 
     df = edge_betweenness_centrality_wrapper.edge_betweenness_centrality(
         G, normalized, weight, vertices, result_dtype
@@ -275,7 +285,7 @@ def edge_betweenness_centrality(
         df = df.groupby(by=["src", "dst"]).sum().reset_index()
 
     if isNx is True:
-        return df_edge_score_to_dictionary(df, 'betweenness_centrality')
+        return df_edge_score_to_mapping(df, 'betweenness_centrality')
     else:
         return df
 
@@ -13,7 +13,7 @@
 
 
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
-                               df_score_to_dictionary,
+                               df_score_to_mapping,
                                )
 
 
@@ -58,7 +58,7 @@ def degree_centrality(G, normalized=True):
         df["degree_centrality"] /= (G.number_of_nodes() - 1)
 
     if isNx is True:
-        dict = df_score_to_dictionary(df, "degree_centrality")
+        dict = df_score_to_mapping(df, "degree_centrality")
         return dict
     else:
         return df
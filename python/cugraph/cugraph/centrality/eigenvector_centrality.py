@@ -12,15 +12,12 @@
 # limitations under the License.
 
 from pylibcugraph import (ResourceHandle,
-                          GraphProperties,
-                          SGGraph,
                           eigenvector_centrality as pylib_eigen
                           )
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
-                               df_score_to_dictionary,
+                               df_score_to_mapping,
                                )
 import cudf
-import cupy
 
 
 def eigenvector_centrality(
@@ -83,23 +80,12 @@ def eigenvector_centrality(
 
     G, isNx = ensure_cugraph_obj_for_nx(G)
 
-    srcs = G.edgelist.edgelist_df['src']
-    dsts = G.edgelist.edgelist_df['dst']
-    if 'weights' in G.edgelist.edgelist_df.columns:
-        weights = G.edgelist.edgelist_df['weights']
-    else:
-        # FIXME: If weights column is not imported, a weights column of 1s
-        # with type hardcoded to float32 is passed into wrapper
-        weights = cudf.Series(cupy.ones(srcs.size, dtype="float32"))
-
     resource_handle = ResourceHandle()
-    graph_props = GraphProperties(is_multigraph=G.is_multigraph())
-    store_transposed = False
-    renumber = False
     do_expensive_check = False
 
-    sg = SGGraph(resource_handle, graph_props, srcs, dsts, weights,
-                 store_transposed, renumber, do_expensive_check)
+    # FIXME: If weights column is not imported, a weights column of 1s
+    # with type hardcoded to float32 is passed into wrapper
+    sg = G._get_plc_graph()
 
     vertices, values = pylib_eigen(resource_handle, sg,
                                    tol, max_iter,
@@ -116,7 +102,7 @@ def eigenvector_centrality(
         df = G.unrenumber(df, "vertex")
 
     if isNx is True:
-        dict = df_score_to_dictionary(df, "eigenvector_centrality")
+        dict = df_score_to_mapping(df, "eigenvector_centrality")
         return dict
     else:
         return df
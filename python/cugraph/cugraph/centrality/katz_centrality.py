@@ -12,16 +12,16 @@
 # limitations under the License.
 
 from pylibcugraph import (ResourceHandle,
-                          GraphProperties,
-                          SGGraph,
                           katz_centrality as pylibcugraph_katz
                           )
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
-                               df_score_to_dictionary,
+                               df_score_to_mapping,
+                               tracing,
                                )
 import cudf
 
 
+@tracing.traced(category="algorithm")
 def katz_centrality(
     G, alpha=None, beta=1.0, max_iter=100, tol=1.0e-6,
     nstart=None, normalized=True
@@ -133,15 +133,6 @@ def katz_centrality(
     if (not isinstance(tol, float)) or (tol <= 0.0):
         raise ValueError(f"'tol' must be a positive float, got: {tol}")
 
-    srcs = G.edgelist.edgelist_df['src']
-    dsts = G.edgelist.edgelist_df['dst']
-    if 'weights' in G.edgelist.edgelist_df.columns:
-        weights = G.edgelist.edgelist_df['weights']
-    else:
-        # FIXME: If weights column is not imported, a weights column of 1s
-        # with type hardcoded to float32 is passed into wrapper
-        weights = cudf.Series((srcs + 1) / (srcs + 1), dtype="float32")
-
     if nstart is not None:
         if G.renumbered is True:
             if len(G.renumber_map.implementation.col_names) > 1:
@@ -152,30 +143,30 @@ def katz_centrality(
             nstart = nstart[nstart.columns[0]]
 
     resource_handle = ResourceHandle()
-    graph_props = GraphProperties(is_multigraph=G.is_multigraph())
-    store_transposed = False
-    renumber = False
     do_expensive_check = False
 
-    sg = SGGraph(resource_handle, graph_props, srcs, dsts, weights,
-                 store_transposed, renumber, do_expensive_check)
+    # FIXME: If weights column is not imported, a weights column of 1s
+    # with type hardcoded to float32 is passed into wrapper
+    sg = G._get_plc_graph()
 
-    vertices, values = pylibcugraph_katz(resource_handle, sg, nstart, alpha,
-                                         beta, tol, max_iter,
-                                         do_expensive_check)
+    with tracing.span("compute") as s:
+        vertices, values = pylibcugraph_katz(resource_handle, sg, nstart,
+                                             alpha, beta, tol, max_iter,
+                                             do_expensive_check)
 
-    vertices = cudf.Series(vertices)
-    values = cudf.Series(values)
+        vertices = cudf.Series(vertices)
+        values = cudf.Series(values)
 
-    df = cudf.DataFrame()
-    df["vertex"] = vertices
-    df["katz_centrality"] = values
+        df = cudf.DataFrame()
+        df["vertex"] = vertices
+        df["katz_centrality"] = values
+        s.set(rows=len(df))
 
     if G.renumbered:
         df = G.unrenumber(df, "vertex")
 
     if isNx is True:
-        dict = df_score_to_dictionary(df, "katz_centrality")
+        dict = df_score_to_mapping(df, "katz_centrality")
         return dict
     else:
         return df
@@ -18,6 +18,7 @@ from cugraph.utilities import (
     is_nx_graph_type,
 )
 from cugraph.utilities import cugraph_to_nx
+from cugraph.utilities import memory_planner
 
 
 def _convert_graph_to_output_type(G, input_type):
@@ -118,12 +119,17 @@ def ego_graph(G, n, radius=1, center=True, undirected=False, distance=None):
 
 
 def batched_ego_graphs(
-    G, seeds, radius=1, center=True, undirected=False, distance=None
+    G, seeds, radius=1, center=True, undirected=False, distance=None,
+    batch_size=None
 ):
     """
     Compute the induced subgraph of neighbors for each node in seeds
     within a given radius.
 
+    The seeds are processed in batches sized to fit the device memory budget
+    (see cugraph.set_memory_budget()), since the extraction uses memory
+    proportional to the number of vertices for each seed.
+
     Parameters
     ----------
     G : cugraph.Graph, networkx.Graph, CuPy or SciPy sparse matrix
@@ -146,6 +152,10 @@ def batched_ego_graphs(
     distance: key, optional (default=None)
         Distances are counted in hops from n. Other cases are not supported.
 
+    batch_size : int, optional (default=None)
+        The number of seeds to process at once. If None, the number of seeds
+        estimated to fit in the device memory budget is used.
+
     Returns
     -------
     ego_edge_lists : cudf.DataFrame or pandas.DataFrame
@@ -175,11 +185,42 @@ def batched_ego_graphs(
             seeds = G.lookup_internal_vertex_id(seeds, seeds.columns)
         else:
             seeds = G.lookup_internal_vertex_id(cudf.Series(seeds))
+    elif not isinstance(seeds, (cudf.Series, cudf.DataFrame)):
+        seeds = cudf.Series(seeds)
 
-    df, offsets = egonet_wrapper.egonet(G, seeds, radius)
+    if batch_size is None:
+        batch_size = memory_planner.get_batch_size(
+            G, "batched_ego_graphs", len(seeds), radius=radius)
+    df, offsets = _batched_egonet(G, seeds, radius, batch_size)
 
     if G.renumbered:
         df = G.unrenumber(df, "src", preserve_order=True)
         df = G.unrenumber(df, "dst", preserve_order=True)
 
     return _convert_df_series_to_output_type(df, offsets, input_type)
+
+
+def _batched_egonet(G, seeds, radius, batch_size):
+    """
+    Extract the egonets of seeds batch_size seeds at a time, returning the
+    concatenated edge lists and the offsets of each seed in them.
+    """
+    if batch_size >= len(seeds):
+        return egonet_wrapper.egonet(G, seeds, radius)
+
+    results = []
+    offsets = []
+    num_edges = 0
+    for (start, end) in memory_planner.split_batches(seeds, batch_size):
+        df, batch_offsets = egonet_wrapper.egonet(
+            G, seeds.iloc[start:end].reset_index(drop=True), radius)
+        # The wrapper returns the offsets as a column. Each batch starts
+        # with a 0 offset, which is the end of the previous batch.
+        batch_offsets = cudf.Series(batch_offsets)
+        if offsets:
+            batch_offsets = batch_offsets.iloc[1:]
+        results.append(df)
+        offsets.append(batch_offsets + num_edges)
+        num_edges += len(df)
+    df = cudf.concat(results, ignore_index=True)
+    return df, cudf.concat(offsets, ignore_index=True)
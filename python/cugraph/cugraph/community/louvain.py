@@ -14,9 +14,11 @@
 from cugraph.community import louvain_wrapper
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
                                df_score_to_dictionary,
+                               tracing,
                                )
 
 
+@tracing.traced(category="algorithm")
 def louvain(G, max_iter=100, resolution=1.):
     """
     Compute the modularity optimizing partition of the input graph using the
@@ -80,9 +82,11 @@ def louvain(G, max_iter=100, resolution=1.):
     if G.is_directed():
         raise ValueError("input graph must be undirected")
 
-    parts, modularity_score = louvain_wrapper.louvain(
-        G, max_iter, resolution
-    )
+    with tracing.span("compute") as s:
+        parts, modularity_score = louvain_wrapper.louvain(
+            G, max_iter, resolution
+        )
+        s.set(rows=len(parts))
 
     if G.renumbered:
         parts = G.unrenumber(parts, "vertex")
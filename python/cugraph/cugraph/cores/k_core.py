@@ -14,10 +14,12 @@
 from cugraph.cores import k_core_wrapper, core_number_wrapper
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
                                cugraph_to_nx,
+                               tracing,
                                )
 from cugraph.structure.graph_classes import Graph
 
 
+@tracing.traced(category="algorithm")
 def k_core(G, k=None, core_number=None):
     """
     Compute the k-core of the graph G based on the out degree of its nodes. A
@@ -81,7 +83,9 @@ def k_core(G, k=None, core_number=None):
                                                    cols)
 
     else:
-        core_number = core_number_wrapper.core_number(G)
+        with tracing.span("compute", step="core_number") as s:
+            core_number = core_number_wrapper.core_number(G)
+            s.set(rows=len(core_number))
         core_number = core_number.rename(
             columns={"core_number": "values"}, copy=False
         )
@@ -89,7 +93,9 @@ def k_core(G, k=None, core_number=None):
     if k is None:
         k = core_number["values"].max()
 
-    k_core_df = k_core_wrapper.k_core(G, k, core_number)
+    with tracing.span("compute", step="k_core") as s:
+        k_core_df = k_core_wrapper.k_core(G, k, core_number)
+        s.set(rows=len(k_core_df))
 
     if G.renumbered:
         k_core_df, src_names = G.unrenumber(k_core_df, "src",
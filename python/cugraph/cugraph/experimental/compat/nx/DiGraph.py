@@ -13,11 +13,19 @@
 
 import networkx as nx
 
+from cugraph.experimental.compat.nx.edge_store import EdgeStoreMixin
 
-class DiGraph(nx.DiGraph):
+
+class DiGraph(EdgeStoreMixin, nx.DiGraph):
     """
     Class which extends NetworkX DiGraph class. It provides original
     NetworkX functionality and will be overridden as this compatibility
     layer moves functionality to gpus in future releases.
+
+    The edges are also kept in a columnar EdgeStore (G.edge_store), updated
+    as nodes and edges are added and removed, which the compat algorithms
+    use instead of converting the graph on every call.
     """
-    pass
+    def to_undirected_class(self):
+        from cugraph.experimental.compat.nx.Graph import Graph
+        return Graph
@@ -13,11 +13,19 @@
 
 import networkx as nx
 
+from cugraph.experimental.compat.nx.edge_store import EdgeStoreMixin
 
-class Graph(nx.Graph):
+
+class Graph(EdgeStoreMixin, nx.Graph):
     """
     Class which extends NetworkX Graph class. It provides original
     NetworkX functionality and will be overridden as this compatibility
     layer moves functionality to gpus in future releases.
+
+    The edges are also kept in a columnar EdgeStore (G.edge_store), updated
+    as nodes and edges are added and removed, which the compat algorithms
+    use instead of converting the graph on every call.
     """
-    pass
+    def to_directed_class(self):
+        from cugraph.experimental.compat.nx.DiGraph import DiGraph
+        return DiGraph
@@ -39,6 +39,9 @@ from networkx import *
 # also be present in the same namespaces.
 # Refer to the networkx __init__.py files when adding new overriding
 # modules to ensure the same paths and used and namespaces are populated.
+from cugraph.experimental.compat.nx.Graph import Graph
+from cugraph.experimental.compat.nx.DiGraph import DiGraph
+
 from cugraph.experimental.compat.nx import algorithms
 from cugraph.experimental.compat.nx.algorithms import *
 
@@ -13,8 +13,16 @@
 
 import cugraph
 import cugraph.utilities
+from cugraph.experimental.compat.nx.edge_store import (
+    EdgeStore, get_edge_store)
+from cugraph.utilities.nx_factory import _to_host
+from cugraph.utilities.utils import import_optional
 import cudf
 import numpy as np
+from numba import cuda
+
+nx = import_optional("networkx")
+sp_sparse = import_optional("scipy.sparse")
 
 
 def create_cudf_from_dict(dict_in):
@@ -56,6 +64,11 @@ def pagerank(
     In future releases it will maintain compatibility but will migrate more
     of the workflow to the GPU.
 
+    The compat Graph and DiGraph classes keep their edges in an EdgeStore,
+    which is used instead of converting the graph on every call. When no
+    GPU is available, pagerank is computed on the CPU with a SciPy sparse
+    power iteration.
+
     Parameters
     ----------
     G : networkx.Graph
@@ -94,19 +107,35 @@ def pagerank(
         nstart['values'] : cudf.Series
             Pagerank values for vertices
 
-    weight: str, optional (default=None)
-        This parameter is here for NetworkX compatibility and not
-        yet supported in this algorithm
+    weight: str, optional (default="weight")
+        The edge attribute used as the weight of the edges of the compat
+        Graph and DiGraph classes and when no GPU is available (edges
+        missing the attribute have a weight of 1).
 
     dangling : dict, optional (default=None)
-        This parameter is here for NetworkX compatibility and ignored
+        The outedges to assign to dangling nodes when no GPU is available,
+        as in NetworkX. It is ignored on the GPU.
 
     Returns
     -------
         PageRank : dictionary
-               A dictionary of nodes with the PageRank as value
+               A dictionary (or read-only mapping) of nodes with the PageRank
+               as value
 
     """
+    store = get_edge_store(G)
+    if not _gpu_available():
+        if G.is_multigraph():
+            return nx.pagerank(G, alpha, personalization, max_iter, tol,
+                               nstart, weight, dangling)
+        if store is None:
+            store = EdgeStore.from_graph(G)
+        return _pagerank_scipy(store, alpha, personalization, max_iter, tol,
+                               nstart, weight, dangling)
+    if store is not None:
+        return _pagerank_edge_store(store, alpha, personalization, max_iter,
+                                    tol, nstart, weight)
+
     local_pers = None
     local_nstart = None
     if (personalization is not None):
@@ -122,3 +151,118 @@ def pagerank(
             local_nstart,
             weight,
             dangling)
+
+
+def _gpu_available():
+    """
+    Return True if a GPU is available to run the cugraph algorithms.
+    """
+    return cuda.is_available()
+
+
+def _create_cudf_from_edge_store(store, dict_in, dtype):
+    """
+    Return a cudf.DataFrame of the vertex IDs in store of the nodes in the
+    dictionary dict_in and their values, ignoring the nodes not in store.
+    """
+    (vertices, found) = store.get_vertices(dict_in.keys())
+    values = np.fromiter(dict_in.values(), dtype="float32",
+                         count=len(dict_in))
+    return cudf.DataFrame({"vertex": vertices[found].astype(dtype),
+                           "values": values[found]})
+
+
+def _pagerank_edge_store(store, alpha, personalization, max_iter, tol,
+                         nstart, weight):
+    """
+    Run the cugraph pagerank algorithm on the edges of the EdgeStore store.
+
+    The cugraph graph is created from the vertex IDs of the store (so no
+    renumbering is needed) and kept in the store cache, to be reused until
+    the store or the weights change.
+    """
+    (src, dst, weights) = store.get_edges(weight)
+    dtype = "int32" if len(store.nodes) < 2**31 else "int64"
+    (cached_weights, G) = store.cache.get(("pagerank", weight), (None, None))
+    if G is None or (
+            weights is not None and not np.array_equal(weights,
+                                                       cached_weights)):
+        gdf = cudf.DataFrame({"src": src.astype(dtype),
+                              "dst": dst.astype(dtype)})
+        edge_attr = None
+        if weights is not None:
+            gdf["weight"] = weights
+            edge_attr = "weight"
+        G = cugraph.Graph(directed=store.directed)
+        G.from_cudf_edgelist(gdf, source="src", destination="dst",
+                             edge_attr=edge_attr, renumber=False)
+        # Without renumbering, the number of vertices is inferred from the
+        # largest vertex ID of the edges, which leaves out the isolated nodes
+        # with larger IDs.
+        G.properties.node_count = len(store.nodes)
+        store.cache[("pagerank", weight)] = (weights, G)
+
+    local_pers = None
+    local_nstart = None
+    if personalization is not None:
+        local_pers = _create_cudf_from_edge_store(store, personalization,
+                                                  dtype)
+    if nstart is not None:
+        local_nstart = _create_cudf_from_edge_store(store, nstart, dtype)
+    df = cugraph.pagerank(G, alpha, local_pers, max_iter, tol, local_nstart)
+    return store.to_mapping(_to_host(df["pagerank"]),
+                            _to_host(df["vertex"]))
+
+
+def _pagerank_scipy(store, alpha, personalization, max_iter, tol, nstart,
+                    weight, dangling):
+    """
+    Compute pagerank on the CPU with a SciPy sparse power iteration over the
+    CSR matrix of the EdgeStore store, with the same semantics (and
+    convergence criterion) as networkx.pagerank.
+    """
+    N = store.num_nodes
+    if N == 0:
+        return {}
+
+    A = store.to_csr(weight)
+    S = np.asarray(A.sum(axis=1)).ravel()
+    is_dangling = S == 0
+    S[~is_dangling] = 1.0 / S[~is_dangling]
+    # The transposed transition matrix, so each iteration is a single
+    # sparse matrix-vector product.
+    AT = (sp_sparse.diags(S) @ A).T.tocsr()
+
+    # initial vector
+    if nstart is None:
+        x = np.repeat(1.0 / N, N)
+    else:
+        x = store.to_vector(nstart)
+        x /= x.sum()
+
+    # Personalization vector
+    if personalization is None:
+        p = np.repeat(1.0 / N, N)
+    else:
+        p = store.to_vector(personalization)
+        if p.sum() == 0:
+            raise ZeroDivisionError
+        p /= p.sum()
+
+    # Dangling nodes
+    if dangling is None:
+        dangling_weights = p
+    else:
+        dangling_weights = store.to_vector(dangling)
+        dangling_weights /= dangling_weights.sum()
+
+    # power iteration: make up to max_iter iterations
+    for _ in range(max_iter):
+        xlast = x
+        x = alpha * (AT @ x + x[is_dangling].sum() * dangling_weights) + \
+            (1 - alpha) * p
+        # check convergence, l1 norm
+        err = np.absolute(x - xlast).sum()
+        if err < N * tol:
+            return store.to_mapping(x)
+    raise nx.PowerIterationFailedConvergence(max_iter)
@@ -0,0 +1,547 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shadow columnar edge store of the nx compat Graph and DiGraph classes.
+
+The compat graph classes keep a copy of their edges in NumPy arrays, updated
+as edges and nodes are added and removed, so the algorithms overridden by the
+compat layer can get the edges in bulk (or as a CSR matrix) without
+converting the graph on every call.
+"""
+
+from itertools import chain, repeat
+from operator import methodcaller
+
+import numpy as np
+import pandas as pd
+
+from cugraph.utilities.nx_factory import ScoreMapping
+from cugraph.utilities.utils import import_optional
+
+sp_sparse = import_optional("scipy.sparse")
+
+# Placeholder of the removed nodes in EdgeStore._nodes.
+_REMOVED = object()
+
+
+class EdgeStore:
+    """
+    Columnar copy of the edges of a (non-multi) NetworkX graph.
+
+    Each node is given a code, its position in the order the nodes were
+    added, and the edges are kept in NumPy arrays of source and destination
+    codes. Each edge of an undirected graph is kept once, with the smaller
+    code as the source. The edge data dicts are shared with the graph, so the
+    weights are always read from the current edge attributes.
+
+    Removed edges and nodes are only marked as removed, and the arrays are
+    compacted once more than half of them are removed. The edges, nodes and
+    CSR matrix returned to the algorithms are computed for the edges and
+    nodes currently in the store, and cached until the store changes.
+
+    Parameters
+    ----------
+    directed : bool
+        Whether the edges are directed.
+    """
+    def __init__(self, directed):
+        self.directed = directed
+        # The adjacency dict of the graph the store is kept in sync with.
+        self.adj = None
+        # The number of changes made to the store, used to detect that the
+        # graph changed (see cugraph.utilities.convert_from_nx()).
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        """
+        Remove all the nodes and edges.
+        """
+        self._codes = {}
+        self._nodes = []
+        self._num_removed_nodes = 0
+        self.clear_edges()
+        self._stale = False
+
+    def clear_edges(self):
+        """
+        Remove all the edges.
+        """
+        self._src = np.empty(0, dtype="int64")
+        self._dst = np.empty(0, dtype="int64")
+        self._data = np.empty(0, dtype=object)
+        self._alive = np.empty(0, dtype=bool)
+        self._positions = {}
+        self._size = 0
+        self._changed()
+
+    def invalidate(self):
+        """
+        Mark the store as out of sync with its graph, so it is rebuilt the
+        next time it is used. Updates are ignored until then.
+        """
+        self._stale = True
+        self._changed()
+
+    def _changed(self):
+        # Data derived from the edges and nodes by the algorithms (and by
+        # _get_view and to_csr) is kept in cache until the store changes.
+        self.cache = {}
+        self.version += 1
+
+    @property
+    def num_nodes(self):
+        return len(self._codes)
+
+    @property
+    def num_edges(self):
+        return len(self._positions)
+
+    # ---------------------------------------------------------------------
+    # Updates
+    def add_node(self, n):
+        """
+        Add node n if it is not already in the store, and return its code.
+        """
+        code = self._codes.get(n)
+        if code is None:
+            code = len(self._nodes)
+            self._codes[n] = code
+            self._nodes.append(n)
+            self._changed()
+        return code
+
+    def _key(self, cu, cv):
+        if self.directed or cu <= cv:
+            return (cu, cv)
+        return (cv, cu)
+
+    def add_edge(self, u, v, data):
+        """
+        Add the edge (u, v) with the edge data dict data, if it is not
+        already in the store.
+        """
+        self.add_edges([(u, v, data)])
+
+    def add_edges(self, edges):
+        """
+        Add the edges (u, v, data) of the iterable edges that are not already
+        in the store, where data is the edge data dict of the edge.
+        """
+        if self._stale:
+            return
+        (codes, nodes, positions) = (self._codes, self._nodes,
+                                     self._positions)
+
+        def add_node(n):
+            code = codes.get(n)
+            if code is None:
+                code = codes[n] = len(nodes)
+                nodes.append(n)
+            return code
+
+        (keys, data) = ([], [])
+        for (u, v, d) in edges:
+            key = self._key(add_node(u), add_node(v))
+            if key not in positions:
+                positions[key] = self._size + len(keys)
+                keys.append(key)
+                data.append(d)
+        self._changed()
+        if not keys:
+            return
+
+        size = self._size + len(keys)
+        if size > len(self._src):
+            self._grow(size)
+        (self._src[self._size:size], self._dst[self._size:size]) = \
+            np.array(keys, dtype="int64").T
+        self._data[self._size:size] = data
+        self._alive[self._size:size] = True
+        self._size = size
+
+    def _grow(self, size):
+        capacity = max(16, 2 * len(self._src), size)
+        for name in ("_src", "_dst", "_data", "_alive"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            setattr(self, name, grown)
+
+    def remove_edge(self, u, v):
+        """
+        Remove the edge (u, v) if it is in the store.
+        """
+        if self._stale:
+            return
+        (cu, cv) = (self._codes.get(u), self._codes.get(v))
+        if cu is None or cv is None:
+            return
+        i = self._positions.pop(self._key(cu, cv), None)
+        if i is None:
+            return
+        self._alive[i] = False
+        self._data[i] = None
+        self._changed()
+        if len(self._positions) < self._size // 2:
+            self._compact()
+
+    def remove_node(self, n, edges):
+        """
+        Remove node n, and the edges (u, v) of edges, which must include all
+        the edges of n.
+        """
+        if self._stale or n not in self._codes:
+            return
+        for (u, v) in edges:
+            self.remove_edge(u, v)
+        code = self._codes.pop(n)
+        self._nodes[code] = _REMOVED
+        self._num_removed_nodes += 1
+        self._changed()
+        if self._num_removed_nodes > len(self._nodes) // 2:
+            self._compact()
+
+    def _get_node_remap(self):
+        """
+        Return the array mapping the codes to the codes of the nodes after
+        the removed nodes are dropped (-1 for the removed nodes), or None if
+        no node was removed.
+        """
+        if self._num_removed_nodes == 0:
+            return None
+        live = np.fromiter((n is not _REMOVED for n in self._nodes),
+                           dtype=bool, count=len(self._nodes))
+        remap = np.cumsum(live) - 1
+        remap[~live] = -1
+        return remap
+
+    def _compact(self):
+        """
+        Drop the removed edges and nodes from the arrays, updating the codes.
+        """
+        keep = np.flatnonzero(self._alive[:self._size])
+        (src, dst) = (self._src[keep], self._dst[keep])
+        remap = self._get_node_remap()
+        if remap is not None:
+            (src, dst) = (remap[src], remap[dst])
+            self._nodes = [n for n in self._nodes if n is not _REMOVED]
+            self._codes = dict(zip(self._nodes, range(len(self._nodes))))
+            self._num_removed_nodes = 0
+        self._data = self._data[keep]
+        self._alive = np.ones(len(keep), dtype=bool)
+        (self._src, self._dst) = (src, dst)
+        self._size = len(keep)
+        self._positions = dict(zip(zip(src.tolist(), dst.tolist()),
+                                   range(len(keep))))
+        self._changed()
+
+    # ---------------------------------------------------------------------
+    # Synchronization with a graph
+    @classmethod
+    def from_graph(cls, G):
+        """
+        Return a new EdgeStore of the edges and nodes of the NetworkX graph
+        G.
+        """
+        store = cls(G.is_directed())
+        store.rebuild(G)
+        return store
+
+    def rebuild(self, G):
+        """
+        Replace the contents of the store with the edges and nodes of the
+        NetworkX graph G, pulling the edges from the adjacency dicts in bulk.
+        """
+        if G.is_multigraph():
+            raise TypeError("EdgeStore does not support multigraphs")
+        self.clear()
+        # The adjacency (successors for directed graphs) of each node is a
+        # dict of {neighbor: edge data}.
+        adj = G._adj
+        nodes = list(adj)
+        self._nodes = nodes
+        self._codes = dict(zip(nodes, range(len(nodes))))
+        degrees = np.fromiter(map(len, adj.values()), dtype="int64",
+                              count=len(nodes))
+        num_edges = int(degrees.sum())
+        src = np.repeat(np.arange(len(nodes), dtype="int64"), degrees)
+        dst = np.fromiter(map(self._codes.__getitem__,
+                              chain.from_iterable(adj.values())),
+                          dtype="int64", count=num_edges)
+        data = np.empty(num_edges, dtype=object)
+        data[:] = list(chain.from_iterable(map(methodcaller("values"),
+                                               adj.values())))
+        if not self.directed:
+            # The adjacency of an undirected graph has both directions of
+            # each edge (but self loops only once).
+            keep = src <= dst
+            (src, dst, data) = (src[keep], dst[keep], data[keep])
+
+        (self._src, self._dst, self._data) = (src, dst, data)
+        self._alive = np.ones(len(src), dtype=bool)
+        self._size = len(src)
+        self._positions = dict(zip(zip(src.tolist(), dst.tolist()),
+                                   range(len(src))))
+        self.adj = adj
+        self._changed()
+
+    def sync(self, G):
+        """
+        Bring the store up to date with the NetworkX graph G and return it.
+
+        The store is rebuilt if it is not kept in sync with G (or was
+        invalidated); otherwise only the nodes added to G without edges are
+        added to the store.
+        """
+        if self._stale or self.adj is not G._adj:
+            self.rebuild(G)
+        elif len(G._node) != self.num_nodes:
+            for n in G._node:
+                if n not in self._codes:
+                    self.add_node(n)
+            if len(G._node) != self.num_nodes:
+                self.rebuild(G)
+        return self
+
+    # ---------------------------------------------------------------------
+    # Access
+    def _get_view(self):
+        """
+        Return (nodes, src, dst, positions, remap) for the edges and nodes
+        currently in the store, where positions are the positions of the
+        edges in the arrays, and remap is the result of _get_node_remap().
+        """
+        view = self.cache.get("view")
+        if view is None:
+            positions = np.flatnonzero(self._alive[:self._size])
+            (src, dst) = (self._src[positions], self._dst[positions])
+            remap = self._get_node_remap()
+            if remap is None:
+                nodes = self._nodes
+            else:
+                nodes = [n for n in self._nodes if n is not _REMOVED]
+                (src, dst) = (remap[src], remap[dst])
+            # Let pandas infer the type of the nodes (numeric, strings, ...).
+            node_values = pd.Index(nodes, tupleize_cols=False).values
+            view = (node_values, src, dst, positions, remap)
+            self.cache["view"] = view
+        return view
+
+    @property
+    def nodes(self):
+        """
+        The array of the nodes, indexed by vertex ID.
+        """
+        return self._get_view()[0]
+
+    def get_edges(self, weight=None):
+        """
+        Return the (src, dst, weights) arrays of the edges, where src and dst
+        are vertex IDs (positions in nodes) and weights is None if weight is
+        None. Edges missing the weight attribute have a weight of 1.
+        """
+        (_, src, dst, _, _) = self._get_view()
+        return (src, dst, self.get_weights(weight))
+
+    def get_weights(self, weight):
+        """
+        Return the array of the weight attributes of the edges (in the order
+        of get_edges()), using 1 for edges missing the attribute, or None if
+        weight is None.
+        """
+        if weight is None:
+            return None
+        positions = self._get_view()[3]
+        return np.fromiter(
+            map(methodcaller("get", weight, 1.0), self._data[positions]),
+            dtype="float64", count=len(positions))
+
+    def to_csr(self, weight="weight"):
+        """
+        Return the adjacency matrix as a scipy.sparse.csr_matrix indexed by
+        vertex ID, with both directions of the edges of undirected graphs.
+        Entries are the weight attributes of the edges (1 for edges missing
+        the attribute), or 1 if weight is None.
+
+        The structure of the matrix is cached until the store changes; only
+        the weights are read again from the edge attributes.
+        """
+        num_nodes = len(self.nodes)
+        csr = self.cache.get("csr")
+        if csr is None:
+            (_, src, dst, _, _) = self._get_view()
+            edges = np.arange(len(src))
+            if not self.directed:
+                mirror = np.flatnonzero(src != dst)
+                (src, dst) = (np.concatenate([src, dst[mirror]]),
+                              np.concatenate([dst, src[mirror]]))
+                edges = np.concatenate([edges, mirror])
+            order = np.lexsort((dst, src))
+            indptr = np.zeros(num_nodes + 1, dtype="int64")
+            np.cumsum(np.bincount(src, minlength=num_nodes),
+                      out=indptr[1:])
+            csr = (indptr, dst[order], edges[order])
+            self.cache["csr"] = csr
+
+        (indptr, indices, edges) = csr
+        if weight is None:
+            data = np.ones(len(indices), dtype="float64")
+        else:
+            data = self.get_weights(weight)[edges]
+        return sp_sparse.csr_matrix((data, indices, indptr),
+                                    shape=(num_nodes, num_nodes))
+
+    def get_vertices(self, nodes):
+        """
+        Return the array of the vertex IDs of the nodes in the iterable
+        nodes, and the boolean array of which nodes are in the store (the
+        IDs of the other nodes are -1).
+        """
+        nodes = list(nodes)
+        vertices = np.fromiter(map(self._codes.get, nodes, repeat(-1)),
+                               dtype="int64", count=len(nodes))
+        found = vertices >= 0
+        remap = self._get_view()[4]
+        if remap is not None:
+            vertices[found] = remap[vertices[found]]
+        return (vertices, found)
+
+    def to_vector(self, values):
+        """
+        Return the array of the values of the dict values of {node: value}
+        indexed by vertex ID, with 0 for the missing nodes. Nodes that are
+        not in the store are ignored.
+        """
+        vector = np.zeros(len(self.nodes), dtype="float64")
+        (vertices, found) = self.get_vertices(values.keys())
+        vector[vertices[found]] = np.fromiter(
+            values.values(), dtype="float64", count=len(values))[found]
+        return vector
+
+    def to_mapping(self, values, vertices=None):
+        """
+        Return a mapping of the nodes to values, the array of the values of
+        the vertices (all the vertices by default).
+
+        A ScoreMapping is returned when the nodes are numbers or strings,
+        otherwise a dict.
+        """
+        nodes = self.nodes
+        keys = nodes if vertices is None else nodes.take(vertices)
+        values = np.asarray(values)
+        if pd.api.types.infer_dtype(keys, skipna=False) in \
+                ("integer", "floating", "string"):
+            order = np.argsort(keys, kind="stable")
+            return ScoreMapping([keys[order]], values[order])
+        return dict(zip(keys.tolist(), values.tolist()))
+
+
+def get_edge_store(G):
+    """
+    Return the EdgeStore of the nx compat Graph or DiGraph G, brought up to
+    date with G, or None if G does not maintain one (other graph classes,
+    and graph views, which share the nodes and edges of another graph).
+    """
+    store = getattr(G, "_edge_store", None)
+    if store is None or getattr(G, "frozen", False) or store.adj is not G._adj:
+        return None
+    return store.sync(G)
+
+
+class EdgeStoreMixin:
+    """
+    Mixin for subclasses of the NetworkX Graph and DiGraph classes, which
+    keeps an EdgeStore of the graph up to date as nodes and edges are added
+    and removed through the graph methods.
+
+    Edges are added to the store with their edge data dicts, so updates of
+    the edge attributes are seen by the store. Changes made without the graph
+    methods (for example to the adjacency dicts directly) are not seen; call
+    G.edge_store.invalidate() after making such changes.
+    """
+    def __init__(self, incoming_graph_data=None, **attr):
+        # The store must exist before the NetworkX constructor adds the
+        # nodes and edges of incoming_graph_data.
+        self._edge_store = EdgeStore(self.is_directed())
+        super().__init__(incoming_graph_data, **attr)
+        self._edge_store.adj = self._adj
+
+    @property
+    def edge_store(self):
+        """
+        The EdgeStore of the nodes and edges of the graph.
+        """
+        return self._edge_store.sync(self)
+
+    def _incident_edges(self, n):
+        if self.is_directed():
+            return chain(zip(repeat(n), self._succ[n]),
+                         zip(self._pred[n], repeat(n)))
+        return zip(repeat(n), self._adj[n])
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        self._edge_store.add_edge(u_of_edge, v_of_edge,
+                                  self._adj[u_of_edge][v_of_edge])
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        ebunch_to_add = list(ebunch_to_add)
+        try:
+            super().add_edges_from(ebunch_to_add, **attr)
+        except Exception:
+            # Some of the edges may have been added.
+            self._edge_store.invalidate()
+            raise
+        store = self._edge_store
+        if len(ebunch_to_add) > store.num_edges:
+            # Rebuilding the store from the adjacency dicts in bulk is faster
+            # than adding more edges than it has one at a time.
+            store.invalidate()
+        else:
+            adj = self._adj
+            store.add_edges((e[0], e[1], adj[e[0]][e[1]])
+                            for e in ebunch_to_add)
+
+    def remove_edge(self, u, v):
+        super().remove_edge(u, v)
+        self._edge_store.remove_edge(u, v)
+
+    def remove_edges_from(self, ebunch):
+        ebunch = list(ebunch)
+        super().remove_edges_from(ebunch)
+        store = self._edge_store
+        for e in ebunch:
+            store.remove_edge(*e[:2])
+
+    def remove_node(self, n):
+        if n in self._node:
+            self._edge_store.remove_node(n, list(self._incident_edges(n)))
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        nodes = list(nodes)
+        store = self._edge_store
+        for n in nodes:
+            if n in self._node:
+                store.remove_node(n, list(self._incident_edges(n)))
+        super().remove_nodes_from(nodes)
+
+    def clear(self):
+        super().clear()
+        self._edge_store.clear()
+
+    def clear_edges(self):
+        super().clear_edges()
+        self._edge_store.clear_edges()
@@ -13,24 +13,32 @@
 
 
 import cudf
-import cugraph
 import numpy as np
 
 
-# TRIM Process:
-#   - removed single vertex componenets
-#   - select vertex with highest out degree
-#   - forwards BFS
-#   - backward BFS
-#   - compute intersection = components
-#   - remove component
+# Multi-pivot FW-BW-TRIM process (operating on array edge lists so it runs on
+# CuPy (device) or NumPy (host) arrays):
+#   - trim-1: repeatedly remove vertices with no in-edges or no out-edges,
+#     each of which is a single vertex component
+#   - trim-2: remove pairs of vertices that are only reachable from (or can
+#     only reach) each other, each of which is a two vertex component
+#   - if few vertices remain, finish with a host Tarjan pass
+#   - otherwise, select one pivot per color (partition of the remaining
+#     vertices) and run the forward and backward reachability of all pivots at
+#     once, one vectorized pass over the edges per BFS level
+#   - the intersection of the forward and backward sets of a pivot is its
+#     component
+#   - recolor the remaining vertices by (color, in forward set, in backward
+#     set), since a component can not span colors, and drop the edges between
+#     different colors
 #   - repeat
 
 
-def EXPERIMENTAL__strong_connected_component(source, destination):
+def EXPERIMENTAL__strong_connected_component(source, destination,
+                                             host_threshold=4096):
     """
-    Generate the strongly connected components
-    using the FW-BW-TRIM approach, but skipping the trimming)
+    Generate the strongly connected components using a multi-pivot
+    forward-backward approach with trimming (FW-BW-TRIM).
 
     Parameters
     ----------
@@ -40,126 +48,295 @@ def EXPERIMENTAL__strong_connected_component(source, destination):
     destination : cudf.Series
         A cudf series that contains the destination side of an edge list
 
+    host_threshold : int, optional (default=4096)
+        Once no more than this many vertices remain to be assigned to a
+        component, the remaining components are found on the host using
+        Tarjan's algorithm.
+
     Returns
     -------
     cdf : cudf.DataFrame - a dataframe for components
         df['vertex']   - the vertex ID
-        df['id']       - the component ID
+        df['id']       - the component ID, which is the smallest vertex ID in
+                         the component
 
     sdf : cudf.DataFrame - a dataframe with single vertex components
         df['vertex']   - the vertex ID
 
-    count - int - the number of components found
+    count - int - the number of components found, not including single vertex
+        components
 
 
     Examples
     --------
-    >>> # M = read_mtx_file(graph_file)
-    >>> # sources = cudf.Series(M.row)
-    >>> # destinations = cudf.Series(M.col)
-    >>> # components, single_components, count =
-    >>> #   cugraph.strong_connected_component(source, destination)
+    >>> M = cudf.read_csv(datasets_path / 'karate-asymmetric.csv',
+    ...                   delimiter=' ', dtype=['int32', 'int32', 'float32'],
+    ...                   header=None)
+    >>> from cugraph.experimental import strong_connected_component
+    >>> (components, single_components,
+    ...  count) = strong_connected_component(M['0'], M['1'])
 
     """
-    # FIXME: Uncomment out the above example
-    max_value = np.iinfo(np.int32).max  # NOQA
-
-    # create the FW and BW graphs - this version dopes nopt modify the graphs
-    G_fw = cugraph.Graph()
-    G_bw = cugraph.Graph()
-
-    G_fw.add_edge_list(source, destination)
-    G_bw.add_edge_list(destination, source)
-
-    # get a list of vertices and sort the list on out_degree
-    d = G_fw.degrees()
-    d = d.sort_values(by='out_degree', ascending=False)
-
-    num_verts = len(d)
-
-    # create space for the answers
-    components = [None] * num_verts
-    single_components = [None] * num_verts
-
-    # Counts - aka array indexies
-    count = 0
-    single_count = 0
-
-    # remove vertices that cannot be in a component
-    bad = d.query('in_degree == 0 or out_degree == 0')
-
-    if len(bad):
-        bad = bad.drop(['in_degree', 'out_degree'])
+    if len(source) != len(destination):
+        raise ValueError("source and destination must have the same length")
 
-        single_components[single_count] = bad
-        single_count = single_count + 1
-        d = _filter_list(d, bad)
+    vertices_df = cudf.concat([source, destination], ignore_index=True)
+    vertices_df = vertices_df.unique().sort_values(ignore_index=True)
+    vertices = vertices_df.values
+    xp = _get_array_module(vertices)
+    src = xp.searchsorted(vertices, source.values)
+    dst = xp.searchsorted(vertices, destination.values)
 
-    # ----- Start processing -----
-    while len(d) > 0:
+    labels = _scc_labels(src, dst, len(vertices),
+                         host_threshold=host_threshold)
+    sizes = xp.bincount(labels, minlength=len(vertices))
+    is_single = sizes[labels] == 1
 
-        v = d['vertex'][0]
+    df = cudf.DataFrame()
+    df["vertex"] = vertices_df
+    df["id"] = vertices[labels]
 
-        # compute the forward BFS
-        bfs_fw = cugraph.bfs(G_fw, v)
-        bfs_fw = bfs_fw.query("distance != @max_value")
-
-        # Now backwards
-        bfs_bw = cugraph.bfs(G_bw, v)
-        bfs_bw = bfs_bw.query("distance != @max_value")
-
-        # intersection
-        common = bfs_fw.merge(bfs_bw, on='vertex', how='inner')
-
-        if len(common) > 1:
-            common['id'] = v
-            components[count] = common
-            d = _filter_list(d, common)
-            count = count + 1
-
-        else:
-            # v is an isolated vertex
-            vdf = cudf.DataFrame()
-            vdf['vertex'] = v
-
-            single_components[single_count] = vdf
-            single_count = single_count + 1
-            d = d.iloc[1:]
-
-    # end of loop until vertex queue is empty
-
-    comp = _compress_array(components, count)
-    sing = _compress_array(single_components, single_count)
+    comp = df[~is_single].reset_index(drop=True)
+    sing = df[is_single][["vertex"]].reset_index(drop=True)
+    count = int((sizes > 1).sum())
 
     return comp, sing, count
 
 #  ---------
 
 
-def _filter_list(vert_list, drop_list):
-    t = cudf.DataFrame()
-    t['vertex'] = drop_list['vertex']
-    t['d'] = 0
-
-    df = vert_list.merge(t, on='vertex', how="left")
-
-    df['d'] = df['d'].fillna(1)
-    df = df.query('d == 1')
-    df.drop('d', inplace=True)
-
-    return df
-
+def _get_array_module(array):
+    """
+    Return the cupy module if array is a CuPy array, otherwise numpy.
+    """
+    if type(array).__module__.startswith("cupy"):
+        import cupy
+        return cupy
+    return np
 
-def _compress_array(a, length):
 
-    tmp = cudf.DataFrame()
+def _to_host(array):
+    if isinstance(array, np.ndarray):
+        return array
+    return array.get()
 
-    if length > 0:
-        tmp_a = [None] * length
 
-        for i in range(length):
-            tmp_a[i] = a[i]
+def _scc_labels(src, dst, num_vertices, host_threshold=4096):
+    """
+    Return an array containing the component label of each vertex in
+    0..num_vertices-1 for the graph with the edges (src[i], dst[i]). The label
+    of each component is the smallest vertex in the component.
+    """
+    xp = _get_array_module(src)
+    src = xp.asarray(src, dtype="int64")
+    dst = xp.asarray(dst, dtype="int64")
+
+    # Remove self loops and multi-edges, which do not change the components
+    # but would be counted by the trims.
+    keep = src != dst
+    keys = xp.unique(src[keep] * num_vertices + dst[keep])
+    src = keys // num_vertices
+    dst = keys % num_vertices
+
+    labels = xp.full(num_vertices, -1, dtype="int64")
+    active = xp.ones(num_vertices, dtype="bool")
+    colors = xp.zeros(num_vertices, dtype="int64")
+
+    while True:
+        (src, dst) = _trim(xp, src, dst, labels, active)
+
+        num_active = int(active.sum())
+        if num_active == 0:
+            break
+        if num_active <= host_threshold:
+            _host_scc(xp, src, dst, labels, active)
+            break
+
+        # Use the vertex with the largest in-degree * out-degree as the pivot
+        # of each color, since it is most likely to be in a large component.
+        in_degrees = xp.bincount(dst, minlength=num_vertices)
+        out_degrees = xp.bincount(src, minlength=num_vertices)
+        candidates = xp.flatnonzero(active)
+        scores = (in_degrees * out_degrees)[candidates]
+        order = xp.lexsort(xp.stack([-scores, colors[candidates]]))
+        candidates = candidates[order]
+        (_, first) = xp.unique(colors[candidates], return_index=True)
+        pivots = candidates[first]
+
+        forward = _reach(xp, src, dst, pivots, num_vertices)
+        backward = _reach(xp, dst, src, pivots, num_vertices)
+
+        pivot_of_color = xp.full(int(colors.max()) + 1, -1, dtype="int64")
+        pivot_of_color[colors[pivots]] = pivots
+        found = forward & backward
+        labels[found] = pivot_of_color[colors[found]]
+        active &= ~found
+
+        # Compact the colors of the vertices left so they stay in
+        # 0..num_colors-1.
+        codes = colors * 4 + forward.astype("int64") * 2 + backward
+        (_, codes) = xp.unique(xp.where(active, codes, -1),
+                               return_inverse=True)
+        colors = codes.reshape(-1)
+
+        keep = active[src] & active[dst] & (colors[src] == colors[dst])
+        (src, dst) = (src[keep], dst[keep])
+
+    # Relabel each component with its smallest vertex.
+    (_, first, inverse) = xp.unique(labels, return_index=True,
+                                    return_inverse=True)
+    return first[inverse.reshape(-1)]
+
+
+def _trim(xp, src, dst, labels, active):
+    """
+    Assign components to the active vertices found by trim-1 and trim-2,
+    update labels and active in place, and return the edges left between
+    active vertices.
+    """
+    num_vertices = len(labels)
+    while True:
+        # trim-1
+        while True:
+            in_degrees = xp.bincount(dst, minlength=num_vertices)
+            out_degrees = xp.bincount(src, minlength=num_vertices)
+            trimmed = active & ((in_degrees == 0) | (out_degrees == 0))
+            trimmed = xp.flatnonzero(trimmed)
+            if len(trimmed) == 0:
+                break
+            labels[trimmed] = trimmed
+            active[trimmed] = False
+            keep = active[src] & active[dst]
+            (src, dst) = (src[keep], dst[keep])
+
+        # trim-2: u and v form a component if the only edge into u is from v
+        # and the only edge into v is from u (or likewise for the edges out
+        # of u and v).
+        num_trimmed = 0
+        for (majors, minors, degrees) in [(dst, src, in_degrees),
+                                          (src, dst, out_degrees)]:
+            only = xp.full(num_vertices, -1, dtype="int64")
+            single = degrees[majors] == 1
+            only[majors[single]] = minors[single]
+            u = xp.flatnonzero(active & (only >= 0))
+            v = only[u]
+            paired = (only[v] == u) & active[v]
+            (u, v) = (u[paired], v[paired])
+            labels[u] = xp.minimum(u, v)
+            active[u] = False
+            num_trimmed += len(u)
+        if num_trimmed == 0:
+            return (src, dst)
+        keep = active[src] & active[dst]
+        (src, dst) = (src[keep], dst[keep])
+
+
+def _reach(xp, src, dst, seeds, num_vertices):
+    """
+    Return a boolean array of the vertices reachable from any of seeds by
+    following the edges (src[i], dst[i]). Every BFS level is a single pass
+    over the edges, no matter how many seeds are used.
+    """
+    visited = xp.zeros(num_vertices, dtype="bool")
+    visited[seeds] = True
+    frontier = visited.copy()
+    while True:
+        next_vertices = dst[frontier[src] & ~visited[dst]]
+        if len(next_vertices) == 0:
+            return visited
+        frontier = xp.zeros(num_vertices, dtype="bool")
+        frontier[next_vertices] = True
+        visited |= frontier
+
+
+def _host_scc(xp, src, dst, labels, active):
+    """
+    Assign components to the active vertices using Tarjan's algorithm on the
+    host, updating labels and active in place.
+    """
+    vertices = xp.flatnonzero(active)
+    local_labels = _tarjan_labels(
+        _to_host(xp.searchsorted(vertices, src)),
+        _to_host(xp.searchsorted(vertices, dst)),
+        len(vertices))
+    labels[vertices] = vertices[xp.asarray(local_labels)]
+    active[vertices] = False
 
-        tmp = cudf.concat(tmp_a)
 
-    return tmp
+def _tarjan_labels(src, dst, num_vertices):
+    """
+    Return a NumPy array containing the component label of each vertex in
+    0..num_vertices-1 using an iterative version of Tarjan's algorithm. The
+    label of each component is the root vertex found by the algorithm.
+    """
+    order = np.argsort(src, kind="stable")
+    indices = dst[order].tolist()
+    offsets = np.zeros(num_vertices + 1, dtype="int64")
+    np.cumsum(np.bincount(src, minlength=num_vertices), out=offsets[1:])
+    offsets = offsets.tolist()
+
+    index = [-1] * num_vertices
+    lowlink = [0] * num_vertices
+    on_stack = [False] * num_vertices
+    labels = np.empty(num_vertices, dtype="int64")
+    stack = []
+    next_index = 0
+
+    for root in range(num_vertices):
+        if index[root] >= 0:
+            continue
+        # Each call frame is (vertex, position of the next edge to visit).
+        call_stack = [(root, offsets[root])]
+        index[root] = lowlink[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+
+        while call_stack:
+            (v, pos) = call_stack[-1]
+            if pos < offsets[v + 1]:
+                call_stack[-1] = (v, pos + 1)
+                w = indices[pos]
+                if index[w] < 0:
+                    index[w] = lowlink[w] = next_index
+                    next_index += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    call_stack.append((w, offsets[w]))
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+                continue
+
+            call_stack.pop()
+            if call_stack:
+                parent = call_stack[-1][0]
+                if lowlink[v] < lowlink[parent]:
+                    lowlink[parent] = lowlink[v]
+            if lowlink[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    labels[w] = v
+                    if w == v:
+                        break
+
+    return labels
+
+
+def _scc_reference_labels(src, dst, num_vertices):
+    """
+    Reference implementation using SciPy that returns the component label of
+    each vertex, with the same labeling as _scc_labels().
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    src = np.asarray(src)
+    dst = np.asarray(dst)
+    matrix = coo_matrix((np.ones(len(src)), (src, dst)),
+                        shape=(num_vertices, num_vertices))
+    (_, labels) = connected_components(matrix, directed=True,
+                                       connection="strong")
+    (_, first, inverse) = np.unique(labels, return_index=True,
+                                    return_inverse=True)
+    return first[inverse.reshape(-1)]
@@ -14,7 +14,7 @@
 # Import needed libraries
 import cudf
 import numpy as np
-from collections import OrderedDict
+import pandas as pd
 
 
 def EXPERIMENTAL__find_bicliques(
@@ -23,13 +23,14 @@ def EXPERIMENTAL__find_bicliques(
         max_iter=-1,
         support=1.0,
         min_features=1,
-        min_machines=10):
+        min_machines=10,
+        batch_edges=2**24):
     """
     Find the top k maximal bicliques
 
     Parameters
     ----------
-    df :  cudf:DataFrame
+    df :  cudf.DataFrame or pandas.DataFrame
         A dataframe containing the bipartite graph edge list
         Columns must be called 'src', 'dst', and 'flag'
 
@@ -38,10 +39,30 @@ def EXPERIMENTAL__find_bicliques(
         -1 mean all
 
     offset : int
+        A value to subtract from the 'dst' (feature) values.
+
+    max_iter : int
+        The max number of features to process, in order of decreasing
+        degree. -1 means all.
+
+    support : float
+        The fraction (between 0.1 and 1.0) of the machines of a biclique that
+        a feature must be used by to be included in the biclique.
+
+    min_features : int
+        A biclique must have more than min_features features.
+
+    min_machines : int
+        A biclique must have at least min_machines machines.
+
+    batch_edges : int
+        The approximate max number of two-hop (feature to machine to feature)
+        edges to process at once. Larger values use more memory but fewer
+        batches.
 
     Returns
     -------
-    B : cudf.DataFrame
+    B : cudf.DataFrame or pandas.DataFrame
         A dataframe containing the list of machine and features.  This is not
         the full edge list to save space.  Since it is a biclique, it is ease
         to recreate the edges
@@ -51,7 +72,7 @@ def EXPERIMENTAL__find_bicliques(
         B['type']  - 0 == machine, 1 == feature
 
 
-    S : cudf.DataFrame
+    S : cudf.DataFrame or pandas.DataFrame
         A dataframe of statistics on the returned info.
         This dataframe is (relatively small) of size k.
 
@@ -59,239 +80,216 @@ def EXPERIMENTAL__find_bicliques(
         S['total']    - total vertex count
         S['machines'] - number of machine nodes
         S['features'] - number of feature vertices
-        S['bad_ration'] - the ratio of bad machine / total machines
+        S['bad_ratio'] - the ratio of bad machine / total machines
     """
-    # must be factor of 10
-    PART_SIZE = int(1000)
+    results = list(EXPERIMENTAL__iter_bicliques(
+        df, k, offset=offset, max_iter=max_iter, support=support,
+        min_features=min_features, min_machines=min_machines,
+        batch_edges=batch_edges))
+
+    df_module = _get_dataframe_module(df)
+    if len(results) == 0:
+        return (df_module.DataFrame(columns=['vert', 'id', 'type']),
+                df_module.DataFrame(columns=['id', 'total', 'machines',
+                                             'features', 'bad_ratio']))
+
+    bicliques = df_module.concat([b for (b, _) in results], ignore_index=True)
+    stats = df_module.concat([s for (_, s) in results], ignore_index=True)
+    return bicliques, stats
+
 
-    x = [col for col in df.columns]
-    if 'src' not in x:
-        raise NameError('src column not found')
-    if 'dst' not in x:
-        raise NameError('dst column not found')
-    if 'flag' not in x:
-        raise NameError('flag column not found')
+def EXPERIMENTAL__iter_bicliques(
+        df, k,
+        offset=0,
+        max_iter=-1,
+        support=1.0,
+        min_features=1,
+        min_machines=10,
+        batch_edges=2**24):
+    """
+    Find the top k maximal bicliques, yielding the bicliques found in each
+    batch of features as they are found rather than returning all of them at
+    once. See find_bicliques() for a description of the parameters.
+
+    Features are processed in order of decreasing degree. Features used by
+    exactly the same set of machines would produce the same biclique, so only
+    the first of them is processed; identical machine sets are detected in one
+    pass by grouping features on their degree and a 128-bit hash of their
+    machine set.
+
+    Yields
+    ------
+    (B, S) : tuple of cudf.DataFrame or pandas.DataFrame
+        The bicliques and statistics found for a batch of features, in the
+        format returned by find_bicliques(). Batches with no bicliques are not
+        yielded.
+    """
+    for name in ['src', 'dst', 'flag']:
+        if name not in df.columns:
+            raise NameError(f'{name} column not found')
 
     if support > 1.0 or support < 0.1:
         raise NameError('support must be between 0.1 and 1.0')
 
-    # this removes a prep step that offset the values for CUDA process
+    # Use unique (machine, feature) edges. A machine is flagged if any of its
+    # edges for the feature are flagged.
+    edges = df[['src', 'dst', 'flag']]
     if offset > 0:
-        df['dst'] = df['dst'] - offset
-
-    # break the data into chunks to improve join/search performance
-    src_by_dst, num_parts = _partition_data_by_feature(df, PART_SIZE)
-
-    # Get a list of all the dst (features) sorted by degree
-    f_list = _count_features(df, True)
-
-    # create a dataframe for the answers
-    bicliques = cudf.DataFrame()
-    stats = cudf.DataFrame()
-
-    # create a dataframe to help prevent duplication of work
-    machine_old = cudf.DataFrame()
-
-    # create a dataframe for stats
-    stats = cudf.DataFrame()
-
-    answer_id = 0
-    iter_max = len(f_list)
+        edges = edges.assign(dst=edges['dst'] - offset)
+    edges = edges.groupby(['src', 'dst'], as_index=False).agg({'flag': 'max'})
 
+    features = _get_feature_signatures(edges)
+    features = features.sort_values(by=['count', 'dst'],
+                                    ascending=[False, True])
     if max_iter != -1:
-        iter_max = max_iter
-
-    # Loop over all the features (dst) or until K is reached
-    for i in range(iter_max):
-
-        # pop the next feature to process
-        feature = f_list['dst'][i]
-        degree = f_list['count'][i]
-
-        # compute the index to this item (which dataframe chunk is in)
-        idx = int(feature/PART_SIZE)
-
-        # get all machines that have this feature
-        machines = get_src_from_dst(src_by_dst[idx], feature)
-
-        # if this set of machines is the same as the last, skip this feature
-        if not is_same_as_last(machine_old, machines):
-
-            # now from those machines, hop out to the list of all the features
-            feature_list = get_all_feature(src_by_dst, machines, num_parts)
-
-            # summarize occurances
-            ic = _count_features(feature_list, True)
-
-            goal = int(degree * support)  # NOQA
-
-            # only get dst nodes with the same degree
-            c = ic.query('count >= @goal')
-
-            # need more than X feature to make a biclique
-            if len(c) > min_features:
-                if len(machines) >= min_machines:
-                    bicliques, stats = update_results(
-                            machines, c, answer_id, bicliques, stats)
-
-                    answer_id = answer_id + 1
-
-        # end - if same
-
-        machine_old = machines
-
-        if k > -1:
-            if answer_id == k:
-                break
-
-    # end for loop
-
-    # All done, reset data
-    if offset > 0:
-        df['dst'] = df['dst'] + offset
-
-    return bicliques, stats
-
-
-def _partition_data_by_feature(_df, PART_SIZE):
-
-    # compute the number of sets
-    m = int((_df['dst'].max() / PART_SIZE) + 1)
+        features = features.head(max_iter)
+    features = features.reset_index(drop=True)
+    features['order'] = np.arange(len(features))
+
+    # The number of machines of a biclique is the degree of its feature.
+    features = features.drop_duplicates(subset=['count', 'hash0', 'hash1'],
+                                        keep='first')
+    features = features[features['count'] >= min_machines]
+    features = features.sort_values(by='order').reset_index(drop=True)
+    features = features[['dst', 'count', 'num_two_hop', 'order']]
+
+    # Split the features into batches of about batch_edges two-hop edges.
+    num_two_hop = _to_host(features['num_two_hop'])
+    batch_ids = np.cumsum(num_two_hop) // max(batch_edges, 1)
+    boundaries = np.flatnonzero(np.diff(batch_ids)) + 1
+    boundaries = [0] + boundaries.tolist() + [len(features)]
 
-    _ui = [None] * (m + 1)
-
-    # Partition the data into a number of smaller DataFrame
-    s = 0
-    e = s + PART_SIZE
-
-    for i in range(m):
-        _ui[i] = _df.query('dst >= @s and dst < @e')
-
-        s = e
-        e = e + PART_SIZE
-
-    return _ui, m
-
-
-def _count_features(_gdf, sort=True):
-
-    aggs = OrderedDict()
-    aggs['dst'] = 'count'
-
-    c = _gdf.groupby(['dst'], as_index=False).agg(aggs)
-
-    c = c.rename(columns={'count_dst': 'count'}, copy=False)
-
-    if (sort):
-        c = c.sort_values(by='count', ascending=False)
-
-    return c
-
-
-# get all src vertices for a given dst
-def get_src_from_dst(_gdf, id):
-
-    _src_list = (_gdf.query('dst == @id'))
-
-    _src_list.drop('dst', inplace=True)
-
-    return _src_list
-
-
-def is_same_as_last(_old, _new):
-    status = False
-
-    if (len(_old) == len(_new)):
-        m = _old.merge(_new, on='src', how="left")
-
-        if m['src'].null_count == 0:
-            status = True
+    answer_id = 0
+    for (start, end) in zip(boundaries[:-1], boundaries[1:]):
+        if start == end:
+            continue
+        if k > -1 and answer_id >= k:
+            return
+        (bicliques, stats) = _find_batch_bicliques(
+            edges, features.iloc[start:end], answer_id,
+            -1 if k == -1 else k - answer_id,
+            support, min_features)
+        if len(stats) > 0:
+            answer_id += len(stats)
+            yield (bicliques, stats)
 
-    return status
 
+def _get_dataframe_module(df):
+    if isinstance(df, pd.DataFrame):
+        return pd
+    return cudf
 
-# get all the items used by the specified users
-def get_all_feature(_gdf, src_list_df, N):
 
-    c = [None] * N
+def _to_host(series):
+    if hasattr(series, "values_host"):
+        return series.values_host
+    return series.to_numpy()
 
-    for i in range(N):
-        c[i] = src_list_df.merge(_gdf[i], on='src', how="inner")
 
-    return cudf.concat(c)
+def _get_array_module(array):
+    if isinstance(array, np.ndarray):
+        return np
+    import cupy
+    return cupy
 
 
-def update_results(m, f, key, b, s):
+def _hash_values(values):
     """
-    Input
-    * m = machines
-    * f = features
-    * key = cluster ID
-    * b = biclique answer
-    * s = stats answer
-
-    Returns
-    -------
-    B : cudf.DataFrame
-        A dataframe containing the list of machine and features.  This is not
-    the full edge list to save space. Since it is a biclique, it is ease
-    to recreate the edges
-
-        B['id']    - a cluster ID (this is a one up number - up to k)
-        B['vert']  - the vertex ID
-        B['type']  - 0 == machine, 1 == feature
-
-
-    S : cudf.DataFrame
-        A Pandas dataframe of statistics on the returned info.
-        This dataframe is (relatively small) of size k.
-
-        S['id']       - the cluster ID
-        S['total']    - total vertex count
-        S['machines'] - number of machine nodes
-        S['features'] - number of feature vertices
-        S['bad_ratio'] - the ratio of bad machine / total machines
+    Return two arrays of independent 64-bit (splitmix64) hashes of values.
+    """
+    xp = _get_array_module(values)
+    x = values.astype("uint64")
+    hashes = []
+    for seed in [0x9E3779B97F4A7C15, 0xD1B54A32D192ED03]:
+        z = x + xp.uint64(seed)
+        z = (z ^ (z >> xp.uint64(30))) * xp.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> xp.uint64(27))) * xp.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> xp.uint64(31))
+        hashes.append(z.view("int64"))
+    return hashes
+
+
+def _get_feature_signatures(edges):
     """
-    B = cudf.DataFrame()
-    S = cudf.DataFrame()
-
-    m_df = cudf.DataFrame()
-    m_df['vert'] = m['src']
-    m_df['id'] = int(key)
-    m_df['type'] = int(0)
-
-    f_df = cudf.DataFrame()
-    f_df['vert'] = f['dst'].astype(np.int32)
-    f_df['id'] = int(key)
-    f_df['type'] = int(1)
-
-    if len(b) == 0:
-        B = cudf.concat([m_df, f_df])
-    else:
-        B = cudf.concat([b, m_df, f_df])
-
-    # now update the stats
-    num_m = len(m_df)
-    num_f = len(f_df)
-    total = num_m + num_f
-
-    num_bad = len(m.query('flag == 1'))
-    ratio = num_bad / total
-
-    # now stats
-    s_tmp = cudf.DataFrame()
-    s_tmp['id'] = key
-    s_tmp['total'] = total
-    s_tmp['machines'] = num_m
-    s_tmp['features'] = num_f
-    s_tmp['bad_ratio'] = ratio
-
-    if len(s) == 0:
-        S = s_tmp
-    else:
-        S = cudf.concat([s, s_tmp])
-
-    del m_df
-    del f_df
-
-    return B, S
+    Return a dataframe with the degree ('count'), the number of two-hop edges
+    ('num_two_hop'), and the hash of the set of machines ('hash0' and
+    'hash1') of each feature ('dst'). The hash of a set is the (wrapping) sum
+    of the hashes of its machines, so it does not depend on the order of the
+    edges.
+    """
+    machine_degrees = edges.groupby('src', as_index=False).agg(
+        {'dst': 'count'})
+    machine_degrees = machine_degrees.rename(columns={'dst': 'machine_degree'})
+    edges = edges[['src', 'dst']].merge(machine_degrees, on='src', how='inner')
+
+    (hash0, hash1) = _hash_values(edges['src'].values)
+    edges['hash0'] = hash0
+    edges['hash1'] = hash1
+    features = edges.groupby('dst', as_index=False).agg(
+        {'src': 'count', 'machine_degree': 'sum', 'hash0': 'sum',
+         'hash1': 'sum'})
+    return features.rename(columns={'src': 'count',
+                                    'machine_degree': 'num_two_hop'})
+
+
+def _find_batch_bicliques(edges, seeds, first_id, max_bicliques, support,
+                          min_features):
+    """
+    Find the bicliques of the features in seeds using two joins: from the
+    seed features to their machines, and from those machines to all of their
+    features. Returns the (bicliques, stats) dataframes, with IDs starting at
+    first_id, of at most max_bicliques bicliques (-1 means all).
+    """
+    seeds = seeds.rename(columns={'dst': 'seed'})
+    seeds = seeds.assign(goal=(seeds['count'] * support).astype('int64'))
+
+    machines = seeds[['seed']].merge(edges, left_on='seed', right_on='dst',
+                                     how='inner')
+    machines = machines[['seed', 'src', 'flag']]
+    two_hop = machines[['seed', 'src']].merge(edges[['src', 'dst']],
+                                              on='src', how='inner')
+
+    counts = two_hop.groupby(['seed', 'dst'], as_index=False).agg(
+        {'src': 'count'})
+    counts = counts.rename(columns={'src': 'support'})
+    counts = counts.merge(seeds[['seed', 'goal']], on='seed', how='inner')
+    counts = counts[counts['support'] >= counts['goal']]
+
+    found = counts.groupby('seed', as_index=False).agg({'dst': 'count'})
+    found = found.rename(columns={'dst': 'features'})
+    found = found[found['features'] > min_features]
+    found = found.merge(seeds[['seed', 'count', 'order']], on='seed',
+                        how='inner')
+    found = found.sort_values(by='order')
+    if max_bicliques > -1:
+        found = found.head(max_bicliques)
+    found = found.reset_index(drop=True)
+    found['id'] = np.arange(first_id, first_id + len(found))
+
+    machines = machines.merge(found[['seed', 'id']], on='seed', how='inner')
+    bad = machines[machines['flag'] == 1].groupby(
+        'seed', as_index=False).agg({'src': 'count'})
+    bad = bad.rename(columns={'src': 'bad'})
+    found = found.merge(bad, on='seed', how='left')
+    found['bad'] = found['bad'].fillna(0)
+
+    stats = found.sort_values(by='id').reset_index(drop=True)
+    stats = stats.rename(columns={'count': 'machines'})
+    stats['total'] = stats['machines'] + stats['features']
+    stats['bad_ratio'] = stats['bad'] / stats['total']
+    stats = stats[['id', 'total', 'machines', 'features', 'bad_ratio']]
+
+    # List the machines (sorted by ID) then the features (sorted by
+    # decreasing support) of each biclique.
+    machines = machines.assign(type=0, key=0, vert=machines['src'])
+    features = counts.merge(found[['seed', 'id']], on='seed', how='inner')
+    features = features.assign(type=1, key=-features['support'],
+                               vert=features['dst'].astype(np.int32))
+    columns = ['id', 'type', 'key', 'vert']
+    df_module = _get_dataframe_module(edges)
+    bicliques = df_module.concat([machines[columns], features[columns]],
+                                 ignore_index=True)
+    bicliques = bicliques.sort_values(by=columns).reset_index(drop=True)
+    bicliques = bicliques[['vert', 'id', 'type']]
+
+    return bicliques, stats
@@ -11,13 +11,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import cudf
 import cugraph
 from cugraph.experimental import PropertyGraph
 from cugraph.community.egonet import batched_ego_graphs
-from cugraph.utilities.utils import sample_groups
+from cugraph.gnn.neighbor_sampling import CSRIndex
+from cugraph.utilities.utils import import_optional
 
-import numpy as np
+# torch will be a MissingModule instance if PyTorch is not installed (any
+# attribute access on a MissingModule instance results in a RuntimeError).
+torch = import_optional("torch")
 
 
 class CuGraphStore:
@@ -32,6 +40,13 @@ class CuGraphStore:
 
     homogeneous graphs, graphs with no attributes - use Property Graph
     hetrogeneous graphs - use PropertyGraph
+
+    Parameters
+    ----------
+    graph : PropertyGraph
+        The PropertyGraph containing the vertices and edges.
+    random_state : int, optional (default=None)
+        Seed for the random number generator used by sample_neighbors().
     """
 
     @property
@@ -46,12 +61,20 @@ class CuGraphStore:
     def gdata(self):
         return self.__G
 
-    def __init__(self, graph):
+    def __init__(self, graph, random_state=None):
         if isinstance(graph, PropertyGraph):
             self.__G = graph
         else:
             raise ValueError("graph must be a PropertyGraph")
 
+        # CSRIndex instances used by sample_neighbors(), keyed by
+        # (edge_dir, prob), which are rebuilt when the edge properties of the
+        # PropertyGraph change.
+        self.__neighbor_indices = {}
+        self.__neighbor_indices_version = None
+        self.__random_state_seed = random_state
+        self.__random_state = None
+
     ######################################
     # Utilities
     ######################################
@@ -66,6 +89,73 @@ class CuGraphStore:
     def get_vertex_ids(self):
         return self.__G.vertices_ids()
 
+    def get_node_storage(self, key, ntype=None, dtype=None):
+        """
+        Return a CuFeatureStorage containing the vertex properties named by
+        key for each vertex, optionally only for vertices of type ntype.
+
+        Parameters
+        ----------
+        key : str or list of str
+            The vertex property name(s) to use as features.
+        ntype : str, optional (default=None)
+            The vertex type_name to get features for. If None, vertices of all
+            types having the properties are used.
+        dtype : str or dtype, optional (default=None)
+            The dtype of the features. If None, the common dtype of the
+            properties is used.
+
+        Returns
+        -------
+        CuFeatureStorage
+        """
+        return self.__get_storage(self.__G._vertex_prop_dataframe,
+                                  self.__G.vertex_col_name,
+                                  key, ntype, dtype)
+
+    def get_edge_storage(self, key, etype=None, dtype=None):
+        """
+        Return a CuFeatureStorage containing the edge properties named by key
+        for each edge ID, optionally only for edges of type etype.
+
+        Parameters
+        ----------
+        key : str or list of str
+            The edge property name(s) to use as features.
+        etype : str, optional (default=None)
+            The edge type_name to get features for. If None, edges of all
+            types having the properties are used.
+        dtype : str or dtype, optional (default=None)
+            The dtype of the features. If None, the common dtype of the
+            properties is used.
+
+        Returns
+        -------
+        CuFeatureStorage
+        """
+        return self.__get_storage(self.__G._edge_prop_dataframe,
+                                  self.__G.edge_id_col_name,
+                                  key, etype, dtype)
+
+    def __get_storage(self, prop_df, id_col_name, key, type_name, dtype):
+        if prop_df is None:
+            raise RuntimeError("the PropertyGraph does not contain properties")
+        columns = [key] if isinstance(key, str) else list(key)
+        invalid_columns = set(columns).difference(prop_df.columns)
+        if invalid_columns:
+            raise ValueError("key contains properties not present in the "
+                             f"PropertyGraph: {list(invalid_columns)}")
+
+        if type_name is not None:
+            prop_df = prop_df[prop_df[self.__G.type_col_name] == type_name]
+        # Only use the rows that have any of the properties, since rows for
+        # other types will have all NA values.
+        prop_df = prop_df[prop_df[columns].notna().any(axis=1)]
+
+        return CuFeatureStorage(prop_df[id_col_name].values,
+                                prop_df[columns],
+                                dtype=dtype)
+
     ######################################
     # Sampling APIs
     ######################################
@@ -93,46 +183,78 @@ class CuGraphStore:
         prob : str
             Feature name used as the (unnormalized) probabilities associated
             with each neighboring edge of a node. Each feature must be a
-            scalar. The features must be non-negative floats, and the sum of
-            the features of inbound/outbound edges for every node must be
-            positive (though they don't have to sum up to one). Otherwise,
-            the result will be undefined. If not specified, sample uniformly.
+            scalar. The features must be non-negative floats (though they
+            don't have to sum up to one). Edges with a probability of 0 are
+            never sampled, even if fanout is -1 or larger than the number of
+            neighbors. If not specified, sample uniformly.
         replace : bool
             If True, sample with replacement.
 
         Returns
         -------
-        CuPy array
-            The sampled arrays for bipartite graph.
+        tuple of CuPy arrays (NumPy arrays if the PropertyGraph uses pandas)
+            The destination and source vertices of the sampled edges, grouped
+            by the node they were sampled for, in the order of nodes.
         """
-        num_nodes = len(nodes)
-        current_seeds = nodes.reindex(index=np.arange(0, num_nodes))
-        _g = self.__G.extract_subgraph(create_using=cugraph.Graph,
-                                       allow_multi_edges=True)
-        ego_edge_list, seeds_offsets = batched_ego_graphs(_g,
-                                                          current_seeds,
-                                                          radius=1)
-        # filter and get a certain size neighborhood
-
-        # Step 1
-        # Get Filtered List of ego_edge_list corresposing to current_seeds
-        # We filter by creating a series of destination nodes
-        # corresponding to the offsets and filtering non matching vallues
-
-        seeds_offsets_s = cudf.Series(seeds_offsets).values
-        offset_lens = seeds_offsets_s[1:] - seeds_offsets_s[0:-1]
-        dst_seeds = current_seeds.repeat(offset_lens)
-        dst_seeds.index = ego_edge_list.index
-        filtered_list = ego_edge_list[ego_edge_list["dst"] == dst_seeds]
-
-        # Step 2
-        # Sample Fan Out
-        # for each dst take maximum of fanout samples
-        filtered_list = sample_groups(filtered_list,
-                                      by="dst",
-                                      n_samples=fanout)
-
-        return filtered_list['dst'].values, filtered_list['src'].values
+        if edge_dir not in ["in", "out"]:
+            raise ValueError(f"edge_dir must be either 'in' or 'out', got "
+                             f"{edge_dir}")
+
+        index = self.__get_neighbor_index(edge_dir, prob)
+        xp = index.xp
+        if self.__random_state is None or \
+           not isinstance(self.__random_state, xp.random.RandomState):
+            self.__random_state = xp.random.RandomState(
+                self.__random_state_seed)
+
+        if hasattr(nodes, "to_numpy"):
+            nodes = nodes.values
+        seeds = xp.asarray(nodes).astype(index.vertices.dtype)
+
+        (seeds, neighbors, _) = index.sample(seeds,
+                                             fanout=fanout,
+                                             replace=replace,
+                                             random_state=self.__random_state)
+        if edge_dir == "in":
+            return (seeds, neighbors)
+        return (neighbors, seeds)
+
+    def __get_neighbor_index(self, edge_dir, prob):
+        """
+        Return the CSRIndex of the edges of the PropertyGraph grouped by
+        destination vertex if edge_dir is "in" or by source vertex if "out",
+        with edge weights taken from the prob property, building it if the
+        edges changed since it was last built.
+        """
+        version = self.__G._edge_prop_version
+        if version != self.__neighbor_indices_version:
+            self.__neighbor_indices = {}
+            self.__neighbor_indices_version = version
+
+        key = (edge_dir, prob)
+        if key not in self.__neighbor_indices:
+            edata = self.__G._edge_prop_dataframe
+            if edata is None:
+                raise RuntimeError("the PropertyGraph does not contain edges")
+            if prob is not None and prob not in edata.columns:
+                raise ValueError(f"prob '{prob}' is not an edge property")
+
+            src = edata[self.__G.src_col_name].values
+            dst = edata[self.__G.dst_col_name].values
+            if edge_dir == "in":
+                (majors, minors) = (dst, src)
+            else:
+                (majors, minors) = (src, dst)
+            edge_ids = edata[self.__G.edge_id_col_name].astype("int64").values
+            if prob is None:
+                weights = None
+            else:
+                weights = edata[prob].fillna(0).astype("float64").values
+
+            self.__neighbor_indices[key] = CSRIndex(majors, minors,
+                                                    edge_ids=edge_ids,
+                                                    weights=weights)
+        return self.__neighbor_indices[key]
 
     def node_subgraph(self,
                       nodes=None,
@@ -249,8 +371,80 @@ class CuFeatureStorage:
 
     Either subclassing this class or implementing the same set of interfaces
     is fine. DGL simply uses duck-typing to implement its sampling pipeline.
+
+    The features are packed into a single contiguous 2D array (one row per
+    ID) when the storage is created, so fetching the features for a batch of
+    IDs is a single vectorized gather. Features are stored on the GPU if they
+    are given as a cudf.DataFrame, or on the host if given as a
+    pandas.DataFrame, and fetched as PyTorch tensors (converted without a
+    copy using DLPack). The storage is a snapshot and does not reflect
+    properties added to a PropertyGraph after it is created.
+
+    Parameters
+    ----------
+    ids : cupy.ndarray or numpy.ndarray
+        The unique node or edge ID for each row of features.
+    features : cudf.DataFrame or pandas.DataFrame
+        The feature columns, in the same order as ids.
+    dtype : str or dtype, optional (default=None)
+        The dtype of the features. If None, the common dtype of the columns is
+        used.
+    max_workers : int, optional (default=None)
+        The number of threads used to fetch features by async_fetch() and
+        prefetch(), which is the number of fetches that can run at once. If
+        None, the ThreadPoolExecutor default is used. With 1, the fetches run
+        one after another, so each one only overlaps with the work on the
+        previously fetched batch.
     """
 
+    def __init__(self, ids, features, dtype=None, max_workers=None):
+        if len(ids) != len(features):
+            raise ValueError("ids and features must have the same length")
+        if features.isna().any().any():
+            raise ValueError("features contains NA values")
+        if dtype is not None:
+            features = features.astype(dtype)
+
+        # DataFrame.values returns a CuPy array for cudf, and a NumPy array
+        # for pandas.
+        self.__features = features.values
+        xp = self.__get_array_module(self.__features)
+        self.__xp = xp
+        self.__features = xp.ascontiguousarray(self.__features)
+
+        ids = xp.asarray(ids).astype("int64")
+        order = xp.argsort(ids)
+        self.__sorted_ids = ids[order]
+        self.__rows = order
+        if len(ids) > 1 and \
+           (self.__sorted_ids[1:] == self.__sorted_ids[:-1]).any():
+            raise ValueError("ids must be unique")
+        # If the IDs are 0..n-1 in order, the IDs are the row numbers and the
+        # lookup can be skipped.
+        self.__ids_are_rows = bool(
+            (ids == xp.arange(len(ids), dtype="int64")).all())
+
+        self.__max_workers = max_workers
+        self.__executor = None
+
+    @staticmethod
+    def __get_array_module(array):
+        if isinstance(array, np.ndarray):
+            return np
+        import cupy
+        return cupy
+
+    @property
+    def shape(self):
+        return self.__features.shape
+
+    @property
+    def dtype(self):
+        return self.__features.dtype
+
+    def __len__(self):
+        return len(self.__features)
+
     def __getitem__(self, ids):
         """Fetch the features of the given node/edge IDs.
 
@@ -262,11 +456,101 @@ class CuFeatureStorage:
         Returns
         -------
         Tensor
-            Feature data stored in PyTorch Tensor.
+            Feature data stored in a PyTorch tensor on the GPU (on the CPU for
+            features stored on the host), with one row per ID.
+        """
+        return self.__to_tensor(self.__gather(ids))
+
+    def __gather(self, ids):
         """
-        pass
+        Return the array (CuPy or NumPy, like the stored features) of the
+        features of ids.
+        """
+        xp = self.__xp
+        if hasattr(ids, "to_numpy"):
+            ids = ids.values
+        ids = xp.asarray(ids).astype("int64")
+
+        if len(ids) == 0:
+            return xp.empty((0,) + self.shape[1:], dtype=self.dtype)
+        if len(self) == 0:
+            raise KeyError("ids contains IDs not present in the storage")
+        if self.__ids_are_rows:
+            rows = ids
+            if int(rows.min()) < 0 or int(rows.max()) >= len(self):
+                raise KeyError("ids contains IDs not present in the storage")
+        else:
+            positions = xp.searchsorted(self.__sorted_ids, ids)
+            positions = xp.minimum(positions, len(self.__sorted_ids) - 1)
+            if not bool((self.__sorted_ids[positions] == ids).all()):
+                raise KeyError("ids contains IDs not present in the storage")
+            rows = self.__rows[positions]
 
-    async def async_fetch(self, ids, device):
+        return xp.take(self.__features, rows, axis=0)
+
+    @staticmethod
+    def __to_tensor(array):
+        """
+        Return array (CuPy or NumPy) as a PyTorch tensor on the same device,
+        sharing its memory.
+        """
+        if isinstance(array, np.ndarray):
+            return torch.from_numpy(array)
+        if array.size == 0:
+            # Empty arrays can not be exported with DLPack by every version
+            # of CuPy and PyTorch.
+            dtype = torch.from_numpy(np.empty(0, dtype=array.dtype)).dtype
+            return torch.empty(array.shape, dtype=dtype,
+                               device=f"cuda:{array.device.id}")
+        return torch.utils.dlpack.from_dlpack(array.toDlpack())
+
+    def __fetch(self, ids, device):
+        """
+        Fetch the features of ids and copy them to device, using a separate
+        CUDA stream if the features are on the device so the fetch can
+        overlap with work on the default stream.
+        """
+        if self.__xp is np:
+            return self.__to_tensor(
+                self.__to_device(self.__gather(ids), device))
+        import cupy
+        with cupy.cuda.Stream(non_blocking=True) as stream:
+            result = self.__to_device(self.__gather(ids), device)
+            stream.synchronize()
+        return self.__to_tensor(result)
+
+    @staticmethod
+    def __to_device(array, device):
+        """
+        Return array on device, which is None to leave array as is, "cpu" for
+        a NumPy array, or a CUDA device number or "cuda[:<number>]" string for
+        a CuPy array on that device.
+        """
+        if device is None:
+            return array
+        if device == "cpu":
+            if isinstance(array, np.ndarray):
+                return array
+            import cupy
+            return cupy.asnumpy(array)
+
+        import cupy
+        if isinstance(device, str):
+            if not device.startswith("cuda"):
+                raise ValueError(f"unsupported device: {device}")
+            device = int(device.split(":")[1]) if ":" in device else None
+        if device is None:
+            return cupy.asarray(array)
+        with cupy.cuda.Device(device):
+            return cupy.asarray(array)
+
+    def __get_executor(self):
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=self.__max_workers)
+        return self.__executor
+
+    async def async_fetch(self, ids, device=None):
         """Asynchronously fetch the features of the given node/edge IDs to the
         given device.
 
@@ -275,12 +559,57 @@ class CuFeatureStorage:
         ids : Tensor
             Node or edge IDs.
         device : Device
-            Device context.
+            Device context: "cpu", a CUDA device number, or "cuda[:<number>]".
+            If None, the features are returned on the device they are stored
+            on.
 
         Returns
         -------
         Tensor
-            Feature data stored in PyTorch Tensor.
+            Feature data stored in a PyTorch tensor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__get_executor(),
+                                          self.__fetch, ids, device)
+
+    def prefetch(self, batches, device=None, depth=1):
+        """
+        Return an iterator of the features for each batch of IDs in batches.
+        The features for the next depth batches are fetched in background
+        threads while the current batch is being used, so fetching features
+        for minibatch i+1 overlaps the computation on minibatch i. The
+        fetches of the batches ahead only run concurrently if max_workers
+        allows it (see CuFeatureStorage).
+
+        Parameters
+        ----------
+        batches : iterable of Tensors
+            Node or edge IDs for each batch.
+        device : Device
+            See async_fetch().
+        depth : int, optional (default=1)
+            The number of batches to fetch ahead.
+
+        Returns
+        -------
+        iterator of Tensors
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        executor = self.__get_executor()
+        batches = iter(batches)
+        pending = deque()
+        for ids in batches:
+            pending.append(executor.submit(self.__fetch, ids, device))
+            if len(pending) > depth:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def close(self):
+        """
+        Shut down the threads used by async_fetch() and prefetch().
         """
-        # Default implementation uses synchronous fetch.
-        return self.__getitem__(ids).to(device)
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
@@ -0,0 +1,205 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Vectorized fanout neighbor sampling using a compressed sparse row (CSR) index
+of an edge list.
+
+The index and sampling functions operate on either CuPy (device) or NumPy
+(host) arrays, using whichever module the edge list arrays belong to. This
+module intentionally does not import cudf or cupy at module scope so the host
+implementation can be used on CPU-only machines.
+"""
+
+import numpy as np
+
+
+def _get_array_module(array):
+    """
+    Return the cupy module if array is a CuPy array, otherwise numpy.
+    """
+    if type(array).__module__.startswith("cupy"):
+        import cupy
+        return cupy
+    return np
+
+
+def _get_segments(xp, counts):
+    """
+    Return arrays containing the segment number and the position within the
+    segment for each element of consecutive segments of sizes counts.
+    """
+    ends = xp.cumsum(counts)
+    total = int(ends[-1]) if len(ends) > 0 else 0
+    indices = xp.arange(total, dtype="int64")
+    segments = xp.searchsorted(ends, indices, side="right")
+    positions = indices - (ends - counts)[segments]
+    return (segments, positions)
+
+
+class CSRIndex:
+    """
+    Compressed sparse row index of an edge list, which groups the edges by
+    their major vertex (the source vertex for a CSR, or the destination vertex
+    for a CSC) so the edges incident to a batch of vertices can be found and
+    sampled without scanning the edge list.
+
+    The index is built once using a single sort of the edge list. Vertex IDs
+    do not need to be contiguous.
+
+    Parameters
+    ----------
+    majors : cupy.ndarray or numpy.ndarray
+        The vertex for each edge used to group edges.
+    minors : cupy.ndarray or numpy.ndarray
+        The other vertex for each edge.
+    edge_ids : cupy.ndarray or numpy.ndarray, optional (default=None)
+        The ID of each edge. If None, the position of each edge in the edge
+        list is used.
+    weights : cupy.ndarray or numpy.ndarray, optional (default=None)
+        Non-negative (unnormalized) sampling probability of each edge. If None,
+        edges are sampled uniformly. Edges with a probability of 0 can never
+        be sampled, so they are left out of the index.
+    """
+    def __init__(self, majors, minors, edge_ids=None, weights=None):
+        xp = _get_array_module(majors)
+        self.xp = xp
+
+        if edge_ids is None:
+            edge_ids = xp.arange(len(majors), dtype="int64")
+        if weights is not None:
+            # Otherwise they would be returned when all the edges of a seed
+            # are sampled (fanout >= degree or -1).
+            keep = weights > 0
+            if not bool(keep.all()):
+                (majors, minors) = (majors[keep], minors[keep])
+                (edge_ids, weights) = (edge_ids[keep], weights[keep])
+        order = xp.argsort(majors, kind="stable")
+        majors = majors[order]
+        self.minors = minors[order]
+        self.edge_ids = edge_ids[order]
+
+        self.vertices = xp.unique(majors)
+        self.offsets = xp.concatenate(
+            [xp.searchsorted(majors, self.vertices),
+             xp.asarray([len(majors)])]).astype("int64")
+
+        if weights is None:
+            self.weights = None
+            self.cumulative_weights = None
+        else:
+            self.weights = weights[order].astype("float64")
+            self.cumulative_weights = xp.concatenate(
+                [xp.zeros(1, dtype="float64"), xp.cumsum(self.weights)])
+
+    @property
+    def number_of_vertices(self):
+        return len(self.vertices)
+
+    @property
+    def number_of_edges(self):
+        return len(self.minors)
+
+    def get_degrees(self, seeds):
+        """
+        Return the starting position in the index and the number of edges for
+        each vertex in seeds. Vertices not in the index have no edges.
+        """
+        xp = self.xp
+        seeds = xp.asarray(seeds)
+        if len(self.vertices) == 0:
+            zeros = xp.zeros(len(seeds), dtype="int64")
+            return (zeros, zeros)
+        positions = xp.searchsorted(self.vertices, seeds)
+        positions = xp.minimum(positions, len(self.vertices) - 1)
+        found = self.vertices[positions] == seeds
+        starts = xp.where(found, self.offsets[positions], 0)
+        degrees = xp.where(
+            found, self.offsets[positions + 1] - self.offsets[positions], 0)
+        return (starts, degrees)
+
+    def sample(self, seeds, fanout=-1, replace=False, random_state=None):
+        """
+        Sample up to fanout edges incident to each vertex in seeds.
+
+        Parameters
+        ----------
+        seeds : cupy.ndarray or numpy.ndarray
+            The vertices to sample edges for.
+        fanout : int, optional (default=-1)
+            The number of edges to sample for each seed. If -1, all edges are
+            returned.
+        replace : bool, optional (default=False)
+            If True, sample with replacement, returning exactly fanout edges
+            for each seed with at least one edge. Otherwise, min(fanout,
+            degree) distinct edges are returned for each seed.
+        random_state : RandomState, optional (default=None)
+            A numpy.random.RandomState or cupy.random.RandomState instance
+            used to generate random numbers.
+
+        Returns
+        -------
+        tuple of (seeds, minors, edge_ids) arrays
+            The seed, the other vertex, and the edge ID of each sampled edge.
+            Edges are grouped by seed in the order of seeds.
+        """
+        xp = self.xp
+        seeds = xp.asarray(seeds)
+        if random_state is None:
+            random_state = xp.random.RandomState()
+        (starts, degrees) = self.get_degrees(seeds)
+
+        if fanout < 0:
+            (segments, positions) = _get_segments(xp, degrees)
+            edges = starts[segments] + positions
+
+        elif replace:
+            counts = xp.where(degrees > 0, fanout, 0)
+            (segments, _) = _get_segments(xp, counts)
+            rands = random_state.random_sample(len(segments))
+            seg_starts = starts[segments]
+            seg_degrees = degrees[segments]
+            if self.weights is None:
+                offsets = (rands * seg_degrees).astype("int64")
+            else:
+                # Inverse transform sampling using the cumulative weights of
+                # the edges of each seed.
+                low = self.cumulative_weights[seg_starts]
+                high = self.cumulative_weights[seg_starts + seg_degrees]
+                targets = low + rands * (high - low)
+                offsets = xp.searchsorted(self.cumulative_weights, targets,
+                                          side="right") - 1 - seg_starts
+            offsets = xp.minimum(xp.maximum(offsets, 0), seg_degrees - 1)
+            edges = seg_starts + offsets
+
+        else:
+            # Assign a random key to each edge of each seed and keep the edges
+            # with the fanout smallest keys for each seed. With weights, the
+            # keys are exponentially distributed with rate equal to the weight
+            # (Efraimidis-Spirakis), giving weighted sampling without
+            # replacement.
+            (segments, positions) = _get_segments(xp, degrees)
+            edges = starts[segments] + positions
+            keys = random_state.random_sample(len(edges))
+            if self.weights is not None:
+                with np.errstate(divide="ignore"):
+                    keys = -xp.log(keys) / self.weights[edges]
+            # Sorting by (segment, key) does not change the position of the
+            # segments, so positions is the rank of each sorted key within its
+            # segment.
+            order = xp.lexsort(xp.stack([keys, segments]))
+            keep = positions < fanout
+            edges = edges[order][keep]
+            segments = segments[keep]
+
+        return (seeds[segments], self.minors[edges], self.edge_ids[edges])
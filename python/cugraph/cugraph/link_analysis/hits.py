@@ -14,16 +14,16 @@
 #
 
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
-                               df_score_to_dictionary,
+                               df_score_to_mapping,
+                               tracing,
                                )
 from pylibcugraph import (ResourceHandle,
-                          GraphProperties,
-                          SGGraph,
                           hits as pylibcugraph_hits
                           )
 import cudf
 
 
+@tracing.traced(category="algorithm")
 def hits(
     G, max_iter=100, tol=1.0e-5, nstart=None, normalized=True
 ):
@@ -89,15 +89,7 @@ def hits(
 
     G, isNx = ensure_cugraph_obj_for_nx(G)
 
-    srcs = G.edgelist.edgelist_df['src']
-    dsts = G.edgelist.edgelist_df['dst']
-    # edge weights are not used for this algorithm
-    weights = G.edgelist.edgelist_df['src'] * 0.0
-
     resource_handle = ResourceHandle()
-    graph_props = GraphProperties(is_multigraph=G.is_multigraph())
-    store_transposed = False
-    renumber = False
     do_expensive_check = False
     init_hubs_guess_vertices = None
     init_hubs_guess_values = None
@@ -106,27 +98,26 @@ def hits(
         init_hubs_guess_vertices = nstart['vertex']
         init_hubs_guess_values = nstart['values']
 
-    sg = SGGraph(resource_handle, graph_props, srcs, dsts, weights,
-                 store_transposed, renumber, do_expensive_check)
+    # edge weights are not used for this algorithm
+    sg = G._get_plc_graph(weight_type="float64", ignore_weights=True)
+
+    with tracing.span("compute") as s:
+        vertices, hubs, authorities = pylibcugraph_hits(
+            resource_handle, sg, tol, max_iter, init_hubs_guess_vertices,
+            init_hubs_guess_values, normalized, do_expensive_check)
+        results = cudf.DataFrame()
+        results["vertex"] = cudf.Series(vertices)
+        results["hubs"] = cudf.Series(hubs)
+        results["authorities"] = cudf.Series(authorities)
+        s.set(rows=len(results))
 
-    vertices, hubs, authorities = pylibcugraph_hits(resource_handle, sg, tol,
-                                                    max_iter,
-                                                    init_hubs_guess_vertices,
-                                                    init_hubs_guess_values,
-                                                    normalized,
-                                                    do_expensive_check)
-    results = cudf.DataFrame()
-    results["vertex"] = cudf.Series(vertices)
-    results["hubs"] = cudf.Series(hubs)
-    results["authorities"] = cudf.Series(authorities)
+    if G.renumbered:
+        results = G.unrenumber(results, "vertex")
 
     if isNx is True:
-        d1 = df_score_to_dictionary(results[["vertex", "hubs"]], "hubs")
-        d2 = df_score_to_dictionary(results[["vertex", "authorities"]],
-                                    "authorities")
+        d1 = df_score_to_mapping(results[["vertex", "hubs"]], "hubs")
+        d2 = df_score_to_mapping(results[["vertex", "authorities"]],
+                                 "authorities")
         results = (d1, d2)
 
-    if G.renumbered:
-        results = G.unrenumber(results, "vertex")
-
     return results
@@ -15,10 +15,12 @@ import cudf
 
 from cugraph.link_analysis import pagerank_wrapper
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
-                               df_score_to_dictionary,
+                               df_score_to_mapping,
+                               tracing,
                                )
 
 
+@tracing.traced(category="algorithm")
 def pagerank(
     G, alpha=0.85, personalization=None, max_iter=100, tol=1.0e-5, nstart=None,
     weight=None, dangling=None
@@ -133,14 +135,16 @@ def pagerank(
                 nstart, "vertex", cols
             )
 
-    df = pagerank_wrapper.pagerank(
-        G, alpha, personalization, max_iter, tol, nstart
-    )
+    with tracing.span("compute") as s:
+        df = pagerank_wrapper.pagerank(
+            G, alpha, personalization, max_iter, tol, nstart
+        )
+        s.set(rows=len(df))
 
     if G.renumbered:
         df = G.unrenumber(df, "vertex")
 
     if isNx is True:
-        return df_score_to_dictionary(df, 'pagerank')
+        return df_score_to_mapping(df, 'pagerank')
     else:
         return df
@@ -14,7 +14,7 @@
 import cudf
 from cugraph.link_prediction import jaccard_wrapper
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
-                               df_edge_score_to_dictionary,
+                               df_edge_score_to_mapping,
                                renumber_vertex_pair,
                                )
 
@@ -179,9 +179,9 @@ def jaccard_coefficient(G, ebunch=None):
     df = jaccard(G, vertex_pair)
 
     if isNx is True:
-        df = df_edge_score_to_dictionary(df,
-                                         k="jaccard_coeff",
-                                         src="source",
-                                         dst="destination")
+        df = df_edge_score_to_mapping(df,
+                                      k="jaccard_coeff",
+                                      src="source",
+                                      dst="destination")
 
     return df
@@ -14,7 +14,7 @@
 from cugraph.link_prediction import overlap_wrapper
 import cudf
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
-                               df_edge_score_to_dictionary,
+                               df_edge_score_to_mapping,
                                renumber_vertex_pair,
                                )
 
@@ -34,10 +34,10 @@ def overlap_coefficient(G, ebunch=None):
     df = overlap(G, vertex_pair)
 
     if isNx is True:
-        df = df_edge_score_to_dictionary(df,
-                                         k="overlap_coeff",
-                                         src="source",
-                                         dst="destination")
+        df = df_edge_score_to_mapping(df,
+                                      k="overlap_coeff",
+                                      src="source",
+                                      dst="destination")
 
     return df
 
@@ -15,7 +15,7 @@ import cudf
 from cugraph.structure.graph_classes import Graph
 from cugraph.link_prediction import jaccard_wrapper
 from cugraph.utilities import (ensure_cugraph_obj_for_nx,
-                               df_edge_score_to_dictionary,
+                               df_edge_score_to_mapping,
                                renumber_vertex_pair,
                                )
 
@@ -149,9 +149,9 @@ def sorensen_coefficient(G, ebunch=None):
     df = sorensen(G, vertex_pair)
 
     if isNx is True:
-        df = df_edge_score_to_dictionary(df,
-                                         k="sorensen_coeff",
-                                         src="source",
-                                         dst="destination")
+        df = df_edge_score_to_mapping(df,
+                                      k="sorensen_coeff",
+                                      src="source",
+                                      dst="destination")
 
     return df
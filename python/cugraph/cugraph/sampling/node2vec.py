@@ -12,8 +12,6 @@
 # limitations under the License.
 
 from pylibcugraph import (ResourceHandle,
-                          GraphProperties,
-                          SGGraph,
                           node2vec as pylibcugraph_node2vec,
                           )
 from cugraph.utilities import ensure_cugraph_obj_for_nx
@@ -123,21 +121,14 @@ def node2vec(G,
             start_vertices = G.lookup_internal_vertex_id(start_vertices)
 
     srcs = G.edgelist.edgelist_df['src']
-    dsts = G.edgelist.edgelist_df['dst']
-    weights = G.edgelist.edgelist_df['weights']
 
     if srcs.dtype != 'int32':
         raise ValueError(f"Graph vertices must have int32 values, "
                          f"got: {srcs.dtype}")
 
     resource_handle = ResourceHandle()
-    graph_props = GraphProperties(is_multigraph=G.is_multigraph())
-    store_transposed = False
-    renumber = False
-    do_expensive_check = False
 
-    sg = SGGraph(resource_handle, graph_props, srcs, dsts, weights,
-                 store_transposed, renumber, do_expensive_check)
+    sg = G._get_plc_graph()
 
     vertex_set, edge_set, sizes = \
         pylibcugraph_node2vec(resource_handle, sg, start_vertices,
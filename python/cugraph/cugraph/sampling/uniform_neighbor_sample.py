@@ -11,10 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pylibcugraph import (ResourceHandle,
-                          GraphProperties,
-                          SGGraph,
-                          )
+from pylibcugraph import ResourceHandle
 from pylibcugraph import uniform_neighbor_sample as \
     pylibcugraph_uniform_neighbor_sample
 
@@ -87,27 +84,22 @@ def uniform_neighbor_sample(G,
             start_list = G.lookup_internal_vertex_id(start_list)
 
     srcs = G.edgelist.edgelist_df['src']
-    dsts = G.edgelist.edgelist_df['dst']
-    weights = G.edgelist.edgelist_df['weights']
-    weight_t = weights.dtype
+    weight_t = G.edgelist.edgelist_df['weights'].dtype
+    weight_type = weight_t
 
     if weight_t == "int32":
-        weights = weights.astype("float32")
+        weight_type = "float32"
     if weight_t == "int64":
-        weights = weights.astype("float64")
+        weight_type = "float64"
 
     if srcs.dtype != 'int32':
         raise ValueError(f"Graph vertices must have int32 values, "
                          f"got: {srcs.dtype}")
 
     resource_handle = ResourceHandle()
-    graph_props = GraphProperties(is_multigraph=G.is_multigraph())
-    store_transposed = False
-    renumber = False
     do_expensive_check = False
 
-    sg = SGGraph(resource_handle, graph_props, srcs, dsts, weights,
-                 store_transposed, renumber, do_expensive_check)
+    sg = G._get_plc_graph(weight_type=weight_type)
 
     sources, destinations, indices = \
         pylibcugraph_uniform_neighbor_sample(resource_handle, sg, start_list,
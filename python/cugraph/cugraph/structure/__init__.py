@@ -34,6 +34,7 @@ from cugraph.structure.convert_matrix import (from_edgelist,
                                               to_numpy_array,
                                               from_numpy_matrix,
                                               to_numpy_matrix,
+                                              to_scipy_sparse,
                                               from_adjlist)
 from cugraph.structure.hypergraph import hypergraph
 from cugraph.structure.shuffle import shuffle
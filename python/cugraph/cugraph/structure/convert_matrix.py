@@ -465,3 +465,40 @@ def to_numpy_matrix(G):
     """
     A = G.to_numpy_matrix()
     return A
+
+
+def to_scipy_sparse(G, format="csr", return_labels=False):
+    """
+    Returns the graph adjacency matrix as a SciPy sparse matrix, without
+    creating a dense matrix.
+    The row indices denote source and column indices denote destination, both
+    ordered by internal vertex ID. Multiple edges between the same pair of
+    vertices are summed.
+
+    Parameters
+    ----------
+    G : cugraph.Graph
+        Graph containing the adjacency matrix.
+
+    format : str, optional (default="csr")
+        The sparse matrix format, one of "csr", "coo", or "csc".
+
+    return_labels : bool, optional (default=False)
+        If True, also return a pandas Index of the vertex ID of each row and
+        column, which accounts for renumbering.
+
+    Returns
+    -------
+    A : scipy.sparse matrix, or a tuple of (A, labels) if return_labels is True
+
+    Examples
+    --------
+    >>> M = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+    ...                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(M, source='0', destination='1', edge_attr='2')
+    >>> A, labels = cugraph.to_scipy_sparse(G, format="csr",
+    ...                                     return_labels=True)
+
+    """
+    return G.to_scipy_sparse(format=format, return_labels=return_labels)
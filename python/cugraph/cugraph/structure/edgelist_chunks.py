@@ -0,0 +1,433 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Construction of the CSR of a graph from an edge list read in chunks, for
+edge lists that do not fit in memory at once.
+
+The edge list is read in two passes over the chunks, with an external sort
+in between when the edges do not fit in the memory budget:
+
+1. Each chunk is deduplicated and kept (in memory, or in parquet files of a
+   temporary directory once the chunks kept exceed the budget), and the
+   number of edges of each vertex is accumulated. The vertices, sorted,
+   make the renumber map: the internal ID of a vertex is its position.
+2. Each kept chunk is renumbered (and, for undirected graphs, the edges are
+   added in both directions) and split into buckets of consecutive source
+   vertices, sized from the edge counts so each bucket fits in the budget.
+   Each bucket is then sorted and deduplicated on its own, and appended to
+   the CSR.
+
+The peak memory use is the budget, plus the renumber map (and the edge
+counts) and the CSR being built.
+"""
+
+import glob
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import cudf
+
+from cugraph.structure.symmetrize import (_get_array_module,
+                                          _get_values,
+                                          _reduce_values,
+                                          _sort_edges)
+from cugraph.utilities import memory_planner
+
+
+_parquet_suffixes = (".parquet", ".pq")
+
+# Bytes of the temporary arrays used to sort an edge, in addition to the
+# edge itself (the packed key, the order and the run ids).
+_sort_bytes_per_edge = 32
+
+
+def _get_paths(chunks):
+    """
+    Return the paths of the files to read if chunks is a path, a glob
+    pattern or a list of paths, otherwise None.
+    """
+    if isinstance(chunks, (str, os.PathLike)):
+        paths = sorted(glob.glob(os.fspath(chunks)))
+        if not paths:
+            raise ValueError(f"no files match '{os.fspath(chunks)}'")
+        return paths
+    if isinstance(chunks, (list, tuple)) and len(chunks) > 0 and \
+            all(isinstance(c, (str, os.PathLike)) for c in chunks):
+        return [os.fspath(c) for c in chunks]
+    return None
+
+
+def _read_file(path, read_options):
+    if path.lower().endswith(_parquet_suffixes):
+        return cudf.read_parquet(path, **read_options)
+    return cudf.read_csv(path, **read_options)
+
+
+def _iter_frames(chunks, read_options):
+    """
+    Yield the DataFrames of chunks, reading them from files if chunks
+    names files.
+    """
+    paths = _get_paths(chunks)
+    if paths is not None:
+        for path in paths:
+            yield _read_file(path, read_options or {})
+        return
+    if read_options:
+        raise ValueError("read_options can only be used to read files")
+    for frame in chunks:
+        if not isinstance(frame, (cudf.DataFrame, pd.DataFrame)):
+            raise TypeError("chunks must be cudf.DataFrame or "
+                            "pandas.DataFrame objects, got "
+                            f"{type(frame)}")
+        yield frame
+
+
+def _frame_module(df):
+    return pd if isinstance(df, pd.DataFrame) else cudf
+
+
+def _nbytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+class _FrameStore:
+    """
+    DataFrames written by one step and read once by the next one, kept in
+    memory until their total size exceeds the budget and written to
+    parquet files in directory afterwards.
+    """
+
+    def __init__(self, budget, directory, name):
+        self.budget = budget
+        self.directory = directory
+        self.name = name
+        self.frames = []
+        self.paths = []
+        self.nbytes = 0
+        self.num_rows = 0
+        self.spilled = False
+
+    def _write(self, df):
+        path = os.path.join(self.directory(),
+                            f"{self.name}-{len(self.paths)}.parquet")
+        df.to_parquet(path, index=False)
+        self.paths.append((path, _frame_module(df)))
+
+    def append(self, df):
+        self.num_rows += len(df)
+        self.nbytes += _nbytes(df)
+        if self.spilled:
+            self._write(df)
+            return
+        self.frames.append(df)
+        if self.budget is not None and self.nbytes > self.budget:
+            self.spilled = True
+            for frame in self.frames:
+                self._write(frame)
+            self.frames = []
+
+    def pop_all(self):
+        """
+        Yield the DataFrames in the order they were appended, releasing
+        them (and removing their files) as they are read.
+        """
+        while self.frames:
+            yield self.frames.pop(0)
+        while self.paths:
+            (path, module) = self.paths.pop(0)
+            df = module.read_parquet(path)
+            os.remove(path)
+            yield df
+
+
+def _dedupe(df, source, destination, edge_attr):
+    """
+    Return the edges of df without duplicates, with the minimum value of the
+    duplicated edges.
+    """
+    if edge_attr is None:
+        return df.drop_duplicates(ignore_index=True)
+    return df.groupby([source, destination], as_index=False, sort=False).min()
+
+
+def _count_edges(df, source, destination, directed):
+    """
+    Return a Series indexed by the vertices of df (sorted) with the number
+    of edges of df out of each vertex, after symmetrizing if not directed.
+    """
+    module = _frame_module(df)
+    num_edges = len(df)
+    vertices = module.concat([df[source], df[destination]],
+                             ignore_index=True)
+    counts = np.ones(2 * num_edges, dtype="int64")
+    if directed:
+        counts[num_edges:] = 0
+    counts = module.DataFrame({"vertex": vertices, "count": counts})
+    return counts.groupby("vertex", sort=True)["count"].sum()
+
+
+def _add_counts(counts, new_counts):
+    if counts is None:
+        return new_counts
+    module = pd if isinstance(counts, pd.Series) else cudf
+    return module.concat([counts, new_counts]).groupby(level=0,
+                                                       sort=True).sum()
+
+
+def _as_array(values):
+    if isinstance(values, (pd.Series, cudf.Series, pd.Index, cudf.Index)):
+        return _get_values(values)
+    return values
+
+
+def _get_vertex_buckets(xp, degrees, capacity):
+    """
+    Return the bucket of each vertex, splitting the vertices into runs of
+    consecutive vertices starting every capacity edges (so a bucket has
+    less than capacity edges, plus the edges of its last vertex).
+    """
+    if len(degrees) == 0:
+        return xp.zeros(0, dtype="int32")
+    first_edge = xp.cumsum(degrees) - degrees
+    buckets = first_edge // capacity
+    new = xp.zeros(len(degrees), dtype="int32")
+    new[1:] = buckets[1:] != buckets[:-1]
+    return xp.cumsum(new, dtype="int32")
+
+
+def build_csr_from_chunks(chunks, source, destination, edge_attr=None,
+                          directed=False, multi=False, renumber=True,
+                          budget=None, spill_dir=None, read_options=None):
+    """
+    Build the CSR of the graph with the edges of the DataFrames (or files)
+    chunks, with bounded memory use.
+
+    Parameters
+    ----------
+    chunks : iterable of cudf.DataFrame or pandas.DataFrame, str or list
+        The chunks of the edge list, or the path or glob pattern (or list of
+        paths) of the CSV or parquet files with the chunks.
+
+    source : str
+        The source column name.
+
+    destination : str
+        The destination column name.
+
+    edge_attr : str or None, optional (default=None)
+        The weights column name. The minimum weight of duplicated edges is
+        kept.
+
+    directed : bool, optional (default=False)
+        If False, the edges are added in both directions.
+
+    multi : bool, optional (default=False)
+        If True, the duplicated edges are kept.
+
+    renumber : bool, optional (default=True)
+        If True, the vertices are numbered by their position in the sorted
+        vertices, otherwise the vertex IDs must be integers, used as the
+        internal vertex IDs.
+
+    budget : int or None, optional (default=None)
+        The memory budget in bytes of the edges held at once, the device (or
+        host, for pandas chunks) budget of the memory planner if None.
+
+    spill_dir : str or None, optional (default=None)
+        The directory of the temporary files, the default temporary
+        directory if None.
+
+    read_options : dict or None, optional (default=None)
+        The keyword arguments of cudf.read_csv or cudf.read_parquet, used
+        to read files.
+
+    Returns
+    -------
+    offsets, indices, weights : cupy.ndarray or numpy.ndarray
+        The CSR (weights is None if edge_attr is None), as numpy arrays if
+        the chunks are pandas DataFrames.
+
+    vertices : cudf.Series, pandas.Series or None
+        The vertex ID of each internal vertex ID, or None if renumber is
+        False.
+
+    num_edges : int
+        The number of edges (counted once for undirected graphs).
+    """
+    if isinstance(source, list) or isinstance(destination, list):
+        if len(source) != 1 or len(destination) != 1:
+            raise ValueError("multi column vertex IDs are not supported "
+                             "when reading an edge list in chunks")
+        (source, destination) = (source[0], destination[0])
+    if budget is not None and budget <= 0:
+        raise ValueError("budget must be positive")
+    columns = [source, destination]
+    if edge_attr is not None:
+        columns.append(edge_attr)
+
+    tmp_dir = None
+
+    def directory():
+        nonlocal tmp_dir
+        if tmp_dir is None:
+            tmp_dir = tempfile.mkdtemp(prefix="cugraph-edgelist-",
+                                       dir=spill_dir)
+        return tmp_dir
+
+    try:
+        # Pass 1: deduplicate and keep each chunk, and count the edges of
+        # each vertex.
+        runs = None
+        counts = None
+        weight_itemsize = 0
+        for frame in _iter_frames(chunks, read_options):
+            if not set(columns).issubset(set(frame.columns)):
+                raise ValueError(
+                    "source, destination and/or edge_attr column names "
+                    "not found in input. Recheck the source, destination "
+                    "and edge_attr parameters")
+            if runs is None:
+                if budget is None:
+                    budget = memory_planner.get_memory_budget(
+                        "host" if isinstance(frame, pd.DataFrame)
+                        else "device")
+                runs = _FrameStore(budget, directory, "chunk")
+            df = frame[columns]
+            if not renumber and (df[source].dtype.kind not in "iu" or
+                                 df[destination].dtype.kind not in "iu"):
+                raise ValueError(
+                    "set renumber to True for non integer columns ids")
+            if edge_attr is not None:
+                weight_itemsize = df[edge_attr].dtype.itemsize
+            if not multi:
+                df = _dedupe(df, source, destination, edge_attr)
+            counts = _add_counts(counts, _count_edges(df, source,
+                                                      destination, directed))
+            runs.append(df)
+        if counts is None or len(counts) == 0:
+            raise ValueError("the edge list is empty")
+
+        # The internal vertex IDs and the number of edges of each.
+        ids = _as_array(counts.index)
+        degrees = _as_array(counts)
+        xp = _get_array_module(degrees)
+        if renumber:
+            vertices = counts.index.to_series().reset_index(drop=True)
+            num_vertices = len(vertices)
+        else:
+            vertices = None
+            if int(ids.min()) < 0:
+                raise ValueError("vertex IDs must be non-negative if not "
+                                 "renumbering")
+            num_vertices = int(ids.max()) + 1
+            all_degrees = xp.zeros(num_vertices, dtype="int64")
+            all_degrees[ids] = degrees
+            degrees = all_degrees
+        del counts, ids
+        id_type = "int32" if num_vertices < 2**31 else "int64"
+
+        # Pass 2: renumber the chunks, and split them into buckets that fit
+        # in the budget.
+        edge_size = 2 * np.dtype(id_type).itemsize + weight_itemsize + \
+            _sort_bytes_per_edge
+        capacity = max(1, budget // edge_size)
+        vertex_buckets = _get_vertex_buckets(xp, degrees, capacity)
+        num_buckets = int(vertex_buckets[-1]) + 1
+        del degrees
+        # The buckets are kept in memory if the chunks fit in the budget.
+        buckets = [_FrameStore(None, directory, f"bucket{i}")
+                   for i in range(num_buckets)]
+        for bucket in buckets:
+            bucket.spilled = runs.spilled
+        module = None
+        for df in runs.pop_all():
+            module = _frame_module(df)
+            if renumber:
+                src = _as_array(vertices.searchsorted(df[source]))
+                dst = _as_array(vertices.searchsorted(df[destination]))
+            else:
+                src = _get_values(df[source])
+                dst = _get_values(df[destination])
+            (src, dst) = (src.astype(id_type), dst.astype(id_type))
+            values = _get_values(df[edge_attr]) if edge_attr else None
+            del df
+            if not directed:
+                (src, dst) = (xp.concatenate([src, dst]),
+                              xp.concatenate([dst, src]))
+                if values is not None:
+                    values = xp.concatenate([values, values])
+            edge_buckets = vertex_buckets[src]
+            order = xp.argsort(edge_buckets)
+            ends = xp.cumsum(xp.bincount(edge_buckets,
+                                         minlength=num_buckets)).tolist()
+            start = 0
+            for (i, end) in enumerate(ends):
+                if end == start:
+                    continue
+                piece = order[start:end]
+                piece_df = {"src": src[piece], "dst": dst[piece]}
+                if values is not None:
+                    piece_df["weights"] = values[piece]
+                buckets[i].append(module.DataFrame(piece_df))
+                start = end
+        del vertex_buckets
+
+        # Sort and deduplicate each bucket, and append it to the CSR.
+        out_degrees = xp.zeros(num_vertices, dtype="int64")
+        indices = []
+        weights = []
+        num_edges = 0
+        for bucket in buckets:
+            pieces = list(bucket.pop_all())
+            if not pieces:
+                continue
+            df = module.concat(pieces, ignore_index=True)
+            del pieces
+            src = _get_values(df["src"])
+            dst = _get_values(df["dst"])
+            (order, starts) = _sort_edges(xp, src, dst, stable=False)
+            if multi:
+                starts = xp.arange(len(order))
+            first = order[starts]
+            if edge_attr is not None:
+                group_ids = xp.zeros(len(order), dtype="int64")
+                group_ids[starts[1:]] = 1
+                group_ids = xp.cumsum(group_ids)
+                weights.append(_reduce_values(
+                    xp, _get_values(df["weights"]), order, starts,
+                    group_ids, "min"))
+            (src, dst) = (src[first], dst[first])
+            del df, order, starts, first
+            out_degrees += xp.bincount(src, minlength=num_vertices)
+            indices.append(dst)
+            if directed:
+                num_edges += len(dst)
+            else:
+                num_edges += int((dst >= src).sum())
+
+        offsets = xp.zeros(num_vertices + 1, dtype="int64")
+        offsets[1:] = xp.cumsum(out_degrees)
+        if int(offsets[-1]) < 2**31:
+            offsets = offsets.astype("int32")
+        indices = xp.concatenate(indices).astype(id_type)
+        weights = xp.concatenate(weights) if edge_attr is not None else None
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return (offsets, indices, weights, vertices, num_edges)
@@ -159,6 +159,94 @@ class Graph:
             renumber=renumber,
             legacy_renum_only=legacy_renum_only)
 
+    def from_edgelist_chunks(
+        self,
+        chunks,
+        source="source",
+        destination="destination",
+        edge_attr=None,
+        renumber=True,
+        budget=None,
+        spill_dir=None,
+        read_options=None,
+    ):
+        """
+        Initialize a graph from an edge list read in chunks, for edge lists
+        that do not fit in (device) memory at once. It is an error to call
+        this method on an initialized Graph object.
+        The chunks are read twice: once to deduplicate them and collect the
+        vertices, and once to renumber the edges and build the adjacency
+        list in buckets of source vertices that fit in the memory budget.
+        The chunks are kept in parquet files of a temporary directory if they
+        do not fit in the budget, so only the renumber map and the adjacency
+        list of the graph need to fit in memory.
+        Duplicated edges are merged (keeping the minimum weight) unless the
+        graph is a MultiGraph. Vertices are renumbered by their position in
+        the sorted vertex IDs.
+
+        Parameters
+        ----------
+        chunks : iterable of cudf.DataFrame or pandas.DataFrame, str or list
+            The chunks of the edge list: DataFrames (which may be produced
+            on demand by a generator), or the path or glob pattern (or list
+            of paths) of CSV or parquet (.parquet or .pq) files, each read
+            as a chunk.
+
+        source : str, optional (default='source')
+            source column name. Multi column vertex IDs are not supported.
+
+        destination : str, optional (default='destination')
+            destination column name.
+
+        edge_attr : str or None, optional (default=None)
+            the weights column name.
+
+        renumber : bool, optional (default=True)
+            Indicate whether or not to renumber the source and destination
+            vertex IDs. If False, the vertex IDs must be integers and the
+            graph has the vertices in the range [0, max vertex ID].
+
+        budget : int or None, optional (default=None)
+            The memory budget in bytes of the edges held in memory at once.
+            If None, the device memory budget (see cugraph.memory_budget) is
+            used, or the host memory budget for pandas DataFrame chunks.
+
+        spill_dir : str or None, optional (default=None)
+            The directory of the temporary files. If None, the default
+            temporary directory is used.
+
+        read_options : dict or None, optional (default=None)
+            Keyword arguments passed to cudf.read_csv or cudf.read_parquet
+            when reading files.
+
+        Examples
+        --------
+        >>> df = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+        ...                    dtype=['int32', 'int32', 'float32'],
+        ...                    header=None)
+        >>> chunks = (df[i:i + 50] for i in range(0, len(df), 50))
+        >>> G = cugraph.Graph()
+        >>> G.from_edgelist_chunks(chunks, source='0', destination='1',
+        ...                        edge_attr='2')
+
+        """
+        if self._Impl is None:
+            self._Impl = simpleGraphImpl(self.graph_properties)
+        elif type(self._Impl) is not simpleGraphImpl:
+            raise RuntimeError("Graph is already initialized")
+        elif (self._Impl.edgelist is not None or
+              self._Impl.adjlist is not None):
+            raise RuntimeError("Graph already has values")
+        self._Impl._simpleGraphImpl__from_edgelist_chunks(
+            chunks,
+            source=source,
+            destination=destination,
+            edge_attr=edge_attr,
+            renumber=renumber,
+            budget=budget,
+            spill_dir=spill_dir,
+            read_options=read_options)
+
     def from_cudf_adjlist(self, offset_col, index_col, value_col=None):
         """
         Initialize a graph from the adjacency list. It is an error to call this
@@ -0,0 +1,155 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache of backend (pylibcugraph) graph handles owned by a graph
+implementation.
+
+Building a pylibcugraph.SGGraph from an edge list copies and sorts the whole
+edge list, so algorithms that are repeatedly called on the same cugraph.Graph
+reuse a previously built handle instead of rebuilding it on every call.  This
+module intentionally does not import cudf or pylibcugraph at module scope so
+the cache (and the host reference backend) can be used on CPU-only machines.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "currsize"])
+
+
+def _to_host_array(series):
+    """
+    Return the values of a cudf/pandas Series or array-like as a NumPy array.
+    """
+    if hasattr(series, "values_host"):
+        return series.values_host
+    if hasattr(series, "to_numpy"):
+        return series.to_numpy()
+    return np.asarray(series)
+
+
+class HostSGGraph:
+    """
+    Pure-host reference implementation of the pylibcugraph.SGGraph
+    constructor.  The edge list is converted to a CSR (or CSC if
+    store_transposed is True) using NumPy, which makes it possible to
+    exercise and benchmark the graph handle cache without a GPU.
+
+    The constructor signature matches pylibcugraph.SGGraph so it can be used
+    as a drop-in backend for PLCGraphCache.
+    """
+    def __init__(self, resource_handle, graph_properties, src_array,
+                 dst_array, weight_array, store_transposed=False,
+                 renumber=False, do_expensive_check=False):
+        srcs = _to_host_array(src_array)
+        dsts = _to_host_array(dst_array)
+        weights = _to_host_array(weight_array)
+
+        if do_expensive_check:
+            if not (len(srcs) == len(dsts) == len(weights)):
+                raise ValueError("src, dst and weight arrays must have the "
+                                 "same length")
+
+        if store_transposed:
+            major, minor = dsts, srcs
+        else:
+            major, minor = srcs, dsts
+
+        self.graph_properties = graph_properties
+        self.store_transposed = store_transposed
+        self.weight_type = weights.dtype
+
+        num_vertices = 0
+        if len(major) > 0:
+            num_vertices = int(max(major.max(), minor.max())) + 1
+
+        order = np.argsort(major, kind="stable")
+        self.indices = minor[order]
+        self.weights = weights[order]
+        self.offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(major, minlength=num_vertices),
+                  out=self.offsets[1:])
+
+    @property
+    def number_of_vertices(self):
+        return len(self.offsets) - 1
+
+    @property
+    def number_of_edges(self):
+        return len(self.indices)
+
+
+def _default_backend():
+    from pylibcugraph import SGGraph
+    return SGGraph
+
+
+class PLCGraphCache:
+    """
+    Lazily built, invalidation-aware cache of backend graph handles.
+
+    Handles are keyed by the parameters that change the backend graph
+    (store_transposed, weight dtype and graph properties), so an algorithm
+    requiring a transposed graph does not evict the handle used by an
+    algorithm requiring the non-transposed one.  The owner is responsible for
+    calling invalidate() whenever the underlying edge list changes.
+
+    Parameters
+    ----------
+    backend : callable, optional (default=None)
+        Callable with the pylibcugraph.SGGraph constructor signature used to
+        build a handle on a cache miss.  Defaults to pylibcugraph.SGGraph.
+    """
+    def __init__(self, backend=None):
+        self.backend = backend
+        self._handles = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, make_args, force_rebuild=False):
+        """
+        Return the handle stored for key, building it with
+        backend(*make_args()) on a miss.  make_args is only called on a miss
+        so the (potentially expensive) input preparation is skipped when a
+        handle is already cached.
+        """
+        if not force_rebuild and key in self._handles:
+            self.hits += 1
+            return self._handles[key]
+
+        self.misses += 1
+        backend = self.backend
+        if backend is None:
+            backend = _default_backend()
+        handle = backend(*make_args())
+        self._handles[key] = handle
+        return handle
+
+    def invalidate(self):
+        """
+        Drop all cached handles, freeing their memory if they are no longer
+        referenced elsewhere.
+        """
+        self._handles.clear()
+
+    def cache_info(self):
+        """
+        Return a CacheInfo namedtuple of (hits, misses, currsize).
+        """
+        return CacheInfo(self.hits, self.misses, len(self._handles))
+
+    def __len__(self):
+        return len(self._handles)
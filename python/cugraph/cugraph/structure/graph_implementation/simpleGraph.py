@@ -15,13 +15,24 @@ from cugraph.structure import graph_primtypes_wrapper
 from cugraph.structure.graph_primtypes_wrapper import Direction
 from cugraph.structure.symmetrize import symmetrize
 from cugraph.structure.number_map import NumberMap
+from cugraph.structure.edgelist_chunks import build_csr_from_chunks
+from cugraph.structure.graph_implementation.plc_graph_cache import (
+    PLCGraphCache)
+from cugraph.utilities.utils import import_optional
+from cugraph.utilities import tracing
 import cugraph.dask.common.mg_utils as mg_utils
 import cudf
+import cupy
 import dask_cudf
 import cugraph.dask.comms.comms as Comms
 import pandas as pd
 import numpy as np
 from cugraph.dask.structure import replication
+from pylibcugraph import (ResourceHandle,
+                          GraphProperties,
+                          )
+
+sp_sparse = import_optional("scipy.sparse")
 
 
 # FIXME: Change to consistent camel case naming
@@ -63,6 +74,10 @@ class simpleGraphImpl:
             self.weighted = False
 
     def __init__(self, properties):
+        # Cache of pylibcugraph graph handles built from the edgelist, must be
+        # created before the edgelist is assigned
+        self._plc_graph_cache = PLCGraphCache()
+
         # Structure
         self.edgelist = None
         self.adjlist = None
@@ -78,6 +93,98 @@ class simpleGraphImpl:
         self.batch_adjlists = None
         self.batch_transposed_adjlists = None
 
+    @property
+    def edgelist(self):
+        return self._edgelist
+
+    @edgelist.setter
+    def edgelist(self, value):
+        # Any cached pylibcugraph graph was built from the previous edgelist
+        self._edgelist = value
+        self._plc_graph_cache.invalidate()
+
+    def _get_plc_graph(self, store_transposed=False, weight_type=None,
+                       ignore_weights=False, is_symmetric=False,
+                       do_expensive_check=False):
+        """
+        Return a pylibcugraph.SGGraph built from the edgelist. The graph is
+        built on first use and cached for subsequent calls with the same
+        store_transposed, weight type and symmetry; the cache is invalidated
+        whenever the edgelist is replaced or deleted.
+
+        Parameters
+        ----------
+        store_transposed : bool, optional (default=False)
+            Build the graph with the transposed (CSC) layout.
+
+        weight_type : str or numpy.dtype, optional (default=None)
+            Type of the edge weights passed to pylibcugraph. If None, the
+            type of the 'weights' column is used, or float32 if the graph is
+            unweighted.
+
+        ignore_weights : bool, optional (default=False)
+            If True, or if the graph is unweighted, a weight of 1 is used for
+            every edge.
+
+        is_symmetric : bool, optional (default=False)
+            Value of the is_symmetric graph property.
+
+        do_expensive_check : bool, optional (default=False)
+            Run the pylibcugraph input checks. Since these checks only happen
+            at construction time, requesting them always rebuilds the graph.
+        """
+        if self.edgelist is None:
+            raise RuntimeError("Graph has no Edgelist.")
+
+        edgelist_df = self.edgelist.edgelist_df
+        use_weights = ("weights" in edgelist_df.columns and
+                       not ignore_weights)
+        if weight_type is None:
+            if use_weights:
+                weight_type = edgelist_df["weights"].dtype
+            else:
+                weight_type = "float32"
+        weight_type = np.dtype(weight_type)
+        is_multigraph = self.properties.multi_edge
+
+        def make_args():
+            srcs = edgelist_df["src"]
+            dsts = edgelist_df["dst"]
+            if use_weights:
+                weights = edgelist_df["weights"]
+                if weights.dtype != weight_type:
+                    weights = weights.astype(weight_type)
+            else:
+                weights = cudf.Series(cupy.ones(len(srcs), dtype=weight_type))
+            graph_props = GraphProperties(is_symmetric=is_symmetric,
+                                          is_multigraph=is_multigraph)
+            return (ResourceHandle(), graph_props, srcs, dsts, weights,
+                    store_transposed, False, do_expensive_check)
+
+        key = (bool(store_transposed), weight_type.str, use_weights,
+               bool(is_symmetric), bool(is_multigraph))
+        with tracing.span("graph_construction") as s:
+            misses = self._plc_graph_cache.misses
+            plc_graph = self._plc_graph_cache.get(
+                key, make_args, force_rebuild=do_expensive_check)
+            s.set(rows=len(edgelist_df),
+                  cached=self._plc_graph_cache.misses == misses)
+        return plc_graph
+
+    def plc_graph_cache_info(self):
+        """
+        Return the (hits, misses, currsize) statistics of the cache of
+        pylibcugraph graphs built from this graph's edgelist.
+        """
+        return self._plc_graph_cache.cache_info()
+
+    def clear_plc_graph_cache(self):
+        """
+        Free the pylibcugraph graphs cached for this graph. They are rebuilt
+        on demand by the next algorithm call.
+        """
+        self._plc_graph_cache.invalidate()
+
     # Functions
     # FIXME: Change to public function
     # FIXME: Make function more modular
@@ -222,32 +329,100 @@ class simpleGraphImpl:
 
     def to_pandas_adjacency(self):
         """
-        Returns the graph adjacency matrix as a Pandas DataFrame.
+        Returns the graph adjacency matrix as a Pandas DataFrame. The index
+        and columns are the vertex IDs of the graph (a MultiIndex for graphs
+        with multi-column vertices).
         """
 
         np_array_data = self.to_numpy_array()
         pdf = pd.DataFrame(np_array_data)
-        if self.properties.renumbered:
-            nodes = self.renumber_map.implementation.df['0'].\
-                    values_host.tolist()
-        pdf.columns = nodes
-        pdf.index = nodes
+        nodes = self._get_vertex_labels()
+        if nodes is not None:
+            pdf.columns = nodes
+            pdf.index = nodes
         return pdf
 
     def to_numpy_array(self):
         """
-        Returns the graph adjacency matrix as a NumPy array.
+        Returns the graph adjacency matrix as a NumPy array. Rows and columns
+        are ordered by internal vertex ID.
         """
 
         nlen = self.number_of_nodes()
-        elen = self.number_of_edges()
-        df = self.edgelist.edgelist_df
+        (src, dst, weights) = self._get_adjacency_arrays()
         np_array = np.full((nlen, nlen), 0.0)
-        for i in range(0, elen):
-            np_array[df['src'].iloc[i], df['dst'].iloc[i]] = df['weights'].\
-                                                             iloc[i]
+        # Scatter all edges at once rather than one edge at a time.
+        np_array[src, dst] = weights
         return np_array
 
+    def to_scipy_sparse(self, format="csr", return_labels=False):
+        """
+        Returns the graph adjacency matrix as a SciPy sparse matrix, built
+        directly from the edge list without creating a dense matrix. Rows and
+        columns are ordered by internal vertex ID. Multiple edges between the
+        same pair of vertices are summed.
+
+        Parameters
+        ----------
+        format : str, optional (default="csr")
+            The sparse matrix format, one of "csr", "coo", or "csc".
+
+        return_labels : bool, optional (default=False)
+            If True, also return a pandas Index of the vertex ID of each row
+            and column (a MultiIndex for graphs with multi-column vertices).
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix, scipy.sparse.coo_matrix, or
+        scipy.sparse.csc_matrix, or a tuple of (matrix, labels) if
+        return_labels is True
+        """
+        if format not in ("csr", "coo", "csc"):
+            raise ValueError(f'format must be "csr", "coo", or "csc", got: '
+                             f"{format}")
+
+        nlen = self.number_of_nodes()
+        (src, dst, weights) = self._get_adjacency_arrays()
+        matrix = sp_sparse.coo_matrix((weights, (src, dst)),
+                                      shape=(nlen, nlen)).asformat(format)
+        if not return_labels:
+            return matrix
+        labels = self._get_vertex_labels()
+        if labels is None:
+            labels = pd.RangeIndex(nlen)
+        return (matrix, labels)
+
+    def _get_adjacency_arrays(self):
+        """
+        Returns NumPy arrays of the internal source vertex ID, internal
+        destination vertex ID, and weight of each (directed) edge. Unweighted
+        edges have a weight of 1.0.
+        """
+        if self.edgelist is None:
+            self.view_edge_list()
+        df = self.edgelist.edgelist_df
+        src = df["src"].values_host
+        dst = df["dst"].values_host
+        if "weights" in df.columns:
+            weights = df["weights"].values_host
+        else:
+            weights = np.ones(len(src), dtype=np.float64)
+        return (src, dst, weights)
+
+    def _get_vertex_labels(self):
+        """
+        Returns a pandas Index of the vertex ID for each internal vertex ID, or
+        None if the graph is not renumbered (the internal vertex IDs are the
+        vertex IDs).
+        """
+        if not self.properties.renumbered:
+            return None
+        impl = self.renumber_map.implementation
+        pdf = impl.df.sort_values("id")[impl.col_names].to_pandas()
+        if len(impl.col_names) == 1:
+            return pd.Index(pdf[impl.col_names[0]])
+        return pd.MultiIndex.from_frame(pdf)
+
     def to_numpy_matrix(self):
         """
         Returns the graph adjacency matrix as a NumPy matrix.
@@ -310,6 +485,50 @@ class simpleGraphImpl:
         # no longer used.
         self.edgelist = None
 
+    def __from_edgelist_chunks(
+        self,
+        chunks,
+        source="source",
+        destination="destination",
+        edge_attr=None,
+        renumber=True,
+        budget=None,
+        spill_dir=None,
+        read_options=None,
+    ):
+        (offsets, indices, weights, vertices, num_edges) = \
+            build_csr_from_chunks(
+                chunks, source, destination, edge_attr=edge_attr,
+                directed=self.properties.directed,
+                multi=self.properties.multi_edge, renumber=renumber,
+                budget=budget, spill_dir=spill_dir,
+                read_options=read_options)
+
+        self.renumber_map = None
+        if vertices is not None:
+            # The internal vertex IDs are the positions of the sorted
+            # vertices, which is the layout of the renumber map.
+            if isinstance(vertices, pd.Series):
+                vertices = cudf.Series.from_pandas(vertices)
+            renumber_map = NumberMap(id_type=indices.dtype)
+            s_col = source if isinstance(source, list) else [source]
+            d_col = destination if isinstance(destination, list) \
+                else [destination]
+            renumber_map.implementation = NumberMap.SingleGPU(
+                cudf.DataFrame({"0": vertices,
+                                "id": cupy.arange(len(vertices),
+                                                  dtype=indices.dtype)}),
+                s_col, d_col, renumber_map.id_type, False)
+            renumber_map.implementation.numbered = True
+            self.renumber_map = renumber_map
+        self.properties.renumbered = vertices is not None
+        self.properties.weighted = edge_attr is not None
+        self.properties.node_count = len(offsets) - 1
+        self.properties.edge_count = num_edges
+
+        self.__from_adjlist(cudf.Series(offsets), cudf.Series(indices),
+                            None if weights is None else cudf.Series(weights))
+
     def __from_adjlist(self, offset_col, index_col, value_col=None):
         self.adjlist = simpleGraphImpl.AdjList(offset_col, index_col,
                                                value_col)
@@ -353,7 +572,10 @@ class simpleGraphImpl:
                     self.transposedadjlist.weights,
                 )
             else:
-                off, ind, vals = graph_primtypes_wrapper.view_adj_list(self)
+                with tracing.span("graph_construction") as s:
+                    off, ind, vals = graph_primtypes_wrapper.view_adj_list(
+                        self)
+                    s.set(rows=len(ind), layout="csr")
             self.adjlist = self.AdjList(off, ind, vals)
 
             if self.batch_enabled:
@@ -396,11 +618,13 @@ class simpleGraphImpl:
                     self.adjlist.weights,
                 )
             else:
-                (
-                    off,
-                    ind,
-                    vals,
-                ) = graph_primtypes_wrapper.view_transposed_adj_list(self)
+                with tracing.span("graph_construction") as s:
+                    (
+                        off,
+                        ind,
+                        vals,
+                    ) = graph_primtypes_wrapper.view_transposed_adj_list(self)
+                    s.set(rows=len(ind), layout="csc")
             self.transposedadjlist = self.transposedAdjList(off, ind, vals)
 
             if self.batch_enabled:
@@ -839,19 +1063,19 @@ class simpleGraphImpl:
         Returns all the nodes in the graph as a cudf.Series.
         If multi columns vertices, return a cudf.DataFrame.
         """
+        if self.properties.renumbered and (self.edgelist is not None or
+                                           self.adjlist is not None):
+            # FIXME: This relies on current implementation
+            #        of NumberMap, should not really expose
+            #        this, perhaps add a method to NumberMap
+            df = self.renumber_map.implementation.df.drop(columns="id")
+            if len(df.columns) > 1:
+                return df
+            else:
+                return df[df.columns[0]]
         if self.edgelist is not None:
             df = self.edgelist.edgelist_df
-            if self.properties.renumbered:
-                # FIXME: This relies on current implementation
-                #        of NumberMap, should not really expose
-                #        this, perhaps add a method to NumberMap
-                df = self.renumber_map.implementation.df.drop(columns="id")
-                if len(df.columns) > 1:
-                    return df
-                else:
-                    return df[df.columns[0]]
-            else:
-                return cudf.concat([df["src"], df["dst"]]).unique()
+            return cudf.concat([df["src"], df["dst"]]).unique()
         if self.adjlist is not None:
             return cudf.Series(np.arange(0, self.number_of_nodes()))
 
@@ -22,6 +22,7 @@ import cudf
 
 from cugraph.dask.common.input_utils import get_distributed_data
 from cugraph.structure import renumber_wrapper as c_renumber
+from cugraph.utilities import tracing
 import cugraph.dask.comms.comms as Comms
 
 
@@ -44,9 +45,75 @@ def call_renumber(sID,
                                store_transposed)
 
 
+class SortedIndex:
+    """
+    Index over the rows of a DataFrame keyed by one of its (unique valued)
+    columns. The DataFrame is sorted by the key once when the index is built,
+    after which a batch of keys is resolved with a single vectorized
+    searchsorted and gather, in O(n log V) for n keys instead of the
+    O(V log V) of a merge against the whole DataFrame.
+
+    Works with both cudf and pandas DataFrames.
+
+    Parameters
+    ----------
+    df : cudf.DataFrame or pandas.DataFrame
+        DataFrame to index. The values of key_column must be unique.
+
+    key_column : str
+        Name of the column to index on.
+    """
+    def __init__(self, df, key_column):
+        df = df.sort_values(key_column).reset_index(drop=True)
+        self.keys = df[key_column]
+        self.values = df.drop(columns=[key_column])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def supports(self, keys):
+        """
+        Returns True if keys can be resolved using this index. Integer keys
+        of a different width than the index are supported, other type
+        mismatches are not.
+        """
+        if len(self.keys) == 0:
+            return False
+        return (keys.dtype == self.keys.dtype) or \
+            (keys.dtype.kind in "iu" and self.keys.dtype.kind in "iu")
+
+    def lookup(self, keys):
+        """
+        Return a DataFrame containing the non-key columns of the indexed
+        DataFrame for each value in keys. Rows of the result are in the order
+        of keys (with a default index), keys that are not present in the index
+        produce null values.
+        """
+        keys = keys.reset_index(drop=True)
+        positions = type(keys)(
+            self.keys.searchsorted(keys.astype(self.keys.dtype)))
+        positions = positions.clip(upper=len(self.keys) - 1).values
+
+        # The keys are compared without casting so that values overflowing
+        # the index type are not matched.
+        found = self.keys.take(positions).reset_index(drop=True) == keys
+        found = found.fillna(False)
+
+        result = self.values.take(positions).reset_index(drop=True)
+        if not found.all():
+            for name in result.columns:
+                result[name] = result[name].where(found)
+        return result
+
+
 class NumberMap:
 
     class SingleGPU:
+        # Resolve lookups using sorted indices of the renumber map rather than
+        # merging against the whole map. Disabling this is only useful to
+        # benchmark the merge-based lookups.
+        use_lookup_index = True
+
         def __init__(self, df, src_col_names, dst_col_names, id_type,
                      store_transposed):
             self.col_names = NumberMap.compute_vals(src_col_names)
@@ -57,7 +124,53 @@ class NumberMap:
             self.store_transposed = store_transposed
             self.numbered = False
 
+        @property
+        def df(self):
+            return self._df
+
+        @df.setter
+        def df(self, value):
+            self._df = value
+            # The indices are rebuilt on demand from the new renumber map
+            self._external_index = None
+            self._internal_index = None
+
+        def _get_external_index(self, keys):
+            """
+            Returns the index mapping external vertex ids to internal vertex
+            ids, or None if it cannot be used to look up keys.
+            """
+            if not self.use_lookup_index or len(self.col_names) != 1 or \
+                    "id" not in self.df.columns:
+                return None
+            if self._external_index is None:
+                self._external_index = SortedIndex(
+                    self.df[[self.col_names[0], "id"]], self.col_names[0])
+            if not self._external_index.supports(keys):
+                return None
+            return self._external_index
+
+        def _get_internal_index(self, ids):
+            """
+            Returns the index mapping internal vertex ids to external vertex
+            ids, or None if it cannot be used to look up ids.
+            """
+            if not self.use_lookup_index or "id" not in self.df.columns:
+                return None
+            if self._internal_index is None:
+                self._internal_index = SortedIndex(
+                    self.df[self.col_names + ["id"]], "id")
+            if not self._internal_index.supports(ids):
+                return None
+            return self._internal_index
+
         def to_internal_vertex_id(self, df, col_names):
+            index = None
+            if len(col_names) == 1:
+                index = self._get_external_index(df[col_names[0]])
+            if index is not None:
+                return index.lookup(df[col_names[0]])["id"]
+
             tmp_df = df[col_names].rename(
                 columns=dict(zip(col_names, self.col_names)), copy=False
             )
@@ -74,14 +187,23 @@ class NumberMap:
         def from_internal_vertex_id(
             self, df, internal_column_name, external_column_names
         ):
-            tmp_df = self.df.merge(
-                df,
-                right_on=internal_column_name,
-                left_on="id",
-                how="right",
-            )
-            if internal_column_name != "id":
-                tmp_df = tmp_df.drop(columns=["id"])
+            index = self._get_internal_index(df[internal_column_name])
+            if index is not None and \
+                    not set(self.col_names).intersection(df.columns):
+                # Same columns as the merge below, but in the input order
+                tmp_df = index.lookup(df[internal_column_name])
+                df = df.reset_index(drop=True)
+                for name in df.columns:
+                    tmp_df[name] = df[name]
+            else:
+                tmp_df = self.df.merge(
+                    df,
+                    right_on=internal_column_name,
+                    left_on="id",
+                    how="right",
+                )
+                if internal_column_name != "id":
+                    tmp_df = tmp_df.drop(columns=["id"])
             if external_column_names is None:
                 return tmp_df
             else:
@@ -94,6 +216,21 @@ class NumberMap:
                                    drop, preserve_order):
             ret = None
 
+            if col_names is None:
+                col_names = self.col_names
+
+            index = None
+            if len(col_names) == 1 and id_column_name not in df.columns:
+                index = self._get_external_index(df[col_names[0]])
+            if index is not None:
+                # The lookup preserves the order of df
+                ret = df.reset_index(drop=True)
+                ret.insert(0, id_column_name,
+                           index.lookup(df[col_names[0]])["id"])
+                if drop:
+                    ret = ret.drop(columns=col_names)
+                return ret
+
             if preserve_order:
                 index_name = NumberMap.generate_unused_column_name(df.columns)
                 tmp_df = df
@@ -108,9 +245,7 @@ class NumberMap:
                 id_name = "id"
                 merge_df = self.df
 
-            if col_names is None:
-                ret = merge_df.merge(tmp_df, on=self.col_names, how="right")
-            elif col_names == self.col_names:
+            if col_names == self.col_names:
                 ret = merge_df.merge(tmp_df, on=self.col_names, how="right")
             else:
                 ret = (
@@ -324,6 +459,7 @@ class NumberMap:
         """
         return [str(i) for i in range(len(column_names))]
 
+    @tracing.traced("renumber_lookup")
     def to_internal_vertex_id(self, df, col_names=None):
         """
         Given a collection of external vertex ids, return the internal
@@ -365,6 +501,7 @@ class NumberMap:
                                                           tmp_col_names)
         return reply
 
+    @tracing.traced("renumber_lookup")
     def add_internal_vertex_id(
         self, df, id_column_name="id", col_names=None, drop=False,
         preserve_order=False
@@ -497,6 +634,7 @@ class NumberMap:
         return output_df
 
     @staticmethod
+    @tracing.traced("renumber")
     def renumber_and_segment(
         df, src_col_names, dst_col_names, preserve_order=False,
         store_transposed=False, legacy_renum_only=False
@@ -690,6 +828,7 @@ class NumberMap:
             df, src_col_names, dst_col_names,
             preserve_order, store_transposed, legacy_renum_only)[0:2]
 
+    @tracing.traced("unrenumber")
     def unrenumber(self, df, column_name, preserve_order=False,
                    get_column_names=False):
         """
@@ -11,24 +11,97 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ast
+import json
+import os
+from collections import namedtuple, OrderedDict
+from functools import lru_cache
+
 import cudf
+import cupy
+import numpy as np
 
 import cugraph
+from cugraph.structure.number_map import SortedIndex
 from cugraph.utilities.utils import import_optional, MissingModule
 
 pd = import_optional("pandas")
+pa = import_optional("pyarrow")
 
 _dataframe_types = [cudf.DataFrame]
 if not isinstance(pd, MissingModule):
     _dataframe_types.append(pd.DataFrame)
 
 
+# The number of bytes used to store properties as returned by
+# PropertyGraph.property_memory_usage(). "stored" is the number of bytes used
+# by the tables actually stored, and "wide" is the number of bytes used by the
+# equivalent single table containing the property columns of all types.
+PropertyMemoryUsage = namedtuple("PropertyMemoryUsage", ["stored", "wide"])
+
+
+# A parsed selection expression. "code" is the compiled expression and
+# "type_names" is the set of type names a row must have to possibly be
+# selected, or None if the expression does not restrict the type.
+_SelectionPlan = namedtuple("_SelectionPlan", ["code", "type_names"])
+
+
+@lru_cache(maxsize=256)
+def _compile_selection_expr(expr, type_col_name):
+    """
+    Parse and compile expr once, returning a _SelectionPlan. Results are cached
+    so repeated selections using the same expression are not re-parsed.
+    """
+    tree = ast.parse(expr, mode="eval")
+    type_names = _get_required_type_names(tree.body, type_col_name)
+    return _SelectionPlan(compile(tree, "<selection>", "eval"), type_names)
+
+
+def _get_required_type_names(node, type_col_name):
+    """
+    Return the set of type names that a row must have in order to satisfy the
+    expression represented by node, or None if the set cannot be determined.
+    Only comparisons of the type column to string constants combined with & and
+    | are recognized.
+    """
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+        left = _get_required_type_names(node.left, type_col_name)
+        right = _get_required_type_names(node.right, type_col_name)
+        if left is None:
+            return right
+        if right is None:
+            return left
+        return left & right
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        left = _get_required_type_names(node.left, type_col_name)
+        right = _get_required_type_names(node.right, type_col_name)
+        if (left is None) or (right is None):
+            return None
+        return left | right
+
+    if isinstance(node, ast.Compare) and (len(node.ops) == 1) and \
+       isinstance(node.ops[0], ast.Eq):
+        operands = [node.left, node.comparators[0]]
+        for (name, value) in [operands, operands[::-1]]:
+            if isinstance(name, ast.Name) and (name.id == type_col_name) and \
+               isinstance(value, ast.Constant) and \
+               isinstance(value.value, str):
+                return frozenset([value.value])
+
+    return None
+
+
 class EXPERIMENTAL__PropertySelection:
     """
     Instances of this class are returned from the PropertyGraph.select_*()
     methods and can be used by the PropertyGraph.extract_subgraph() method to
     extrac a Graph containing vertices and edges with only the selected
     properties.
+
+    The vertex_selections and edge_selections Series are shared with the
+    selection cache of the PropertyGraph (repeating a select_*() call returns
+    the same Series), so they must not be modified in place.
     """
     def __init__(self,
                  vertex_selection_series=None,
@@ -56,6 +129,19 @@ class EXPERIMENTAL__PropertyGraph:
     Class which stores vertex and edge properties that can be used to construct
     Graphs from individual property selections and used later to annotate graph
     algorithm results with corresponding properties.
+
+    Parameters
+    ----------
+    partition_by_type : bool, optional (default=False)
+        If True, the properties for each type_name are stored in a separate
+        table containing only the property columns added for that type,
+        instead of in a single table containing the property columns of all
+        types. This can use significantly less memory for graphs with many
+        types having different properties, and allows selections and subgraph
+        extractions restricted to specific types to only access the tables for
+        those types. Operations that require all properties (eg. selections
+        not restricted to specific types) assemble the single table on demand.
+        See property_memory_usage().
     """
     # column name constants used in internal DataFrames
     vertex_col_name = "_VERTEX_"
@@ -66,7 +152,11 @@ class EXPERIMENTAL__PropertyGraph:
     vertex_id_col_name = "_VERTEX_ID_"
     weight_col_name = "_WEIGHT_"
 
-    def __init__(self):
+    # The maximum number of results from select_vertices() and select_edges()
+    # to cache for each table.
+    selection_cache_maxsize = 32
+
+    def __init__(self, partition_by_type=False):
         # The dataframe containing the properties for each vertex.
         # Each vertex occupies a row, and individual properties are maintained
         # in individual columns. The table contains a column for each property
@@ -94,6 +184,36 @@ class EXPERIMENTAL__PropertyGraph:
         #   9 |  88 | ""        | NaN   | NaN   | 2
         self.__edge_prop_dataframe = None
 
+        # If partition_by_type is True, dictionaries mapping each type_name to
+        # a DataFrame containing only the properties of that type, otherwise
+        # None. The rows of the __vertex_prop_dataframe and
+        # __edge_prop_dataframe described above are then the concatenation of
+        # the rows of each DataFrame in dictionary order, and the
+        # __vertex_prop_dataframe and __edge_prop_dataframe themselves only
+        # contain the default columns (and no rows).
+        if partition_by_type:
+            self.__vertex_prop_partitions = {}
+            self.__edge_prop_partitions = {}
+        else:
+            self.__vertex_prop_partitions = None
+            self.__edge_prop_partitions = None
+
+        # DataFrames added by add_vertex_data() and add_edge_data() that have
+        # not yet been merged into the __vertex_prop_dataframe and
+        # __edge_prop_dataframe. Merging each small DataFrame into the entire
+        # property table as it is added makes ingesting a stream of small
+        # DataFrames quadratic, so the merge is deferred until the properties
+        # are accessed. Each item is a (type_name, DataFrame, batch_id)
+        # tuple. The DataFrames of each add_*_data() call are merged
+        # separately (in the order they were added) so duplicates of existing
+        # rows are combined exactly as if they were merged immediately. Only
+        # the DataFrames of a single add_*_data_many() call, which share a
+        # batch_id, are concatenated and merged at once.
+        self.__vertex_prop_pending = []
+        self.__edge_prop_pending = []
+        self.__last_batch_id = 0
+        self.__many_batch_id = None
+
         # The var:value dictionaries used during evaluation of filter/query
         # expressions for vertices and edges. These dictionaries contain
         # entries for each column name in their respective dataframes which
@@ -107,6 +227,8 @@ class EXPERIMENTAL__PropertyGraph:
         # the tables to contain additional or different column names than what
         # can be used in expressions.
         #
+        # These are not maintained if partition_by_type is True.
+        #
         # Example: "type_name == 'user' & propC > 10"
         #
         # The above would be evaluated and "type_name" and "propC" would be
@@ -133,6 +255,25 @@ class EXPERIMENTAL__PropertyGraph:
         # incrementing this counter.
         self.__last_edge_id = None
 
+        # A SortedIndex mapping each edge ID to the table and row containing
+        # the properties for the edge, used for gathering the properties of
+        # specific edges without merging against the entire table. This is
+        # built on demand and reset when edge properties are added.
+        self.__edge_id_index = None
+
+        # The type names added to each table, used to short-circuit selections
+        # of types that are not present.
+        self.__vertex_type_names = set()
+        self.__edge_type_names = set()
+
+        # Versions of the property tables, incremented each time new data is
+        # merged into them, and LRU caches of selection results keyed by
+        # (expression, version).
+        self.__vertex_prop_version = 0
+        self.__edge_prop_version = 0
+        self.__vertex_selection_cache = OrderedDict()
+        self.__edge_selection_cache = OrderedDict()
+
         # Cached property values
         self.__num_vertices = None
 
@@ -154,22 +295,28 @@ class EXPERIMENTAL__PropertyGraph:
 
     @property
     def num_edges(self):
-        if self.__edge_prop_dataframe is not None:
-            return len(self.__edge_prop_dataframe)
-        else:
+        self.__consolidate_edge_data()
+        if self.__edge_prop_dataframe is None:
             return 0
+        elif self.__edge_prop_partitions is not None:
+            return sum([len(part_df) for part_df in
+                        self.__edge_prop_partitions.values()])
+        else:
+            return len(self.__edge_prop_dataframe)
 
     @property
     def edges(self):
-        if self.__edge_prop_dataframe is not None:
-            return self.__edge_prop_dataframe[[self.src_col_name,
-                                               self.dst_col_name]]
+        epd = self.__get_edge_prop_dataframe()
+        if epd is not None:
+            return epd[[self.src_col_name, self.dst_col_name]]
         return None
 
     @property
     def vertex_property_names(self):
+        self.__consolidate_vertex_data()
         if self.__vertex_prop_dataframe is not None:
-            props = list(self.__vertex_prop_dataframe.columns)
+            props = self.__get_column_names(self.__vertex_prop_dataframe,
+                                            self.__vertex_prop_partitions)
             props.remove(self.vertex_col_name)
             props.remove(self.type_col_name)  # should "type" be removed?
             return props
@@ -177,8 +324,10 @@ class EXPERIMENTAL__PropertyGraph:
 
     @property
     def edge_property_names(self):
+        self.__consolidate_edge_data()
         if self.__edge_prop_dataframe is not None:
-            props = list(self.__edge_prop_dataframe.columns)
+            props = self.__get_column_names(self.__edge_prop_dataframe,
+                                            self.__edge_prop_partitions)
             props.remove(self.src_col_name)
             props.remove(self.dst_col_name)
             props.remove(self.edge_id_col_name)
@@ -189,11 +338,20 @@ class EXPERIMENTAL__PropertyGraph:
     # PropertyGraph read-only attributes for debugging
     @property
     def _vertex_prop_dataframe(self):
-        return self.__vertex_prop_dataframe
+        return self.__get_vertex_prop_dataframe()
 
     @property
     def _edge_prop_dataframe(self):
-        return self.__edge_prop_dataframe
+        return self.__get_edge_prop_dataframe()
+
+    @property
+    def _edge_prop_version(self):
+        """
+        A number that changes whenever edge properties are added, which can be
+        used to invalidate data derived from the edge properties.
+        """
+        self.__consolidate_edge_data()
+        return self.__edge_prop_version
 
     def get_vertices(self, selection=None):
         """
@@ -300,12 +458,14 @@ class EXPERIMENTAL__PropertyGraph:
         # type column name are present for proper merging.
 
         # NOTE: This copies the incoming DataFrame in order to add the new
-        # columns. The copied DataFrame is then merged (another copy) and then
-        # deleted when out-of-scope.
+        # columns. The copied DataFrame is kept until it is merged into the
+        # __vertex_prop_dataframe (another copy) by
+        # __consolidate_vertex_data().
         tmp_df = dataframe.copy(deep=True)
         tmp_df[self.vertex_col_name] = tmp_df[vertex_col_name]
         # FIXME: handle case of a type_name column already being in tmp_df
         tmp_df[self.type_col_name] = type_name
+        self.__vertex_type_names.add(type_name)
 
         if property_columns:
             # all columns
@@ -319,16 +479,57 @@ class EXPERIMENTAL__PropertyGraph:
         # prior to constructing subgraphs (since column dtypes may get altered
         # during merge to accommodate NaN values).
         new_col_info = self.__get_new_column_dtypes(
-                           tmp_df, self.__vertex_prop_dataframe)
+            tmp_df,
+            set(self.__vertex_prop_dataframe.columns).union(
+                self.__vertex_prop_dtypes))
         self.__vertex_prop_dtypes.update(new_col_info)
 
-        self.__vertex_prop_dataframe = \
-            self.__vertex_prop_dataframe.merge(tmp_df, how="outer")
+        self.__vertex_prop_pending.append(
+            (type_name, tmp_df, self.__get_batch_id()))
 
-        # Update the vertex eval dict with the latest column instances
-        latest = dict([(n, self.__vertex_prop_dataframe[n])
-                       for n in self.__vertex_prop_dataframe.columns])
-        self.__vertex_prop_eval_dict.update(latest)
+    def add_vertex_data_many(self,
+                             dataframes,
+                             vertex_col_name,
+                             type_name=None,
+                             property_columns=None
+                             ):
+        """
+        Add a list of dataframes describing vertex properties to the
+        PropertyGraph. The dataframes are concatenated and merged into the
+        vertex properties at once, which is faster than calling
+        add_vertex_data() for each dataframe. Unlike separate
+        add_vertex_data() calls, rows that exactly duplicate a row of another
+        dataframe of the list are not combined into a single row; duplicates
+        of rows added by previous calls are combined as usual.
+
+        Parameters
+        ----------
+        dataframes : list of DataFrame-compatible instances
+            DataFrame instances with a compatible Pandas-like DataFrame
+            interface.
+        vertex_col_name : string
+            The column name that contains the values to be used as vertex IDs.
+        type_name : string
+            The name to be assigned to the type of property being added.
+        property_columns : list of strings
+            List of column names in each dataframe to be added as properties.
+
+        Returns
+        -------
+        None
+        """
+        if type(dataframes) not in [list, tuple]:
+            raise TypeError("dataframes must be a list or tuple, got: "
+                            f"{type(dataframes)}")
+        self.__many_batch_id = self.__get_batch_id()
+        try:
+            for dataframe in dataframes:
+                self.add_vertex_data(dataframe,
+                                     vertex_col_name=vertex_col_name,
+                                     type_name=type_name,
+                                     property_columns=property_columns)
+        finally:
+            self.__many_batch_id = None
 
     def add_edge_data(self,
                       dataframe,
@@ -421,13 +622,14 @@ class EXPERIMENTAL__PropertyGraph:
                  self.edge_id_col_name: "Int64"})
 
         # NOTE: This copies the incoming DataFrame in order to add the new
-        # columns. The copied DataFrame is then merged (another copy) and then
-        # deleted when out-of-scope.
+        # columns. The copied DataFrame is kept until it is merged into the
+        # __edge_prop_dataframe (another copy) by __consolidate_edge_data().
         tmp_df = dataframe.copy(deep=True)
         tmp_df[self.src_col_name] = tmp_df[vertex_col_names[0]]
         tmp_df[self.dst_col_name] = tmp_df[vertex_col_names[1]]
         # FIXME: handle case of a type_name column already being in tmp_df
         tmp_df[self.type_col_name] = type_name
+        self.__edge_type_names.add(type_name)
 
         if property_columns:
             # all columns
@@ -441,18 +643,58 @@ class EXPERIMENTAL__PropertyGraph:
         # prior to constructing subgraphs (since column dtypes may get altered
         # during merge to accommodate NaN values).
         new_col_info = self.__get_new_column_dtypes(
-            tmp_df, self.__edge_prop_dataframe)
+            tmp_df,
+            set(self.__edge_prop_dataframe.columns).union(
+                self.__edge_prop_dtypes))
         self.__edge_prop_dtypes.update(new_col_info)
 
-        self.__edge_prop_dataframe = \
-            self.__edge_prop_dataframe.merge(tmp_df, how="outer")
+        self.__edge_prop_pending.append(
+            (type_name, tmp_df, self.__get_batch_id()))
 
-        self.__add_edge_ids()
+    def add_edge_data_many(self,
+                           dataframes,
+                           vertex_col_names,
+                           type_name=None,
+                           property_columns=None
+                           ):
+        """
+        Add a list of dataframes describing edge properties to the
+        PropertyGraph. The dataframes are concatenated and merged into the edge
+        properties at once, which is faster than calling add_edge_data() for
+        each dataframe. Unlike separate add_edge_data() calls, rows that
+        exactly duplicate a row of another dataframe of the list are not
+        combined into a single edge and each gets its own edge ID; duplicates
+        of edges added by previous calls are combined as usual.
 
-        # Update the vertex eval dict with the latest column instances
-        latest = dict([(n, self.__edge_prop_dataframe[n])
-                       for n in self.__edge_prop_dataframe.columns])
-        self.__edge_prop_eval_dict.update(latest)
+        Parameters
+        ----------
+        dataframes : list of DataFrame-compatible instances
+            DataFrame instances with a compatible Pandas-like DataFrame
+            interface.
+        vertex_col_names : list of strings
+            The column names that contain the values to be used as the source
+            and destination vertex IDs for the edges.
+        type_name : string
+            The name to be assigned to the type of property being added.
+        property_columns : list of strings
+            List of column names in each dataframe to be added as properties.
+
+        Returns
+        -------
+        None
+        """
+        if type(dataframes) not in [list, tuple]:
+            raise TypeError("dataframes must be a list or tuple, got: "
+                            f"{type(dataframes)}")
+        self.__many_batch_id = self.__get_batch_id()
+        try:
+            for dataframe in dataframes:
+                self.add_edge_data(dataframe,
+                                   vertex_col_names=vertex_col_names,
+                                   type_name=type_name,
+                                   property_columns=property_columns)
+        finally:
+            self.__many_batch_id = None
 
     def select_vertices(self, expr, from_previous_selection=None):
         """
@@ -475,37 +717,58 @@ class EXPERIMENTAL__PropertyGraph:
         -------
         PropertySelection instance to be used for calls to extract_subgraph()
         in order to construct a Graph containing only specific vertices.
+        The selection Series is cached and must not be modified in place.
 
         Examples
         --------
         >>>
         """
         # FIXME: check types
+        self.__consolidate_vertex_data()
+        plan = _compile_selection_expr(expr, self.type_col_name)
 
         # Check if the expr is to be evaluated in the context of properties
         # from only the previously selected vertices (as opposed to all
         # properties from all vertices)
-        if (from_previous_selection is not None) and \
-           (from_previous_selection.vertex_selections is not None):
-            previously_selected_rows = self.__vertex_prop_dataframe[
+        previous_selection = (from_previous_selection is not None) and \
+            (from_previous_selection.vertex_selections is not None)
+        if not previous_selection:
+            key = (expr, self.__vertex_prop_version)
+            selected_col = self.__get_cached_selection(
+                self.__vertex_selection_cache, key)
+            if selected_col is not None:
+                return EXPERIMENTAL__PropertySelection(
+                    vertex_selection_series=selected_col)
+
+        num_rows = self.__get_num_rows(self.__vertex_prop_dataframe,
+                                       self.__vertex_prop_partitions)
+        if (plan.type_names is not None) and \
+           plan.type_names.isdisjoint(self.__vertex_type_names):
+            # None of the types the expr is restricted to have been added, so
+            # nothing can be selected.
+            selected_col = self.__get_false_series(num_rows)
+        elif previous_selection:
+            vpd = self.__get_vertex_prop_dataframe()
+            previously_selected_rows = vpd[
                 from_previous_selection.vertex_selections]
             verts_from_previously_selected_rows = \
                 previously_selected_rows[self.vertex_col_name]
             # get all the rows from the entire __vertex_prop_dataframe that
             # contain those verts
-            rows_with_verts = \
-                self.__vertex_prop_dataframe[self.vertex_col_name]\
-                    .isin(verts_from_previously_selected_rows)
-            rows_to_eval = self.__vertex_prop_dataframe[rows_with_verts]
+            rows_with_verts = vpd[self.vertex_col_name]\
+                .isin(verts_from_previously_selected_rows)
+            rows_to_eval = vpd[rows_with_verts]
             locals = dict([(n, rows_to_eval[n])
                            for n in rows_to_eval.columns])
+            globals = {}
+            selected_col = eval(plan.code, globals, locals)
         else:
-            locals = self.__vertex_prop_eval_dict
-
-        globals = {}
-        selected_col = eval(expr, globals, locals)
+            selected_col = self.__eval_selection_plan(
+                plan,
+                self.__vertex_prop_dataframe,
+                self.__vertex_prop_partitions,
+                self.__vertex_prop_eval_dict)
 
-        num_rows = len(self.__vertex_prop_dataframe)
         # Ensure the column is the same size as the DataFrame, then replace any
         # NA values with False to represent rows that should not be selected.
         # This ensures the selected column can be applied to the entire
@@ -515,6 +778,10 @@ class EXPERIMENTAL__PropertyGraph:
             selected_col = selected_col.reindex(range(num_rows), copy=False)
             selected_col.fillna(False, inplace=True)
 
+        if not previous_selection:
+            self.__cache_selection(self.__vertex_selection_cache, key,
+                                   selected_col)
+
         return EXPERIMENTAL__PropertySelection(
             vertex_selection_series=selected_col)
 
@@ -533,16 +800,35 @@ class EXPERIMENTAL__PropertyGraph:
         -------
         PropertySelection instance to be used for calls to extract_subgraph()
         in order to construct a Graph containing only specific edges.
+        The selection Series is cached and must not be modified in place.
 
         Examples
         --------
         >>>
         """
         # FIXME: check types
-        globals = {}
-        locals = self.__edge_prop_eval_dict
+        self.__consolidate_edge_data()
+        plan = _compile_selection_expr(expr, self.type_col_name)
+
+        key = (expr, self.__edge_prop_version)
+        selected_col = self.__get_cached_selection(
+            self.__edge_selection_cache, key)
+
+        if selected_col is None:
+            if (plan.type_names is not None) and \
+               plan.type_names.isdisjoint(self.__edge_type_names):
+                # None of the types the expr is restricted to have been added,
+                # so nothing can be selected.
+                selected_col = self.__get_false_series(self.num_edges)
+            else:
+                selected_col = self.__eval_selection_plan(
+                    plan,
+                    self.__edge_prop_dataframe,
+                    self.__edge_prop_partitions,
+                    self.__edge_prop_eval_dict)
+            self.__cache_selection(self.__edge_selection_cache, key,
+                                   selected_col)
 
-        selected_col = eval(expr, globals, locals)
         return EXPERIMENTAL__PropertySelection(
             edge_selection_series=selected_col)
 
@@ -603,17 +889,21 @@ class EXPERIMENTAL__PropertyGraph:
         # values.
         if (selection is not None) and \
            (selection.vertex_selections is not None):
-            selected_vertex_dataframe = \
-                self.__vertex_prop_dataframe[selection.vertex_selections]
+            selected_vertex_dataframe = self.__select_rows(
+                self.__get_vertex_prop_dataframe,
+                self.__vertex_prop_partitions,
+                selection.vertex_selections)
         else:
             selected_vertex_dataframe = None
 
         if (selection is not None) and \
            (selection.edge_selections is not None):
-            selected_edge_dataframe = \
-                self.__edge_prop_dataframe[selection.edge_selections]
+            selected_edge_dataframe = self.__select_rows(
+                self.__get_edge_prop_dataframe,
+                self.__edge_prop_partitions,
+                selection.edge_selections)
         else:
-            selected_edge_dataframe = self.__edge_prop_dataframe
+            selected_edge_dataframe = self.__get_edge_prop_dataframe()
 
         # FIXME: check that self.__edge_prop_dataframe is set!
 
@@ -630,11 +920,20 @@ class EXPERIMENTAL__PropertyGraph:
         else:
             edges = selected_edge_dataframe
 
+        # If partitioned by type, the selected edges only contain the
+        # properties of the selected types, so add the weight property (as all
+        # NA values) if none of the selected types have it.
+        if edge_weight_property and \
+           (edge_weight_property not in edges.columns) and \
+           (edge_weight_property in self.__edge_prop_dtypes):
+            edges[edge_weight_property] = None
+
         # The __*_prop_dataframes have likely been merged several times and
         # possibly had their dtypes converted in order to accommodate NaN
         # values. Restore the original dtypes in the resulting edges df prior
         # to creating a Graph.
-        self.__update_dataframe_dtypes(edges, self.__edge_prop_dtypes)
+        self.__update_dataframe_dtypes(
+            edges, self.__get_present_dtypes(edges, self.__edge_prop_dtypes))
 
         return self.edge_props_to_graph(
             edges,
@@ -643,7 +942,7 @@ class EXPERIMENTAL__PropertyGraph:
             default_edge_weight=default_edge_weight,
             allow_multi_edges=allow_multi_edges)
 
-    def annotate_dataframe(self, df, G, edge_vertex_col_names):
+    def annotate_dataframe(self, df, G, edge_vertex_col_names, columns=None):
         """
         Add properties to df that represent the vertices and edges in graph G.
 
@@ -660,6 +959,9 @@ class EXPERIMENTAL__PropertyGraph:
         edge_vertex_col_names : tuple of strings
             The column names in df that represent the source and destination
             vertices, used for identifying edges.
+        columns : list of strings, optional (default=None)
+            The names of the edge properties to add to df. If None, all edge
+            property columns are added.
 
         Returns
         -------
@@ -684,23 +986,68 @@ class EXPERIMENTAL__PropertyGraph:
         else:
             raise AttributeError("Graph G does not have attribute 'edge_data'")
 
-        # New result includes only properties from the src/dst edges identified
-        # by edge IDs. All other data in df is merged based on src/dst values.
-        # NOTE: results from MultiGraph graphs will have to include edge IDs!
-        edge_props_df = edge_info_df.merge(self.__edge_prop_dataframe,
-                                           how="inner")
+        self.__consolidate_edge_data()
 
+        all_columns = self.__get_column_names(self.__edge_prop_dataframe,
+                                              self.__edge_prop_partitions)
+        for col in [self.src_col_name, self.dst_col_name,
+                    self.edge_id_col_name]:
+            all_columns.remove(col)
+        if columns is None:
+            columns = all_columns
+        else:
+            invalid_columns = set(columns).difference(all_columns)
+            if invalid_columns:
+                raise ValueError("columns contains column(s) not found in "
+                                 f"edge properties: {list(invalid_columns)}")
+            columns = list(columns)
+
+        # Look up the edge ID of each edge in df by merging with the edges of
+        # G (only properties from the src/dst edges identified by edge IDs
+        # are included), then gather the properties for those edge IDs using
+        # the edge ID index. The lookup scans every edge of G, so it is
+        # O(number of edges in G); the gather is O(len(df) log(E)) in the
+        # number of edges E of the PropertyGraph, instead of a merge with the
+        # edge property tables.
+        # NOTE: results from MultiGraph graphs will have to include edge IDs!
         # FIXME: also allow edge ID col to be passed in and renamed.
         new_df = df.rename(columns={src_col_name: self.src_col_name,
                                     dst_col_name: self.dst_col_name})
-        new_df = new_df.merge(edge_props_df)
+        order_col_name = self.__gen_unique_name(new_df.columns,
+                                                prefix="_ORDER_")
+        new_df[order_col_name] = range(len(new_df))
+        # Only merge with the edges of G whose src and dst are in df. The
+        # isin filter is a single pass over the edges of G, which is cheaper
+        # than merging all of them when df is small.
+        edge_info_df = edge_info_df[
+            edge_info_df[self.src_col_name].isin(new_df[self.src_col_name]) &
+            edge_info_df[self.dst_col_name].isin(new_df[self.dst_col_name])]
+        new_df = new_df.merge(edge_info_df,
+                              on=[self.src_col_name, self.dst_col_name],
+                              how="inner")
+        new_df = new_df.sort_values(order_col_name)\
+                       .drop(columns=[order_col_name])\
+                       .reset_index(drop=True)
+
+        props_df = self.__gather_edge_props(new_df[self.edge_id_col_name],
+                                            columns)
+        found = props_df[self.__edge_id_index_found_col_name]
+        props_df = props_df.drop(
+            columns=[self.__edge_id_index_found_col_name])
+        if not found.all():
+            new_df = new_df[found].reset_index(drop=True)
+            props_df = props_df[found].reset_index(drop=True)
+        for col in columns:
+            new_df[col] = props_df[col]
+
         # restore the original src/dst column names
         new_df.rename(columns={self.src_col_name: src_col_name,
                                self.dst_col_name: dst_col_name},
                       inplace=True)
 
         # restore the original dtypes
-        self.__update_dataframe_dtypes(new_df, self.__edge_prop_dtypes)
+        self.__update_dataframe_dtypes(
+            new_df, self.__get_present_dtypes(new_df, self.__edge_prop_dtypes))
         for col in df.columns:
             new_df[col] = new_df[col].astype(df[col].dtype)
 
@@ -799,6 +1146,168 @@ class EXPERIMENTAL__PropertyGraph:
 
         return G
 
+    def save(self, path):
+        """
+        Save the vertex and edge properties to the directory path, which is
+        created if necessary. Each property table is written as an Arrow IPC
+        file, along with a metadata file containing the original property
+        dtypes, type names, and edge ID counter needed to continue adding
+        properties after the PropertyGraph is reloaded with load().
+
+        Parameters
+        ----------
+        path : string
+            The directory to write the files to.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>>
+        """
+        self.__consolidate_vertex_data()
+        self.__consolidate_edge_data()
+
+        if self.__dataframe_type is cudf.DataFrame:
+            dataframe_type = "cudf"
+        elif self.__dataframe_type is None:
+            dataframe_type = None
+        elif self.__dataframe_type is pd.DataFrame:
+            dataframe_type = "pandas"
+        else:
+            raise TypeError("only PropertyGraphs using cudf or pandas "
+                            "DataFrames can be saved, got: "
+                            f"{self.__dataframe_type}")
+
+        os.makedirs(path, exist_ok=True)
+
+        def write_tables(prefix, df, partitions):
+            if df is None:
+                return (None, None)
+            file_name = f"{prefix}.arrow"
+            self.__write_arrow_file(df, os.path.join(path, file_name))
+            if partitions is None:
+                return (file_name, None)
+            partition_files = []
+            for (i, (type_name, part_df)) in enumerate(partitions.items()):
+                part_file_name = f"{prefix}_{i}.arrow"
+                self.__write_arrow_file(part_df,
+                                        os.path.join(path, part_file_name))
+                partition_files.append([type_name, part_file_name])
+            return (file_name, partition_files)
+
+        (vertex_file, vertex_partition_files) = write_tables(
+            "vertex", self.__vertex_prop_dataframe,
+            self.__vertex_prop_partitions)
+        (edge_file, edge_partition_files) = write_tables(
+            "edge", self.__edge_prop_dataframe,
+            self.__edge_prop_partitions)
+
+        metadata = {
+            "format_version": self.__save_format_version,
+            "dataframe_type": dataframe_type,
+            "partition_by_type": self.__vertex_prop_partitions is not None,
+            "vertex_file": vertex_file,
+            "vertex_partition_files": vertex_partition_files,
+            "edge_file": edge_file,
+            "edge_partition_files": edge_partition_files,
+            "vertex_prop_dtypes": dict(
+                [(col, str(dtype))
+                 for (col, dtype) in self.__vertex_prop_dtypes.items()]),
+            "edge_prop_dtypes": dict(
+                [(col, str(dtype))
+                 for (col, dtype) in self.__edge_prop_dtypes.items()]),
+            "vertex_type_names": list(self.__vertex_type_names),
+            "edge_type_names": list(self.__edge_type_names),
+            "last_edge_id": self.__last_edge_id,
+        }
+        with open(os.path.join(path, self.__metadata_file_name), "w") as f:
+            json.dump(metadata, f, indent=2)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Return a new PropertyGraph containing the properties saved to the
+        directory path by save().
+
+        Parameters
+        ----------
+        path : string
+            The directory previously passed to save().
+        mmap : bool, optional (default=True)
+            If True, the property files are memory-mapped instead of read.
+            For PropertyGraphs using pandas DataFrames, columns without null
+            values are then not copied until they are modified, so large
+            property tables can be reopened quickly.
+
+        Returns
+        -------
+        PropertyGraph instance
+
+        Examples
+        --------
+        >>>
+        """
+        with open(os.path.join(path, cls.__metadata_file_name)) as f:
+            metadata = json.load(f)
+        if metadata["format_version"] != cls.__save_format_version:
+            raise ValueError("unsupported PropertyGraph format version "
+                             f"{metadata['format_version']} in {path}")
+
+        pG = cls(partition_by_type=metadata["partition_by_type"])
+
+        dataframe_type = metadata["dataframe_type"]
+        if dataframe_type is None:
+            return pG
+        elif dataframe_type == "cudf":
+            pG.__dataframe_type = cudf.DataFrame
+            pG.__series_type = cudf.Series
+        else:
+            pG.__dataframe_type = pd.DataFrame
+            pG.__series_type = pd.Series
+
+        def read_tables(file_name, partition_files):
+            if file_name is None:
+                return (None, None)
+            df = pG.__read_arrow_file(os.path.join(path, file_name), mmap)
+            if partition_files is None:
+                return (df, None)
+            partitions = {}
+            for (type_name, part_file_name) in partition_files:
+                partitions[type_name] = pG.__read_arrow_file(
+                    os.path.join(path, part_file_name), mmap)
+            return (df, partitions)
+
+        (pG.__vertex_prop_dataframe, pG.__vertex_prop_partitions) = \
+            read_tables(metadata["vertex_file"],
+                        metadata["vertex_partition_files"])
+        (pG.__edge_prop_dataframe, pG.__edge_prop_partitions) = \
+            read_tables(metadata["edge_file"],
+                        metadata["edge_partition_files"])
+
+        pG.__vertex_prop_dtypes = cls.__get_dtypes(
+            metadata["vertex_prop_dtypes"])
+        pG.__edge_prop_dtypes = cls.__get_dtypes(
+            metadata["edge_prop_dtypes"])
+        pG.__vertex_type_names = set(metadata["vertex_type_names"])
+        pG.__edge_type_names = set(metadata["edge_type_names"])
+        pG.__last_edge_id = metadata["last_edge_id"]
+
+        if pG.__vertex_prop_partitions is None and \
+           pG.__vertex_prop_dataframe is not None:
+            pG.__vertex_prop_eval_dict = dict(
+                [(n, pG.__vertex_prop_dataframe[n])
+                 for n in pG.__vertex_prop_dataframe.columns])
+        if pG.__edge_prop_partitions is None and \
+           pG.__edge_prop_dataframe is not None:
+            pG.__edge_prop_eval_dict = dict(
+                [(n, pG.__edge_prop_dataframe[n])
+                 for n in pG.__edge_prop_dataframe.columns])
+
+        return pG
+
     @classmethod
     def has_duplicate_edges(cls, df):
         """
@@ -827,13 +1336,429 @@ class EXPERIMENTAL__PropertyGraph:
                                       self.dst_col_name: dst,
                                       self.edge_id_col_name: edge_id})
 
-    def __add_edge_ids(self):
+    def __consolidate_vertex_data(self):
+        """
+        Merge the DataFrames added since the last consolidation into the
+        __vertex_prop_dataframe.
+        """
+        if not self.__vertex_prop_pending:
+            return
+        partitions = self.__vertex_prop_partitions
+        for (type_name, tmp_df) in self.__concat_pending(
+                self.__vertex_prop_pending, partitions is not None):
+            if partitions is not None:
+                part_df = partitions.get(type_name,
+                                         self.__vertex_prop_dataframe)
+                partitions[type_name] = part_df.merge(tmp_df, how="outer")
+            else:
+                self.__vertex_prop_dataframe = \
+                    self.__vertex_prop_dataframe.merge(tmp_df, how="outer")
+        self.__vertex_prop_pending = []
+        self.__vertex_prop_version += 1
+        self.__vertex_selection_cache.clear()
+
+        # Update the vertex eval dict with the latest column instances
+        if partitions is None:
+            latest = dict([(n, self.__vertex_prop_dataframe[n])
+                           for n in self.__vertex_prop_dataframe.columns])
+            self.__vertex_prop_eval_dict.update(latest)
+
+    def __consolidate_edge_data(self):
+        """
+        Merge the DataFrames added since the last consolidation into the
+        __edge_prop_dataframe, and assign edge IDs to the new edges.
+        """
+        if not self.__edge_prop_pending:
+            return
+        partitions = self.__edge_prop_partitions
+        for (type_name, tmp_df) in self.__concat_pending(
+                self.__edge_prop_pending, partitions is not None):
+            if partitions is not None:
+                part_df = partitions.get(type_name,
+                                         self.__edge_prop_dataframe)
+                part_df = part_df.merge(tmp_df, how="outer")
+                self.__add_edge_ids(part_df)
+                partitions[type_name] = part_df
+            else:
+                self.__edge_prop_dataframe = \
+                    self.__edge_prop_dataframe.merge(tmp_df, how="outer")
+                self.__add_edge_ids(self.__edge_prop_dataframe)
+        self.__edge_prop_pending = []
+        self.__edge_prop_version += 1
+        self.__edge_selection_cache.clear()
+        self.__edge_id_index = None
+
+        # Update the edge eval dict with the latest column instances
+        if partitions is None:
+            latest = dict([(n, self.__edge_prop_dataframe[n])
+                           for n in self.__edge_prop_dataframe.columns])
+            self.__edge_prop_eval_dict.update(latest)
+
+    # The name of the metadata file written by save(), and the version of the
+    # format, which must be incremented when the format changes.
+    __metadata_file_name = "metadata.json"
+    __save_format_version = 1
+
+    def __write_arrow_file(self, df, file_path):
+        """
+        Write df to file_path in the Arrow IPC file format.
+        """
+        if self.__dataframe_type is cudf.DataFrame:
+            table = df.to_arrow(preserve_index=False)
+        else:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(file_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    def __read_arrow_file(self, file_path, mmap):
+        """
+        Return a DataFrame of the type used by this PropertyGraph containing
+        the table in the Arrow IPC file at file_path.
+        """
+        if mmap:
+            source = pa.memory_map(file_path, "r")
+        else:
+            source = pa.OSFile(file_path, "rb")
+        with source:
+            table = pa.ipc.open_file(source).read_all()
+        if self.__dataframe_type is cudf.DataFrame:
+            return cudf.DataFrame.from_arrow(table)
+        # split_blocks prevents consolidating columns of the same dtype into
+        # a single (copied) array, allowing memory-mapped columns without
+        # nulls to be used without copying.
+        return table.to_pandas(split_blocks=mmap)
+
+    @staticmethod
+    def __get_dtypes(dtype_strs):
+        """
+        Return a dictionary mapping column names to the dtypes named by the
+        strings in the dtype_strs dictionary, as written by save().
+        """
+        dtypes = {}
+        for (col, dtype_str) in dtype_strs.items():
+            try:
+                dtypes[col] = pd.api.types.pandas_dtype(dtype_str)
+            except TypeError:
+                dtypes[col] = dtype_str
+        return dtypes
+
+    # Column names used in the DataFrames of the edge ID index
+    __edge_id_index_table_col_name = "_TABLE_"
+    __edge_id_index_row_col_name = "_ROW_"
+    __edge_id_index_found_col_name = "_FOUND_"
+
+    def __get_edge_prop_tables(self):
+        """
+        Return the list of DataFrames containing the edge properties, which is
+        the table for each type if partition_by_type is True.
+        """
+        self.__consolidate_edge_data()
+        if self.__edge_prop_partitions is None:
+            return [self.__edge_prop_dataframe]
+        return list(self.__edge_prop_partitions.values())
+
+    def __get_edge_id_index(self):
+        """
+        Return the SortedIndex mapping edge IDs to the position of the
+        containing DataFrame in the list returned by __get_edge_prop_tables()
+        and the row in that DataFrame, building it if necessary.
         """
-        Replace nans with unique edge IDs. Edge IDs are simply numbers
-        incremented by 1 for each edge.
+        tables = self.__get_edge_prop_tables()
+        if self.__edge_id_index is None:
+            index_dfs = []
+            for (i, table) in enumerate(tables):
+                index_df = self.__dataframe_type()
+                index_df[self.edge_id_col_name] = \
+                    table[self.edge_id_col_name].reset_index(drop=True)
+                index_df[self.__edge_id_index_table_col_name] = i
+                index_df[self.__edge_id_index_row_col_name] = \
+                    range(len(table))
+                index_dfs.append(index_df)
+            self.__edge_id_index = SortedIndex(self.__concat(index_dfs),
+                                               self.edge_id_col_name)
+        return self.__edge_id_index
+
+    def __gather_edge_props(self, edge_ids, columns):
+        """
+        Return a DataFrame containing the property columns for each edge ID in
+        edge_ids, in the same order, plus a boolean column named
+        __edge_id_index_found_col_name which is False for edge IDs that were
+        not found.
+        """
+        tables = self.__get_edge_prop_tables()
+        edge_ids = edge_ids.reset_index(drop=True)
+        locations = self.__get_edge_id_index().lookup(edge_ids)
+        found = locations[self.__edge_id_index_row_col_name].notna()
+        locations[self.__edge_id_index_found_col_name] = found
+        locations = locations[found]
+
+        props_dfs = []
+        for (i, table) in enumerate(tables):
+            in_table = locations[self.__edge_id_index_table_col_name] == i
+            if not in_table.any():
+                continue
+            table_locations = locations[in_table]
+            rows = table_locations[self.__edge_id_index_row_col_name]\
+                .astype("int64").values
+            props_df = table[[c for c in columns if c in table.columns]]\
+                .take(rows).reset_index(drop=True)
+            props_df.index = table_locations.index
+            props_dfs.append(props_df)
+
+        if len(props_dfs) == 1:
+            props_df = props_dfs[0]
+        elif props_dfs:
+            if self.__series_type is cudf.Series:
+                props_df = cudf.concat(props_dfs)
+            else:
+                props_df = pd.concat(props_dfs)
+        else:
+            props_df = self.__dataframe_type()
+
+        # Restore the order of edge_ids, with missing rows for edge IDs that
+        # were not found.
+        props_df = props_df.reindex(index=range(len(edge_ids)),
+                                    columns=columns)
+        props_df[self.__edge_id_index_found_col_name] = \
+            found.reset_index(drop=True)
+        return props_df
+
+    def __get_vertex_prop_dataframe(self):
+        """
+        Return the __vertex_prop_dataframe, assembling it from the tables for
+        each type if partition_by_type is True.
+        """
+        self.__consolidate_vertex_data()
+        return self.__concat_partitions(self.__vertex_prop_dataframe,
+                                        self.__vertex_prop_partitions)
+
+    def __get_edge_prop_dataframe(self):
+        """
+        Return the __edge_prop_dataframe, assembling it from the tables for
+        each type if partition_by_type is True.
+        """
+        self.__consolidate_edge_data()
+        return self.__concat_partitions(self.__edge_prop_dataframe,
+                                        self.__edge_prop_partitions)
+
+    def __concat_partitions(self, df, partitions):
+        """
+        Return the rows of each DataFrame in partitions concatenated in order,
+        with the columns of df first. Returns df if partitions is None.
+        """
+        if (df is None) or (partitions is None):
+            return df
+        return self.__concat([df] + list(partitions.values()))
+
+    @staticmethod
+    def __get_num_rows(df, partitions):
+        """
+        Return the number of rows in df, or in the DataFrames in partitions if
+        not None.
+        """
+        if df is None:
+            return 0
+        if partitions is None:
+            return len(df)
+        return sum([len(part_df) for part_df in partitions.values()])
+
+    @staticmethod
+    def __get_column_names(df, partitions):
+        """
+        Return a list of the column names in df followed by the column names in
+        the DataFrames in partitions that are not already in the list.
+        """
+        names = list(df.columns)
+        if partitions is not None:
+            for part_df in partitions.values():
+                names += [n for n in part_df.columns if n not in names]
+        return names
+
+    @staticmethod
+    def __get_present_dtypes(df, column_dtype_dict):
+        """
+        Return a dictionary containing the items in column_dtype_dict for
+        columns present in df.
+        """
+        return dict([(col, dtype) for (col, dtype) in column_dtype_dict.items()
+                     if col in df.columns])
+
+    def __eval_selection_plan(self, plan, df, partitions, eval_dict):
+        """
+        Evaluate the _SelectionPlan plan against all rows of the table, using
+        eval_dict if not partitioned. If partitioned and plan is restricted to
+        specific types, plan is only evaluated on the tables for those types.
+        """
+        globals = {}
+        if partitions is None:
+            return eval(plan.code, globals, eval_dict)
+
+        if plan.type_names is not None:
+            selected_cols = []
+            try:
+                for (type_name, part_df) in partitions.items():
+                    if type_name in plan.type_names:
+                        locals = dict([(n, part_df[n])
+                                       for n in part_df.columns])
+                        selected_col = eval(plan.code, globals, locals)
+                        selected_col = selected_col.reset_index(drop=True)
+                    else:
+                        selected_col = self.__get_false_series(
+                            len(part_df))
+                    selected_cols.append(selected_col)
+            except NameError:
+                # The expr uses a property not present in one of the types, so
+                # it must be evaluated against the columns of all types.
+                pass
+            else:
+                if not selected_cols:
+                    return self.__series_type([], dtype="bool")
+                return self.__concat(selected_cols)
+
+        all_df = self.__concat_partitions(df, partitions)
+        locals = dict([(n, all_df[n]) for n in all_df.columns])
+        return eval(plan.code, globals, locals)
+
+    def __select_rows(self, get_dataframe, partitions, selected_col):
+        """
+        Return the rows selected by the boolean Series selected_col. If
+        partitioned, only the tables containing selected rows are used,
+        otherwise the DataFrame returned by get_dataframe() is used.
+        """
+        if partitions is None:
+            return get_dataframe()[selected_col]
+
+        selected_dfs = []
+        start = 0
+        for part_df in partitions.values():
+            stop = start + len(part_df)
+            part_selected_col = \
+                selected_col.iloc[start:stop].reset_index(drop=True)
+            if part_selected_col.any():
+                selected_dfs.append(part_df[part_selected_col])
+            start = stop
+
+        if not selected_dfs:
+            return get_dataframe()[selected_col]
+        return self.__concat(selected_dfs)
+
+    def property_memory_usage(self):
+        """
+        Return a dictionary containing PropertyMemoryUsage tuples for the
+        "vertex" and "edge" property tables. The "stored" field is the number
+        of bytes used to store the properties, and the "wide" field is the
+        number of bytes a single table containing the columns for all types
+        would use. These differ only if partition_by_type is True, in which
+        case the single table is temporarily assembled in order to measure it.
+
+        Returns
+        -------
+        dict mapping "vertex" and "edge" to PropertyMemoryUsage instances.
+
+        Examples
+        --------
+        >>>
+        """
+        self.__consolidate_vertex_data()
+        self.__consolidate_edge_data()
+
+        def get_nbytes(df):
+            if df is None:
+                return 0
+            return int(df.memory_usage(deep=True).sum())
+
+        usage = {}
+        for (name, df, partitions) in [
+                ("vertex", self.__vertex_prop_dataframe,
+                 self.__vertex_prop_partitions),
+                ("edge", self.__edge_prop_dataframe,
+                 self.__edge_prop_partitions)]:
+            if partitions is None:
+                stored = wide = get_nbytes(df)
+            else:
+                stored = sum([get_nbytes(part_df)
+                              for part_df in partitions.values()])
+                wide = get_nbytes(self.__concat_partitions(df, partitions))
+            usage[name] = PropertyMemoryUsage(stored, wide)
+        return usage
+
+    def __get_false_series(self, length):
+        """
+        Return a boolean Series of length False values, allocated directly on
+        the device for cudf (rather than from a Python list).
+        """
+        if self.__series_type is cudf.Series:
+            return cudf.Series(cupy.zeros(length, dtype="bool"))
+        return self.__series_type(np.zeros(length, dtype="bool"))
+
+    def __get_cached_selection(self, cache, key):
+        """
+        Return the selection Series cached for key, or None if not present.
+        """
+        selected_col = cache.get(key)
+        if selected_col is not None:
+            cache.move_to_end(key)
+        return selected_col
+
+    def __cache_selection(self, cache, key, selected_col):
+        """
+        Add selected_col to the cache, evicting the least recently used entry
+        if the cache is full.
+        """
+        cache[key] = selected_col
+        cache.move_to_end(key)
+        while len(cache) > self.selection_cache_maxsize:
+            cache.popitem(last=False)
+
+    def __get_batch_id(self):
+        """
+        Return the batch ID of a DataFrame being added: the ID of the
+        add_*_data_many() call in progress, if any, otherwise a new ID.
+        """
+        if self.__many_batch_id is not None:
+            return self.__many_batch_id
+        self.__last_batch_id += 1
+        return self.__last_batch_id
+
+    def __concat_pending(self, pending, by_type):
+        """
+        Return a list of (type_name, DataFrame) tuples made by concatenating
+        each run of consecutive DataFrames in pending that were added by the
+        same add_*_data_many() call (same batch ID) and have the same columns,
+        and the same type_name if by_type is True. Runs must be merged
+        separately since the columns used for the merge depend on the columns
+        of the DataFrame being merged, and so that duplicates of rows added by
+        separate calls are combined.
+        """
+        runs = []
+        for (type_name, df, batch_id) in pending:
+            if runs and runs[-1][1] == batch_id \
+               and list(runs[-1][2][0].columns) == list(df.columns) \
+               and (not by_type or runs[-1][0] == type_name):
+                runs[-1][2].append(df)
+            else:
+                runs.append((type_name, batch_id, [df]))
+
+        return [(type_name, dfs[0] if len(dfs) == 1 else self.__concat(dfs))
+                for (type_name, _, dfs) in runs]
+
+    def __concat(self, objs):
+        """
+        Concatenate the DataFrames or Series in objs using the concat function
+        for the DataFrame type of this PropertyGraph.
+        """
+        if self.__series_type is cudf.Series:
+            return cudf.concat(objs, ignore_index=True)
+        return pd.concat(objs, ignore_index=True)
+
+    def __add_edge_ids(self, edge_prop_df):
+        """
+        Replace nans in edge_prop_df with unique edge IDs. Edge IDs are simply
+        numbers incremented by 1 for each edge.
         """
         prev_eid = -1 if self.__last_edge_id is None else self.__last_edge_id
-        nans = self.__edge_prop_dataframe[self.edge_id_col_name].isna()
+        nans = edge_prop_df[self.edge_id_col_name].isna()
 
         if nans.any():
             indices = nans.index[nans]
@@ -842,8 +1767,7 @@ class EXPERIMENTAL__PropertyGraph:
             new_eids = self.__series_type(
                 range(starting_eid, starting_eid + num_indices))
 
-            self.__edge_prop_dataframe[self.edge_id_col_name]\
-                .iloc[indices] = new_eids
+            edge_prop_df[self.edge_id_col_name].iloc[indices] = new_eids
 
             self.__last_edge_id = starting_eid + num_indices - 1
 
@@ -852,14 +1776,22 @@ class EXPERIMENTAL__PropertyGraph:
         Return a list of all Series objects that contain vertices from all
         tables.
         """
-        vpd = self.__vertex_prop_dataframe
-        epd = self.__edge_prop_dataframe
+        self.__consolidate_vertex_data()
+        self.__consolidate_edge_data()
+        vpds = [self.__vertex_prop_dataframe]
+        if self.__vertex_prop_partitions:
+            vpds = list(self.__vertex_prop_partitions.values())
+        epds = [self.__edge_prop_dataframe]
+        if self.__edge_prop_partitions:
+            epds = list(self.__edge_prop_partitions.values())
         vert_sers = []
-        if vpd is not None:
-            vert_sers.append(vpd[self.vertex_col_name])
-        if epd is not None:
-            vert_sers.append(epd[self.src_col_name])
-            vert_sers.append(epd[self.dst_col_name])
+        for vpd in vpds:
+            if vpd is not None:
+                vert_sers.append(vpd[self.vertex_col_name])
+        for epd in epds:
+            if epd is not None:
+                vert_sers.append(epd[self.src_col_name])
+                vert_sers.append(epd[self.dst_col_name])
         return vert_sers
 
     @staticmethod
@@ -875,12 +1807,12 @@ class EXPERIMENTAL__PropertyGraph:
         return name
 
     @staticmethod
-    def __get_new_column_dtypes(from_df, to_df):
+    def __get_new_column_dtypes(from_df, existing_col_names):
         """
         Returns a list containing tuples of (column name, dtype) for each
-        column in from_df that is not present in to_df.
+        column in from_df that is not present in existing_col_names.
         """
-        new_cols = set(from_df.columns) - set(to_df.columns)
+        new_cols = set(from_df.columns) - set(existing_col_names)
         return [(col, from_df[col].dtype) for col in new_cols]
 
     @staticmethod
@@ -11,14 +11,48 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
 from cugraph.structure import graph_classes as csg
 import cudf
 import dask_cudf
 from cugraph.dask.comms import comms as Comms
 
 
+# Reductions of the values of the edges merged by symmetrize.
+_reductions = ("min", "max", "sum", "first")
+
+SymmetrizeStats = namedtuple(
+    "SymmetrizeStats",
+    ["input_edges", "output_edges", "duplicates", "added", "conflicts",
+     "presymmetric"])
+SymmetrizeStats.__doc__ = """
+Statistics of a symmetrize_df call.
+
+input_edges : int
+    The number of input edges.
+output_edges : int
+    The number of output edges.
+duplicates : int
+    The number of input edges dropped as duplicates of another input edge
+    with the same source and destination.
+added : int
+    The number of edges added in the reverse direction of an input edge.
+conflicts : int or None
+    The number of (undirected, when symmetrizing) edges with values that
+    differ between their merged input edges, or None if not computed.
+presymmetric : bool
+    Whether the input was returned as is because it was already symmetric
+    (or, if not symmetrizing, had no duplicate edges).
+"""
+
+
 def symmetrize_df(df, src_name, dst_name,
-                  weight_name=None, multi=False, symmetrize=True):
+                  weight_name=None, multi=False, symmetrize=True,
+                  reduction="min", return_stats=False):
     """
     Take a COO stored in a DataFrame, along with the column names of
     the source and destination columns and create a new data frame
@@ -31,13 +65,21 @@ def symmetrize_df(df, src_name, dst_name,
     data will contain both (u,v,data) and (v,u,data) with matching
     data.
     If (u,v,data1) and (v,u,data2) exist in the input data where data1
-    != data2 then this code will arbitrarily pick the smaller data
-    element to keep, if this is not desired then the caller
-    should correct the data prior to calling symmetrize.
+    != data2 then the data of the edge is reduced with reduction (by
+    default the smaller data element is kept), if this is not desired
+    then the caller should correct the data prior to calling symmetrize.
+
+    Edges with a single integer source and destination column (and numeric
+    other columns) are symmetrized by sorting: the (smaller vertex, larger
+    vertex) pair of each edge is packed into a 64-bit key, the keys are
+    sorted, and the runs of equal keys are merged. Input that is already
+    symmetric and free of duplicates (or, if symmetrize is False, free of
+    duplicates) is detected in the process and returned as is. Other edges
+    are symmetrized with a concat and a groupby.
 
     Parameters
     ----------
-    df : cudf.DataFrame
+    df : cudf.DataFrame or pandas.DataFrame
         Input data frame containing COO.  Columns should contain source
         ids, destination ids and any properties associated with the
         edges.
@@ -60,6 +102,26 @@ def symmetrize_df(df, src_name, dst_name,
         Default is True to perform symmetrization. If False only duplicate
         edges are dropped.
 
+    reduction : str, optional (default='min')
+        How the other columns of merged edges are reduced: 'min', 'max',
+        'sum', or 'first' (the values of the first of the merged edges in
+        the input). With 'sum', the values of each input edge (self loops
+        included) are added once, so the two directions of an edge are
+        added together.
+
+    return_stats : bool, optional (default=False)
+        If True, also return a SymmetrizeStats of the number of input,
+        output, duplicate, and added edges.
+
+    Returns
+    -------
+    result : cudf.DataFrame or pandas.DataFrame
+        The symmetrized edges, of the same type as df, or df itself if it
+        was already symmetric.
+
+    stats : SymmetrizeStats
+        Only returned if return_stats is True.
+
     Examples
     --------
     >>> from cugraph.structure.symmetrize import symmetrize_df
@@ -67,33 +129,255 @@ def symmetrize_df(df, src_name, dst_name,
     >>> M = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
     ...                   dtype=['int32', 'int32', 'float32'], header=None)
     >>> sym_df = symmetrize_df(M, '0', '1')
+    >>> sym_df, stats = symmetrize_df(M, '0', '1', '2', reduction='max',
+    ...                               return_stats=True)
 
     """
+    if reduction not in _reductions:
+        raise ValueError(f"reduction must be one of {_reductions}, got: "
+                         f"{reduction!r}")
     if not isinstance(src_name, list):
         src_name = [src_name]
     if not isinstance(dst_name, list):
         dst_name = [dst_name]
+    vertex_col_name = src_name + dst_name
+
+    if multi:
+        (result, stats) = _symmetrize_df_multi(df, src_name, dst_name,
+                                               weight_name, symmetrize)
+    elif _can_sort(df, vertex_col_name):
+        (result, stats) = _symmetrize_df_sorted(
+            df, src_name[0], dst_name[0], symmetrize, reduction)
+    else:
+        (result, stats) = _symmetrize_df_groupby(
+            df, src_name, dst_name, weight_name, symmetrize, reduction,
+            return_stats)
+
+    if return_stats:
+        return (result, stats)
+    return result
+
+
+def _concat(dfs):
+    if isinstance(dfs[0], pd.DataFrame):
+        return pd.concat(dfs)
+    return cudf.concat(dfs)
+
+
+def _reverse_df(df, src_name, dst_name, weight_name):
+    """
+    Return the edges of df in the reverse direction.
+    """
+    if weight_name:
+        df2 = df[[*dst_name, *src_name, weight_name]]
+        df2.columns = [*src_name, *dst_name, weight_name]
+    else:
+        df2 = df[[*dst_name, *src_name]]
+        df2.columns = [*src_name, *dst_name]
+    return df2
+
+
+def _symmetrize_df_multi(df, src_name, dst_name, weight_name, symmetrize):
+    """
+    Symmetrize the edges of a multigraph, keeping all the edges.
+    """
+    num_edges = len(df)
+    if not symmetrize:
+        return (df, SymmetrizeStats(num_edges, num_edges, 0, 0, 0, True))
+    df2 = _reverse_df(df, src_name, dst_name, weight_name)
+    result = _concat([df, df2]).reset_index(drop=True)
+    return (result, SymmetrizeStats(num_edges, len(result), 0, num_edges, 0,
+                                    False))
+
 
+def _symmetrize_df_groupby(df, src_name, dst_name, weight_name, symmetrize,
+                           reduction, return_stats):
+    """
+    Symmetrize the edges of df by concatenating them with the reversed edges
+    and reducing the groups of edges with the same vertices.
+    """
+    vertex_col_name = src_name + dst_name
     if symmetrize:
-        if weight_name:
-            df2 = df[[*dst_name, *src_name, weight_name]]
-            df2.columns = [*src_name, *dst_name, weight_name]
-        else:
-            df2 = df[[*dst_name, *src_name]]
-            df2.columns = [*src_name, *dst_name]
-        result = cudf.concat([df, df2]).reset_index(drop=True)
+        df2 = _reverse_df(df, src_name, dst_name, weight_name)
+        result = _concat([df, df2]).reset_index(drop=True)
     else:
         result = df
-    if multi:
-        return result
+    result = result.groupby(by=[*vertex_col_name], as_index=False)
+    result = result.min() if reduction == "min" else result.agg(reduction)
+
+    stats = None
+    if return_stats:
+        num_unique = len(df[vertex_col_name].drop_duplicates())
+        stats = SymmetrizeStats(len(df), len(result), len(df) - num_unique,
+                                len(result) - num_unique, None, False)
+    return (result, stats)
+
+
+def _get_values(series):
+    if isinstance(series, pd.Series):
+        return series.to_numpy()
+    return series.values
+
+
+def _get_array_module(array):
+    if isinstance(array, np.ndarray):
+        return np
+    import cupy
+    return cupy
+
+
+def _can_sort(df, vertex_col_name):
+    """
+    Return True if the edges of df can be symmetrized by sorting: with a
+    single integer source and destination column, and numeric other
+    columns.
+    """
+    return (len(vertex_col_name) == 2 and
+            all(df[c].dtype.kind in "iu" for c in vertex_col_name) and
+            all(df[c].dtype.kind in "iufb" for c in df.columns))
+
+
+def _get_keys(xp, src, dst):
+    """
+    Return the (src, dst) pairs packed into 64-bit keys (in the same order
+    as the pairs), or None if the vertex IDs span 2**32 values or more.
+    """
+    (src, dst) = (src.astype("int64"), dst.astype("int64"))
+    base = min(int(src.min()), int(dst.min()))
+    if max(int(src.max()), int(dst.max())) - base >= 2**32:
+        return None
+    return (((src - base).astype("uint64") << xp.uint64(32)) |
+            (dst - base).astype("uint64"))
+
+
+def _sort_edges(xp, src, dst, stable):
+    """
+    Return (order, starts): the order sorting the (src, dst) pairs (keeping
+    equal pairs in their input order if stable is True), and the positions
+    in that order of the first of each run of equal pairs.
+    """
+    num_edges = len(src)
+    if num_edges == 0:
+        return (xp.arange(0), xp.arange(0))
+    keys = _get_keys(xp, src, dst) \
+        if src.dtype.kind == "i" and dst.dtype.kind == "i" else None
+    if keys is not None:
+        if bool((keys[1:] > keys[:-1]).all()):
+            # Sorted already, and without duplicates.
+            order = xp.arange(num_edges)
+        else:
+            order = xp.argsort(keys, kind="stable" if stable else None)
+            keys = keys[order]
+        new = keys[1:] != keys[:-1]
     else:
-        vertex_col_name = src_name + dst_name
-        result = result.groupby(by=[*vertex_col_name], as_index=False).min()
-        return result
+        order = xp.lexsort(xp.stack([dst, src]))
+        (src, dst) = (src[order], dst[order])
+        new = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+    starts = xp.concatenate([xp.zeros(1, dtype="int64"),
+                             xp.flatnonzero(new) + 1])
+    return (order, starts)
+
+
+def _reduce_values(xp, values, order, starts, group_ids, reduction):
+    """
+    Return the values of each run of equal edges (the edges in order from
+    each of starts, numbered by group_ids) reduced with reduction.
+    """
+    if reduction == "first":
+        return values[order[starts]]
+    values = values[order]
+    if xp is np:
+        ufunc = {"min": np.minimum, "max": np.maximum, "sum": np.add}
+        return ufunc[reduction].reduceat(values, starts)
+    if reduction == "sum":
+        sums = xp.bincount(group_ids, weights=values.astype("float64"),
+                           minlength=len(starts))
+        return sums.astype(values.dtype if values.dtype.kind != "b"
+                           else "int64")
+    # Order the values of each run, which keeps the runs in place.
+    by_value = xp.argsort(values, kind="stable")
+    by_value = by_value[xp.argsort(group_ids[by_value], kind="stable")]
+    values = values[by_value]
+    if reduction == "min":
+        return values[starts]
+    ends = xp.concatenate([starts[1:], xp.asarray([len(values)])])
+    return values[ends - 1]
+
+
+def _symmetrize_df_sorted(df, src_name, dst_name, symmetrize, reduction):
+    """
+    Symmetrize the edges of df by sorting their packed keys and merging the
+    runs of equal edges.
+    """
+    src = _get_values(df[src_name])
+    dst = _get_values(df[dst_name])
+    xp = _get_array_module(src)
+    num_edges = len(df)
+    value_names = [c for c in df.columns if c not in (src_name, dst_name)]
+
+    if symmetrize:
+        # Both directions of an edge are merged into the edge from the
+        # smaller to the larger vertex.
+        (lo, hi) = (xp.minimum(src, dst), xp.maximum(src, dst))
+    else:
+        (lo, hi) = (src, dst)
+    (order, starts) = _sort_edges(xp, lo, hi, stable=reduction == "first")
+    num_groups = len(starts)
+    group_ids = xp.zeros(num_edges, dtype="int64")
+    group_ids[starts[1:]] = 1
+    group_ids = xp.cumsum(group_ids)
+
+    # The runs with values that differ between their edges.
+    same_group = group_ids[1:] == group_ids[:-1]
+    conflicting = xp.zeros(num_groups, dtype=bool)
+    for name in value_names:
+        values = _get_values(df[name])[order]
+        conflicting[group_ids[1:][same_group &
+                                  (values[1:] != values[:-1])]] = True
+    conflicts = int(conflicting.sum())
+
+    first = order[starts]
+    (lo, hi) = (lo[first], hi[first])
+    if symmetrize:
+        # The number of edges of each run in each direction: the edges of
+        # a run are already symmetric and distinct if there is one in each
+        # direction (or one self loop).
+        reverse = xp.bincount(group_ids,
+                              weights=(src > dst)[order].astype("float64"),
+                              minlength=num_groups)
+        forward = xp.bincount(group_ids, minlength=num_groups) - reverse
+        num_unique = int((forward > 0).sum() + (reverse > 0).sum())
+        mirror = xp.flatnonzero(lo != hi)
+        num_output = num_groups + len(mirror)
+    else:
+        num_unique = num_output = num_groups
+    stats = SymmetrizeStats(num_edges, num_output, num_edges - num_unique,
+                            num_output - num_unique, conflicts, False)
+
+    # Symmetric input is returned as is unless merging the two directions
+    # of its edges changes their values.
+    if num_output == num_edges == num_unique and (
+            not symmetrize or (conflicts == 0 and reduction != "sum")):
+        return (df, stats._replace(presymmetric=True))
+
+    columns = {src_name: lo, dst_name: hi}
+    for name in value_names:
+        columns[name] = _reduce_values(xp, _get_values(df[name]), order,
+                                       starts, group_ids, reduction)
+    if symmetrize:
+        columns[src_name] = xp.concatenate([lo, hi[mirror]])
+        columns[dst_name] = xp.concatenate([hi, lo[mirror]])
+        for name in value_names:
+            columns[name] = xp.concatenate([columns[name],
+                                            columns[name][mirror]])
+    result = type(df)({name: columns[name].astype(df[name].dtype)
+                       for name in df.columns})
+    return (result, stats)
 
 
 def symmetrize_ddf(ddf, src_name, dst_name,
-                   weight_name=None, multi=False, symmetrize=True):
+                   weight_name=None, multi=False, symmetrize=True,
+                   reduction="min"):
     """
     Take a COO stored in a distributed DataFrame, and the column names of
     the source and destination columns and create a new data frame
@@ -108,9 +392,9 @@ def symmetrize_ddf(ddf, src_name, dst_name,
     data.
 
     If (u,v,data1) and (v,u,data2) exist in the input data where data1
-    != data2 then this code will arbitrarily pick the smaller data
-    element to keep, if this is not desired then the caller
-    should correct the data prior to calling symmetrize.
+    != data2 then the data of the edge is reduced with reduction (by
+    default the smaller data element is kept), if this is not desired
+    then the caller should correct the data prior to calling symmetrize.
 
     Parameters
     ----------
@@ -137,6 +421,10 @@ def symmetrize_ddf(ddf, src_name, dst_name,
         Default is True to perform symmetrization. If False only duplicate
         edges are dropped.
 
+    reduction : str, optional (default='min')
+        How the other columns of merged edges are reduced: 'min', 'max',
+        'sum', or 'first'.
+
     Examples
     --------
     >>> # import cugraph.dask as dcg
@@ -153,6 +441,9 @@ def symmetrize_ddf(ddf, src_name, dst_name,
     """
     # FIXME: Uncomment out the above (broken) example
 
+    if reduction not in _reductions:
+        raise ValueError(f"reduction must be one of {_reductions}, got: "
+                         f"{reduction!r}")
     if not isinstance(src_name, list):
         src_name = [src_name]
     if not isinstance(dst_name, list):
@@ -178,15 +469,14 @@ def symmetrize_ddf(ddf, src_name, dst_name,
         return result
     else:
         vertex_col_name = src_name + dst_name
-        result = result.groupby(
-                by=[*vertex_col_name]).min(
-                    split_out=num_partitions).reset_index()
+        result = getattr(result.groupby(by=[*vertex_col_name]), reduction)(
+            split_out=num_partitions).reset_index()
 
         return result
 
 
 def symmetrize(input_df, source_col_name, dest_col_name, value_col_name=None,
-               multi=False, symmetrize=True):
+               multi=False, symmetrize=True, reduction="min"):
     """
     Take a dataframe of source destination pairs along with associated
     values stored in a single GPU or distributed
@@ -200,8 +490,9 @@ def symmetrize(input_df, source_col_name, dest_col_name, value_col_name=None,
 
     Parameters
     ----------
-    input_df : cudf.DataFrame or dask_cudf.DataFrame
-        The edgelist as a cudf.DataFrame or dask_cudf.DataFrame
+    input_df : cudf.DataFrame, pandas.DataFrame or dask_cudf.DataFrame
+        The edgelist as a cudf.DataFrame, pandas.DataFrame or
+        dask_cudf.DataFrame
 
     source_col_name : str or list
         source column name.
@@ -220,6 +511,9 @@ def symmetrize(input_df, source_col_name, dest_col_name, value_col_name=None,
         Default is True to perform symmetrization. If False only duplicate
         edges are dropped.
 
+    reduction : str, optional (default='min')
+        How the values of merged edges are reduced: 'min', 'max', 'sum', or
+        'first'.
 
     Examples
     --------
@@ -241,20 +535,21 @@ def symmetrize(input_df, source_col_name, dest_col_name, value_col_name=None,
     if isinstance(input_df, dask_cudf.DataFrame):
         output_df = symmetrize_ddf(input_df, source_col_name, dest_col_name,
                                    value_col_name, multi, symmetrize,
-                                   )
+                                   reduction)
     else:
         output_df = symmetrize_df(input_df, source_col_name, dest_col_name,
                                   value_col_name, multi, symmetrize,
-                                  )
+                                  reduction)
     if value_col_name is not None:
         value_col = output_df[value_col_name]
-        if isinstance(value_col, (cudf.Series, dask_cudf.Series)):
+        if isinstance(value_col, (cudf.Series, pd.Series,
+                                  dask_cudf.Series)):
             return (
                 output_df[source_col_name],
                 output_df[dest_col_name],
                 output_df[value_col_name],
             )
-        elif isinstance(value_col, cudf.DataFrame):
+        elif isinstance(value_col, (cudf.DataFrame, pd.DataFrame)):
             return (
                 output_df[source_col_name],
                 output_df[dest_col_name],
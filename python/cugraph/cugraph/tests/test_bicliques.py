@@ -0,0 +1,147 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+
+import pytest
+import numpy as np
+import pandas as pd
+
+import cudf
+from cugraph.experimental.structure.bicliques import (
+    EXPERIMENTAL__find_bicliques as find_bicliques,
+    EXPERIMENTAL__iter_bicliques as iter_bicliques,
+)
+
+
+# =============================================================================
+# Pytest Setup / Teardown - called for each test function
+# =============================================================================
+def setup_function():
+    gc.collect()
+
+
+# =============================================================================
+# Helper functions
+# =============================================================================
+def reference_bicliques(pdf, k, support, min_features, min_machines):
+    """
+    Find bicliques one feature at a time using Python sets, returning a list
+    of (machines, features) frozensets in ID order.
+    """
+    pdf = pdf.drop_duplicates(["src", "dst"])
+    machines_of = pdf.groupby("dst")["src"].apply(frozenset)
+    features_of = pdf.groupby("src")["dst"].apply(list)
+    order = sorted(machines_of.index,
+                   key=lambda f: (-len(machines_of[f]), f))
+
+    seen = set()
+    results = []
+    for feature in order:
+        machines = machines_of[feature]
+        if machines in seen:
+            continue
+        seen.add(machines)
+        counts = pd.Series(
+            [f for m in machines for f in features_of[m]]).value_counts()
+        goal = int(len(machines) * support)
+        features = frozenset(counts[counts >= goal].index)
+        if len(features) > min_features and len(machines) >= min_machines:
+            results.append((machines, features))
+        if len(results) == k:
+            break
+    return results
+
+
+def get_bicliques(bicliques, num_bicliques):
+    if len(bicliques) == 0:
+        return []
+    if isinstance(bicliques, cudf.DataFrame):
+        bicliques = bicliques.to_pandas()
+    results = []
+    for i in range(num_bicliques):
+        df = bicliques[bicliques["id"] == i]
+        results.append((frozenset(df[df["type"] == 0]["vert"]),
+                        frozenset(df[df["type"] == 1]["vert"])))
+    return results
+
+
+def make_bipartite(seed, num_machines=200, num_features=100):
+    random_state = np.random.RandomState(seed)
+    adj = random_state.random_sample((num_machines, num_features)) < 0.05
+    # Plant some bicliques
+    for _ in range(5):
+        machines = random_state.choice(num_machines, 20, replace=False)
+        features = random_state.choice(num_features, 5, replace=False)
+        adj[np.ix_(machines, features)] = True
+    (src, dst) = np.nonzero(adj)
+    return pd.DataFrame({"src": src, "dst": dst,
+                         "flag": random_state.randint(0, 2, len(src))})
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+@pytest.mark.parametrize("df_type", [cudf.DataFrame, pd.DataFrame])
+@pytest.mark.parametrize("k", [-1, 3])
+@pytest.mark.parametrize("support", [1.0, 0.5])
+@pytest.mark.parametrize("batch_edges", [100, 2**24])
+def test_find_bicliques(df_type, k, support, batch_edges):
+    pdf = make_bipartite(42)
+    df = cudf.DataFrame.from_pandas(pdf) if df_type is cudf.DataFrame \
+        else pdf.copy()
+
+    (B, S) = find_bicliques(df, k, support=support, min_features=1,
+                            min_machines=5, batch_edges=batch_edges)
+    assert type(B) is df_type
+    assert type(S) is df_type
+
+    expected = reference_bicliques(pdf, k, support, 1, 5)
+    assert get_bicliques(B, len(S)) == expected
+    assert S["id"].to_numpy().tolist() == list(range(len(expected)))
+    assert S["machines"].sum() == sum(len(m) for (m, _) in expected)
+    assert S["features"].sum() == sum(len(f) for (_, f) in expected)
+
+
+def test_iter_bicliques():
+    pdf = make_bipartite(0)
+    (B, S) = find_bicliques(pdf, -1, support=0.5, min_machines=5)
+
+    # Small batches yield the same bicliques as they are found.
+    results = list(iter_bicliques(pdf, -1, support=0.5, min_machines=5,
+                                  batch_edges=50))
+    assert len(results) > 1
+    assert pd.concat([b for (b, _) in results], ignore_index=True).equals(B)
+    assert pd.concat([s for (_, s) in results], ignore_index=True).equals(S)
+
+
+def test_find_bicliques_offset():
+    pdf = make_bipartite(1)
+    (B, S) = find_bicliques(pdf, -1, support=0.5, min_machines=5)
+    assert len(S) > 0
+
+    shifted = pdf.assign(dst=pdf["dst"] + 1000)
+    (B2, S2) = find_bicliques(shifted, -1, offset=1000, support=0.5,
+                              min_machines=5)
+    assert B2.equals(B)
+    assert S2.equals(S)
+    # The input is not modified.
+    assert shifted["dst"].min() >= 1000
+
+
+def test_find_bicliques_invalid():
+    pdf = make_bipartite(2)
+    with pytest.raises(NameError):
+        find_bicliques(pdf.drop(columns="flag"), -1)
+    with pytest.raises(NameError):
+        find_bicliques(pdf, -1, support=0.05)
@@ -11,6 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Mapping
+
 import cugraph.experimental.compat.nx as nx
 
 
@@ -32,4 +34,4 @@ def test_pagerank_result_type():
                      ('D', 'F')])
     ppr1 = nx.pagerank(G)
     # This just tests that the right type is returned.
-    assert isinstance(ppr1, dict)
+    assert isinstance(ppr1, Mapping)
@@ -0,0 +1,140 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+
+import pytest
+import numpy as np
+import networkx
+
+import cugraph.experimental.compat.nx as nx
+from cugraph.experimental.compat.nx.algorithms.link_analysis import (
+    pagerank_alg)
+from cugraph.experimental.compat.nx.edge_store import get_edge_store
+
+
+# =============================================================================
+# Pytest Setup / Teardown - called for each test function
+# =============================================================================
+def setup_function():
+    gc.collect()
+
+
+# =============================================================================
+# Helper functions
+# =============================================================================
+def assert_edge_store_matches(G):
+    store = G.edge_store
+    assert store.num_edges == G.number_of_edges()
+    assert sorted(map(str, store.nodes)) == sorted(map(str, G))
+    if len(G) == 0:
+        return
+    expected = networkx.to_scipy_sparse_array(G, nodelist=list(store.nodes))
+    assert np.allclose(store.to_csr().toarray(), expected.toarray())
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+@pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph])
+def test_edge_store_updates(graph_class):
+    random_state = np.random.RandomState(42)
+    G = graph_class()
+    for i in range(1000):
+        (u, v) = random_state.randint(0, 30, 2).tolist()
+        op = random_state.randint(0, 8)
+        if op < 3:
+            G.add_edge(u, v, weight=random_state.random_sample())
+        elif op == 3:
+            G.add_edges_from([(u, v), (v, u, {"weight": 2.0})])
+        elif op == 4 and G.has_edge(u, v):
+            G.remove_edge(u, v)
+        elif op == 5:
+            G.remove_nodes_from([u, v])
+        elif op == 6:
+            G.add_node(f"isolated_{u}")
+        elif G.number_of_edges() > 0:
+            # Edge attributes are read from the graph.
+            (a, b) = next(iter(G.edges()))
+            G[a][b]["weight"] = 5.0
+        if i % 100 == 0:
+            assert_edge_store_matches(G)
+    assert_edge_store_matches(G)
+
+    G.clear_edges()
+    assert_edge_store_matches(G)
+    G.clear()
+    assert_edge_store_matches(G)
+
+
+def test_edge_store_graph_conversions():
+    G = nx.Graph(networkx.karate_club_graph())
+    assert_edge_store_matches(G)
+
+    H = G.to_directed()
+    assert isinstance(H, nx.DiGraph)
+    assert_edge_store_matches(H)
+    assert isinstance(H.to_undirected(), nx.Graph)
+    assert_edge_store_matches(H.to_undirected())
+
+    # Views share the nodes and edges of another graph.
+    view = G.subgraph(range(10))
+    assert get_edge_store(view) is None
+    assert get_edge_store(G) is G.edge_store
+
+
+@pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph])
+def test_pagerank_scipy(graph_class, monkeypatch):
+    monkeypatch.setattr(pagerank_alg, "_gpu_available", lambda: False)
+    Gnx = networkx.karate_club_graph()
+    if graph_class is nx.DiGraph:
+        Gnx = networkx.DiGraph(Gnx)
+        Gnx.remove_edges_from([(0, 1), (2, 0)])
+    G = graph_class(Gnx)
+
+    personalization = {0: 0.5, 5: 0.2, 33: 0.3}
+    for kwargs in [{},
+                   {"alpha": 0.7, "personalization": personalization},
+                   {"nstart": {n: 1.0 for n in range(10)}},
+                   {"dangling": {3: 1.0}},
+                   {"weight": None}]:
+        pr = nx.pagerank(G, **kwargs)
+        expected = networkx.pagerank(Gnx, **kwargs)
+        assert pr.keys() == expected.keys()
+        for (n, value) in expected.items():
+            assert pr[n] == pytest.approx(value)
+
+    # Graphs without an edge store are converted for the call.
+    pr = nx.pagerank(Gnx)
+    expected = networkx.pagerank(Gnx)
+    for (n, value) in expected.items():
+        assert pr[n] == pytest.approx(value)
+
+    with pytest.raises(networkx.PowerIterationFailedConvergence):
+        nx.pagerank(G, max_iter=1, tol=0)
+
+
+@pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph])
+def test_pagerank_isolated_nodes(graph_class):
+    # The last nodes (largest vertex IDs) have no edges.
+    Gnx = networkx.karate_club_graph()
+    if graph_class is nx.DiGraph:
+        Gnx = networkx.DiGraph(Gnx)
+    Gnx.add_nodes_from([100, 101])
+    G = graph_class(Gnx)
+
+    pr = nx.pagerank(G)
+    expected = networkx.pagerank(Gnx)
+    assert pr.keys() == expected.keys()
+    for (n, value) in expected.items():
+        assert pr[n] == pytest.approx(value, rel=1e-3)
@@ -28,6 +28,9 @@ from scipy.sparse.csc import csc_matrix as sp_csc_matrix
 import cudf
 import cugraph
 from cugraph.testing import utils
+from cugraph.experimental.components.scc import (_scc_labels,
+                                                 _scc_reference_labels,
+                                                 _tarjan_labels)
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -446,3 +449,74 @@ def test_scipy_api_compat(connection_type):
     n_components = cugraph.connected_components(input_coo_matrix,
                                                 return_labels=False)
     assert type(n_components) is int
+
+
+@pytest.mark.parametrize("graph_file", utils.STRONGDATASETS)
+@pytest.mark.parametrize("host_threshold", [0, 4096])
+def test_experimental_strong_cc(graph_file, host_threshold):
+    M = utils.read_csv_for_nx(graph_file)
+    (_, nx_labels, nx_n_components, _, _) = networkx_strong_call(graph_file)
+
+    cu_M = cudf.DataFrame.from_pandas(M[["0", "1"]])
+    (comp, sing, count) = \
+        cugraph.experimental.strong_connected_component(
+            cu_M["0"], cu_M["1"], host_threshold=host_threshold)
+
+    assert count == len([c for c in nx_labels if len(c) > 1])
+    assert len(sing) == nx_n_components - count
+    components = comp.to_pandas().groupby("id")["vertex"].apply(set)
+    expected = sorted(sorted(c) for c in nx_labels if len(c) > 1)
+    assert sorted(sorted(c) for c in components) == expected
+    # Each component is labeled with its smallest vertex.
+    assert all(min(c) == i for (i, c) in components.items())
+
+
+def test_experimental_strong_cc_host():
+    """
+    Compare the array implementations against the SciPy reference on random
+    graphs, including graphs small enough to be finished on the host.
+    """
+    random_state = np.random.RandomState(42)
+    for _ in range(100):
+        num_vertices = random_state.randint(1, 60)
+        num_edges = random_state.randint(0, 200)
+        src = random_state.randint(0, num_vertices, num_edges)
+        dst = random_state.randint(0, num_vertices, num_edges)
+
+        expected = _scc_reference_labels(src, dst, num_vertices)
+        for host_threshold in [0, 5, 100]:
+            labels = _scc_labels(src, dst, num_vertices,
+                                 host_threshold=host_threshold)
+            assert (labels == expected).all()
+            labels = _scc_labels(cp.asarray(src), cp.asarray(dst),
+                                 num_vertices, host_threshold=host_threshold)
+            assert (labels.get() == expected).all()
+
+        # Tarjan labels each component with its root rather than its smallest
+        # vertex, so compare the partitions.
+        labels = _tarjan_labels(src, dst, num_vertices)
+        (_, first, inverse) = np.unique(labels, return_index=True,
+                                        return_inverse=True)
+        assert (first[inverse] == expected).all()
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+@pytest.mark.parametrize("method", ["experimental", "scipy"])
+def bench_experimental_strong_cc(gpubenchmark, method):
+    """
+    Find the strongly connected components of email-Eu-core using the multi-
+    pivot FW-BW-TRIM implementation and the SciPy reference implementation.
+    """
+    graph_file = utils.RAPIDS_DATASET_ROOT_DIR_PATH/"email-Eu-core.csv"
+    M = utils.read_csv_file(graph_file)
+
+    if method == "experimental":
+        gpubenchmark(cugraph.experimental.strong_connected_component,
+                     M["0"], M["1"])
+    else:
+        src = M["0"].values_host
+        dst = M["1"].values_host
+        num_vertices = int(max(src.max(), dst.max())) + 1
+        gpubenchmark(_scc_reference_labels, src, dst, num_vertices)
@@ -16,6 +16,8 @@ import pytest
 import cugraph
 from cugraph.testing import utils
 import numpy as np
+import pandas as pd
+import cudf
 
 # Temporarily suppress warnings till networkX fixes deprecation warnings
 # (Using or importing the ABCs from 'collections' instead of from
@@ -28,6 +30,17 @@ with warnings.catch_warnings():
     warnings.filterwarnings("ignore", category=DeprecationWarning)
     import networkx as nx
 
+# If the rapids-pytest-benchmark plugin is installed, the "gpubenchmark"
+# fixture will be available automatically. Check that this fixture is available
+# by trying to import rapids_pytest_benchmark, and if that fails, set
+# "gpubenchmark" to the standard "benchmark" fixture provided by
+# pytest-benchmark.
+try:
+    import rapids_pytest_benchmark  # noqa: F401
+except ImportError:
+    import pytest_benchmark
+    gpubenchmark = pytest_benchmark.plugin.benchmark
+
 
 # =============================================================================
 # Pytest Setup / Teardown - called for each test function
@@ -195,3 +208,92 @@ def test_from_adjlist(graph_file):
                               create_using=cugraph.DiGraph)
 
     assert G1.AdjList == G2.AdjList
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS)
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("format", ["csr", "coo", "csc"])
+def test_to_scipy_sparse(graph_file, directed, format):
+    M = utils.read_csv_for_nx(graph_file, read_weights_in_sp=True)
+    cuG = cugraph.from_pandas_edgelist(
+        M, source="0", destination="1", edge_attr="weight",
+        create_using=cugraph.Graph(directed=directed)
+    )
+
+    (A, labels) = cugraph.to_scipy_sparse(cuG, format=format,
+                                          return_labels=True)
+    assert A.format == format
+    assert A.shape == (cuG.number_of_nodes(), cuG.number_of_nodes())
+    np.testing.assert_array_equal(A.toarray(), cugraph.to_numpy_array(cuG))
+
+    # The labels map rows and columns to the original vertex IDs.
+    pdf = cugraph.to_pandas_adjacency(cuG)
+    assert (pdf.index == labels).all()
+    A = A.tocoo()
+    edges = pd.DataFrame({"0": labels[A.row], "1": labels[A.col],
+                          "weight": A.data})
+    expected = M[["0", "1", "weight"]]
+    if not directed:
+        reverse = expected.rename(columns={"0": "1", "1": "0"})
+        expected = pd.concat([expected, reverse]).drop_duplicates(["0", "1"])
+    edges = edges.sort_values(["0", "1"]).reset_index(drop=True)
+    expected = expected.sort_values(["0", "1"]).reset_index(drop=True)
+    assert len(edges) == len(expected)
+    assert (edges[["0", "1"]].values == expected[["0", "1"]].values).all()
+    np.testing.assert_allclose(edges["weight"], expected["weight"])
+
+    with pytest.raises(ValueError):
+        cugraph.to_scipy_sparse(cuG, format="dense")
+
+
+def test_to_numpy_array_unweighted():
+    df = cudf.DataFrame({"src": [10, 20, 20], "dst": [20, 30, 10]})
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(df, source="src", destination="dst")
+
+    pdf = cugraph.to_pandas_adjacency(G)
+    assert pdf.loc[10, 20] == 1.0
+    assert pdf.loc[20, 30] == 1.0
+    assert pdf.loc[20, 10] == 1.0
+    assert pdf.values.sum() == 3.0
+    assert cugraph.to_scipy_sparse(G).nnz == 3
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+def _to_numpy_array_loop(G):
+    # The previous implementation, which sets one element per edge.
+    nlen = G.number_of_nodes()
+    elen = G.number_of_edges()
+    df = G.edgelist.edgelist_df
+    np_array = np.full((nlen, nlen), 0.0)
+    for i in range(0, elen):
+        np_array[df['src'].iloc[i], df['dst'].iloc[i]] = df['weights'].\
+                                                         iloc[i]
+    return np_array
+
+
+@pytest.mark.parametrize("method", ["loop", "to_numpy_array",
+                                    "to_scipy_sparse"])
+def bench_to_numpy_array(gpubenchmark, method):
+    """
+    Export the adjacency matrix of a 4096 vertex RMAT graph.
+    """
+    from cugraph.generators import rmat
+
+    scale = 12
+    df = rmat(scale, (2**scale)*16, 0.57, 0.19, 0.19, 42,
+              clip_and_flip=False, scramble_vertex_ids=False,
+              create_using=None, mg=False)
+    df["weights"] = 1.0
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(df, source="src", destination="dst",
+                         edge_attr="weights", renumber=False)
+
+    if method == "loop":
+        gpubenchmark(_to_numpy_array_loop, G)
+    elif method == "to_numpy_array":
+        gpubenchmark(cugraph.to_numpy_array, G)
+    else:
+        gpubenchmark(cugraph.to_scipy_sparse, G)
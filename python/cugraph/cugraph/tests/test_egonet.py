@@ -115,3 +115,44 @@ def test_multi_column_ego_graph(graph_file, seed, radius):
     for i in range(len(edgelist_df_res)):
         assert ego_cugraph_exp.has_edge(edgelist_df_res["0_src"].iloc[i],
                                         edgelist_df_res["0_dst"].iloc[i])
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_batched_ego_graphs_batch_size(graph_file, batch_size):
+    gc.collect()
+
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=False,
+                                               edgevals=True)
+    seeds = [0, 5, 13]
+    expected_df, expected_offsets = cugraph.batched_ego_graphs(
+        G, seeds, radius=2)
+    df, offsets = cugraph.batched_ego_graphs(G, seeds, radius=2,
+                                             batch_size=batch_size)
+    assert offsets.values_host.tolist() == \
+        expected_offsets.values_host.tolist()
+    assert df.to_pandas().equals(expected_df.to_pandas())
+
+
+def test_batched_ego_graphs_stitch_offsets(monkeypatch):
+    # Check how the batches are stitched without running the algorithm: each
+    # seed's egonet is seed + 1 copies of the edge (seed, seed), with the
+    # offsets returned as a column like egonet_wrapper.egonet does.
+    def egonet(G, seeds, radius):
+        sizes = [seed + 1 for seed in seeds.values_host.tolist()]
+        src = [seed for (seed, size) in zip(seeds.values_host, sizes)
+               for _ in range(size)]
+        df = cudf.DataFrame({"src": src, "dst": src}, dtype="int32")
+        offsets = cudf.Series([0] + sizes).cumsum()._column
+        return df, offsets
+
+    monkeypatch.setattr(cugraph.community.egonet.egonet_wrapper, "egonet",
+                        egonet)
+    seeds = cudf.Series([3, 0, 2, 1, 4], dtype="int32")
+    expected_df, expected_offsets = egonet(None, seeds, 1)
+    for batch_size in [1, 2, 5]:
+        df, offsets = cugraph.community.egonet._batched_egonet(
+            None, seeds, 1, batch_size)
+        assert cudf.Series(offsets).values_host.tolist() == \
+            expected_offsets.values_host.tolist()
+        assert df.to_pandas().equals(expected_df.to_pandas())
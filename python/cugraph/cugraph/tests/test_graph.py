@@ -15,6 +15,7 @@ import gc
 
 import time
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -696,3 +697,146 @@ def test_graph_init_with_multigraph():
     cDiMG = cugraph.MultiDiGraph()  # deprecated, but should still work
     cDiMG.from_cudf_edgelist(gdf, source="src", destination="dst")
     cugraph.Graph(m_graph=cDiMG)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_plc_graph_cache(graph_file):
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1", edge_attr="2")
+
+    assert G.plc_graph_cache_info() == (0, 0, 0)
+
+    # Repeated algorithm calls on the same graph reuse the pylibcugraph graph
+    cugraph.katz_centrality(G)
+    cugraph.katz_centrality(G)
+    cugraph.bfs(G, 0)
+    assert G.plc_graph_cache_info() == (2, 1, 1)
+
+    # A different weight type requires a different pylibcugraph graph
+    cugraph.hits(G)
+    assert G.plc_graph_cache_info() == (2, 2, 2)
+
+    # Replacing the edgelist invalidates the cache
+    G.delete_edge_list()
+    assert G.plc_graph_cache_info().currsize == 0
+
+
+def test_plc_graph_cache_host_backend():
+    from cugraph.structure.graph_implementation.plc_graph_cache import (
+        PLCGraphCache, HostSGGraph)
+
+    srcs = np.array([0, 1, 2, 2], dtype="int32")
+    dsts = np.array([1, 2, 0, 3], dtype="int32")
+    weights = np.array([1.0, 2.0, 3.0, 4.0], dtype="float32")
+    built = []
+
+    def make_args():
+        built.append(True)
+        return (None, None, srcs, dsts, weights, False, False, True)
+
+    cache = PLCGraphCache(backend=HostSGGraph)
+    sg = cache.get("key", make_args)
+    assert cache.get("key", make_args) is sg
+    assert len(built) == 1
+    assert cache.cache_info() == (1, 1, 1)
+    assert sg.offsets.tolist() == [0, 1, 2, 4, 4]
+    assert sg.indices.tolist() == [1, 2, 0, 3]
+
+    cache.invalidate()
+    assert cache.get("key", make_args) is not sg
+    assert cache.cache_info() == (1, 2, 1)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("budget", [None, 2**10])
+def test_from_edgelist_chunks(graph_file, directed, budget):
+    cu_M = utils.read_csv_file(graph_file)
+    chunks = (cu_M[i:i + 100] for i in range(0, len(cu_M), 100))
+
+    G = cugraph.Graph(directed=directed)
+    G.from_edgelist_chunks(chunks, source="0", destination="1",
+                           edge_attr="2", budget=budget)
+    expected = cugraph.Graph(directed=directed)
+    expected.from_cudf_edgelist(cu_M, source="0", destination="1",
+                                edge_attr="2")
+    assert G.is_renumbered()
+    assert G.is_weighted()
+    assert G.number_of_vertices() == expected.number_of_vertices()
+    assert G.number_of_edges() == expected.number_of_edges()
+
+    edges = G.view_edge_list().to_pandas()
+    edges_exp = expected.view_edge_list().to_pandas()
+    columns = ["src", "dst", "weights"]
+    edges = edges.sort_values(columns).reset_index(drop=True)
+    edges_exp = edges_exp.sort_values(columns).reset_index(drop=True)
+    assert (edges[["src", "dst"]] == edges_exp[["src", "dst"]]).all().all()
+    assert np.allclose(edges["weights"], edges_exp["weights"])
+
+    # Without renumbering, the vertex IDs are the rows of the adjacency list
+    M = utils.read_csv_for_nx(graph_file)
+    N = max(max(M["0"]), max(M["1"])) + 1
+    G = cugraph.Graph(directed=True)
+    G.from_edgelist_chunks([cu_M], source="0", destination="1",
+                           renumber=False, budget=budget)
+    M = scipy.sparse.csr_matrix((M.weight, (M["0"], M["1"])), shape=(N, N))
+    offsets_cu, indices_cu, values_cu = G.view_adj_list()
+    compare_series(offsets_cu, M.indptr)
+    compare_series(indices_cu, M.indices)
+    assert values_cu is None
+
+
+def test_from_edgelist_chunks_files(tmpdir):
+    df = pd.DataFrame({"src": ["a", "b", "c", "a", "b"],
+                       "dst": ["b", "c", "a", "b", "a"],
+                       "weight": [1.0, 2.0, 3.0, 0.5, 4.0]})
+    df[:3].to_csv(tmpdir.join("part0.csv"), index=False)
+    df[3:].to_csv(tmpdir.join("part1.csv"), index=False)
+
+    G = cugraph.Graph()
+    G.from_edgelist_chunks(str(tmpdir.join("*.csv")), source="src",
+                           destination="dst", edge_attr="weight",
+                           spill_dir=str(tmpdir))
+    assert sorted(tmpdir.listdir()) == sorted(
+        [tmpdir.join("part0.csv"), tmpdir.join("part1.csv")])
+    assert G.number_of_vertices() == 3
+    assert G.number_of_edges() == 3
+    assert G.nodes().to_arrow().to_pylist() == ["a", "b", "c"]
+    edges = G.view_edge_list().to_pandas()
+    weights = {(u, v): w for (u, v, w) in edges.itertuples(index=False)}
+    assert weights == {("a", "b"): 0.5, ("b", "c"): 2.0, ("a", "c"): 3.0}
+
+    with pytest.raises(ValueError):
+        cugraph.Graph().from_edgelist_chunks(str(tmpdir.join("*.parquet")))
+    with pytest.raises(ValueError):
+        cugraph.Graph().from_edgelist_chunks([df], source="src",
+                                             destination="dst",
+                                             renumber=False)
+
+
+def test_build_csr_from_chunks_host():
+    from cugraph.structure.edgelist_chunks import build_csr_from_chunks
+
+    df = pd.DataFrame({"src": [10, 30, 20, 10, 30, 10],
+                       "dst": [20, 10, 30, 20, 30, 20],
+                       "weight": [4.0, 1.0, 2.0, 3.0, 5.0, 6.0]})
+    chunks = [df[i:i + 2] for i in range(0, len(df), 2)]
+    for budget in [None, 100]:
+        (offsets, indices, weights, vertices, num_edges) = \
+            build_csr_from_chunks(iter(chunks), "src", "dst", "weight",
+                                  directed=True, budget=budget)
+        assert vertices.tolist() == [10, 20, 30]
+        assert offsets.tolist() == [0, 1, 2, 4]
+        assert indices.tolist() == [1, 2, 0, 2]
+        assert weights.tolist() == [3.0, 2.0, 1.0, 5.0]
+        assert num_edges == 4
+
+    (offsets, indices, weights, vertices, num_edges) = build_csr_from_chunks(
+        iter(chunks), "src", "dst", directed=False, renumber=False)
+    assert vertices is None
+    assert len(offsets) == 32
+    assert indices[offsets[10]:offsets[11]].tolist() == [20, 30]
+    assert indices[offsets[30]:offsets[31]].tolist() == [10, 20, 30]
+    assert num_edges == 4
@@ -16,9 +16,24 @@ import pytest
 import cugraph
 from cugraph.testing import utils
 from cugraph.experimental import PropertyGraph
+from cugraph.gnn.graph_store import CuFeatureStorage
+from cugraph.gnn.neighbor_sampling import CSRIndex
+import asyncio
 import numpy as np
+import pandas as pd
 import cudf
 
+# If the rapids-pytest-benchmark plugin is installed, the "gpubenchmark"
+# fixture will be available automatically. Check that this fixture is available
+# by trying to import rapids_pytest_benchmark, and if that fails, set
+# "gpubenchmark" to the standard "benchmark" fixture provided by
+# pytest-benchmark.
+try:
+    import rapids_pytest_benchmark  # noqa: F401
+except ImportError:
+    import pytest_benchmark
+    gpubenchmark = pytest_benchmark.plugin.benchmark
+
 
 # Test
 @pytest.mark.parametrize("graph_file", utils.DATASETS)
@@ -187,6 +202,200 @@ def test_sample_neighbor_neg_one_fanout(graph_file):
     assert len(parents_list) > 0
 
 
+@pytest.mark.parametrize("graph_file", utils.DATASETS)
+@pytest.mark.parametrize("edge_dir", ["in", "out"])
+@pytest.mark.parametrize("replace", [False, True])
+def test_sample_neighbors_fanout(graph_file, edge_dir, replace):
+    cu_M = utils.read_csv_file(graph_file)
+
+    pg = PropertyGraph()
+    pg.add_edge_data(cu_M,
+                     type_name="edge",
+                     vertex_col_names=("0", "1"),
+                     property_columns=["2"])
+
+    gstore = cugraph.gnn.CuGraphStore(graph=pg, random_state=42)
+
+    nodes = gstore.get_vertex_ids()[:20]
+    fanout = 3
+    (dsts, srcs) = gstore.sample_neighbors(nodes, fanout,
+                                           edge_dir=edge_dir,
+                                           replace=replace)
+    sampled = cudf.DataFrame({"0": srcs, "1": dsts})
+    seed_col = "1" if edge_dir == "in" else "0"
+
+    # All sampled edges are edges of the graph incident to the seeds.
+    sampled_edges = sampled.drop_duplicates()
+    assert len(sampled_edges.merge(cu_M[["0", "1"]].drop_duplicates())) == \
+        len(sampled_edges)
+    assert sampled[seed_col].isin(nodes).all()
+
+    degrees = cu_M[seed_col].value_counts()
+    counts = sampled[seed_col].value_counts()
+    for (node, count) in counts.to_pandas().items():
+        degree = degrees[node]
+        if replace:
+            assert count == fanout
+        else:
+            assert count == min(degree, fanout)
+
+    # Sampling with fanout=-1 returns all incident edges.
+    (dsts, srcs) = gstore.sample_neighbors(nodes, -1, edge_dir=edge_dir)
+    assert len(dsts) == int(cu_M[seed_col].isin(nodes).sum())
+
+
+@pytest.mark.parametrize("replace", [False, True])
+def test_sample_neighbors_prob(replace):
+    df = cudf.DataFrame({"src": [0, 1, 2, 3, 4, 5],
+                         "dst": [9, 9, 9, 9, 8, 8],
+                         "p": [1.0, 0.0, 2.0, 0.0, 0.0, 1.0]})
+    pg = PropertyGraph()
+    pg.add_edge_data(df, vertex_col_names=("src", "dst"))
+    gstore = cugraph.gnn.CuGraphStore(graph=pg, random_state=42)
+
+    (dsts, srcs) = gstore.sample_neighbors(cudf.Series([9, 8] * 50), 1,
+                                           prob="p", replace=replace)
+    # Edges with a probability of 0 are never sampled.
+    assert set(srcs.tolist()) == {0, 2, 5}
+
+    # Not even when all the neighbors are returned.
+    for fanout in [-1, 10]:
+        (dsts, srcs) = gstore.sample_neighbors(cudf.Series([9, 8]), fanout,
+                                               prob="p")
+        assert sorted(srcs.tolist()) == [0, 2, 5]
+
+    with pytest.raises(ValueError):
+        gstore.sample_neighbors(cudf.Series([9]), 1, prob="bad_prop")
+    with pytest.raises(ValueError):
+        gstore.sample_neighbors(cudf.Series([9]), 1, edge_dir="bad_dir")
+
+
+def test_csr_index_host():
+    """
+    Ensures CSRIndex works with NumPy arrays.
+    """
+    srcs = np.array([0, 0, 0, 0, 1, 1, 5, 5, 5])
+    dsts = np.array([1, 2, 3, 4, 0, 2, 0, 1, 2])
+    weights = np.array([1, 0, 1, 0, 1, 1, 0, 0, 1], dtype="float64")
+    random_state = np.random.RandomState(42)
+
+    index = CSRIndex(srcs, dsts)
+    assert index.number_of_vertices == 3
+    assert index.number_of_edges == 9
+
+    (seeds, minors, edge_ids) = index.sample(np.array([5, 7, 0]))
+    assert seeds.tolist() == [5, 5, 5, 0, 0, 0, 0]
+    assert minors.tolist() == [0, 1, 2, 1, 2, 3, 4]
+    assert edge_ids.tolist() == [6, 7, 8, 0, 1, 2, 3]
+
+    (seeds, minors, edge_ids) = index.sample(np.array([0] * 100), fanout=2,
+                                             random_state=random_state)
+    assert len(seeds) == 200
+    # Sampling without replacement never returns the same edge for a seed.
+    assert (edge_ids[0::2] != edge_ids[1::2]).all()
+
+    index = CSRIndex(srcs, dsts, weights=weights)
+    for replace in [False, True]:
+        (seeds, minors, edge_ids) = index.sample(np.array([0] * 100),
+                                                 fanout=2,
+                                                 replace=replace,
+                                                 random_state=random_state)
+        assert set(minors.tolist()) == {1, 3}
+
+    # Only the edges with a non-zero weight are returned when fanout is
+    # at least the degree.
+    for fanout in [-1, 4]:
+        (seeds, minors, edge_ids) = index.sample(np.array([0, 5]),
+                                                 fanout=fanout,
+                                                 random_state=random_state)
+        assert sorted(edge_ids.tolist()) == [0, 2, 8]
+
+
+def test_get_node_storage():
+    torch = pytest.importorskip("torch")
+
+    pg = PropertyGraph()
+    pg.add_edge_data(cudf.DataFrame({"src": [0, 1, 2], "dst": [1, 2, 3],
+                                     "w": [0.5, 1.5, 2.5]}),
+                     vertex_col_names=("src", "dst"))
+    pg.add_vertex_data(cudf.DataFrame({"v": [3, 1, 0],
+                                       "a": [30.0, 10.0, 0.0],
+                                       "b": [31.0, 11.0, 1.0]}),
+                       vertex_col_name="v", type_name="feat")
+    pg.add_vertex_data(cudf.DataFrame({"v": [2], "c": [5]}),
+                       vertex_col_name="v", type_name="other")
+    gstore = cugraph.gnn.CuGraphStore(graph=pg)
+
+    nstorage = gstore.get_node_storage(["a", "b"], ntype="feat")
+    assert nstorage.shape == (3, 2)
+    feats = nstorage[cudf.Series([1, 3, 1])]
+    assert isinstance(feats, torch.Tensor)
+    assert feats.is_cuda
+    assert feats.tolist() == [[10.0, 11.0], [30.0, 31.0], [10.0, 11.0]]
+    assert nstorage[np.array([], dtype="int64")].shape == (0, 2)
+    with pytest.raises(KeyError):
+        nstorage[[2]]
+
+    # Without a type, only vertices having the property are used.
+    nstorage = gstore.get_node_storage("c")
+    assert len(nstorage) == 1
+    assert nstorage[[2]].tolist() == [[5]]
+
+    estorage = gstore.get_edge_storage("w", dtype="float32")
+    assert estorage.dtype == np.float32
+    assert estorage[[2, 0]].tolist() == [[2.5], [0.5]]
+
+    with pytest.raises(ValueError):
+        gstore.get_node_storage("bad_prop")
+    # Vertex 2 does not have properties "a" or "b".
+    with pytest.raises(ValueError):
+        gstore.get_node_storage(["a", "c"])
+
+
+def test_feature_storage_fetch():
+    """
+    Ensures async_fetch() and prefetch() return the same features as
+    __getitem__(), in batch order, for features stored on the host.
+    """
+    torch = pytest.importorskip("torch")
+
+    num_ids = 1000
+    ids = np.random.RandomState(42).permutation(num_ids) * 2
+    features = pd.DataFrame({"x": ids * 10, "y": ids * 100})
+    storage = CuFeatureStorage(ids, features, max_workers=2)
+    batches = [np.arange(i, i + 100) * 2 for i in range(0, num_ids, 100)]
+
+    expected = [storage[batch] for batch in batches]
+    assert (expected[0][:, 0].numpy() == batches[0] * 10).all()
+
+    for depth in [1, 3, 20]:
+        results = list(storage.prefetch(batches, device="cpu", depth=depth))
+        assert len(results) == len(expected)
+        for (result, exp) in zip(results, expected):
+            assert isinstance(result, torch.Tensor)
+            assert not result.is_cuda
+            assert (result == exp).all()
+
+    async def fetch_all():
+        return await asyncio.gather(
+            *[storage.async_fetch(batch) for batch in batches])
+    for (result, exp) in zip(asyncio.run(fetch_all()), expected):
+        assert (result == exp).all()
+    storage.close()
+
+    with pytest.raises(KeyError):
+        storage[[1]]
+    with pytest.raises(ValueError):
+        CuFeatureStorage(np.array([0, 0]), features[:2])
+    with pytest.raises(ValueError):
+        list(storage.prefetch(batches, depth=0))
+
+    empty = CuFeatureStorage(np.array([], dtype="int64"), features[:0])
+    assert empty[np.array([], dtype="int64")].shape == (0, 2)
+    with pytest.raises(KeyError):
+        empty[[0]]
+
+
 @pytest.mark.parametrize("graph_file", utils.DATASETS)
 def test_n_data(graph_file):
     cu_M = utils.read_csv_file(graph_file)
@@ -234,3 +443,50 @@ def test_e_data(graph_file):
     edata = gstore.edata
 
     assert edata.shape[0] > 0
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+@pytest.mark.parametrize("num_seeds", [1000, 100000])
+def bench_sample_neighbors(gpubenchmark, num_seeds):
+    """
+    Sample 10 neighbors per seed on an RMAT graph. Divide num_seeds by the
+    reported time for the throughput in seeds/second.
+    """
+    from cugraph.generators import rmat
+
+    scale = 20
+    df = rmat(scale, (2**scale)*16, 0.57, 0.19, 0.19, 42,
+              clip_and_flip=False, scramble_vertex_ids=True,
+              create_using=None, mg=False)
+    pg = PropertyGraph()
+    pg.add_edge_data(df, vertex_col_names=("src", "dst"))
+    gstore = cugraph.gnn.CuGraphStore(graph=pg, random_state=42)
+
+    nodes = df["dst"].sample(n=num_seeds, replace=True, random_state=42)
+    # Build the index before benchmarking.
+    gstore.sample_neighbors(nodes[:1], 10)
+
+    gpubenchmark(gstore.sample_neighbors, nodes, 10)
+
+
+@pytest.mark.parametrize("batch_size", [1000, 100000])
+def bench_feature_storage_getitem(gpubenchmark, batch_size):
+    """
+    Gather 64 features for a batch of random vertices from 2**20 vertices.
+    """
+    import cupy
+
+    num_vertices = 2**20
+    df = cudf.DataFrame({"v": cupy.arange(num_vertices)})
+    for i in range(64):
+        df[f"f{i}"] = cupy.random.random(num_vertices, dtype="float32")
+    pg = PropertyGraph()
+    pg.add_vertex_data(df, vertex_col_name="v")
+    gstore = cugraph.gnn.CuGraphStore(graph=pg)
+    storage = gstore.get_node_storage([f"f{i}" for i in range(64)])
+
+    ids = cupy.random.randint(0, num_vertices, batch_size)
+
+    gpubenchmark(storage.__getitem__, ids)
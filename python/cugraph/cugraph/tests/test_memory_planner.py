@@ -0,0 +1,195 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import importlib.util
+import pathlib
+
+import numpy as np
+import pytest
+
+
+# Load the planner from its file rather than through the cugraph package,
+# which imports cudf, rmm and pylibcugraph, so the host-only tests below do
+# not need a GPU stack.
+_spec = importlib.util.spec_from_file_location(
+    "_memory_planner",
+    pathlib.Path(__file__).parents[1] / "utilities" / "memory_planner.py")
+memory_planner = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(memory_planner)
+GraphInfo = memory_planner.GraphInfo
+estimate_memory = memory_planner.estimate_memory
+
+
+# =============================================================================
+# Pytest Setup / Teardown - called for each test function
+# =============================================================================
+def setup_function():
+    gc.collect()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+# The estimates and budgets are computed on the host, so only the tests of
+# real graphs below need a GPU (and import cugraph and its test utilities).
+# Those use cugraph.utilities.memory_planner, whose budget is the one the
+# algorithms read.
+@pytest.mark.parametrize("algo", memory_planner.supported_algorithms())
+def test_estimate_memory_scaling(algo):
+    small = GraphInfo(1000, 10000)
+    large = GraphInfo(2000, 20000)
+    small_size = estimate_memory(small, algo)
+    assert small_size > 0
+    assert estimate_memory(large, algo) > small_size
+
+    # Larger types use more memory.
+    wide = small._replace(vertex_itemsize=8, weight_itemsize=8)
+    assert estimate_memory(wide, algo) > small_size
+    # A tuple describes the same graph.
+    assert estimate_memory((1000, 10000), algo) == small_size
+
+
+def test_estimate_memory_items():
+    info = GraphInfo(1000, 10000)
+    estimate = memory_planner.plan_memory(info, "multi_source_bfs",
+                                          sources=10)
+    assert estimate.num_items == 10
+    assert estimate_memory(info, "multi_source_bfs", sources=10) == \
+        estimate.fixed + 10 * estimate.per_item
+    assert estimate_memory(info, "multi_source_bfs",
+                           sources=list(range(10))) == \
+        estimate_memory(info, "multi_source_bfs", sources=10)
+    assert estimate_memory(info, "multi_source_bfs",
+                           sources=np.int64(10)) == \
+        estimate_memory(info, "multi_source_bfs", sources=10)
+
+    # Smaller components mean smaller outputs.
+    assert estimate_memory(
+        info, "multi_source_bfs", sources=10, mean_component_size=10) < \
+        estimate_memory(info, "multi_source_bfs", sources=10)
+
+    # The ego graphs grow with the radius, up to the whole graph.
+    assert estimate_memory(info, "ego_graph", seeds=5, radius=2) > \
+        estimate_memory(info, "ego_graph", seeds=5, radius=1)
+    assert estimate_memory(info, "ego_graph", seeds=5, radius=300) == \
+        estimate_memory(info, "ego_graph", seeds=5, radius=10)
+
+
+def test_estimate_memory_invalid():
+    with pytest.raises(ValueError):
+        estimate_memory(GraphInfo(10, 10), "not_an_algorithm")
+    with pytest.raises(TypeError):
+        estimate_memory(GraphInfo(10, 10), "pagerank", sources=1)
+
+
+def test_host_memory_budget():
+    memory_planner.set_memory_budget(10**6, memory="host")
+    try:
+        assert memory_planner.get_memory_budget(memory="host") == 10**6
+        with memory_planner.memory_budget(memory="host", fraction=0.25):
+            available = memory_planner.get_available_memory(memory="host")
+            budget = memory_planner.get_memory_budget(memory="host")
+            assert budget <= available
+            assert budget > 0
+        assert memory_planner.get_memory_budget(memory="host") == 10**6
+    finally:
+        memory_planner.set_memory_budget(memory="host")
+
+    with pytest.raises(ValueError):
+        memory_planner.set_memory_budget(memory="host", fraction=1.5)
+    with pytest.raises(ValueError):
+        memory_planner.set_memory_budget(-1, memory="host")
+    # Fractions must be passed as such, so 1.0 is not mistaken for 1 byte.
+    with pytest.raises(TypeError):
+        memory_planner.set_memory_budget(1.0, memory="host")
+    with pytest.raises(ValueError):
+        memory_planner.set_memory_budget(10**6, memory="host", fraction=0.5)
+    with pytest.raises(TypeError):
+        memory_planner.set_memory_budget("1GB", memory="host")
+    with pytest.raises(ValueError):
+        memory_planner.set_memory_budget(10**6, memory="disk")
+
+
+def test_get_batch_size():
+    info = GraphInfo(1000, 10000)
+    estimate = memory_planner.plan_memory(info, "multi_source_bfs")
+
+    with memory_planner.memory_budget(estimate.fixed + 7 * estimate.per_item,
+                                      memory="host"):
+        batch_size = memory_planner.get_batch_size(
+            info, "multi_source_bfs", 100, memory="host")
+        assert batch_size == 7
+        # Never more than the number of items.
+        assert memory_planner.get_batch_size(
+            info, "multi_source_bfs", 3, memory="host") == 3
+
+    # At least one item is processed, with a warning if it does not fit.
+    with pytest.warns(UserWarning):
+        assert memory_planner.get_batch_size(
+            info, "multi_source_bfs", 100, budget=estimate.fixed) == 1
+
+    # Work that does not grow with the number of items is not split.
+    assert memory_planner.get_batch_size(
+        info, "betweenness_centrality", 100, budget=1) == 100
+
+    assert memory_planner.split_batches(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert memory_planner.split_batches(list(range(3)), 4) == [(0, 3)]
+
+
+def test_check_memory():
+    info = GraphInfo(1000, 10000)
+    size = estimate_memory(info, "pagerank")
+    with memory_planner.memory_budget(size, memory="host"):
+        assert memory_planner.check_memory(info, "pagerank",
+                                           memory="host") == size
+    with memory_planner.memory_budget(size - 1, memory="host"):
+        with pytest.warns(UserWarning):
+            memory_planner.check_memory(info, "pagerank", memory="host")
+
+
+def test_get_graph_info():
+    from cugraph.testing import utils
+    from cugraph.utilities.memory_planner import get_graph_info
+
+    for graph_file in utils.DATASETS_SMALL:
+        G = utils.generate_cugraph_graph_from_file(graph_file, directed=True,
+                                                   edgevals=True)
+        info = get_graph_info(G)
+        assert info.num_vertices == G.number_of_vertices()
+        assert info.num_edges == G.number_of_edges()
+        assert info.vertex_itemsize == 4
+        assert info.weight_itemsize == 4
+        assert info.directed
+        assert estimate_memory(G, "bfs") == estimate_memory(info, "bfs")
+
+
+def test_multi_source_bfs_budget():
+    import cugraph
+    from cugraph.testing import utils
+    from cugraph.utilities import memory_planner
+
+    for graph_file in utils.DATASETS_SMALL:
+        G = utils.generate_cugraph_graph_from_file(graph_file, directed=True)
+        sources = G.nodes().to_pandas().sample(6, random_state=0).tolist()
+        expected = cugraph.multi_source_bfs(G, sources).to_pandas()
+
+        # A budget for the results of two sources at a time.
+        estimate = memory_planner.plan_memory(G, "multi_source_bfs")
+        with memory_planner.memory_budget(estimate.fixed +
+                                          2 * estimate.per_item):
+            assert cugraph.traversal.ms_bfs._get_batch_size(
+                G, len(sources)) == 2
+            with pytest.warns(UserWarning):
+                result = cugraph.multi_source_bfs(G, sources).to_pandas()
+        assert result.equals(expected)
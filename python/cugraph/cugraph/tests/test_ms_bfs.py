@@ -0,0 +1,149 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+
+import pytest
+import numpy as np
+
+import cudf
+import cugraph
+from cugraph.testing import utils
+
+
+# =============================================================================
+# Pytest Setup / Teardown - called for each test function
+# =============================================================================
+def setup_function():
+    gc.collect()
+
+
+# =============================================================================
+# Helper functions
+# =============================================================================
+def get_reached(G, source, depth_limit=None):
+    """
+    Return a dict of vertex: distance for the vertices reached from source
+    using cugraph.bfs.
+    """
+    df = cugraph.bfs(G, source, depth_limit=depth_limit).to_pandas()
+    df = df[df["distance"] != np.iinfo(np.int32).max]
+    return dict(zip(df["vertex"], df["distance"]))
+
+
+def get_sources(G, num_sources, seed=42):
+    vertices = G.nodes().to_pandas()
+    return vertices.sample(num_sources, random_state=seed).tolist()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_multi_source_bfs(graph_file, directed, batch_size):
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=directed)
+    sources = get_sources(G, 5)
+
+    df = cugraph.multi_source_bfs(G, sources, batch_size=batch_size)
+    df = df.to_pandas()
+    assert len(df) == G.number_of_vertices()
+    for source in sources:
+        reached = df[df[f"distance_{source}"] != np.iinfo(np.int32).max]
+        assert dict(zip(reached["vertex"], reached[f"distance_{source}"])) \
+            == get_reached(G, source)
+        assert (reached[reached["vertex"] == source]
+                [f"predecessor_{source}"] == -1).all()
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("depth_limit", [None, 2])
+def test_multi_source_bfs_components(graph_file, depth_limit):
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=False)
+    components = cugraph.weakly_connected_components(G)
+    components = components.rename(columns={"labels": "color"})
+    sources = get_sources(G, 4)
+
+    (df, offsets) = cugraph.multi_source_bfs(
+        G, sources, components=components, depth_limit=depth_limit,
+        batch_size=3)
+    df = df.to_pandas()
+    offsets = offsets.to_pandas().tolist()
+    assert len(offsets) == len(sources) + 1
+    assert offsets[-1] == len(df)
+    for (i, source) in enumerate(sources):
+        result = df.iloc[offsets[i]:offsets[i + 1]]
+        assert dict(zip(result["vertex"], result["distance"])) == \
+            get_reached(G, source, depth_limit=depth_limit)
+
+
+def test_multi_source_bfs_invalid():
+    graph_file = utils.DATASETS_SMALL[0]
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=False)
+    sources = get_sources(G, 3)
+
+    with pytest.raises(ValueError):
+        cugraph.multi_source_bfs(G, sources + sources[:1])
+
+    # Colors that split a weakly connected component are rejected.
+    components = cugraph.weakly_connected_components(G)
+    components = components.rename(columns={"labels": "color"})
+    components["color"] = components["vertex"]
+    with pytest.raises(ValueError):
+        cugraph.multi_source_bfs(G, sources, components=components)
+
+
+def test_multi_source_bfs_offload(tmp_path):
+    graph_file = utils.DATASETS_SMALL[0]
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=True)
+    sources = get_sources(G, 5)
+
+    paths = cugraph.multi_source_bfs(G, sources, offload=True,
+                                     output_dir=str(tmp_path / "bfs"),
+                                     batch_size=2)
+    assert len(paths) == 3
+    df = cudf.concat([cudf.read_parquet(path) for path in paths])
+    df = df.to_pandas()
+    assert set(df["source"]) == set(sources)
+    for source in sources:
+        result = df[df["source"] == source]
+        assert dict(zip(result["vertex"], result["distance"])) == \
+            get_reached(G, source)
+
+
+def test_concurrent_bfs():
+    Graphs = [utils.generate_cugraph_graph_from_file(graph_file,
+                                                     directed=True)
+              for graph_file in utils.DATASETS_SMALL[:2]]
+    sources = [cudf.Series(get_sources(G, 3)) for G in Graphs]
+
+    (df, offsets) = cugraph.concurrent_bfs(Graphs, sources)
+    df = df.to_pandas()
+    offsets = offsets.to_pandas().tolist()
+    i = 0
+    for (g, (G, graph_sources)) in enumerate(zip(Graphs, sources)):
+        for source in graph_sources.to_pandas():
+            result = df.iloc[offsets[i]:offsets[i + 1]]
+            assert (result["graph"] == g).all()
+            assert dict(zip(result["vertex"], result["distance"])) == \
+                get_reached(G, source)
+            i += 1
+
+    with pytest.raises(ValueError):
+        cugraph.concurrent_bfs(Graphs, sources[:1])
+    with pytest.raises(ValueError):
+        cugraph.concurrent_bfs(
+            Graphs + [utils.generate_cugraph_graph_from_file(
+                utils.DATASETS_SMALL[0], directed=False)],
+            sources + [sources[0]])
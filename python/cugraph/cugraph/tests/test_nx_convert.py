@@ -159,3 +159,165 @@ def test_nx_convert_multicol(graph_file):
 
     assert nxG.number_of_nodes() == cuG.number_of_nodes()
     assert nxG.number_of_edges() == cuG.number_of_edges()
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_nx_convert_string_nodes(directed):
+    # Nodes that are not integers are dictionary-encoded.
+    nx_df = utils.read_csv_for_nx(utils.DATASETS_SMALL[0],
+                                  read_weights_in_sp=True)
+    nx_df["0"] = "v" + nx_df["0"].astype(str)
+    nx_df["1"] = "v" + nx_df["1"].astype(str)
+    create_using = nx.DiGraph if directed else nx.Graph
+    nxG = nx.from_pandas_edgelist(nx_df, "0", "1", "weight",
+                                  create_using=create_using)
+
+    cuG = cugraph.utilities.convert_from_nx(nxG, weight="weight")
+    assert cuG.is_directed() is directed
+    assert nxG.number_of_nodes() == cuG.number_of_nodes()
+    assert nxG.number_of_edges() == cuG.number_of_edges()
+
+    cu_df = cuG.view_edge_list().to_pandas()
+    for row in cu_df.itertuples(index=False):
+        assert nxG[row.src][row.dst]["weight"] == pytest.approx(row.weights)
+
+
+def test_nx_convert_cache():
+    nx_df = utils.read_csv_for_nx(utils.DATASETS_SMALL[0])
+    nxG = nx.from_pandas_edgelist(nx_df, "0", "1", create_using=nx.Graph)
+
+    # NetworkX graphs are not cached unless enabled.
+    (cuG, _) = cugraph.utilities.ensure_cugraph_obj_for_nx(nxG)
+    assert cugraph.utilities.ensure_cugraph_obj_for_nx(nxG)[0] is not cuG
+
+    cugraph.utilities.enable_nx_cache()
+    try:
+        # Algorithms reuse the graph converted by the first one.
+        (cuG, _) = cugraph.utilities.ensure_cugraph_obj_for_nx(nxG)
+        assert cugraph.utilities.ensure_cugraph_obj_for_nx(nxG)[0] is cuG
+        assert cugraph.utilities.ensure_cugraph_obj(
+            nxG, nx_weight_attr="weight")[0] is cuG
+        # The graph is not cached unless requested.
+        assert cugraph.utilities.convert_from_nx(nxG) is not cuG
+
+        # Changing the graph invalidates the cached graph.
+        nxG.add_edge(-1, -2)
+        (cuG2, _) = cugraph.utilities.ensure_cugraph_obj_for_nx(nxG)
+        assert cuG2 is not cuG
+        assert cuG2.number_of_edges() == nxG.number_of_edges()
+
+        cugraph.utilities.clear_nx_cache(nxG)
+        assert cugraph.utilities.ensure_cugraph_obj_for_nx(nxG)[0] is not \
+            cuG2
+    finally:
+        cugraph.utilities.enable_nx_cache(False)
+
+
+def test_nx_convert_cache_same_degrees():
+    nx_df = utils.read_csv_for_nx(utils.DATASETS_SMALL[0],
+                                  read_weights_in_sp=True)
+    nxG = nx.from_pandas_edgelist(nx_df, "0", "1", "weight",
+                                  create_using=nx.Graph)
+    cuG = cugraph.utilities.convert_from_nx(nxG, cache=True)
+
+    # Rewiring edges keeps every degree the same.
+    nx.double_edge_swap(nxG, nswap=2, seed=42)
+    cuG2 = cugraph.utilities.convert_from_nx(nxG, cache=True)
+    assert cuG2 is not cuG
+
+    # So does changing a weight in place.
+    (u, v, w) = next(iter(nxG.edges(data="weight")))
+    nxG[u][v]["weight"] = w + 1
+    cuG3 = cugraph.utilities.convert_from_nx(nxG, cache=True)
+    assert cuG3 is not cuG2
+    cu_df = cuG3.view_edge_list().to_pandas()
+    row = cu_df[((cu_df.src == u) & (cu_df.dst == v)) |
+                ((cu_df.src == v) & (cu_df.dst == u))]
+    assert row.weights.iloc[0] == pytest.approx(w + 1)
+
+    # Other edge attributes are not converted and do not invalidate it.
+    nxG[u][v]["label"] = "x"
+    assert cugraph.utilities.convert_from_nx(nxG, cache=True) is cuG3
+
+
+def test_nx_convert_cache_compat_graph():
+    from cugraph.experimental.compat.nx import Graph
+
+    nx_df = utils.read_csv_for_nx(utils.DATASETS_SMALL[0])
+    nxG = Graph(nx.from_pandas_edgelist(nx_df, "0", "1"))
+
+    # The compat graphs count their changes, so they are always cached.
+    cuG = cugraph.utilities.convert_from_nx(nxG, cache=None)
+    assert cugraph.utilities.convert_from_nx(nxG, cache=None) is cuG
+
+    # Rewiring edges through the graph methods invalidates the cached graph.
+    nx.double_edge_swap(nxG, nswap=2, seed=42)
+    cuG2 = cugraph.utilities.convert_from_nx(nxG, cache=None)
+    assert cuG2 is not cuG
+    nxG.add_node(-1)
+    cuG3 = cugraph.utilities.convert_from_nx(nxG, cache=None)
+    assert cuG3 is not cuG2
+
+    # In-place changes to the edge attributes are not seen.
+    (u, v) = next(iter(nxG.edges()))
+    nxG[u][v]["weight"] = 2.0
+    assert cugraph.utilities.convert_from_nx(nxG, cache=None) is cuG3
+    cugraph.utilities.clear_nx_cache(nxG)
+    assert cugraph.utilities.convert_from_nx(nxG, cache=None) is not cuG3
+
+
+def test_score_mapping():
+    df = cudf.DataFrame({"vertex": [5, 1, 3, 10],
+                         "score": [0.5, 0.1, 0.3, 1.0]})
+    scores = cugraph.utilities.df_score_to_mapping(df, "score")
+    expected = cugraph.utilities.df_score_to_dictionary(df, "score")
+
+    assert scores == expected
+    assert dict(scores) == expected
+    assert list(scores) == [1, 3, 5, 10]
+    assert len(scores) == 4
+    assert scores[3] == 0.3
+    assert 3 in scores
+    assert 4 not in scores
+    assert "a" not in scores
+    assert (3,) not in scores
+    assert scores.get(4) is None
+    with pytest.raises(KeyError):
+        scores[(3,)]
+    with pytest.raises(KeyError):
+        scores[4]
+    with pytest.raises(TypeError):
+        scores[4] = 0.4
+    assert list(scores.items()) == sorted(expected.items())
+    assert list(scores.values()) == [0.1, 0.3, 0.5, 1.0]
+    assert scores.copy() == expected
+
+    df = cudf.DataFrame({"source": [2, 1, 1], "destination": [1, 5, 2],
+                         "coeff": [0.1, 0.2, 0.3]})
+    scores = cugraph.utilities.df_edge_score_to_mapping(
+        df, "coeff", src="source", dst="destination")
+    assert scores == cugraph.utilities.df_edge_score_to_dictionary(
+        df, "coeff", src="source", dst="destination")
+    assert list(scores) == [(1, 2), (1, 5), (2, 1)]
+    assert scores[(1, 5)] == 0.2
+    assert (5, 1) not in scores
+    assert 1 not in scores
+    assert ((1, 5), 2) not in scores
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_nx_score_mapping(graph_file):
+    nx_df = utils.read_csv_for_nx(graph_file)
+    nxG = nx.from_pandas_edgelist(nx_df, "0", "1", create_using=nx.DiGraph)
+
+    pr = cugraph.pagerank(nxG)
+    assert isinstance(pr, cugraph.utilities.ScoreMapping)
+    assert set(pr) == set(nxG.nodes())
+    expected = cugraph.pagerank(cugraph.utilities.convert_from_nx(nxG))
+    expected = expected.to_pandas()
+    for (vertex, score) in zip(expected["vertex"], expected["pagerank"]):
+        assert pr[vertex] == pytest.approx(score)
+
+    coeffs = cugraph.jaccard_coefficient(nxG.to_undirected())
+    assert all(0 <= coeff <= 1 for coeff in coeffs.values())
+    assert all(nxG.has_node(u) and nxG.has_node(v) for (u, v) in coeffs)
@@ -134,21 +134,24 @@ def df_type_id(dataframe_type):
 
 
 df_types_fixture_params = utils.genFixtureParamsProduct((df_types, df_type_id))
+dataset1_fixture_params = utils.genFixtureParamsProduct(
+    (df_types, df_type_id), ([False, True], "partition_by_type"))
 
 
-@pytest.fixture(scope="module", params=df_types_fixture_params)
+@pytest.fixture(scope="module", params=dataset1_fixture_params)
 def dataset1_PropertyGraph(request):
     """
     Fixture which returns an instance of a PropertyGraph with vertex and edge
-    data added from dataset1, parameterized for different DataFrame types.
+    data added from dataset1, parameterized for different DataFrame types and
+    storage modes.
     """
-    dataframe_type = request.param[0]
+    (dataframe_type, partition_by_type) = request.param
     from cugraph.experimental import PropertyGraph
 
     (merchants, users, taxpayers,
      transactions, relationships, referrals) = dataset1.values()
 
-    pG = PropertyGraph()
+    pG = PropertyGraph(partition_by_type=partition_by_type)
 
     # Vertex and edge data is added as one or more DataFrames; either a Pandas
     # DataFrame to keep data on the CPU, a cuDF DataFrame to keep data on GPU,
@@ -465,6 +468,130 @@ def test_add_edge_data_prop_columns(df_type):
     assert sorted(pG.edge_property_names) == sorted(expected_props)
 
 
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_add_edge_data_many(df_type):
+    """
+    add_edge_data_many() on "transactions" and "relationships" tables split
+    into several dataframes, checks that the result matches adding each table
+    with add_edge_data().
+    """
+    from cugraph.experimental import PropertyGraph
+
+    transactions = dataset1["transactions"]
+    transactions_df = df_type(columns=transactions[0],
+                              data=transactions[1])
+    relationships = dataset1["relationships"]
+    relationships_df = df_type(columns=relationships[0],
+                               data=relationships[1])
+
+    expected_pG = PropertyGraph()
+    expected_pG.add_edge_data(transactions_df,
+                              type_name="transactions",
+                              vertex_col_names=("user_id", "merchant_id"))
+    expected_pG.add_edge_data(relationships_df,
+                              type_name="relationships",
+                              vertex_col_names=("user_id_1", "user_id_2"))
+
+    pG = PropertyGraph()
+    pG.add_edge_data_many([transactions_df.iloc[:2], transactions_df.iloc[2:]],
+                          type_name="transactions",
+                          vertex_col_names=("user_id", "merchant_id"))
+    pG.add_edge_data_many([relationships_df.iloc[i:i+1]
+                           for i in range(len(relationships_df))],
+                          type_name="relationships",
+                          vertex_col_names=("user_id_1", "user_id_2"))
+
+    assert pG.num_vertices == expected_pG.num_vertices
+    assert pG.num_edges == expected_pG.num_edges
+    assert sorted(pG.edge_property_names) == \
+        sorted(expected_pG.edge_property_names)
+
+    edge_ids = pG._edge_prop_dataframe[pG.edge_id_col_name]
+    assert edge_ids.isna().sum() == 0
+    assert edge_ids.nunique() == pG.num_edges
+
+    # Adding more data after the properties were consolidated assigns new
+    # edge IDs.
+    pG.add_edge_data(relationships_df,
+                     type_name="relationships",
+                     vertex_col_names=("user_id_1", "user_id_2"))
+    edge_ids = pG._edge_prop_dataframe[pG.edge_id_col_name]
+    assert pG.num_edges == expected_pG.num_edges
+    assert edge_ids.nunique() == pG.num_edges
+
+    with pytest.raises(TypeError):
+        pG.add_edge_data_many(transactions_df,
+                              type_name="transactions",
+                              vertex_col_names=("user_id", "merchant_id"))
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_add_vertex_data_many(df_type):
+    """
+    add_vertex_data_many() with dataframes containing different properties for
+    the same vertices, checks that the properties are merged into one row per
+    vertex.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    merchants = dataset1["merchants"]
+    merchants_df = df_type(columns=merchants[0],
+                           data=merchants[1])
+
+    pG = PropertyGraph()
+    pG.add_vertex_data_many([merchants_df.iloc[:3], merchants_df.iloc[3:]],
+                            type_name="merchants",
+                            vertex_col_name="merchant_id",
+                            property_columns=["merchant_location"])
+    pG.add_vertex_data(merchants_df,
+                       type_name="merchants",
+                       vertex_col_name="merchant_id",
+                       property_columns=["merchant_size"])
+
+    assert pG.num_vertices == len(merchants_df)
+    assert len(pG._vertex_prop_dataframe) == len(merchants_df)
+    assert sorted(pG.vertex_property_names) == \
+        sorted(["merchant_location", "merchant_size"])
+
+    selection = pG.select_vertices("merchant_size > 0")
+    assert len(selection.vertex_selections) == len(merchants_df)
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("read_between", [False, True])
+def test_add_data_twice(df_type, read_between):
+    """
+    Adds the same vertex and edge dataframes twice, with and without reading
+    the properties in between, checks that the duplicate rows are combined as
+    if the dataframes were added once.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    merchants = dataset1["merchants"]
+    merchants_df = df_type(columns=merchants[0],
+                           data=merchants[1])
+    transactions = dataset1["transactions"]
+    transactions_df = df_type(columns=transactions[0],
+                              data=transactions[1])
+
+    pG = PropertyGraph()
+    for i in range(2):
+        pG.add_vertex_data(merchants_df,
+                           type_name="merchants",
+                           vertex_col_name="merchant_id")
+        pG.add_edge_data(transactions_df,
+                         type_name="transactions",
+                         vertex_col_names=("user_id", "merchant_id"))
+        if read_between:
+            assert pG.num_edges == len(transactions_df)
+
+    assert len(pG._vertex_prop_dataframe) == len(merchants_df)
+    assert pG.num_edges == len(transactions_df)
+    edge_ids = pG._edge_prop_dataframe[pG.edge_id_col_name]
+    assert edge_ids.nunique() == len(transactions_df)
+    assert edge_ids.max() == len(transactions_df) - 1
+
+
 def test_add_edge_data_bad_args():
     """
     add_edge_data() with various bad args, checks that proper exceptions are
@@ -950,6 +1077,172 @@ def test_annotate_dataframe(dataset1_PropertyGraph):
         ase(new_algo_result[col], expected_algo_result[col])
 
 
+def test_annotate_dataframe_columns(dataset1_PropertyGraph):
+    """
+    Ensures annotate_dataframe() only adds the requested properties, in the
+    order of the rows being annotated.
+    """
+    pG = dataset1_PropertyGraph
+
+    selection = pG.select_edges("(_TYPE_ == 'referrals') & (stars > 3)")
+    G = pG.extract_subgraph(selection=selection,
+                            create_using=DiGraph_inst)
+
+    df_type = type(pG._edge_prop_dataframe)
+    (srcs, dsts, mids, stars) = zip(*(dataset1["referrals"][1]))
+    algo_result = df_type({"from": srcs, "to": dsts,
+                           "result": range(len(srcs))})
+    algo_result.drop_duplicates(subset=["from", "to"],
+                                inplace=True, ignore_index=True)
+    # Reverse the rows to ensure the order of the rows is preserved.
+    algo_result = algo_result.iloc[::-1].reset_index(drop=True)
+
+    new_algo_result = pG.annotate_dataframe(
+        algo_result, G, edge_vertex_col_names=("from", "to"),
+        columns=["stars"])
+
+    expected_algo_result = df_type({"from": srcs, "to": dsts,
+                                    "result": range(len(srcs)),
+                                    "stars": stars})
+    expected_algo_result["stars"] = \
+        expected_algo_result["stars"].astype("Int64")
+    expected_algo_result.drop_duplicates(subset=["from", "to"],
+                                         inplace=True, ignore_index=True)
+    expected_algo_result = \
+        expected_algo_result.iloc[::-1].reset_index(drop=True)
+
+    assert sorted(new_algo_result.columns) == \
+        sorted(["from", "to", "result", pG.edge_id_col_name, "stars"])
+    if df_type is cudf.DataFrame:
+        ase = assert_series_equal
+    else:
+        ase = pd.testing.assert_series_equal
+    for col in ["from", "to", "result", "stars"]:
+        ase(new_algo_result[col], expected_algo_result[col])
+
+    with pytest.raises(ValueError):
+        pG.annotate_dataframe(algo_result, G,
+                              edge_vertex_col_names=("from", "to"),
+                              columns=["stars", "bad_column"])
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_load(dataset1_PropertyGraph, tmp_path, mmap):
+    """
+    Ensures a PropertyGraph reloaded from a saved copy has the same properties
+    and can have more properties added.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = dataset1_PropertyGraph
+    pG.save(str(tmp_path))
+    loaded_pG = PropertyGraph.load(str(tmp_path), mmap=mmap)
+
+    assert loaded_pG.num_vertices == pG.num_vertices
+    assert loaded_pG.num_edges == pG.num_edges
+    assert loaded_pG.vertex_property_names == pG.vertex_property_names
+    assert loaded_pG.edge_property_names == pG.edge_property_names
+
+    df_type = type(pG._edge_prop_dataframe)
+    if df_type is cudf.DataFrame:
+        afe = assert_frame_equal
+    else:
+        afe = pd.testing.assert_frame_equal
+    afe(loaded_pG._vertex_prop_dataframe, pG._vertex_prop_dataframe)
+    afe(loaded_pG._edge_prop_dataframe, pG._edge_prop_dataframe)
+
+    tcn = PropertyGraph.type_col_name
+    expr = f"({tcn} == 'referrals') & (stars > 3)"
+    assert loaded_pG.select_edges(expr).edge_selections.sum() == \
+        pG.select_edges(expr).edge_selections.sum()
+
+    # New edges get edge IDs that do not conflict with the loaded edges.
+    loaded_pG.add_edge_data(df_type({"src": [1, 2], "dst": [2, 3]}),
+                            type_name="new_edges",
+                            vertex_col_names=("src", "dst"))
+    edge_ids = loaded_pG._edge_prop_dataframe[PropertyGraph.edge_id_col_name]
+    assert loaded_pG.num_edges == pG.num_edges + 2
+    assert edge_ids.nunique() == loaded_pG.num_edges
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_select_cache(df_type):
+    """
+    Ensures repeated selections return cached results until more properties
+    are added, and that selections of types not present select nothing.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    df = df_type({"a": [1, 2, 3], "b": [4, 5, 6], "c": [7, 8, 9]})
+    tcn = PropertyGraph.type_col_name
+
+    pG = PropertyGraph()
+    pG.add_vertex_data(df, type_name="foo", vertex_col_name="a")
+    pG.add_edge_data(df, type_name="bar", vertex_col_names=("a", "b"))
+
+    vs1 = pG.select_vertices("c > 7").vertex_selections
+    vs2 = pG.select_vertices("c > 7").vertex_selections
+    assert vs1 is vs2
+    assert list(vs1.to_numpy()) == [False, True, True]
+
+    es1 = pG.select_edges(f"{tcn} == 'bar'").edge_selections
+    es2 = pG.select_edges(f"{tcn} == 'bar'").edge_selections
+    assert es1 is es2
+    assert list(es1.to_numpy()) == [True, True, True]
+
+    selection = pG.select_edges(f"({tcn} == 'baz') & (c > 7)")
+    assert list(selection.edge_selections.to_numpy()) == [False] * 3
+
+    # Adding data invalidates the cached selections
+    pG.add_vertex_data(df_type({"a": [10], "c": [11]}),
+                       type_name="baz", vertex_col_name="a")
+    vs3 = pG.select_vertices("c > 7").vertex_selections
+    assert vs3 is not vs1
+    assert vs3.sum() == 3
+    selection = pG.select_vertices(f"({tcn} == 'baz') | ({tcn} == 'qux')")
+    assert selection.vertex_selections.sum() == 1
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_property_memory_usage(df_type):
+    """
+    Ensures storing properties partitioned by type uses less memory than a
+    single table for dataset1, where types have different properties.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    usages = []
+    for partition_by_type in [False, True]:
+        pG = PropertyGraph(partition_by_type=partition_by_type)
+        for name in ["transactions", "relationships", "referrals"]:
+            (columns, data) = dataset1[name]
+            pG.add_edge_data(df_type(columns=columns, data=data),
+                             type_name=name,
+                             vertex_col_names=columns[:2])
+        assert pG.num_edges == 14
+        usages.append(pG.property_memory_usage()["edge"])
+
+    (wide_usage, partitioned_usage) = usages
+    assert wide_usage.stored == wide_usage.wide
+    assert partitioned_usage.stored < partitioned_usage.wide
+
+
+def test_compile_selection_expr():
+    from cugraph.structure.property_graph import _compile_selection_expr
+
+    tcn = "_TYPE_"
+    plan = _compile_selection_expr(f"({tcn}=='a') & (x > 1)", tcn)
+    assert plan.type_names == {"a"}
+    plan = _compile_selection_expr(f"({tcn}=='a') | ('b'=={tcn})", tcn)
+    assert plan.type_names == {"a", "b"}
+    plan = _compile_selection_expr(f"({tcn}=='a') | (x > 1)", tcn)
+    assert plan.type_names is None
+    plan = _compile_selection_expr(f"({tcn}=='a') & ({tcn}=='b')", tcn)
+    assert plan.type_names == set()
+    assert _compile_selection_expr("x > 1", tcn) is \
+        _compile_selection_expr("x > 1", tcn)
+
+
 def test_different_vertex_edge_input_dataframe_types():
     """
     Ensures that a PropertyGraph initialized with one DataFrame type cannot be
@@ -1156,3 +1449,78 @@ def bench_extract_subgraph_for_rmat_detect_duplicate_edges(
                                 allow_multi_edges=False)
 
     gpubenchmark(func)
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("num_batches", [1, 100])
+@pytest.mark.parametrize("many", [False, True])
+def bench_add_edge_data_batches(gpubenchmark, df_type, num_batches, many):
+    """
+    Ingest 100,000 edges split into num_batches dataframes, with an
+    add_edge_data() call per dataframe or a single add_edge_data_many() call.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    num_edges = 100_000
+    batch_size = num_edges // num_batches
+    df = df_type({"src": np.arange(num_edges, dtype="int32"),
+                  "dst": np.arange(1, num_edges + 1, dtype="int32"),
+                  "weight": np.ones(num_edges, dtype="float32")})
+    batches = [df.iloc[i:i + batch_size]
+               for i in range(0, num_edges, batch_size)]
+
+    def add_batches():
+        pG = PropertyGraph()
+        if many:
+            pG.add_edge_data_many(batches, vertex_col_names=("src", "dst"))
+        else:
+            for batch in batches:
+                pG.add_edge_data(batch, vertex_col_names=("src", "dst"))
+        return pG.num_edges
+
+    assert gpubenchmark(add_batches) == num_edges
+
+
+def bench_select_edges_repeated(gpubenchmark, cyber_PropertyGraph):
+    from cugraph.experimental import PropertyGraph
+
+    pG = cyber_PropertyGraph
+    scn = PropertyGraph.src_col_name
+    dcn = PropertyGraph.dst_col_name
+    verts = ["10.40.182.3", "10.40.182.255", "59.166.0.9", "59.166.0.8"]
+
+    def select_edges():
+        for _ in range(100):
+            pG.select_edges(f"{scn}.isin({verts}) | {dcn}.isin({verts})")
+
+    gpubenchmark(select_edges)
+
+
+def bench_annotate_dataframe_for_rmat(gpubenchmark, rmat_PropertyGraph):
+    """
+    Annotate a small result (1000 edges) using a large PropertyGraph.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    (pG, generated_df) = rmat_PropertyGraph
+    scn = PropertyGraph.src_col_name
+
+    verts = list(generated_df["src"].iloc[:10].to_pandas())
+    G = pG.extract_subgraph(create_using=cugraph.Graph(directed=True),
+                            selection=pG.select_edges(f"{scn}.isin({verts})"),
+                            allow_multi_edges=True)
+    result = G.view_edge_list().head(1000)[["src", "dst"]]
+
+    gpubenchmark(pG.annotate_dataframe, result, G,
+                 edge_vertex_col_names=("src", "dst"),
+                 columns=["weight"])
+
+
+def bench_load_for_rmat(gpubenchmark, rmat_PropertyGraph, tmp_path):
+    from cugraph.experimental import PropertyGraph
+
+    (pG, generated_df) = rmat_PropertyGraph
+    pG.save(str(tmp_path))
+
+    loaded_pG = gpubenchmark(PropertyGraph.load, str(tmp_path))
+    assert loaded_pG.num_edges == pG.num_edges
@@ -372,3 +372,85 @@ def test_renumber_unrenumber_non_default_vert_names():
 
     assert sorted(expected_values) == \
            sorted(some_result_gdf["vertex"].to_arrow().to_pylist())
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS)
+def test_renumber_lookup_index(graph_file):
+    """
+    Ensure lookups served by the sorted renumber map indices match the
+    merge-based lookups.
+    """
+    gc.collect()
+
+    M = utils.read_csv_for_nx(graph_file)
+    gdf = cudf.DataFrame()
+    gdf["src"] = cudf.Series([x + 7 for x in M["0"]])
+    gdf["dst"] = cudf.Series([x + 7 for x in M["1"]])
+
+    renumbered_df, renumber_map = NumberMap.renumber(gdf, "src", "dst")
+    impl = renumber_map.implementation
+
+    # Include a vertex that is not in the map
+    queries = cudf.Series([gdf["dst"][3], 0, gdf["src"][0], gdf["dst"][0]])
+    ids = renumber_map.to_internal_vertex_id(queries)
+    ids_with_index = renumber_map.add_internal_vertex_id(
+        queries.to_frame("v"), "id", "v", preserve_order=True)
+    vertices = renumber_map.unrenumber(
+        cudf.DataFrame({"vertex": ids.fillna(-1)}), "vertex",
+        preserve_order=True)
+
+    impl.use_lookup_index = False
+    expected_ids = renumber_map.to_internal_vertex_id(queries)
+    expected_ids_with_index = renumber_map.add_internal_vertex_id(
+        queries.to_frame("v"), "id", "v", preserve_order=True)
+    impl.use_lookup_index = True
+
+    assert_series_equal(ids, expected_ids, check_names=False)
+    assert_series_equal(ids_with_index["id"], expected_ids_with_index["id"],
+                        check_names=False)
+    assert ids[1] is cudf.NA
+    assert vertices["vertex"][1] is cudf.NA
+    assert vertices["vertex"][0] == queries[0]
+    assert vertices["vertex"][2] == queries[2]
+
+
+def test_sorted_index_pandas():
+    from cugraph.structure.number_map import SortedIndex
+
+    pdf = pd.DataFrame({"0": [50, 10, 30, 20],
+                        "id": [0, 1, 2, 3]})
+    external_index = SortedIndex(pdf, "0")
+    internal_index = SortedIndex(pdf, "id")
+
+    # Keys overflowing the index type must not match after the cast
+    keys = pd.Series([30, 99, 10, 2**40 + 10], dtype="int64")
+    assert external_index.supports(keys)
+    result = external_index.lookup(keys)["id"]
+    assert result[0] == 2 and result[2] == 1
+    assert result[[1, 3]].isna().all()
+
+    result = internal_index.lookup(pd.Series([3, 0]))["0"]
+    assert result.tolist() == [20, 50]
+
+    # IDs and internal offsets above the int32 range, looked up with int32
+    # and int64 keys.
+    pdf = pd.DataFrame({"0": [2**40 + 5, 7, 2**31, 2**33],
+                        "id": [2**31 + 3, 2**31, 2**32, 1]})
+    external_index = SortedIndex(pdf, "0")
+    internal_index = SortedIndex(pdf, "id")
+    keys = pd.Series([2**33, 2**31, 2**40 + 5, 2**40 + 6], dtype="int64")
+    result = external_index.lookup(keys)["id"]
+    assert result[:3].tolist() == [1, 2**32, 2**31 + 3]
+    assert result[3:].isna().all()
+    result = external_index.lookup(pd.Series([7, 8], dtype="int32"))["id"]
+    assert result[0] == 2**31
+    assert result[1:].isna().all()
+    result = internal_index.lookup(pd.Series([2**32, 2**31 + 3]))["0"]
+    assert result.tolist() == [2**31, 2**40 + 5]
+
+    # int64 keys that wrap around when cast to an int32 index.
+    pdf = pd.DataFrame({"0": pd.Series([7], dtype="int32"), "id": [2**31]})
+    external_index = SortedIndex(pdf, "0")
+    result = external_index.lookup(
+        pd.Series([2**32 + 7, 7], dtype="int64"))["id"]
+    assert result.isna().tolist() == [True, False]
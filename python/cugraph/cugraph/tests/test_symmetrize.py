@@ -182,3 +182,79 @@ def test_symmetrize_weighted(graph_file):
     )
 
     compare(cu_M["0"], cu_M["1"], cu_M["2"], sym_src, sym_dst, sym_w)
+
+
+def reference_symmetrize(pdf, reduction):
+    #
+    #  Symmetrize with a concat of the reversed edges (without duplicating
+    #  self loops) and a groupby.
+    #
+    reverse = pdf.rename(columns={"0": "1", "1": "0"})[pdf.columns]
+    reverse = reverse[reverse["0"] != reverse["1"]]
+    result = pd.concat([pdf, reverse]).groupby(["0", "1"], as_index=False)
+    return result.agg(reduction).astype(pdf.dtypes.to_dict())
+
+
+def sort_edges(df):
+    if isinstance(df, cudf.DataFrame):
+        df = df.to_pandas()
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("df_type", [cudf.DataFrame, pd.DataFrame])
+@pytest.mark.parametrize("reduction", ["min", "max", "sum"])
+def test_symmetrize_df_reduction(graph_file, df_type, reduction):
+    gc.collect()
+
+    pdf = utils.read_csv_for_nx(graph_file)
+    pdf = pdf.rename(columns={"weight": "2"})
+    # Add duplicates and reversed edges with different weights.
+    extra = pdf.sample(frac=0.2, random_state=0)
+    extra = extra.assign(**{"2": extra["2"] + 1})
+    reverse = extra.rename(columns={"0": "1", "1": "0"})[pdf.columns]
+    pdf = pd.concat([pdf, extra, reverse], ignore_index=True)
+    df = cudf.DataFrame.from_pandas(pdf) if df_type is cudf.DataFrame \
+        else pdf
+
+    result, stats = cugraph.symmetrize_df(df, "0", "1", "2",
+                                          reduction=reduction,
+                                          return_stats=True)
+    assert type(result) is df_type
+    expected = reference_symmetrize(pdf, reduction)
+    assert sort_edges(result).equals(sort_edges(expected))
+
+    num_unique = len(pdf[["0", "1"]].drop_duplicates())
+    assert stats.input_edges == len(pdf)
+    assert stats.output_edges == len(result)
+    assert stats.duplicates == len(pdf) - num_unique
+    assert stats.added == len(result) - num_unique
+    assert stats.conflicts > 0
+    assert not stats.presymmetric
+
+    # The symmetrized edges are already symmetric.
+    result2, stats = cugraph.symmetrize_df(result, "0", "1", "2",
+                                           return_stats=True)
+    assert result2 is result
+    assert stats.presymmetric
+    assert stats.duplicates == stats.added == stats.conflicts == 0
+
+    # Without symmetrizing, only duplicates are dropped.
+    result3 = cugraph.symmetrize_df(df, "0", "1", "2", symmetrize=False,
+                                    reduction=reduction)
+    expected = pdf.groupby(["0", "1"], as_index=False).agg(reduction)
+    assert sort_edges(result3).equals(
+        sort_edges(expected.astype(pdf.dtypes.to_dict())))
+
+
+def test_symmetrize_df_first():
+    pdf = pd.DataFrame({"0": [0, 1, 1, 2, 2],
+                        "1": [1, 0, 2, 1, 2],
+                        "2": [3.0, 1.0, 2.0, 5.0, 4.0]})
+    result = cugraph.symmetrize_df(pdf, "0", "1", "2", reduction="first")
+    # The weight of the first input edge of each pair is kept.
+    assert sort_edges(result).values.tolist() == [
+        [0, 1, 3.0], [1, 0, 3.0], [1, 2, 2.0], [2, 1, 2.0], [2, 2, 4.0]]
+
+    with pytest.raises(ValueError):
+        cugraph.symmetrize_df(pdf, "0", "1", "2", reduction="mean")
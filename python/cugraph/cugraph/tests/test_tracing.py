@@ -0,0 +1,147 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import json
+
+import pytest
+
+import cudf
+import cugraph
+from cugraph.testing import utils
+from cugraph.utilities import tracing
+
+
+# =============================================================================
+# Pytest Setup / Teardown - called for each test function
+# =============================================================================
+def setup_function():
+    gc.collect()
+    tracing.disable()
+    tracing.clear()
+
+
+def teardown_function():
+    tracing.disable()
+    tracing.clear()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+def test_tracing_disabled():
+    assert not cugraph.tracing.is_enabled()
+    with tracing.span("compute") as s:
+        s.set(rows=1)
+    assert tracing.get_spans() == []
+
+
+def test_span_nesting():
+    tracing.enable(synchronize=False, memory=False)
+    with tracing.span("outer", category="algorithm"):
+        with tracing.span("inner") as s:
+            s.set(rows=3, step="x")
+        with pytest.raises(ValueError):
+            with tracing.span("failed"):
+                raise ValueError
+    tracing.disable()
+
+    (inner, failed, outer) = tracing.get_spans()
+    assert (inner.name, inner.depth, inner.rows) == ("inner", 1, 3)
+    assert inner.args == {"step": "x"}
+    assert failed.args == {"error": "ValueError"}
+    assert (outer.name, outer.category, outer.depth) == \
+        ("outer", "algorithm", 0)
+    assert outer.start <= inner.start
+    assert outer.duration >= inner.duration + failed.duration
+    assert outer.self_duration == pytest.approx(
+        outer.duration - inner.duration - failed.duration)
+
+
+def test_nested_trace():
+    # A nested trace() restores the settings of the enclosing tracing.
+    tracing.enable(synchronize=False, memory=False)
+    with tracing.trace(synchronize=True, memory=True):
+        assert tracing._synchronize
+    assert tracing.is_enabled()
+    assert not tracing._synchronize
+    assert tracing._statistics is None
+
+    tracing.enable(synchronize=True, memory=True)
+    had_statistics = tracing._statistics is not None
+    with tracing.span("outer"):
+        with tracing.trace(synchronize=False, memory=False):
+            assert not tracing._synchronize
+            assert tracing._statistics is None
+    assert tracing.is_enabled()
+    assert tracing._synchronize
+    assert (tracing._statistics is not None) == had_statistics
+    # The statistics were replaced during the span, so its allocations are
+    # not known.
+    assert tracing.get_spans()[-1].bytes_allocated is None
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_sssp_phases(graph_file, tmp_path):
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=True,
+                                               edgevals=True)
+    source = G.nodes()[0]
+
+    with tracing.trace(tmp_path / "trace.json"):
+        df = cugraph.sssp(G, source)
+
+    spans = tracing.get_spans()
+    (algorithm,) = [s for s in spans if s.depth == 0]
+    assert (algorithm.name, algorithm.category) == ("sssp", "algorithm")
+    assert algorithm.rows == len(df)
+    phases = [s.name for s in spans if s.depth == 1]
+    if G.renumbered:
+        assert phases == ["ensure_cugraph_obj", "renumber_lookup",
+                          "graph_construction", "compute", "unrenumber",
+                          "unrenumber"]
+    else:
+        assert phases == ["ensure_cugraph_obj", "graph_construction",
+                          "compute"]
+    compute = [s for s in spans if s.name == "compute"][0]
+    assert compute.rows == len(df)
+    assert sum(s.duration for s in spans if s.depth == 1) <= \
+        algorithm.duration
+
+    with open(tmp_path / "trace.json") as f:
+        events = json.load(f)["traceEvents"]
+    assert len(events) == len(spans)
+    assert {e["ph"] for e in events} == {"X"}
+    assert events[0]["name"] == "sssp"
+
+    summary = tracing.summary()
+    assert set(summary["name"]) == set(phases) | {"sssp"}
+    if G.renumbered:
+        assert summary.set_index("name").loc["unrenumber", "count"] == 2
+
+
+def test_graph_construction_cached():
+    df = cudf.DataFrame({"src": [0, 1, 2], "dst": [1, 2, 0]})
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(df, "src", "dst", renumber=False)
+
+    tracing.enable(synchronize=False, memory=False)
+    cugraph.bfs(G, 0)
+    cugraph.bfs(G, 0)
+    tracing.disable()
+
+    constructions = [s for s in tracing.get_spans()
+                     if s.name == "graph_construction"]
+    assert [s.args["cached"] for s in constructions] == [False, True]
+    assert all(s.rows == 3 for s in constructions)
+    # The graph is not renumbered
+    assert "unrenumber" not in [s.name for s in tracing.get_spans()]
@@ -72,6 +72,38 @@ def test_bfs_paths_array():
         assert "not in the result set" in str(ErrorMsg)
 
 
+@pytest.mark.parametrize("graph_file", utils.DATASETS)
+def test_bfs_paths_batch(graph_file):
+    gc.collect()
+
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source='0', destination='1', edge_attr='2')
+
+    df = cugraph.bfs(G, 16)
+    targets = df["vertex"].values_host.tolist()
+
+    offsets, vertices = cugraph.utils.get_traversed_paths(df, targets)
+    offsets = offsets.values_host.tolist()
+    vertices = vertices.values_host.tolist()
+
+    assert len(offsets) == len(targets) + 1
+    for i, target in enumerate(targets):
+        expected = cugraph.utils.get_traversed_path_list(df, target)
+        assert vertices[offsets[i]:offsets[i + 1]] == expected
+
+    # The same paths are returned for a pandas result
+    pd_offsets, pd_vertices = cugraph.utils.get_traversed_paths(
+        df.to_pandas(), targets)
+    assert pd_offsets.tolist() == offsets
+    assert pd_vertices.tolist() == vertices
+
+    with pytest.raises(ValueError) as ErrorMsg:
+        cugraph.utils.get_traversed_paths(df, [100])
+    assert "not in the result set" in str(ErrorMsg)
+
+
 @pytest.mark.parametrize("graph_file", utils.DATASETS)
 @pytest.mark.skip(reason="Skipping large tests")
 def test_get_traversed_cost(graph_file):
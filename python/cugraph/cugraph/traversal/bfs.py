@@ -15,8 +15,6 @@ import cudf
 import dask_cudf
 
 from pylibcugraph import (ResourceHandle,
-                          GraphProperties,
-                          SGGraph,
                           bfs as pylibcugraph_bfs
                           )
 
@@ -26,6 +24,7 @@ from cugraph.utilities import (ensure_cugraph_obj,
                                is_cp_matrix_type,
                                is_nx_graph_type,
                                cupy_package as cp,
+                               tracing,
                                )
 
 
@@ -131,41 +130,31 @@ def _call_plc_bfs(G, sources, depth_limit, do_expensive_check=False,
                   direction_optimizing=False, return_predecessors=True):
     handle = ResourceHandle()
 
-    srcs = G.edgelist.edgelist_df['src']
-    dsts = G.edgelist.edgelist_df['dst']
-    weights = G.edgelist.edgelist_df['weights'] \
-        if 'weights' in G.edgelist.edgelist_df \
-        else cudf.Series((srcs + 1) / (srcs + 1), dtype='float32')
-
-    sg = SGGraph(
-        resource_handle=handle,
-        graph_properties=GraphProperties(is_multigraph=G.is_multigraph()),
-        src_array=srcs,
-        dst_array=dsts,
-        weight_array=weights,
-        store_transposed=False,
-        renumber=False,
-        do_expensive_check=do_expensive_check
-    )
+    sg = G._get_plc_graph(do_expensive_check=do_expensive_check)
 
-    distances, predecessors, vertices = \
-        pylibcugraph_bfs(
-            handle,
-            sg,
-            sources,
-            direction_optimizing,
-            depth_limit if depth_limit is not None else -1,
-            return_predecessors,
-            do_expensive_check
-        )
+    with tracing.span("compute") as s:
+        distances, predecessors, vertices = \
+            pylibcugraph_bfs(
+                handle,
+                sg,
+                sources,
+                direction_optimizing,
+                depth_limit if depth_limit is not None else -1,
+                return_predecessors,
+                do_expensive_check
+            )
+
+        df = cudf.DataFrame({
+            'distance': cudf.Series(distances),
+            'vertex': cudf.Series(vertices),
+            'predecessor': cudf.Series(predecessors),
+        })
+        s.set(rows=len(df))
 
-    return cudf.DataFrame({
-        'distance': cudf.Series(distances),
-        'vertex': cudf.Series(vertices),
-        'predecessor': cudf.Series(predecessors),
-    })
+    return df
 
 
+@tracing.traced(category="algorithm")
 def bfs(G,
         start=None,
         depth_limit=None,
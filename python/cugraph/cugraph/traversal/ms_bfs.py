@@ -1,4 +1,4 @@
-# Copyright (c) 2021, NVIDIA CORPORATION.
+# Copyright (c) 2021-2022, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -11,11 +11,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
+
 import numpy as np
+import cupy
 import cudf
 
 import warnings
 
+from cugraph.structure.graph_classes import Graph
+from cugraph.traversal.bfs import _call_plc_bfs
+from cugraph.utilities import memory_planner
+
+# Unreachable vertices have the max distance
+_max_distance = np.iinfo(np.int32).max
+
 
 def _get_feasibility(G, sources, components=None, depth_limit=None):
     """
@@ -25,7 +36,7 @@ def _get_feasibility(G, sources, components=None, depth_limit=None):
     Parameters
     ----------
     G : cugraph.Graph or cugraph.DiGraph
-        The adjacency list will be computed if not already present.
+        The graph to traverse.
 
     sources :  cudf.Series
         Subset of vertices from which the traversals start. A BFS is run for
@@ -53,69 +64,225 @@ def _get_feasibility(G, sources, components=None, depth_limit=None):
     mem_footprint : integer
         Estimated memory foot print size in Bytes
     """
-
-    # Fixme not implemented in RMM yet
-    # using 96GB upper bound for now
-    # mem = get_device_memory_info()
-    mem = 9.6e10
-    n_sources = sources.size
-    V = G.number_of_vertices()
-    E = G.number_of_edges()
-    mean_component_sz = V
-    n_components = 1
-
-    # Retreive types
-    size_of_v = 4
-    size_of_e = 4
-    size_of_w = 0
-    if G.adjlist.weights is not None:
-        if G.adjlist.weights.dtype is np.float64:
-            size_of_w = 8
-        else:
-            size_of_w = 4
-    if G.adjlist.offsets.dtype is np.float64:
-        size_of_v = 8
-    if G.adjlist.indices.dtype is np.float64:
-        size_of_e = 8
-
-    # Graph size
-    G_sz = E * size_of_e + E * size_of_w + V * size_of_v
+    n_sources = len(sources)
+    if components is not None:
+        n_components = components["color"].nunique()
+        if n_sources / n_components > 100:
+            warnings.warn(
+                "High number of seeds per component result in large output."
+            )
 
     # The impact of depth limit depends on the sparsity
     # pattern and diameter. We cannot leverage it without
     # traversing the full dataset a the moment.
+    return memory_planner.check_memory(
+        G, "multi_source_bfs", sources=n_sources,
+        mean_component_size=_get_mean_component_size(G, components))
 
-    # dense output
-    output_sz = n_sources * 2 * V * size_of_v
 
-    # sparse output
-    if components is not None:
-        tmp = components["color"].value_counts()
-        n_components = tmp.size
-        if n_sources / n_components > 100:
-            warnings.warn(
-                "High number of seeds per component result in large output."
-            )
-        mean_component_sz = tmp.mean()
-        output_sz = mean_component_sz * n_sources * 2 * size_of_e
+def _get_mean_component_size(G, components=None):
+    """
+    Return the mean number of vertices reached from a source: the mean size
+    of the components if they are given, otherwise the number of vertices.
+    """
+    if components is None:
+        return G.number_of_vertices()
+    return float(components["color"].value_counts().mean())
 
-    # counting 10% for context, handle and temporary allocations
-    mem_footprint = (G_sz + output_sz) * 1.1
-    if mem_footprint > mem:
-        warnings.warn(f"Cannot execute in-memory :{mem_footprint} Bytes")
 
-    return mem_footprint
+def _get_batch_size(G, n_sources, components=None):
+    """
+    Return the number of sources to process at once so the results of a batch
+    fit in the device memory budget.
+    """
+    return memory_planner.get_batch_size(
+        G, "multi_source_bfs", n_sources,
+        mean_component_size=_get_mean_component_size(G, components))
+
+
+def _get_external_ids(G):
+    """
+    Return a cupy array of the external vertex ID of each internal vertex ID,
+    or None if G is not renumbered.
+    """
+    if not G.renumbered:
+        return None
+    impl = G.renumber_map.implementation
+    if len(impl.col_names) > 1:
+        raise ValueError("graphs with multi-column vertices are not "
+                         "supported")
+    return impl.df.sort_values("id")[impl.col_names[0]].values
+
+
+def _to_external(df, external_ids):
+    """
+    Replace the internal vertex IDs in the 'vertex' and 'predecessor' columns
+    of df with the external vertex IDs.
+    """
+    if external_ids is None:
+        return df
+    df = df.copy(deep=False)
+    predecessors = df["predecessor"].values
+    df["vertex"] = external_ids[df["vertex"].values]
+    df["predecessor"] = cupy.where(
+        predecessors >= 0,
+        external_ids[cupy.maximum(predecessors, 0)],
+        -1).astype(external_ids.dtype)
+    return df
+
+
+def _get_weak_components(G):
+    """
+    Return a DataFrame of the weakly connected component ('color') of each
+    internal vertex ID ('vertex').
+    """
+    from cugraph.components.connectivity import weakly_connected_components
 
+    components = weakly_connected_components(G)
+    if G.renumbered:
+        components = G.add_internal_vertex_id(
+            components, "internal", "vertex", drop=True)
+        components = components.rename(columns={"internal": "vertex"})
+    return components.rename(columns={"labels": "color"})
 
-def concurrent_bfs(Graphs, sources, depth_limit=None, offload=False):
+
+def _check_components(G, colors):
+    """
+    Raise a ValueError if an edge of G connects vertices of different colors
+    (or a vertex without a color), since the vertices reached by a BFS call
+    from sources of different colors are attributed to the sources by their
+    color. colors uses internal vertex IDs.
+    """
+    V = G.number_of_vertices()
+    colors = colors.dropna()
+    colors = colors[(colors["vertex"] >= 0) & (colors["vertex"] < V)]
+    codes = cupy.full(V, -1, dtype="int64")
+    codes[colors["vertex"].values] = \
+        cupy.asarray(colors["color"].factorize()[0])
+    edgelist_df = G.edgelist.edgelist_df
+    if (codes[edgelist_df["src"].values] !=
+            codes[edgelist_df["dst"].values]).any():
+        raise ValueError("components must label the weakly connected "
+                         "components of G (or unions of them), but some "
+                         "edges connect vertices of different colors")
+
+
+def _bfs_batches(G, sources, colors, depth_limit, batch_size):
+    """
+    Yield a DataFrame for each batch of batch_size sources with the 'order'
+    (position in sources), 'vertex', 'distance', and 'predecessor' of every
+    vertex reached from each source in the batch, using internal vertex IDs.
+
+    Sources in different (weakly connected) components do not reach any of
+    the same vertices, so each BFS call starts from one source of each
+    component in the batch, and the reached vertices are attributed to the
+    source by their component (color).
+    """
+    sources_df = cudf.DataFrame({
+        "vertex": sources.reset_index(drop=True),
+        "order": cupy.arange(len(sources), dtype="int64")})
+    if colors is not None:
+        sources_df = sources_df.merge(colors, on="vertex", how="left")
+        if sources_df["color"].isnull().any():
+            raise ValueError("components does not contain all sources")
+        sources_df = sources_df.sort_values("order").reset_index(drop=True)
+
+    for start in range(0, len(sources_df), batch_size):
+        batch = sources_df.iloc[start:start + batch_size]
+        if colors is not None:
+            batch = batch.assign(wave=batch.groupby("color").cumcount())
+        else:
+            batch = batch.assign(wave=cupy.arange(len(batch)))
+
+        results = []
+        for wave in range(int(batch["wave"].max()) + 1):
+            wave_sources = batch[batch["wave"] == wave]
+            df = _call_plc_bfs(G, wave_sources["vertex"], depth_limit)
+            df = df[df["distance"] != _max_distance]
+            if len(wave_sources) > 1:
+                df = df.merge(colors, on="vertex", how="inner")
+                df = df.merge(wave_sources[["color", "order"]], on="color",
+                              how="inner")
+            else:
+                df["order"] = wave_sources["order"].iloc[0]
+            results.append(df[["order", "vertex", "distance",
+                               "predecessor"]])
+
+        df = cudf.concat(results, ignore_index=True)
+        yield df.sort_values(["order", "distance", "vertex"],
+                             ignore_index=True)
+
+
+def _get_source_offsets(orders, n_sources):
+    counts = cupy.bincount(orders.values, minlength=n_sources)
+    offsets = cupy.zeros(n_sources + 1, dtype="int64")
+    cupy.cumsum(counts, out=offsets[1:])
+    return cudf.Series(offsets)
+
+
+def _write_batches(batches, output_dir, to_output):
+    """
+    Write each batch to a Parquet file in output_dir (a new temporary
+    directory if None) and return the list of file paths.
+    """
+    if output_dir is None:
+        output_dir = tempfile.mkdtemp(prefix="cugraph_bfs_")
+    else:
+        os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for (i, df) in enumerate(batches):
+        path = os.path.join(output_dir, f"bfs_{i:05d}.parquet")
+        to_output(df).to_parquet(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def _ensure_sources(G, sources):
+    """
+    Return the internal vertex IDs of sources as a cudf.Series, preserving
+    order, and the original sources as a cudf.Series.
+    """
+    if G.edgelist is None:
+        G.view_edge_list()
+    if isinstance(sources, list):
+        sources = cudf.Series(sources)
+    if not isinstance(sources, cudf.Series):
+        raise TypeError("sources should be a list or a cudf.Series")
+    if len(sources) == 0:
+        raise ValueError("sources must contain at least one vertex")
+    if len(sources) > G.number_of_vertices():
+        raise ValueError("the number of sources cannot exceed the number of "
+                         "vertices of the graph")
+    sources = sources.reset_index(drop=True)
+
+    if G.renumbered:
+        tmp = cudf.DataFrame({"vertex": sources})
+        tmp = G.add_internal_vertex_id(tmp, "internal", "vertex", drop=True,
+                                       preserve_order=True)
+        internal = tmp["internal"]
+    else:
+        internal = sources
+    if internal.isnull().any() or \
+       ((internal < 0) | (internal >= G.number_of_vertices())).any():
+        raise ValueError("sources contains vertices not in the graph")
+    return (internal.astype(G.edgelist.edgelist_df["src"].dtype), sources)
+
+
+def concurrent_bfs(Graphs, sources, depth_limit=None, offload=False,
+                   output_dir=None, batch_size=None):
     """
     Find the breadth first traversals of multiple graphs with multiple sources
     in each graph.
 
+    The graphs are consolidated into a single graph that is the disjoint union
+    of the graphs, so traversals in different graphs run in the same BFS
+    calls.
+
     Parameters
     ----------
     Graphs : list of cugraph.Graph or cugraph.DiGraph
-        The adjacency lists will be computed if not already present.
+        The graphs to traverse. All graphs must be directed or all graphs must
+        be undirected.
 
     sources : list of cudf.Series
         For each graph, subset of vertices from which the traversals start.
@@ -124,35 +291,41 @@ def concurrent_bfs(Graphs, sources, depth_limit=None, offload=False):
         The size of each Series (ie. the number of sources per graph)
         is flexible, but cannot exceed the size of the corresponding graph.
 
-
     depth_limit : Integer, optional, default=None
         Limit the depth of the search. Terminates if no more vertices are
         reachable within the distance of depth_limit
 
     offload : boolean, optional, default=False
         Indicates if output should be written to the disk.
-        When not provided, the algorithms decides if offloading is needed
-        based on the input parameters.
+
+    output_dir : str, optional, default=None
+        The directory to write files to if offload is True. If None, a new
+        temporary directory is used.
+
+    batch_size : int, optional, default=None
+        The number of sources to process at once. If None, the number of
+        sources whose output fits in the device memory budget is used (see
+        cugraph.set_memory_budget()).
 
     Returns
     -------
-    Return type is decided based on the input parameters (size of
-    sources, size of the graph, number of graphs and offload setting)
-
-    If G is a cugraph.Graph and output fits in memory:
+    If offload is False :
         BFS_edge_lists : cudf.DataFrame
-            GPU data frame containing all BFS edges
+            GPU data frame containing all BFS edges, grouped by source in the
+            order of the sources of each graph
+            df['graph'] index of the graph in Graphs
+            df['vertex'] vertex ID
+            df['distance'] path distance from the source
+            df['predecessor'] vertex ID immediately preceding the vertex, or
+            -1 for the source
         source_offsets: cudf.Series
             Series containing the starting offset in the returned edge list
-            for each source.
+            for each source, followed by the total number of edges.
 
-    If offload is True, or if the output does not fit in memory :
-        Writes csv files containing BFS output to the disk.
+    If offload is True :
+        List of paths of the Parquet files written, one per batch of sources,
+        each containing the BFS edges and a 'source' column.
     """
-    raise NotImplementedError(
-        "concurrent_bfs is coming soon! Please up vote the github issue 1465\
-             to help us prioritize"
-    )
     if not isinstance(Graphs, list):
         raise TypeError(
             "Graphs should be a list of cugraph.Graph or cugraph.DiGraph"
@@ -164,67 +337,128 @@ def concurrent_bfs(Graphs, sources, depth_limit=None, offload=False):
             "The size of the sources list must match\
              the size of the graph list."
         )
-    if offload is True:
-        raise NotImplementedError(
-            "Offloading is coming soon! Please up vote the github issue 1461\
-             to help us prioritize"
-        )
-
-    # Consolidate graphs in a single graph and record components
-
-    # Renumber and concatenate sources in a single df
-
-    # Call multi_source_bfs
-    # multi_source_bfs(
-    #    G,
-    #    sources,
-    #    components=components,
-    #    depth_limit=depth_limit,
-    #    offload=offload,
-    # )
+    if len(Graphs) == 0:
+        raise ValueError("Graphs must contain at least one graph")
+    directed = Graphs[0].is_directed()
+    if any(G.is_directed() != directed for G in Graphs):
+        raise ValueError("Graphs must be all directed or all undirected")
+
+    # Consolidate graphs in a single graph, with the vertices of graph i
+    # numbered from vertex_offsets[i]. The component (color) of each vertex
+    # is its graph.
+    vertices = []
+    edges = []
+    all_sources = []
+    vertex_offsets = [0]
+    for (i, (G, graph_sources)) in enumerate(zip(Graphs, sources)):
+        (internal, _) = _ensure_sources(G, graph_sources)
+        external_ids = _get_external_ids(G)
+        edgelist_df = G.edgelist.edgelist_df
+        if external_ids is None:
+            external_ids = cupy.arange(G.number_of_vertices(),
+                                       dtype=edgelist_df["src"].dtype)
+        vertices.append(external_ids)
+        edges.append(cudf.DataFrame({
+            "src": edgelist_df["src"].astype("int64") + vertex_offsets[-1],
+            "dst": edgelist_df["dst"].astype("int64") + vertex_offsets[-1]}))
+        all_sources.append(internal.astype("int64") + vertex_offsets[-1])
+        vertex_offsets.append(vertex_offsets[-1] + len(external_ids))
+
+    edges = cudf.concat(edges, ignore_index=True)
+    U = Graph(directed=directed)
+    U.from_cudf_edgelist(edges, source="src", destination="dst",
+                         renumber=False)
+    external_ids = cupy.concatenate(vertices)
+    vertex_offsets = cupy.asarray(vertex_offsets)
+    all_sources = cudf.concat(all_sources, ignore_index=True)
+
+    colors = cudf.DataFrame({
+        "vertex": cupy.arange(len(external_ids), dtype="int64"),
+        "color": cupy.repeat(cupy.arange(len(Graphs)),
+                             cupy.diff(vertex_offsets).tolist())})
+    if batch_size is None:
+        batch_size = _get_batch_size(U, len(all_sources), colors)
+    if not offload:
+        _get_feasibility(U, all_sources, components=colors,
+                         depth_limit=depth_limit)
+
+    def to_output(df):
+        graphs = cupy.searchsorted(vertex_offsets, df["vertex"].values,
+                                   side="right") - 1
+        df = _to_external(df, external_ids)
+        df.insert(0, "graph", graphs)
+        return df
+
+    batches = _bfs_batches(U, all_sources, colors, depth_limit, batch_size)
+    if offload:
+        def to_file_output(df):
+            df = to_output(df)
+            df["source"] = external_ids[all_sources.values[
+                df.pop("order").values]]
+            return df
+        return _write_batches(batches, output_dir, to_file_output)
+
+    df = to_output(cudf.concat(list(batches), ignore_index=True))
+    offsets = _get_source_offsets(df.pop("order"), len(all_sources))
+    return (df, offsets)
 
 
 def multi_source_bfs(
-    G, sources, components=None, depth_limit=None, offload=False
+    G, sources, components=None, depth_limit=None, offload=False,
+    output_dir=None, batch_size=None
 ):
     """
     Find the breadth first traversal from multiple sources in a graph.
 
+    Sources are processed in batches sized to fit the device memory budget. In
+    each batch, the traversals from sources in different (weakly connected)
+    components run in the same BFS call.
+
     Parameters
     ----------
     G : cugraph.Graph or cugraph.DiGraph
-        The adjacency list will be computed if not already present.
+        The graph to traverse.
 
-    sources :  cudf.Series
+    sources :  cudf.Series or list
         Subset of vertices from which the traversals start. A BFS is run for
         each source in the Series.
         The size of the series should be at least one and cannot exceed the
-        size of the graph.
-
-    depth_limit : Integer, optional, default=None
-        Limit the depth of the search. Terminates if no more vertices are
-        reachable within the distance of depth_limit
+        size of the graph, and the sources must be distinct.
 
     components : cudf.DataFrame, optional, default=None
         GPU Dataframe containing the component information.
         Passing this information may impact the return type.
         When no component information is passed BFS uses one component
-        behavior settings.
+        behavior settings. The colors must be the weakly connected
+        components of G (see cugraph.weakly_connected_components()), or
+        unions of them: a ValueError is raised if an edge connects vertices
+        of different colors.
 
         components['vertex'] : cudf.Series
             vertex IDs
         components['color'] : cudf.Series
             component IDs/color for vertices.
 
+    depth_limit : Integer, optional, default=None
+        Limit the depth of the search. Terminates if no more vertices are
+        reachable within the distance of depth_limit
+
     offload : boolean, optional, default=False
         Indicates if output should be written to the disk.
-        When not provided, the algorithms decides if offloading is needed
-        based on the input parameters.
+
+    output_dir : str, optional, default=None
+        The directory to write files to if offload is True. If None, a new
+        temporary directory is used.
+
+    batch_size : int, optional, default=None
+        The number of sources to process at once. If None, the number of
+        sources whose output fits in the device memory budget is used (see
+        cugraph.set_memory_budget()).
 
     Returns
     -------
-    Return value type is decided based on the input parameters (size of
-    sources, size of the graph, number of components and offload setting)
+    Return value type is decided based on the input parameters (component
+    information and offload setting)
     If G is a cugraph.Graph, returns :
        cudf.DataFrame
           df['vertex'] vertex IDs
@@ -238,43 +472,90 @@ def multi_source_bfs(
 
     If G is a cugraph.Graph and component information is present returns :
         BFS_edge_lists : cudf.DataFrame
-            GPU data frame containing all BFS edges
+            GPU data frame containing all BFS edges, grouped by source in the
+            order of sources
+            df['vertex'] vertex ID
+            df['distance'] path distance from the source
+            df['predecessor'] vertex ID immediately preceding the vertex, or
+            -1 for the source
         source_offsets: cudf.Series
             Series containing the starting offset in the returned edge list
-            for each source.
+            for each source, followed by the total number of edges.
+
+    If offload is True :
+        List of paths of the Parquet files written, one per batch of sources,
+        each containing the BFS edges (as above) and a 'source' column.
+
+    Examples
+    --------
+    >>> M = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+    ...                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(M, source='0', destination='1')
+    >>> df = cugraph.multi_source_bfs(G, [0, 5, 12])
 
-    If offload is True, or if the output does not fit in memory :
-        Writes csv files containing BFS output to the disk.
     """
-    raise NotImplementedError(
-        "concurrent_bfs is coming soon! Please up vote the github issue 1465\
-             to help us prioritize"
-    )
-    # if components is not None:
-    #    null_check(components["vertex"])
-    #    null_check(components["colors"])
-    #
-    # if depth_limit is not None:
-    #    raise NotImplementedError(
-    #        "depth limit implementation of BFS is not currently supported"
-    #    )
-
-    # if offload is True:
-    #    raise NotImplementedError(
-    #        "Offloading is coming soon! Please up vote the github issue 1461
-    #         to help us prioritize"
-    #    )
-    if isinstance(sources, list):
-        sources = cudf.Series(sources)
-    if G.renumbered is True:
-        sources = G.lookup_internal_vertex_id(cudf.Series(sources))
-    if not G.adjlist:
-        G.view_adj_list()
-    # Memory footprint check
-    footprint = _get_feasibility(
-        G, sources, components=components, depth_limit=depth_limit
-    )
-    print(footprint)
-    # Call multi_source_bfs
-    # FIXME remove when implemented
-    # raise NotImplementedError("Commming soon")
+    (internal_sources, sources) = _ensure_sources(G, sources)
+    if internal_sources.duplicated().any():
+        raise ValueError("sources contains duplicate vertices")
+    external_ids = _get_external_ids(G)
+
+    # Use the weakly connected components to run the traversals of sources
+    # in different components at once.
+    colors = None
+    if components is not None:
+        if components["vertex"].isnull().any() or \
+           components["color"].isnull().any():
+            raise ValueError("components contains null values")
+        colors = components[["vertex", "color"]]
+        if G.renumbered:
+            colors = G.add_internal_vertex_id(colors, "internal", "vertex",
+                                              drop=True)
+            colors = colors.rename(columns={"internal": "vertex"})
+        if len(sources) > 1:
+            _check_components(G, colors)
+    elif len(sources) > 1:
+        colors = _get_weak_components(G)
+
+    if batch_size is None:
+        batch_size = _get_batch_size(G, len(sources), components)
+    if not offload:
+        _get_feasibility(G, sources, components=components,
+                         depth_limit=depth_limit)
+
+    batches = _bfs_batches(G, internal_sources, colors, depth_limit,
+                           batch_size)
+    if offload:
+        def to_file_output(df):
+            df = _to_external(df, external_ids)
+            df["source"] = sources.values[df.pop("order").values]
+            return df
+        return _write_batches(batches, output_dir, to_file_output)
+
+    df = cudf.concat(list(batches), ignore_index=True)
+    if components is not None:
+        df = _to_external(df, external_ids)
+        offsets = _get_source_offsets(df.pop("order"), len(sources))
+        return (df, offsets)
+
+    # Dense output, with one distance and predecessor column per source.
+    V = G.number_of_vertices()
+    result = cudf.DataFrame()
+    result["vertex"] = external_ids if external_ids is not None \
+        else cupy.arange(V, dtype=internal_sources.dtype)
+    offsets = _get_source_offsets(df["order"], len(sources)).values_host
+    vertex = df["vertex"].values
+    distance = df["distance"].values
+    predecessor = df["predecessor"].values
+    if external_ids is not None:
+        predecessor = cupy.where(
+            predecessor >= 0, external_ids[cupy.maximum(predecessor, 0)], -1)
+    for (i, source) in enumerate(sources.values_host):
+        (start, end) = (offsets[i], offsets[i + 1])
+        distances = cupy.full(V, _max_distance, dtype=distance.dtype)
+        distances[vertex[start:end]] = distance[start:end]
+        predecessors = cupy.full(V, -1, dtype=predecessor.dtype)
+        predecessors[vertex[start:end]] = predecessor[start:end]
+        result[f"distance_{source}"] = distances
+        result[f"predecessor_{source}"] = predecessors
+    return result
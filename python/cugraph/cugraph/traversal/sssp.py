@@ -20,11 +20,10 @@ from cugraph.utilities import (ensure_cugraph_obj,
                                is_cp_matrix_type,
                                is_nx_graph_type,
                                cupy_package as cp,
+                               tracing,
                                )
 from pylibcugraph import sssp as pylibcugraph_sssp
-from pylibcugraph import (ResourceHandle,
-                          GraphProperties,
-                          SGGraph)
+from pylibcugraph import ResourceHandle
 
 
 def _ensure_args(G, source, method, directed,
@@ -131,41 +130,33 @@ def _call_plc_sssp(
         cutoff,
         compute_predecessors=True,
         do_expensive_check=False):
-    srcs = G.edgelist.edgelist_df['src']
-    dsts = G.edgelist.edgelist_df['dst']
-    weights = G.edgelist.edgelist_df['weights'] \
-        if 'weights' in G.edgelist.edgelist_df \
-        else cudf.Series((srcs + 1) / (srcs + 1), dtype='float32')
-    if weights.dtype not in ('float32', 'double'):
-        weights = weights.astype('double')
+    weight_type = None
+    if 'weights' in G.edgelist.edgelist_df:
+        weight_type = G.edgelist.edgelist_df['weights'].dtype
+        if weight_type not in ('float32', 'double'):
+            weight_type = 'double'
 
     handle = ResourceHandle()
 
-    sg = SGGraph(
-        resource_handle=handle,
-        graph_properties=GraphProperties(is_multigraph=G.is_multigraph()),
-        src_array=srcs,
-        dst_array=dsts,
-        weight_array=weights,
-        store_transposed=False,
-        renumber=False,
-        do_expensive_check=do_expensive_check
-    )
-
-    vertices, distances, predecessors = pylibcugraph_sssp(
-        resource_handle=handle,
-        graph=sg,
-        source=source,
-        cutoff=cutoff,
-        compute_predecessors=compute_predecessors,
-        do_expensive_check=do_expensive_check
-    )
-
-    df = cudf.DataFrame({
-        'distance': cudf.Series(distances),
-        'vertex': cudf.Series(vertices),
-        'predecessor': cudf.Series(predecessors),
-    })
+    sg = G._get_plc_graph(weight_type=weight_type,
+                          do_expensive_check=do_expensive_check)
+
+    with tracing.span("compute") as s:
+        vertices, distances, predecessors = pylibcugraph_sssp(
+            resource_handle=handle,
+            graph=sg,
+            source=source,
+            cutoff=cutoff,
+            compute_predecessors=compute_predecessors,
+            do_expensive_check=do_expensive_check
+        )
+
+        df = cudf.DataFrame({
+            'distance': cudf.Series(distances),
+            'vertex': cudf.Series(vertices),
+            'predecessor': cudf.Series(predecessors),
+        })
+        s.set(rows=len(df))
 
     return df
 
@@ -175,6 +166,7 @@ def _call_plc_sssp(
 # Nx graphs may be needed.  From the Nx docs:
 # |      Many NetworkX algorithms designed for weighted graphs use
 # |      an edge attribute (by default `weight`) to hold a numerical value.
+@tracing.traced(category="algorithm")
 def sssp(G,
          source=None,
          method=None,
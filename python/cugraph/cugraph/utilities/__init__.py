@@ -14,8 +14,13 @@
 # from cugraph.utilities.grmat import grmat_gen
 # from cugraph.utilities.pointer_utils import device_of_gpu_pointer
 from cugraph.utilities.nx_factory import convert_from_nx
+from cugraph.utilities.nx_factory import clear_nx_cache
+from cugraph.utilities.nx_factory import enable_nx_cache
 from cugraph.utilities.nx_factory import df_score_to_dictionary
 from cugraph.utilities.nx_factory import df_edge_score_to_dictionary
+from cugraph.utilities.nx_factory import df_score_to_mapping
+from cugraph.utilities.nx_factory import df_edge_score_to_mapping
+from cugraph.utilities.nx_factory import ScoreMapping
 from cugraph.utilities.nx_factory import cugraph_to_nx
 from cugraph.utilities.utils import (import_optional,
                                      ensure_cugraph_obj,
@@ -28,3 +33,9 @@ from cugraph.utilities.utils import (import_optional,
                                      cupy_package,
                                      )
 from cugraph.utilities.path_retrieval import get_traversed_cost
+from cugraph.utilities import memory_planner
+from cugraph.utilities import tracing
+from cugraph.utilities.memory_planner import (estimate_memory,
+                                              set_memory_budget,
+                                              get_memory_budget,
+                                              )
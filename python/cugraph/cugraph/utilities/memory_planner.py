@@ -0,0 +1,566 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory planner shared by the algorithms that can split their work.
+
+The estimates are computed from the number of vertices and edges of a graph
+and the sizes of its vertex and weight types, so they do not depend on the
+data and can be computed for a graph that has not been created yet (by
+passing a GraphInfo). Each estimate is split into a fixed part (the graph and
+the work buffers used no matter how much work is done at once) and a part
+per item of work (source, seed, ...), which is what batched APIs use to pick
+how many items to process at once so the work fits in a memory budget.
+
+The estimates are upper bounds of the memory allocated by the
+implementations rather than exact figures, since the temporary allocations
+of the underlying libraries are not known.
+"""
+
+import math
+import numbers
+import os
+import warnings
+from collections import namedtuple
+from contextlib import contextmanager
+
+
+# Fraction of the available memory used by default, leaving the rest for
+# the caller and the allocations not accounted for.
+_default_fraction = 0.5
+
+# Configured budget of each kind of memory: None (use _default_fraction),
+# a fraction of the available memory (float), or a number of bytes (int).
+_budgets = {"device": None, "host": None}
+
+GraphInfo = namedtuple(
+    "GraphInfo",
+    ["num_vertices", "num_edges", "vertex_itemsize", "weight_itemsize",
+     "directed"],
+    defaults=[4, 0, True])
+GraphInfo.__doc__ = """
+Description of a graph used to estimate memory footprints.
+
+num_vertices : int
+    The number of vertices.
+num_edges : int
+    The number of stored (directed) edges. Undirected graphs store both
+    directions of each edge.
+vertex_itemsize : int, optional (default=4)
+    The size in bytes of a vertex ID.
+weight_itemsize : int, optional (default=0)
+    The size in bytes of an edge weight, or 0 if the graph is unweighted.
+directed : bool, optional (default=True)
+    Whether the graph is directed.
+"""
+
+MemoryEstimate = namedtuple("MemoryEstimate",
+                            ["fixed", "per_item", "num_items"])
+MemoryEstimate.__doc__ = """
+Estimated memory footprint in bytes of running an algorithm on num_items
+items of work (sources, seeds, ...) at once: fixed + per_item * num_items.
+"""
+
+
+def get_graph_info(G):
+    """
+    Return a GraphInfo describing G.
+
+    Parameters
+    ----------
+    G : cugraph.Graph, GraphInfo or tuple
+        The graph, or a GraphInfo or a (num_vertices, num_edges, ...) tuple
+        describing it.
+
+    Returns
+    -------
+    info : GraphInfo
+    """
+    if isinstance(G, GraphInfo):
+        return G
+    if isinstance(G, tuple):
+        return GraphInfo(*G)
+
+    num_vertices = G.number_of_vertices()
+    num_edges = G.number_of_edges(directed_edges=True)
+    vertex_itemsize = 4
+    weight_itemsize = 0
+    if G.edgelist is not None:
+        edgelist_df = G.edgelist.edgelist_df
+        vertex_itemsize = edgelist_df["src"].dtype.itemsize
+        if "weights" in edgelist_df.columns:
+            weight_itemsize = edgelist_df["weights"].dtype.itemsize
+    elif G.adjlist is not None:
+        vertex_itemsize = G.adjlist.indices.dtype.itemsize
+        if G.adjlist.weights is not None:
+            weight_itemsize = G.adjlist.weights.dtype.itemsize
+    return GraphInfo(num_vertices, num_edges, vertex_itemsize,
+                     weight_itemsize, G.is_directed())
+
+
+# =============================================================================
+# Estimators
+# =============================================================================
+def _offset_itemsize(info):
+    return 4 if info.num_edges < 2**31 else 8
+
+
+def _edgelist_size(info, num_edges=None):
+    if num_edges is None:
+        num_edges = info.num_edges
+    return num_edges * (2 * info.vertex_itemsize + info.weight_itemsize)
+
+
+def _csr_size(info):
+    return ((info.num_vertices + 1) * _offset_itemsize(info) +
+            info.num_edges * (info.vertex_itemsize + info.weight_itemsize))
+
+
+def _graph_size(info):
+    """
+    The size of a graph used by an algorithm: its edge list and the
+    compressed (CSR) structure built from it.
+    """
+    return _edgelist_size(info) + _csr_size(info)
+
+
+def _estimate_graph_construction(info):
+    # The input edge list, the sorted copy, and the CSR structure.
+    return MemoryEstimate(2 * _edgelist_size(info) + _csr_size(info), 0, 0)
+
+
+def _estimate_renumber(info, external_itemsize=None, num_columns=1):
+    # The external and internal edge lists, and the map between the external
+    # and internal vertex IDs with its hash table.
+    if external_itemsize is None:
+        external_itemsize = info.vertex_itemsize
+    external_itemsize *= num_columns
+    edges = 2 * info.num_edges * (external_itemsize + info.vertex_itemsize)
+    number_map = (3 * info.num_vertices *
+                  (external_itemsize + info.vertex_itemsize))
+    return MemoryEstimate(edges + number_map, 0, 0)
+
+
+def _estimate_symmetrize(info):
+    # The input edge list, the packed keys and their sort order, the merged
+    # edges, and the output edge list in both directions.
+    return MemoryEstimate(4 * _edgelist_size(info) + 16 * info.num_edges,
+                          0, 0)
+
+
+def _estimate_traversal(info, distance_itemsize):
+    # The distances and predecessors, and the current and next frontiers.
+    vertices = info.num_vertices * (distance_itemsize +
+                                    3 * info.vertex_itemsize)
+    return MemoryEstimate(_graph_size(info) + vertices, 0, 0)
+
+
+def _estimate_bfs(info):
+    return _estimate_traversal(info, 4)
+
+
+def _estimate_sssp(info):
+    return _estimate_traversal(info, max(info.weight_itemsize, 4))
+
+
+def _estimate_link_analysis(info, result_itemsize=None):
+    # The vertices and values of the result, and the current and previous
+    # values and the (weighted) out-degrees of the iterations.
+    if result_itemsize is None:
+        result_itemsize = max(info.weight_itemsize, 4)
+    vertices = info.num_vertices * (info.vertex_itemsize +
+                                    4 * result_itemsize)
+    return MemoryEstimate(_graph_size(info) + vertices, 0, 0)
+
+
+def _estimate_pagerank(info, result_itemsize=None):
+    return _estimate_link_analysis(info, result_itemsize)
+
+
+def _estimate_katz_centrality(info, result_itemsize=None):
+    return _estimate_link_analysis(info, result_itemsize)
+
+
+def _estimate_louvain(info):
+    # The coarsened graph of each level is at most the size of the graph,
+    # and the clustering keeps a few vertex and weight arrays per vertex.
+    vertices = info.num_vertices * (4 * info.vertex_itemsize + 16)
+    return MemoryEstimate(2 * _graph_size(info) + vertices, 0, 0)
+
+
+def _estimate_weakly_connected_components(info):
+    # Directed graphs are symmetrized first.
+    graph = _graph_size(info._replace(num_edges=2 * info.num_edges)) \
+        if info.directed else _graph_size(info)
+    return MemoryEstimate(graph + 3 * info.num_vertices *
+                          info.vertex_itemsize, 0, 0)
+
+
+def _estimate_triangle_count(info):
+    # The neighbor list intersections and the count of each vertex.
+    return MemoryEstimate(_graph_size(info) +
+                          info.num_edges * info.vertex_itemsize +
+                          info.num_vertices * (info.vertex_itemsize + 8),
+                          0, 0)
+
+
+def _estimate_betweenness(info, k, result_itemsize, num_results):
+    # Every source reuses the same distances, predecessors, shortest path
+    # counters (double), and dependencies, so the footprint does not depend
+    # on the number of sources (the sources themselves are on the host).
+    work = info.num_vertices * (4 + info.vertex_itemsize + 8 +
+                                result_itemsize)
+    results = num_results * (info.vertex_itemsize + result_itemsize)
+    num_items = info.num_vertices if k is None else _num_items(k)
+    return MemoryEstimate(_graph_size(info) + work + results, 0, num_items)
+
+
+def _estimate_betweenness_centrality(info, k=None, result_itemsize=8):
+    return _estimate_betweenness(info, k, result_itemsize, info.num_vertices)
+
+
+def _estimate_edge_betweenness_centrality(info, k=None, result_itemsize=8):
+    # The result has the source and destination of every edge.
+    return _estimate_betweenness(
+        info, k, result_itemsize + info.vertex_itemsize, info.num_edges)
+
+
+def _estimate_ego_graph(info, seeds=1, radius=1):
+    # Each seed has its own reached vertices, distances, and predecessors,
+    # and an induced subgraph of about degree**radius vertices.
+    num_vertices = max(info.num_vertices, 1)
+    degree = info.num_edges / num_vertices
+    # Compare in log space, since degree**radius overflows for large radii.
+    if degree > 1 and radius * math.log(degree) >= math.log(num_vertices):
+        reached = num_vertices
+    else:
+        reached = min(num_vertices, (degree ** radius) + 1)
+    edges = int(min(info.num_edges, reached * degree))
+    per_seed = (num_vertices * (2 * info.vertex_itemsize + 4) +
+                _edgelist_size(info, edges) + 8)
+    return MemoryEstimate(_graph_size(info), per_seed, _num_items(seeds))
+
+
+def _estimate_multi_source_bfs(info, sources=1, mean_component_size=None):
+    # One row of (source order, vertex, distance, predecessor) per vertex in
+    # the component of each source.
+    if mean_component_size is None:
+        mean_component_size = info.num_vertices
+    per_source = int(mean_component_size *
+                     (8 + 4 + 2 * info.vertex_itemsize))
+    fixed = _estimate_bfs(info).fixed
+    return MemoryEstimate(fixed, per_source, _num_items(sources))
+
+
+_estimators = {
+    "graph_construction": _estimate_graph_construction,
+    "renumber": _estimate_renumber,
+    "symmetrize": _estimate_symmetrize,
+    "bfs": _estimate_bfs,
+    "sssp": _estimate_sssp,
+    "pagerank": _estimate_pagerank,
+    "katz_centrality": _estimate_katz_centrality,
+    "louvain": _estimate_louvain,
+    "weakly_connected_components": _estimate_weakly_connected_components,
+    "triangle_count": _estimate_triangle_count,
+    "betweenness_centrality": _estimate_betweenness_centrality,
+    "edge_betweenness_centrality": _estimate_edge_betweenness_centrality,
+    "ego_graph": _estimate_ego_graph,
+    "batched_ego_graphs": _estimate_ego_graph,
+    "multi_source_bfs": _estimate_multi_source_bfs,
+}
+
+
+def _num_items(items):
+    # A number of items (including NumPy integers) or a list-like of items.
+    if isinstance(items, numbers.Integral):
+        return int(items)
+    return len(items)
+
+
+def plan_memory(G, algo, **params):
+    """
+    Return the MemoryEstimate of running algo on G.
+
+    Parameters
+    ----------
+    G : cugraph.Graph, GraphInfo or tuple
+        The graph, or a description of it (see get_graph_info()).
+
+    algo : str
+        The name of the operation or algorithm, one of
+        supported_algorithms().
+
+    **params
+        The parameters of the algorithm that change its footprint, such as
+        the number (or list) of sources or seeds.
+
+    Returns
+    -------
+    estimate : MemoryEstimate
+    """
+    if algo not in _estimators:
+        raise ValueError(f"unknown algorithm '{algo}', supported algorithms "
+                         f"are {supported_algorithms()}")
+    return _estimators[algo](get_graph_info(G), **params)
+
+
+def estimate_memory(G, algo, **params):
+    """
+    Estimate the memory footprint in bytes of running an algorithm on a
+    graph.
+
+    The estimate is computed from the number of vertices and edges of the
+    graph and the sizes of its vertex and weight types, so it can also be
+    computed for a graph that has not been created yet.
+
+    Parameters
+    ----------
+    G : cugraph.Graph, GraphInfo or tuple
+        The graph, or a GraphInfo or a (num_vertices, num_edges,
+        vertex_itemsize, weight_itemsize, directed) tuple describing it.
+
+    algo : str
+        The name of the operation or algorithm: 'graph_construction',
+        'renumber', 'symmetrize', 'bfs', 'sssp', 'pagerank',
+        'katz_centrality', 'louvain', 'weakly_connected_components',
+        'triangle_count', 'betweenness_centrality',
+        'edge_betweenness_centrality', 'ego_graph', 'batched_ego_graphs' or
+        'multi_source_bfs'.
+
+    **params
+        The parameters of the algorithm that change its footprint:
+
+        - renumber: external_itemsize, num_columns
+        - pagerank and katz_centrality: result_itemsize
+        - betweenness_centrality and edge_betweenness_centrality: k,
+          result_itemsize
+        - ego_graph and batched_ego_graphs: seeds (a number or a list),
+          radius
+        - multi_source_bfs: sources (a number or a list),
+          mean_component_size
+
+    Returns
+    -------
+    size : int
+        The estimated footprint in bytes.
+
+    Examples
+    --------
+    >>> M = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+    ...                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(M, source='0', destination='1')
+    >>> size = cugraph.estimate_memory(G, 'multi_source_bfs', sources=10)
+    >>> size = cugraph.estimate_memory((10**6, 10**7), 'pagerank')
+
+    """
+    estimate = plan_memory(G, algo, **params)
+    return int(estimate.fixed + estimate.per_item * estimate.num_items)
+
+
+def supported_algorithms():
+    """
+    Return the sorted list of the algorithm names accepted by
+    estimate_memory().
+    """
+    return sorted(_estimators)
+
+
+# =============================================================================
+# Budgets
+# =============================================================================
+def _check_memory_kind(memory):
+    if memory not in _budgets:
+        raise ValueError(f"memory must be one of {sorted(_budgets)}, got "
+                         f"'{memory}'")
+
+
+def get_available_memory(memory="device"):
+    """
+    Return the available (free) memory in bytes of the current device, or
+    of the host if memory is 'host'.
+    """
+    _check_memory_kind(memory)
+    if memory == "device":
+        from cugraph.utilities.utils import get_free_device_memory
+        return get_free_device_memory()
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        raise RuntimeError("the available host memory can not be "
+                           "determined on this platform, set an explicit "
+                           "budget in bytes with set_memory_budget()")
+
+
+def _get_budget(nbytes, fraction):
+    """
+    Return the value stored in _budgets for a budget of nbytes bytes or of a
+    fraction of the available memory (at most one of them is not None).
+    """
+    if nbytes is not None and fraction is not None:
+        raise ValueError("only one of nbytes and fraction can be specified")
+    if nbytes is not None:
+        if isinstance(nbytes, bool) or \
+           not isinstance(nbytes, numbers.Integral):
+            raise TypeError("nbytes must be an int, use fraction to set a "
+                            "fraction of the available memory, got: "
+                            f"{type(nbytes)}")
+        if nbytes <= 0:
+            raise ValueError("nbytes must be positive")
+        return int(nbytes)
+    if fraction is not None:
+        if isinstance(fraction, bool) or \
+           not isinstance(fraction, numbers.Real):
+            raise TypeError("fraction must be a number, got: "
+                            f"{type(fraction)}")
+        if not 0 < fraction <= 1:
+            raise ValueError("fraction must be in (0, 1]")
+        return float(fraction)
+    return None
+
+
+def set_memory_budget(nbytes=None, memory="device", fraction=None):
+    """
+    Set the memory budget used by the algorithms that split their work to
+    fit in memory, either as a number of bytes or as a fraction of the
+    available memory. If neither is specified, the default budget, which is
+    half of the available memory, is restored.
+
+    Parameters
+    ----------
+    nbytes : int or None, optional (default=None)
+        The budget in bytes.
+
+    memory : str, optional (default='device')
+        The kind of memory the budget applies to, 'device' or 'host'.
+
+    fraction : float or None, optional (default=None)
+        The budget as a fraction (in (0, 1]) of the memory available when
+        the budget is used.
+
+    Examples
+    --------
+    >>> cugraph.set_memory_budget(2**30)
+    >>> cugraph.get_memory_budget()
+    1073741824
+    >>> cugraph.set_memory_budget(fraction=0.8)
+    >>> cugraph.set_memory_budget()
+
+    """
+    _check_memory_kind(memory)
+    _budgets[memory] = _get_budget(nbytes, fraction)
+
+
+def get_memory_budget(memory="device"):
+    """
+    Return the current memory budget in bytes of the given kind of memory,
+    'device' or 'host'.
+    """
+    _check_memory_kind(memory)
+    budget = _budgets[memory]
+    if budget is None:
+        budget = _default_fraction
+    if isinstance(budget, float):
+        return int(get_available_memory(memory) * budget)
+    return budget
+
+
+@contextmanager
+def memory_budget(nbytes=None, memory="device", fraction=None):
+    """
+    Context manager that sets the memory budget (see set_memory_budget())
+    and restores the previous one on exit.
+    """
+    _check_memory_kind(memory)
+    previous = _budgets[memory]
+    set_memory_budget(nbytes, memory, fraction)
+    try:
+        yield
+    finally:
+        _budgets[memory] = previous
+
+
+# =============================================================================
+# Planning
+# =============================================================================
+def check_memory(G, algo, memory="device", **params):
+    """
+    Return the estimated footprint in bytes of running algo on G, warning if
+    it exceeds the memory budget.
+    """
+    size = estimate_memory(G, algo, **params)
+    budget = get_memory_budget(memory)
+    if size > budget:
+        warnings.warn(f"{algo} is estimated to use {size} bytes of {memory} "
+                      f"memory, which exceeds the budget of {budget} bytes")
+    return size
+
+
+def get_batch_size(G, algo, num_items, memory="device", budget=None,
+                   **params):
+    """
+    Return the number of items of work (sources, seeds, ...) of algo to
+    process at once so that the estimated footprint fits in the memory
+    budget. At least one item is processed at once; a warning is issued if
+    even a single item does not fit.
+
+    Parameters
+    ----------
+    G : cugraph.Graph, GraphInfo or tuple
+        The graph, or a description of it (see get_graph_info()).
+
+    algo : str
+        The name of the algorithm (see estimate_memory()).
+
+    num_items : int
+        The total number of items of work.
+
+    memory : str, optional (default='device')
+        The kind of memory to fit in, 'device' or 'host'.
+
+    budget : int, optional (default=None)
+        The budget in bytes. If None, the configured budget of memory is
+        used (see set_memory_budget()).
+
+    **params
+        The other parameters of the algorithm (see estimate_memory()).
+
+    Returns
+    -------
+    batch_size : int
+    """
+    estimate = plan_memory(G, algo, **params)
+    if budget is None:
+        budget = get_memory_budget(memory)
+    num_items = max(int(num_items), 1)
+    if estimate.per_item == 0:
+        return num_items
+    batch_size = (budget - estimate.fixed) // estimate.per_item
+    if batch_size < 1:
+        warnings.warn(f"a batch of one item of {algo} is estimated to use "
+                      f"{estimate.fixed + estimate.per_item} bytes of "
+                      f"{memory} memory, which exceeds the budget of "
+                      f"{budget} bytes")
+    return int(min(max(batch_size, 1), num_items))
+
+
+def split_batches(items, batch_size):
+    """
+    Return the list of (start, end) ranges of consecutive batches of at most
+    batch_size of the num_items (or len(items)) items.
+    """
+    num_items = _num_items(items)
+    batch_size = max(int(batch_size), 1)
+    return [(start, min(start + batch_size, num_items))
+            for start in range(0, num_items, batch_size)]
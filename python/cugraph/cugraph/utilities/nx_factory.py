@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2021, NVIDIA CORPORATION.
+# Copyright (c) 2020-2022, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -18,72 +18,264 @@ NetworkX is required at runtime in order to call any of these functions, so
 ensure code using these utilities has done the proper checks prior to calling.
 """
 
+import weakref
+from collections.abc import ItemsView, Mapping, ValuesView
+from itertools import chain
+from operator import itemgetter, methodcaller
+
+import numpy as np
+import pandas as pd
+
 import cugraph
 from .utils import import_optional
 import cudf
-from cudf import from_pandas
 
 # nx will be a MissingModule instance if NetworkX is not installed (any
 # attribute access on a MissingModule instance results in a RuntimeError).
 nx = import_optional("networkx")
 
+# Cache of the cugraph graphs converted from NetworkX graphs: maps id(nxG) to
+# (weak reference to nxG, {(weight, do_renumber): (fingerprint, G)}). The
+# entry is removed when nxG is garbage collected.
+_nx_cache = {}
+# Whether ensure_cugraph_obj() caches the conversions of all NetworkX graphs,
+# see enable_nx_cache().
+_nx_cache_enabled = False
 
-def convert_unweighted_to_gdf(NX_G):
-    _edges = NX_G.edges(data=False)
-    src = [s for s, _ in _edges]
-    dst = [d for _, d in _edges]
 
-    _gdf = cudf.DataFrame()
-    _gdf['src'] = src
-    _gdf['dst'] = dst
+def _get_edge_arrays(NX_G, weight=None):
+    """
+    Return the (src, dst, weights) arrays of the edges of NX_G, where weights
+    is None if weight is None. Edges missing the weight attribute have a
+    weight of 1.
+
+    The edges are pulled from the adjacency dicts of the nodes in bulk into
+    NumPy arrays. Integer nodes are used as is; other nodes are
+    dictionary-encoded once and decoded with a single take. Each edge of an
+    undirected graph is only included once.
+    """
+    nodes = list(NX_G)
+    # Let pandas infer the type of the nodes (numeric, strings, ...).
+    node_values = pd.Index(nodes, tupleize_cols=False).values
+    if node_values.dtype.kind in "iu":
+        encode = None
+        dtype = node_values.dtype
+    else:
+        encode = dict(zip(nodes, range(len(nodes)))).__getitem__
+        dtype = np.dtype("int64")
+
+    if NX_G.is_multigraph():
+        edges = list(NX_G.edges(data=weight, default=1.0)) \
+            if weight is not None else list(NX_G.edges())
+        (src, dst) = (map(itemgetter(0), edges), map(itemgetter(1), edges))
+        if encode is not None:
+            (src, dst) = (map(encode, src), map(encode, dst))
+        src = np.fromiter(src, dtype=dtype, count=len(edges))
+        dst = np.fromiter(dst, dtype=dtype, count=len(edges))
+        weights = None
+        if weight is not None:
+            weights = np.asarray(list(map(itemgetter(2), edges)))
+    else:
+        # The adjacency (successors for directed graphs) of each node is a
+        # dict of {neighbor: edge data}.
+        adj = NX_G._adj
+        degrees = np.fromiter(map(len, adj.values()), dtype="int64",
+                              count=len(nodes))
+        num_edges = int(degrees.sum())
+        neighbors = chain.from_iterable(adj.values())
+        if encode is not None:
+            neighbors = map(encode, neighbors)
+            src = np.repeat(np.arange(len(nodes), dtype=dtype), degrees)
+        else:
+            src = np.repeat(node_values, degrees)
+        dst = np.fromiter(neighbors, dtype=dtype, count=num_edges)
+        weights = None
+        if weight is not None:
+            weights = _get_weights(adj, weight)
+
+        if not NX_G.is_directed():
+            # The adjacency of an undirected graph has both directions of
+            # each edge (but self loops only once).
+            keep = src <= dst
+            (src, dst) = (src[keep], dst[keep])
+            if weights is not None:
+                weights = weights[keep]
+
+    if encode is not None:
+        (src, dst) = (node_values.take(src), node_values.take(dst))
+    return (src, dst, weights)
+
+
+def _get_weights(adj, weight):
+    """
+    Return the array of the weight attributes of the edges in adj (in the
+    order of the edges in adj), using 1 for edges missing the attribute.
+    """
+    def edge_data():
+        return chain.from_iterable(map(methodcaller("values"),
+                                       adj.values()))
+    try:
+        weights = list(map(itemgetter(weight), edge_data()))
+    except KeyError:
+        weights = list(map(methodcaller("get", weight, 1.0), edge_data()))
+    return np.asarray(weights)
+
 
+def _to_gdf(NX_G, weight, names):
+    """
+    Return a cudf.DataFrame of the edges of NX_G, with the source,
+    destination, and (if weight is not None) weight columns named names.
+    """
+    (src, dst, weights) = _get_edge_arrays(NX_G, weight)
+    _gdf = cudf.DataFrame()
+    _gdf[names[0]] = src
+    _gdf[names[1]] = dst
+    if weight is not None:
+        _gdf[names[2]] = weights
     return _gdf
 
 
+def convert_unweighted_to_gdf(NX_G):
+    return _to_gdf(NX_G, None, ["src", "dst"])
+
+
 def convert_weighted_named_to_gdf(NX_G, weight):
-    _edges = NX_G.edges(data=weight)
+    return _to_gdf(NX_G, weight, ["src", "dst", "weight"])
 
-    src = [s for s, _, _ in _edges]
-    dst = [d for _, d, _ in _edges]
-    wt = [w for _, _, w in _edges]
 
-    _gdf = cudf.DataFrame()
-    _gdf['src'] = src
-    _gdf['dst'] = dst
-    _gdf['weight'] = wt
+def convert_weighted_unnamed_to_gdf(NX_G):
+    # NX_G is weighted (see networkx.is_weighted()), so every edge has a
+    # 'weight' attribute.
+    return _to_gdf(NX_G, "weight", ["source", "target", "weight"])
 
-    return _gdf
 
+def _get_mutation_count(nxG):
+    """
+    Return the number of changes made to nxG if nxG counts them, otherwise
+    None. The nx compat Graph and DiGraph count the changes made through the
+    graph methods in their edge store, which is brought up to date first.
+    """
+    store = getattr(nxG, "_edge_store", None)
+    if store is None or store.adj is not nxG._adj:
+        return None
+    return store.sync(nxG).version
 
-def convert_weighted_unnamed_to_gdf(NX_G):
-    _pdf = nx.to_pandas_edgelist(NX_G)
-    nx_col = ["source", "target"]
-    wt_col = [col for col in _pdf.columns if col not in nx_col]
-    if len(wt_col) != 1:
-        raise ValueError(
-            "Unable to determine weight column name")
 
-    if wt_col[0] != "weight":
-        _pdf.rename(columns={wt_col[0]: "weight"})
+def _get_fingerprint(nxG, weight=None):
+    """
+    Return a fingerprint of nxG, used to detect that nxG changed since it was
+    converted.
+
+    If nxG counts its changes (see _get_mutation_count()), the fingerprint is
+    computed in O(1) from the count and the number of nodes, and changes made
+    to the edge attributes in place are not seen. Otherwise it is computed in
+    O(V + E) from the nodes (and their order) and the edges with the values
+    of the weight attribute (the 'weight' attribute if weight is None), which
+    costs about as much as converting the edges on the host; changes to the
+    other edge attributes, which are not converted, are ignored.
+    """
+    count = _get_mutation_count(nxG)
+    if count is not None:
+        return (type(nxG), len(nxG), count)
+    if weight is None:
+        weight = "weight"
+    return (type(nxG), nxG.number_of_nodes(), hash(tuple(nxG)),
+            hash(tuple(nxG.edges(data=weight))))
+
+
+def _remove_from_cache(key):
+    def remove(ref):
+        _nx_cache.pop(key, None)
+    return remove
+
+
+def clear_nx_cache(nxG=None):
+    """
+    Remove the cugraph graphs converted from nxG from the conversion cache,
+    or all of the cached graphs if nxG is None, to release the memory of the
+    cached graphs before nxG is garbage collected.
+    """
+    if nxG is None:
+        _nx_cache.clear()
+    else:
+        _nx_cache.pop(id(nxG), None)
 
-    _gdf = from_pandas(_pdf)
-    return _gdf
 
+def enable_nx_cache(enabled=True):
+    """
+    Enable (or disable) the caching of the conversions of all NetworkX
+    graphs passed to the algorithms.
 
-def convert_from_nx(nxG, weight=None, do_renumber=True):
+    By default, only the graphs that count their changes (the nx compat
+    Graph and DiGraph) are cached, since checking that any other graph did
+    not change costs about as much as converting its edges again (see
+    convert_from_nx()). The cache is cleared when it is disabled.
     """
-    weight: weight column name. Only used if
-    nxG.is_weighted() is True
+    global _nx_cache_enabled
+    _nx_cache_enabled = enabled
+    if not enabled:
+        _nx_cache.clear()
+
+
+def convert_from_nx(nxG, weight=None, do_renumber=True, cache=False):
+    """
+    Convert a NetworkX Graph or DiGraph to a cugraph Graph.
+
+    Parameters
+    ----------
+    nxG : networkx.Graph or networkx.DiGraph
+        The graph to convert. The nodes can be any values that can be
+        stored in a cudf column (such as integers or strings).
+
+    weight : str, optional (default=None)
+        The edge attribute to use as the weight. Only used if nxG is
+        weighted (see networkx.is_weighted()). If None, the 'weight'
+        attribute is used.
+
+    do_renumber : bool, optional (default=True)
+        Whether to renumber the vertices of the cugraph Graph.
+
+    cache : bool or None, optional (default=False)
+        If True, the converted graph is cached (holding a weak reference to
+        nxG) and returned by the next conversions of nxG with the same
+        parameters, until nxG is garbage collected or its nodes, edges or
+        edge weights change (see clear_nx_cache()). If None, nxG is cached
+        if it counts its changes (the nx compat Graph and DiGraph, whose
+        in-place changes to the edge attributes are not seen) or if caching
+        was enabled with enable_nx_cache().
+
+        Checking that a graph that does not count its changes is unchanged
+        walks all of its nodes and edges, so caching it only saves building
+        the cugraph Graph.
+
+    Returns
+    -------
+    G : cugraph.Graph
     """
 
     if isinstance(nxG, nx.classes.digraph.DiGraph):
-        G = cugraph.Graph(directed=True)
+        directed = True
     elif isinstance(nxG, nx.classes.graph.Graph):
-        G = cugraph.Graph()
+        directed = False
     else:
         raise TypeError(
             f"nxG must be either a NetworkX Graph or DiGraph, got {type(nxG)}")
 
+    if cache is None:
+        cache = _nx_cache_enabled or _get_mutation_count(nxG) is not None
+    if cache:
+        key = (weight, do_renumber)
+        fingerprint = _get_fingerprint(nxG, weight)
+        entry = _nx_cache.get(id(nxG))
+        if entry is not None and entry[0]() is nxG:
+            cached = entry[1].get(key)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+        else:
+            entry = (weakref.ref(nxG, _remove_from_cache(id(nxG))), {})
+            _nx_cache[id(nxG)] = entry
+
+    G = cugraph.Graph(directed=directed)
     is_weighted = nx.is_weighted(nxG)
 
     if is_weighted is False:
@@ -100,6 +292,8 @@ def convert_from_nx(nxG, weight=None, do_renumber=True):
             G.from_cudf_edgelist(_gdf, source="src", destination="dst",
                                  edge_attr='weight', renumber=do_renumber)
 
+    if cache:
+        entry[1][key] = (fingerprint, G)
     return G
 
 
@@ -132,7 +326,7 @@ def df_score_to_dictionary(df, k, v="vertex"):
 
     """
     df = df.sort_values(by=v)
-    return df.to_pandas().set_index(v).to_dict()[k]
+    return dict(zip(_to_host(df[v]).tolist(), _to_host(df[k]).tolist()))
 
 
 def df_edge_score_to_dictionary(df, k, src="src", dst="dst"):
@@ -165,12 +359,187 @@ def df_edge_score_to_dictionary(df, k, src="src", dst="dst"):
     dict : Dictionary of vertices and score
 
     """
-    pdf = df.sort_values(by=[src, dst]).to_pandas()
-    d = {}
-    for i in range(len(pdf)):
-        d[(pdf[src][i], pdf[dst][i])] = pdf[k][i]
+    df = df.sort_values(by=[src, dst])
+    keys = zip(_to_host(df[src]).tolist(), _to_host(df[dst]).tolist())
+    return dict(zip(keys, _to_host(df[k]).tolist()))
+
+
+def _to_host(series):
+    if hasattr(series, "values_host"):
+        return series.values_host
+    return series.to_numpy()
+
+
+class ScoreMapping(Mapping):
+    """
+    Read-only mapping of vertices (or (source, destination) edges) to scores,
+    returned in place of a dict by the algorithms called with a NetworkX
+    graph.
 
-    return d
+    The keys and values are kept in NumPy arrays sorted by key, so creating
+    the mapping does not create a Python object per entry, and a lookup is a
+    binary search (O(log n)). Python objects are only created for the
+    entries that are accessed or iterated over, and to_dict() (or copy())
+    returns a regular dict.
+
+    Parameters
+    ----------
+    keys : list of numpy.ndarray
+        One array of vertices, or the arrays of the sources and the
+        destinations of edges, sorted lexicographically.
+
+    values : numpy.ndarray
+        The score of each key.
+    """
+    def __init__(self, keys, values):
+        if any(len(key) != len(values) for key in keys):
+            raise ValueError("keys and values must have the same length")
+        self._keys = keys
+        self._values = values
+        self._dict = None
+
+    @classmethod
+    def from_dataframe(cls, df, keys, values):
+        """
+        Return a ScoreMapping of the values column of the cudf or pandas
+        DataFrame df indexed by the keys column(s).
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        df = df.sort_values(by=keys)
+        return cls([_to_host(df[key]) for key in keys],
+                   _to_host(df[values]))
+
+    def _find(self, key):
+        """
+        Return the position of key in the arrays, or -1 if it is not found.
+        """
+        if len(self._keys) == 1:
+            key = (key,)
+        elif not isinstance(key, tuple) or len(key) != len(self._keys):
+            return -1
+        (start, end) = (0, len(self._values))
+        try:
+            for (array, k) in zip(self._keys, key):
+                # searchsorted() would search each element of a non-scalar
+                # key such as (1,) instead of failing.
+                if np.ndim(k) != 0:
+                    return -1
+                array = array[start:end]
+                (start, end) = (start + np.searchsorted(array, k, "left"),
+                                start + np.searchsorted(array, k, "right"))
+                if start == end:
+                    return -1
+        except (TypeError, ValueError):
+            return -1
+        return int(start)
+
+    def __getitem__(self, key):
+        if self._dict is not None:
+            return self._dict[key]
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i].item()
+
+    def __contains__(self, key):
+        if self._dict is not None:
+            return key in self._dict
+        return self._find(key) >= 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        if len(self._keys) == 1:
+            return iter(self._keys[0].tolist())
+        return zip(*[key.tolist() for key in self._keys])
+
+    def items(self):
+        return _ScoreItemsView(self)
+
+    def values(self):
+        return _ScoreValuesView(self)
+
+    def to_dict(self):
+        """
+        Return the contents as a dict, which is created once and cached.
+        """
+        if self._dict is None:
+            self._dict = dict(zip(self, self._values.tolist()))
+        return self._dict
+
+    def copy(self):
+        """
+        Return the contents as a new (mutable) dict.
+        """
+        return dict(self.to_dict())
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class _ScoreItemsView(ItemsView):
+    def __iter__(self):
+        return zip(self._mapping, self._mapping._values.tolist())
+
+
+class _ScoreValuesView(ValuesView):
+    def __iter__(self):
+        return iter(self._mapping._values.tolist())
+
+
+def df_score_to_mapping(df, k, v="vertex"):
+    """
+    Convert a dataframe to a read-only ScoreMapping of vertices to scores,
+    which behaves like the dict returned by df_score_to_dictionary() but is
+    faster to create for large graphs.
+
+    Parameters
+    ----------
+    df : cudf.DataFrame
+        GPU data frame containing the vertex identifiers and the
+        corresponding score values.
+
+    k : str
+        score column name
+
+    v : str
+        the vertex column name. Default is "vertex"
+
+    Returns
+    -------
+    mapping : ScoreMapping of vertices and score
+    """
+    return ScoreMapping.from_dataframe(df, v, k)
+
+
+def df_edge_score_to_mapping(df, k, src="src", dst="dst"):
+    """
+    Convert a dataframe to a read-only ScoreMapping of (src, dst) edges to
+    scores, which behaves like the dict returned by
+    df_edge_score_to_dictionary() but is faster to create for large graphs.
+
+    Parameters
+    ----------
+    df : cudf.DataFrame
+        GPU data frame containing the source and destination vertex
+        identifiers and the corresponding score values.
+
+    k : str
+        score column name
+
+    src : str
+        source column name
+
+    dst : str
+        destination column name
+
+    Returns
+    -------
+    mapping : ScoreMapping of edges and score
+    """
+    return ScoreMapping.from_dataframe(df, [src, dst], k)
 
 
 def cugraph_to_nx(G):
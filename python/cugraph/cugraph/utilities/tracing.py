@@ -0,0 +1,478 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Opt-in tracing of the phases of the algorithms.
+
+The algorithms follow the same steps: converting the input to a cugraph
+Graph (ensure_cugraph_obj), looking up the internal ids of the input
+vertices (renumber_lookup), creating the graph used by the backend
+(graph_construction), running the algorithm (compute), and converting the
+internal ids of the result back to the ids of the input (unrenumber). When
+tracing is enabled, each of these is recorded as a span nested in the span
+of the algorithm, with its duration, the number of rows it produced and the
+bytes of device memory it allocated, so the time spent outside of the
+computation can be measured. The spans can be exported in the Chrome trace
+event format, which can be loaded in chrome://tracing or Perfetto.
+
+Tracing is disabled by default, in which case the instrumentation only
+costs a check of a flag.
+
+Examples
+--------
+>>> gdf = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+...                     dtype=['int32', 'int32', 'float32'], header=None)
+>>> G = cugraph.Graph()
+>>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+>>> cugraph.tracing.enable()
+>>> df = cugraph.sssp(G, 0)
+>>> cugraph.tracing.disable()
+>>> [s.name for s in cugraph.tracing.get_spans() if s.depth == 1]
+['ensure_cugraph_obj', 'renumber_lookup', 'graph_construction', 'compute',
+ 'unrenumber', 'unrenumber']
+>>> cugraph.tracing.export_chrome_trace("sssp_trace.json")
+>>> cugraph.tracing.clear()
+
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+
+Span = namedtuple(
+    "Span",
+    ["name", "category", "start", "duration", "self_duration", "depth",
+     "thread_id", "rows", "bytes_allocated", "args"])
+Span.__doc__ = """
+A completed span.
+
+name : str
+    The name of the phase or algorithm.
+category : str
+    'algorithm' for the span of a public algorithm, 'phase' for the spans of
+    the steps nested in it.
+start : float
+    The start time in seconds, relative to the first call to enable().
+duration : float
+    The duration in seconds.
+self_duration : float
+    The duration in seconds not spent in nested spans.
+depth : int
+    The number of spans the span is nested in.
+thread_id : int
+    The ID of the thread that recorded the span.
+rows : int or None
+    The number of rows of the result of the phase, if known.
+bytes_allocated : int or None
+    The bytes of device memory allocated during the span (including the
+    allocations that were freed before it ended), or None if the memory
+    statistics are not available.
+args : dict
+    Other information recorded with the span.
+"""
+
+_enabled = False
+_synchronize = True
+_spans = []
+_lock = threading.Lock()
+_local = threading.local()
+# Start of the time of the spans, set when tracing is first enabled.
+_origin = None
+# rmm memory resource adaptor collecting the allocation statistics, and the
+# memory resource it replaced.
+_statistics = None
+_previous_resource = None
+
+
+# =============================================================================
+# Device helpers
+# =============================================================================
+def _device_synchronize():
+    try:
+        import cupy
+        cupy.cuda.runtime.deviceSynchronize()
+    except ImportError:
+        pass
+
+
+def _enable_memory_statistics():
+    """
+    Make the current rmm memory resource collect allocation statistics,
+    return False if rmm does not support them.
+    """
+    global _statistics, _previous_resource
+    try:
+        import rmm
+        adaptor_type = rmm.mr.StatisticsResourceAdaptor
+    except (ImportError, AttributeError):
+        return False
+    current = rmm.mr.get_current_device_resource()
+    if isinstance(current, adaptor_type):
+        _statistics = current
+    else:
+        _previous_resource = current
+        _statistics = adaptor_type(current)
+        rmm.mr.set_current_device_resource(_statistics)
+    return True
+
+
+def _disable_memory_statistics():
+    global _statistics, _previous_resource
+    if _previous_resource is not None:
+        import rmm
+        # Allocations made with the adaptor keep a reference to it, so it
+        # can be removed while they are alive.
+        rmm.mr.set_current_device_resource(_previous_resource)
+    _statistics = None
+    _previous_resource = None
+
+
+def _total_bytes_allocated():
+    statistics = _statistics
+    if statistics is None:
+        return None
+    return statistics.allocation_counts["total_bytes"]
+
+
+def _num_rows(obj):
+    """
+    Return the number of rows of a DataFrame, Series or array (or of the
+    first item of a tuple of them), or None. The rows of dask collections
+    are not counted since it would compute them.
+    """
+    if isinstance(obj, tuple):
+        obj = obj[0] if len(obj) > 0 else None
+    if hasattr(obj, "npartitions"):
+        return None
+    shape = getattr(obj, "shape", None)
+    if isinstance(shape, tuple) and len(shape) > 0:
+        return shape[0]
+    return None
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+class _NullSpan:
+    """
+    Span returned when tracing is disabled.
+    """
+    __slots__ = ()
+
+    def set(self, rows=None, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_null_span = _NullSpan()
+
+
+class _ActiveSpan:
+    """
+    Span being recorded, returned by span() when tracing is enabled.
+    """
+    __slots__ = ("name", "category", "rows", "args", "_start",
+                 "_start_bytes", "_statistics", "_child_duration", "_depth")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.rows = None
+        self.args = args
+
+    def set(self, rows=None, **args):
+        """
+        Record the number of rows of the result of the span, and other
+        information about it.
+        """
+        if rows is not None:
+            self.rows = rows
+        self.args.update(args)
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self._depth = len(stack)
+        self._child_duration = 0.0
+        stack.append(self)
+        if _synchronize:
+            _device_synchronize()
+        self._statistics = _statistics
+        self._start_bytes = _total_bytes_allocated()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if _synchronize:
+            _device_synchronize()
+        end = time.perf_counter()
+        end_bytes = _total_bytes_allocated()
+        stack = _local.stack
+        stack.pop()
+        duration = end - self._start
+        if stack:
+            stack[-1]._child_duration += duration
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        bytes_allocated = None
+        # The counts of different adaptors (if the memory statistics were
+        # disabled and enabled again during the span) can not be compared.
+        if self._start_bytes is not None and end_bytes is not None and \
+           _statistics is self._statistics:
+            bytes_allocated = end_bytes - self._start_bytes
+        span = Span(self.name, self.category, self._start - _origin,
+                    duration, duration - self._child_duration, self._depth,
+                    threading.get_ident(), self.rows, bytes_allocated,
+                    self.args)
+        with _lock:
+            _spans.append(span)
+        return False
+
+
+def span(name, category="phase", **args):
+    """
+    Return a context manager recording a span named name while tracing is
+    enabled. Spans opened in the context are nested in it.
+
+    The object returned by the context manager has a set(rows=None, **args)
+    method to record the number of rows of the result of the span, and other
+    information about it.
+
+    Examples
+    --------
+    >>> with cugraph.tracing.span("compute") as s:
+    ...     df = cudf.DataFrame({"vertex": [0, 1, 2]})
+    ...     s.set(rows=len(df))
+
+    """
+    if not _enabled:
+        return _null_span
+    return _ActiveSpan(name, category, args)
+
+
+def traced(name=None, category="phase"):
+    """
+    Decorator recording a span (see span()) for each call of the decorated
+    function while tracing is enabled. The span is named name, or after the
+    function if None, and records the number of rows of the result of the
+    function if it is a DataFrame, a Series or an array (or a tuple starting
+    with one).
+    """
+    def decorator(func):
+        span_name = func.__name__ if name is None else name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _ActiveSpan(span_name, category, {}) as s:
+                result = func(*args, **kwargs)
+                s.rows = _num_rows(result)
+                return result
+        return wrapper
+    return decorator
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+def enable(synchronize=True, memory=True):
+    """
+    Enable the recording of the spans of the algorithms and of their phases.
+
+    Parameters
+    ----------
+    synchronize : bool, optional (default=True)
+        If True, the device is synchronized when spans start and end, so the
+        duration of a span includes the device work it launched. This makes
+        the durations accurate at the cost of serializing the work.
+
+    memory : bool, optional (default=True)
+        If True and rmm supports it, the current rmm memory resource is
+        wrapped in a rmm.mr.StatisticsResourceAdaptor (until disable() is
+        called) to record the bytes allocated by each span.
+    """
+    global _enabled, _synchronize, _origin
+    if _origin is None:
+        _origin = time.perf_counter()
+    _synchronize = synchronize
+    if memory and _statistics is None:
+        _enable_memory_statistics()
+    elif not memory:
+        _disable_memory_statistics()
+    _enabled = True
+
+
+def disable():
+    """
+    Disable the recording of spans. The spans recorded so far are kept until
+    clear() is called.
+    """
+    global _enabled
+    _enabled = False
+    _disable_memory_statistics()
+
+
+def is_enabled():
+    """
+    Return True if tracing is enabled.
+    """
+    return _enabled
+
+
+def clear():
+    """
+    Discard the spans recorded so far.
+    """
+    with _lock:
+        del _spans[:]
+
+
+@contextmanager
+def trace(path=None, synchronize=True, memory=True):
+    """
+    Context manager enabling tracing (see enable()) and restoring the
+    previous state on exit, including the synchronize and memory settings if
+    tracing was already enabled. The spans recorded in the context are
+    exported to path in the Chrome trace event format if path is not None.
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+    ...                     dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> with cugraph.tracing.trace("bfs_trace.json"):
+    ...     df = cugraph.bfs(G, 0)
+
+    """
+    was_enabled = _enabled
+    (was_synchronized, had_memory) = (_synchronize, _statistics is not None)
+    first = len(_spans)
+    enable(synchronize=synchronize, memory=memory)
+    try:
+        yield
+    finally:
+        if was_enabled:
+            enable(synchronize=was_synchronized, memory=had_memory)
+        else:
+            disable()
+        if path is not None:
+            export_chrome_trace(path, spans=_spans[first:])
+
+
+# =============================================================================
+# Results
+# =============================================================================
+def get_spans():
+    """
+    Return the list of Span recorded so far, in the order they ended (nested
+    spans end before the span they are nested in).
+    """
+    with _lock:
+        return list(_spans)
+
+
+def summary(spans=None):
+    """
+    Return a pandas DataFrame with the number of calls, total duration, self
+    duration (excluding nested spans), rows and bytes allocated of each span
+    name, sorted by decreasing self duration.
+
+    Parameters
+    ----------
+    spans : list of Span, optional (default=None)
+        The spans to summarize, all the recorded spans if None.
+    """
+    import pandas as pd
+
+    if spans is None:
+        spans = get_spans()
+    columns = ["name", "category", "count", "duration", "self_duration",
+               "rows", "bytes_allocated"]
+    totals = {}
+    for s in spans:
+        key = (s.name, s.category)
+        total = totals.setdefault(key, [0, 0.0, 0.0, None, None])
+        total[0] += 1
+        total[1] += s.duration
+        total[2] += s.self_duration
+        if s.rows is not None:
+            total[3] = (total[3] or 0) + s.rows
+        if s.bytes_allocated is not None:
+            total[4] = (total[4] or 0) + s.bytes_allocated
+    df = pd.DataFrame([key + tuple(total) for (key, total) in totals.items()],
+                      columns=columns)
+    return df.sort_values("self_duration", ascending=False,
+                          ignore_index=True)
+
+
+def to_chrome_trace(spans=None):
+    """
+    Return the spans in the Chrome trace event format, as a dictionary that
+    can be serialized to JSON.
+
+    Parameters
+    ----------
+    spans : list of Span, optional (default=None)
+        The spans to export, all the recorded spans if None.
+    """
+    if spans is None:
+        spans = get_spans()
+    pid = os.getpid()
+    events = []
+    for s in sorted(spans, key=lambda s: (s.start, s.depth)):
+        args = dict(s.args)
+        if s.rows is not None:
+            args["rows"] = s.rows
+        if s.bytes_allocated is not None:
+            args["bytes_allocated"] = s.bytes_allocated
+        args["self_duration_us"] = s.self_duration * 1e6
+        events.append({"name": s.name,
+                       "cat": s.category,
+                       "ph": "X",
+                       "ts": s.start * 1e6,
+                       "dur": s.duration * 1e6,
+                       "pid": pid,
+                       "tid": s.thread_id,
+                       "args": args,
+                       })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path, spans=None):
+    """
+    Write the spans to path in the Chrome trace event format (JSON), which
+    can be loaded in chrome://tracing or https://ui.perfetto.dev.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The path of the file to write.
+
+    spans : list of Span, optional (default=None)
+        The spans to export, all the recorded spans if None.
+    """
+    with open(path, "w") as f:
+        json.dump(to_chrome_trace(spans), f, default=str)
@@ -13,6 +13,7 @@
 
 import importlib
 
+import numpy as np
 from numba import cuda
 
 import cudf
@@ -20,6 +21,8 @@ import cudf
 from cuda.cudart import cudaDeviceAttr
 from rmm._cuda.gpu import getDeviceAttribute
 
+from cugraph.utilities import tracing
+
 
 # optional dependencies
 try:
@@ -207,6 +210,123 @@ def get_traversed_path_list(df, id):
     return answer
 
 
+def get_traversed_paths(df, targets):
+    """
+    Take the DataFrame result from a BFS or SSSP function call and extract
+    the paths from many vertices back to the start vertex at once.
+
+    The predecessor of every vertex is first resolved to a row of df, then
+    pointer jumping is used to compute the depth of every vertex and the
+    2**i-th ancestors in O(V log D) (D: longest path), from which all the
+    requested paths are gathered together.  This avoids the per-hop scans of
+    df done by get_traversed_path and get_traversed_path_list.
+
+    Input Parameters
+    ----------
+    df : cudf.DataFrame or pandas.DataFrame
+        The dataframe containing the results of a BFS or SSSP call
+
+    targets : cudf.Series, pandas.Series or array-like
+        The vertex IDs to extract the paths of, must be the same data type as
+        df['vertex']
+
+    Returns
+    ---------
+    offsets : cudf.Series or pandas.Series
+        Series of size len(targets) + 1 such that the path of targets[i] is
+        vertices[offsets[i]:offsets[i+1]]
+
+    vertices : cudf.Series or pandas.Series
+        The vertices of all the paths. Each path is ordered from its target to
+        the root, as returned by get_traversed_path_list. A path stops at a
+        vertex whose predecessor is -1 or is not in df.
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+    ...                     dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> sssp_df = cugraph.sssp(G, 1)
+    >>> offsets, vertices = cugraph.utils.get_traversed_paths(sssp_df,
+    ...                                                       [32, 33])
+
+    """
+
+    if "vertex" not in df.columns:
+        raise ValueError(
+            "DataFrame does not appear to be a BFS or "
+            "SSP result - 'vertex' column missing"
+        )
+    if "predecessor" not in df.columns:
+        raise ValueError(
+            "DataFrame does not appear to be a BFS or "
+            "SSP result - 'predecessor' column missing"
+        )
+
+    if isinstance(df, cudf.DataFrame):
+        xp = cp
+        series_type = cudf.Series
+    else:
+        xp = np
+        series_type = type(df["vertex"])
+
+    # There is no guarantee that the dataframe has not been filtered
+    # or edited, so vertices are located using a sorted copy of df
+    sorted_df = df[["vertex", "predecessor"]].sort_values("vertex")
+    vertices = xp.asarray(sorted_df["vertex"].values)
+    preds = xp.asarray(sorted_df["predecessor"].values)
+    num_vertices = len(vertices)
+    positions = xp.arange(num_vertices, dtype=np.int64)
+
+    def locate(values):
+        pos = xp.searchsorted(vertices, values)
+        pos = xp.minimum(pos, max(num_vertices - 1, 0))
+        found = (num_vertices > 0) & (vertices[pos] == values)
+        return pos, found
+
+    # Roots point to themselves
+    parent, has_parent = locate(preds)
+    has_parent &= (preds != -1)
+    parent = xp.where(has_parent, parent, positions)
+
+    # jumps[i] is the 2**i-th ancestor of each vertex (or its root), and
+    # depth the number of edges from each vertex to its root
+    depth = has_parent.astype(np.int64)
+    jumps = [parent]
+    for _ in range(num_vertices.bit_length() + 1):
+        if not bool(has_parent[jumps[-1]].any()):
+            break
+        depth = depth + depth[jumps[-1]]
+        jumps.append(jumps[-1][jumps[-1]])
+    else:
+        raise ValueError("The predecessors in the result set contain a cycle")
+
+    if isinstance(targets, (cudf.Series, type(df["vertex"]))):
+        targets = targets.values
+    targets = xp.asarray(targets, dtype=vertices.dtype)
+    target_pos, found = locate(targets)
+    if not bool(found.all()):
+        missing = targets[~found][0]
+        raise ValueError("The vertex (", missing, " is not in the result set")
+
+    lengths = depth[target_pos] + 1
+    offsets = xp.zeros(len(targets) + 1, dtype=np.int64)
+    xp.cumsum(lengths, out=offsets[1:])
+
+    # Each element of the output is the step-th ancestor of its target, built
+    # from the binary decomposition of step
+    path_id = xp.zeros(int(offsets[-1]), dtype=np.int64)
+    path_id[offsets[1:-1]] = 1
+    path_id = xp.cumsum(path_id)
+    step = xp.arange(int(offsets[-1]), dtype=np.int64) - offsets[path_id]
+    pos = target_pos[path_id]
+    for i, ancestors in enumerate(jumps):
+        pos = xp.where((step >> i) & 1 == 1, ancestors[pos], pos)
+
+    return series_type(offsets), series_type(vertices[pos])
+
+
 def is_cuda_version_less_than(min_version=(10, 2)):
     """
     Returns True if the version of CUDA being used is less than min_version
@@ -248,11 +368,20 @@ def get_device_memory_info():
     return meminfo[1]
 
 
+def get_free_device_memory():
+    """
+    Returns the amount of free global memory on the device in bytes
+    """
+    meminfo = cuda.current_context().get_memory_info()
+    return meminfo[0]
+
+
 # FIXME: if G is a Nx type, the weight attribute is assumed to be "weight", if
 # set. An additional optional parameter for the weight attr name when accepting
 # Nx graphs may be needed.  From the Nx docs:
 # |      Many NetworkX algorithms designed for weighted graphs use
 # |      an edge attribute (by default `weight`) to hold a numerical value.
+@tracing.traced("ensure_cugraph_obj")
 def ensure_cugraph_obj(obj, nx_weight_attr=None, matrix_graph_type=None):
 
     """
@@ -260,6 +389,8 @@ def ensure_cugraph_obj(obj, nx_weight_attr=None, matrix_graph_type=None):
     DiGraph, etc.) and return a tuple of (cugraph Graph-type obj, original
     input obj type). If matrix_graph_type is specified, it is used as the
     cugraph Graph-type obj to create when converting from a matrix type.
+    Conversions of NetworkX graphs may be cached, see convert_from_nx() and
+    enable_nx_cache().
     """
     # FIXME: importing here to avoid circular import
     from cugraph.structure import Graph
@@ -270,7 +401,8 @@ def ensure_cugraph_obj(obj, nx_weight_attr=None, matrix_graph_type=None):
         return (obj, input_type)
 
     elif is_nx_graph_type(input_type):
-        return (convert_from_nx(obj, weight=nx_weight_attr), input_type)
+        return (convert_from_nx(obj, weight=nx_weight_attr, cache=None),
+                input_type)
 
     elif (input_type in __cp_matrix_types) or \
          (input_type in __sp_matrix_types):
@@ -323,17 +455,20 @@ def ensure_cugraph_obj(obj, nx_weight_attr=None, matrix_graph_type=None):
 # Nx graphs may be needed.  From the Nx docs:
 # |      Many NetworkX algorithms designed for weighted graphs use
 # |      an edge attribute (by default `weight`) to hold a numerical value.
+@tracing.traced("ensure_cugraph_obj")
 def ensure_cugraph_obj_for_nx(obj, nx_weight_attr="weight"):
     """
     Ensures a cuGraph Graph-type obj is returned for either cuGraph or Nx
-    Graph-type objs. If obj is a Nx type,
+    Graph-type objs. If obj is a Nx type, it is converted (or the cached
+    conversion is used, see convert_from_nx() and enable_nx_cache()).
     """
     # FIXME: importing here to avoid circular import
     from cugraph.utilities.nx_factory import convert_from_nx
 
     input_type = type(obj)
     if is_nx_graph_type(input_type):
-        return (convert_from_nx(obj, weight=nx_weight_attr), True)
+        return (convert_from_nx(obj, weight=nx_weight_attr, cache=None),
+                True)
     elif is_cugraph_graph_type(input_type):
         return (obj, False)
     else:
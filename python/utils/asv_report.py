@@ -36,10 +36,14 @@ def cugraph_update_asv(asvDir, datasetName, algoRunResults,
     prefixDict = dict(maxGpuUtil="gpuutil",
                       maxGpuMemUsed="gpumem",
                       exeTime="time",
+                      maxRss="rss",
+                      avgCpuUtil="cpuutil",
                       )
     unitsDict = dict(maxGpuUtil="percent",
                      maxGpuMemUsed="bytes",
                      exeTime="seconds",
+                     maxRss="bytes",
+                     avgCpuUtil="percent",
                      )
 
     bInfo = BenchmarkInfo(machineName=machineName or uname.machine,
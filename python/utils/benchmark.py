@@ -16,7 +16,7 @@ from time import clock_gettime, CLOCK_MONOTONIC_RAW
 
 import numpy as np
 
-from gpu_metric_poller import startGpuMetricPolling, stopGpuMetricPolling
+from resource_poller import startResourcePolling, stopResourcePolling
 
 
 class Benchmark:
@@ -24,6 +24,14 @@ class Benchmark:
     resultsDict = {}
     metricNameCellWidth = 20
     valueCellWidth = 40
+    # Seconds between samples of the resource usage
+    pollInterval = 0.05
+    # Metrics of the resource poller summary reported, in addition to the
+    # execution time and GPU metrics. Metrics that are not available on the
+    # host are skipped.
+    hostMetricNames = ["maxRss", "avgRss", "maxCpuUtil", "avgCpuUtil",
+                       "minorPageFaults", "majorPageFaults",
+                       "ioReadBytes", "ioWriteBytes"]
 
     def __init__(self, func, name="", args=None):
         """
@@ -39,6 +47,9 @@ class Benchmark:
         """
         Run self.func() n times and compute the average of all runs for all
         metrics after discarding the min and max values for each.
+
+        The resource usage time series of each run is saved as a list in the
+        "timeSeries" entry of the results.
         """
         retVal = None
         # Return or create the results dict unique to the function name
@@ -51,6 +62,9 @@ class Benchmark:
             exeTimes = []
             gpuMems = []
             gpuUtils = []
+            hostMetrics = {}
+            timeSeries = []
+            pollObj = None
 
             if n > 1:
                 print("  - iteration ", end="", flush=True)
@@ -58,17 +72,24 @@ class Benchmark:
             for i in range(n):
                 if n > 1:
                     print(i+1, end="...", flush=True)
-                gpuPollObj = startGpuMetricPolling()
+                pollObj = startResourcePolling(self.pollInterval)
                 # st = process_time_ns()
                 st = clock_gettime(CLOCK_MONOTONIC_RAW)
                 retVal = self.func(*self.args)
-                stopGpuMetricPolling(gpuPollObj)
-
                 # exeTime = (process_time_ns() - st) / 1e9
                 exeTime = clock_gettime(CLOCK_MONOTONIC_RAW) - st
+                stopResourcePolling(pollObj)
+
                 exeTimes.append(exeTime)
-                gpuMems.append(gpuPollObj.maxGpuUtil)
-                gpuUtils.append(gpuPollObj.maxGpuMemUsed)
+                gpuMems.append(pollObj.maxGpuMemUsed)
+                gpuUtils.append(pollObj.maxGpuUtil)
+                summary = pollObj.summary
+                for metricName in self.hostMetricNames:
+                    if metricName in summary:
+                        hostMetrics.setdefault(metricName, []).append(
+                            summary[metricName])
+                timeSeries.append(pollObj.timeSeries)
+                pollObj = None
 
             print("  - done running %s." % self.name, flush=True)
 
@@ -76,14 +97,19 @@ class Benchmark:
             funcResultsDict["ERROR"] = str(e)
             print("   %s | %s" % ("ERROR".ljust(self.metricNameCellWidth),
                                   str(e).ljust(self.valueCellWidth)))
-            stopGpuMetricPolling(gpuPollObj)
+            if pollObj is not None:
+                stopResourcePolling(pollObj)
             return
 
         funcResultsDict["exeTime"] = self.__computeValue(exeTimes)
-        funcResultsDict["maxGpuUtil"] = self.__computeValue(gpuMems)
-        funcResultsDict["maxGpuMemUsed"] = self.__computeValue(gpuUtils)
-
-        for metricName in ["exeTime", "maxGpuUtil", "maxGpuMemUsed"]:
+        funcResultsDict["maxGpuUtil"] = self.__computeValue(gpuUtils)
+        funcResultsDict["maxGpuMemUsed"] = self.__computeValue(gpuMems)
+        for (metricName, vals) in hostMetrics.items():
+            funcResultsDict[metricName] = self.__computeValue(vals)
+        funcResultsDict["timeSeries"] = timeSeries
+
+        for metricName in ["exeTime", "maxGpuUtil", "maxGpuMemUsed"] + \
+                [m for m in self.hostMetricNames if m in hostMetrics]:
             val = funcResultsDict[metricName]
             print("   %s | %s" % (metricName.ljust(self.metricNameCellWidth),
                                   str(val).ljust(self.valueCellWidth)),
@@ -0,0 +1,328 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# ResourcePoller
+# Utility class and samplers for recording host (and GPU, if NVML is
+# available) resource usage over a specific section of code.
+#
+"""
+# Example:
+
+# Poll the resources used by a section of code every 10ms:
+with ResourcePoller(interval=0.01) as poller:
+    run_cugraph_algo(G)
+
+# Retrieve the summary (peak/average of each metric) and time series:
+print("Max RSS: %s" % poller.summary["maxRss"])
+print("Avg CPU utilization: %s" % poller.summary["avgCpuUtil"])
+print("Samples: %s" % poller.timeSeries)
+"""
+
+import os
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class ResourceSampler:
+    """
+    Base class of the samplers used by ResourcePoller. A sampler returns a
+    dictionary of metric names to values each time sample() is called, between
+    calls to start() and stop().
+
+    Metrics listed in counters are cumulative (eg. page faults): they are
+    sampled relative to their value at start(), and summarized by their final
+    value instead of their maximum and average.
+    """
+    counters = ()
+
+    def start(self):
+        pass
+
+    def sample(self):
+        raise NotImplementedError
+
+    def stop(self):
+        pass
+
+
+class HostSampler(ResourceSampler):
+    """
+    Samples the RSS, CPU utilization (of the process, and of each core of the
+    host), page faults and I/O bytes of the current process. psutil is used if
+    available, otherwise /proc (on Linux) and getrusage() are read.
+    """
+    counters = ("minorPageFaults", "majorPageFaults",
+                "ioReadBytes", "ioWriteBytes")
+
+    def __init__(self):
+        self.__process = psutil.Process() if psutil is not None else None
+        self.__initial = {}
+        self.__lastCpuTimes = None
+        self.__lastCoreTimes = None
+
+    @staticmethod
+    def __readProcCoreTimes():
+        """
+        Return a list of (busy, total) jiffies of each core from /proc/stat.
+        """
+        coreTimes = []
+        with open("/proc/stat") as statFile:
+            for line in statFile:
+                fields = line.split()
+                if fields[0].startswith("cpu") and fields[0] != "cpu":
+                    values = [int(x) for x in fields[1:]]
+                    # idle and iowait
+                    idle = values[3] + (values[4] if len(values) > 4 else 0)
+                    coreTimes.append((sum(values) - idle, sum(values)))
+        return coreTimes
+
+    def __getCpuUtilPerCore(self):
+        if psutil is not None:
+            return psutil.cpu_percent(percpu=True)
+        try:
+            coreTimes = self.__readProcCoreTimes()
+        except OSError:
+            return None
+        lastCoreTimes = self.__lastCoreTimes or coreTimes
+        self.__lastCoreTimes = coreTimes
+        return [100.0 * (busy - lastBusy) / (total - lastTotal)
+                if total > lastTotal else 0.0
+                for ((busy, total), (lastBusy, lastTotal))
+                in zip(coreTimes, lastCoreTimes)]
+
+    def __getCpuUtil(self):
+        """
+        Return the CPU utilization of the process since the last call, in
+        percent of one core.
+        """
+        now = time.perf_counter()
+        cpuTime = time.process_time()
+        (lastNow, lastCpuTime) = self.__lastCpuTimes or (now, cpuTime)
+        self.__lastCpuTimes = (now, cpuTime)
+        if now <= lastNow:
+            return 0.0
+        return 100.0 * (cpuTime - lastCpuTime) / (now - lastNow)
+
+    def __getRss(self):
+        if self.__process is not None:
+            return self.__process.memory_info().rss
+        try:
+            with open("/proc/self/statm") as statmFile:
+                return int(statmFile.read().split()[1]) * \
+                    os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            return None
+
+    def __getCounters(self):
+        counters = {}
+        if resource is not None:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            counters["minorPageFaults"] = usage.ru_minflt
+            counters["majorPageFaults"] = usage.ru_majflt
+        try:
+            if self.__process is not None:
+                ioCounters = self.__process.io_counters()
+                counters["ioReadBytes"] = ioCounters.read_bytes
+                counters["ioWriteBytes"] = ioCounters.write_bytes
+            else:
+                with open("/proc/self/io") as ioFile:
+                    fields = dict(line.split(":") for line in ioFile)
+                counters["ioReadBytes"] = int(fields["read_bytes"])
+                counters["ioWriteBytes"] = int(fields["write_bytes"])
+        except (AttributeError, OSError, KeyError, ValueError):
+            # I/O counters are not available on all platforms
+            pass
+        return counters
+
+    def start(self):
+        self.__initial = self.__getCounters()
+        self.__lastCpuTimes = None
+        self.__lastCoreTimes = None
+        # Prime the CPU utilization, which is measured between samples
+        self.__getCpuUtil()
+        self.__getCpuUtilPerCore()
+
+    def sample(self):
+        values = {"rss": self.__getRss(),
+                  "cpuUtil": self.__getCpuUtil(),
+                  "cpuUtilPerCore": self.__getCpuUtilPerCore(),
+                  }
+        for (name, value) in self.__getCounters().items():
+            values[name] = value - self.__initial.get(name, 0)
+        return {name: value for (name, value) in values.items()
+                if value is not None}
+
+
+class NVMLSampler(ResourceSampler):
+    """
+    Samples the memory used and utilization of a GPU using NVML, relative to
+    their values at start() like GPUMetricPoller.
+    """
+    def __init__(self, deviceIndex=0):
+        from pynvml import smi
+        self.__smi = smi
+        self.deviceIndex = deviceIndex
+        self.__device = None
+
+    @classmethod
+    def isAvailable(cls):
+        try:
+            from pynvml import smi
+            smi.nvmlInit()
+            smi.nvmlShutdown()
+            return True
+        except Exception:
+            return False
+
+    def start(self):
+        self.__smi.nvmlInit()
+        self.__device = self.__smi.nvmlDeviceGetHandleByIndex(
+            self.deviceIndex)
+        self.__initialMemUsed = self.__smi.nvmlDeviceGetMemoryInfo(
+            self.__device).used
+        self.__initialGpuUtil = self.__smi.nvmlDeviceGetUtilizationRates(
+            self.__device).gpu
+
+    def sample(self):
+        memUsed = self.__smi.nvmlDeviceGetMemoryInfo(self.__device).used
+        gpuUtil = self.__smi.nvmlDeviceGetUtilizationRates(self.__device).gpu
+        return {"gpuMemUsed": memUsed - self.__initialMemUsed,
+                "gpuUtil": gpuUtil - self.__initialGpuUtil,
+                }
+
+    def stop(self):
+        self.__smi.nvmlShutdown()
+
+
+def getDefaultSamplers():
+    """
+    Return the samplers used by default: a HostSampler, and a NVMLSampler if
+    NVML is available.
+    """
+    samplers = [HostSampler()]
+    if NVMLSampler.isAvailable():
+        samplers.append(NVMLSampler())
+    return samplers
+
+
+class ResourcePoller(threading.Thread):
+    """
+    Polls samplers every interval seconds in a thread, and saves the samples
+    as a time series of (seconds since start, {metric: value}) tuples. A
+    sample is also taken when starting and stopping, so short sections of code
+    have at least two samples.
+
+    Can be used as a context manager, or with start() and stop().
+    """
+    def __init__(self, interval=0.05, samplers=None):
+        super().__init__(daemon=True)
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.samplers = getDefaultSamplers() if samplers is None \
+            else list(samplers)
+        self.timeSeries = []
+        self.__stopEvent = threading.Event()
+        self.__startTime = None
+
+    def __sample(self):
+        values = {}
+        for sampler in self.samplers:
+            values.update(sampler.sample())
+        self.timeSeries.append((time.perf_counter() - self.__startTime,
+                                values))
+
+    def start(self):
+        for sampler in self.samplers:
+            sampler.start()
+        self.__startTime = time.perf_counter()
+        self.__sample()
+        super().start()
+
+    def run(self):
+        while not self.__stopEvent.wait(self.interval):
+            self.__sample()
+
+    def stop(self):
+        self.__stopEvent.set()
+        self.join()
+        self.__sample()
+        for sampler in self.samplers:
+            sampler.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *excInfo):
+        self.stop()
+        return False
+
+    @property
+    def summary(self):
+        """
+        Return a dictionary of the peak ("max" prefix) and average ("avg"
+        prefix) of each metric, and of the final value of each counter. The
+        summary of per-core metrics is a list with a value per core.
+        """
+        counters = set()
+        for sampler in self.samplers:
+            counters.update(sampler.counters)
+
+        series = {}
+        for (_, values) in self.timeSeries:
+            for (name, value) in values.items():
+                series.setdefault(name, []).append(value)
+
+        summary = {}
+        for (name, values) in series.items():
+            if name in counters:
+                summary[name] = values[-1]
+                continue
+            suffix = name[0].upper() + name[1:]
+            if isinstance(values[0], list):
+                perCore = list(zip(*values))
+                summary["max" + suffix] = [max(v) for v in perCore]
+                summary["avg" + suffix] = [sum(v) / len(v) for v in perCore]
+            else:
+                summary["max" + suffix] = max(values)
+                summary["avg" + suffix] = sum(values) / len(values)
+        return summary
+
+    @property
+    def maxGpuUtil(self):
+        return self.summary.get("maxGpuUtil", 0)
+
+    @property
+    def maxGpuMemUsed(self):
+        return self.summary.get("maxGpuMemUsed", 0)
+
+
+def startResourcePolling(interval=0.05, samplers=None):
+    pollObj = ResourcePoller(interval=interval, samplers=samplers)
+    pollObj.start()
+    return pollObj
+
+
+def stopResourcePolling(pollObj):
+    pollObj.stop()